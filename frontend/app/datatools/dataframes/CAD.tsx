@@ -1,56 +0,0 @@
-
-import { PlotDataType, PlotDataSet, PlotDataAccessors } from '../types';
-
-const CAD: PlotDataSet = {
-    xLabels: ['Radius', 'Noise normal', 'Shape', 'struct'],
-    yLabels: ['N', 'Neighbors count', 'RMSAE Normal', 'Timings (ms)', 'Non-stable ratio'],
-    dividers: [],
-    constraints: ['all', 'No noise kD-Tree', 'Helios kD-Tree', 'Noise normal kD-Tree', 'Helios + noise normal kD-Tree', 'No noise kNN-graph', 'Helios kNN-graph', 'Noise normal kNN-graph', 'Helios + noise normal kNN-graph'],
-    data: {'all_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]]}, 'all_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [123.62885791666668, 290.1714683333333, 531.8001833333333, 848.4583187499999, 1232.5113554166667, 1684.76446375, 2194.7902041666666]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [123.62002291666666, 290.24130291666665, 531.7714841666667, 848.7192608333334, 1232.1438045833333, 1684.4328204166666, 2194.7602458333336]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [123.53930958333333, 290.5691004166667, 531.6866608333333, 849.3116770833333, 1232.4832970833334, 1684.1277979166669, 2194.445491666667]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [124.39282916666666, 290.2557075, 531.2200475000001, 848.9231554166666, 1232.9908883333333, 1684.2654879166666, 2194.2181416666667]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [123.06177916666665, 289.3461354166667, 530.31912875, 847.21744875, 1231.54289125, 1683.20604, 2193.048470833333]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [123.7498175, 291.30617041666665, 533.5011804166667, 850.3856149999999, 1236.8387829166668, 1686.8128933333332, 2198.0379958333333]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [124.08454875000001, 290.19634708333336, 531.8480645833333, 848.1904533333333, 1233.4232558333335, 1684.6614295833335, 2194.7229250000005]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [124.42897791666668, 291.7321195833334, 532.3733895833334, 849.3293783333335, 1234.1545383333334, 1686.6745870833333, 2195.975891666667]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [123.41125958333333, 289.95271291666666, 527.65755, 839.9043183333332, 1219.4546137500001, 1664.2450962500002, 2169.174716666667]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [124.31932916666668, 291.33064125, 528.3054970833333, 840.9816379166666, 1220.5491804166666, 1665.3548187500003, 2170.9678875]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [120.96587916666665, 280.47183624999997, 512.6339487500001, 822.1256850000001, 1197.4752158333333, 1649.1359162500003, 2159.080154166667]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [125.03415875, 293.43942208333334, 537.1595320833334, 856.8088358333334, 1242.2211187500002, 1694.9373454166669, 2205.4903875]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [124.01303666666666, 291.6857395833333, 532.67085125, 849.4035262500001, 1234.044585416667, 1685.5812462499998, 2196.0192916666665]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [124.41010791666666, 290.56608958333334, 531.6038108333333, 849.2920045833333, 1233.2286995833333, 1684.761275, 2194.5751]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [125.60323166666667, 291.65766125000005, 534.1650870833333, 851.1864504166666, 1236.4709420833335, 1686.4923066666665, 2197.5835791666664]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [155.23352500000001, 364.16221500000006, 656.96636, 1029.91918, 1469.17065, 1977.8056000000001, 2536.82435]]}, 'all_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [26.929560999999996, 24.899846562500002, 24.767350000000004, 25.1944484375, 26.01283588235294, 26.62837705882353, 26.87719305555556]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [20.34239, 20.90247175, 22.0105355, 23.209969499999996, 24.49185125, 25.755555, 26.7499375]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [20.07643475, 20.436542250000002, 21.669117000000004, 23.035758, 24.4371645, 25.7459725, 26.8118575]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [19.171154250000004, 19.6945205, 20.91995275, 22.142846750000004, 23.33048, 24.7083075, 25.8166625]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [21.3684635, 21.14495475, 22.50119975, 23.699674, 24.9714005, 26.387655000000002, 27.330225]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [19.426389000000004, 19.77626275, 20.96842325, 22.18335075, 23.3675475, 24.728895, 25.83022]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [10.336954875, 14.47646425, 15.72870375, 17.773275416666664, 19.444102458333337, 20.963601166666667, 22.488735416666668]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.47641140425532, 16.34769542735043, 18.98101313559322, 21.465210420168063, 23.532046638655462, 25.346889915966386, 26.921465546218485]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [28.70126575, 27.9059925, 27.7471925, 27.931525, 28.401555, 28.5768125, 28.745115]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.953242435897437, 15.716764425531915, 18.517721308016878, 20.678488781512605, 22.202687773109243, 23.346475210084037, 24.37739705882353]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.518490128205128, 17.958418728813562, 20.953107161016945, 23.507704621848735, 25.649733193277314, 27.66236260504202, 29.302300840336134]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.56531091743119, 19.173374210526315, 20.366086440677968, 20.840061344537816, 21.857766386554623, 22.951829411764706, 23.999379166666664]]}, 'all_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.030551207083333334, 0.033812966666666666, 0.03591867541666667, 0.037909083333333336, 0.03897577666666666, 0.04191886708333333, 0.041540597916666665]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.027690203666666666, 0.03131841216666667, 0.03769542645833334, 0.048656942791666664, 0.05341683233333334, 0.061742861583333336, 0.062513936875]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.016609235958333336, 0.019445793499999996, 0.023411802166666665, 0.029996624625000006, 0.036319597, 0.04231625033333333, 0.04947886191666666]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.001259420775, 0.00145542235, 0.0013236678833333335, 0.0014721908833333333, 0.0015596855333333331, 0.0016628264833333335, 0.0016328264166666666]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.051550212916666664, 0.10802506987499999, 0.1849159195833333, 0.2848835304166667, 0.41036210166666665, 0.5797320025, 0.7597114904166667]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0050479150958333335, 0.0012514347916666665, 0.0013026475625, 0.0011792669333333334, 0.0015345334875, 0.001370175825, 0.0014360826291666664]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0010494070208333334, 0.0012035608291666668, 0.0012378082250000001, 0.0013150674416666668, 0.0014431611166666669, 0.0014245154833333333, 0.0013409629416666667]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0011401136166666668, 0.0012613500291666668, 0.0014100128041666666, 0.0014551954083333331, 0.0014559358625, 0.0015424196291666666, 0.0015322162125]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0034272896666666663, 0.0037302588333333326, 0.0037803119999999996, 0.003919999166666666, 0.0037157794583333333, 0.004035699416666667, 0.004020964875]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00034183423333333335, 0.00035900385, 0.0003514044208333333, 0.00037680653333333337, 0.00039047087916666673, 0.00043070860416666664, 0.0003534739125]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.015541014541666669, 0.015819338041666665, 0.016812120875, 0.015468942666666667, 0.015102999208333334, 0.01887531075, 0.01753938229166667]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.008664927, 0.008728905291666667, 0.009000266958333333, 0.009544449250000002, 0.009232337916666668, 0.009828486958333334, 0.009991766583333334]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0012422264, 0.0014037624708333333, 0.0014916007958333333, 0.0015133977416666665, 0.0015207755625, 0.0015418733916666668, 0.0015948114749999999]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0011730453458333333, 0.0014173880291666668, 0.00144238805, 0.0013057616833333332, 0.0015099957833333334, 0.0015606148666666665, 0.0014678128]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00012426974708333333, 0.00014235707041666666, 0.00016401866375, 0.00022122894875, 0.00020604034374999998, 0.00013860251, 0.00013688820916666667]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.13343444291666667, 0.26090617833333335, 0.4389510708333333, 0.6652746041666667, 1.2283607516666668, 1.2562547583333334, 1.6178764666666665]]}, 'all_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.026088342514999998, 0.0009016496475000002, 9.00652475e-05, 4.06440225e-05, 3.35838475e-05, 3.35838475e-05, 1.47567975e-05]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000148934395, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0028964925724999997, 0.000102043025, 5.6481000000000004e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 9.413549999999999e-06]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0028964925724999997, 0.000102043025, 5.6481000000000004e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 9.413549999999999e-06]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0028820062125, 0.000102043025, 5.6481000000000004e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 9.413549999999999e-06]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.002890133589166667, 0.00010361202499999999, 6.1188e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 9.413549999999999e-06]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000139520895, 6.5895e-05, 3.29474e-05, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.13140516605, 0.0026187280150000002, 0.00023595494500000002, 6.5895e-05, 2.8240600000000002e-05, 2.8240600000000002e-05, 1.4120300000000001e-05]]}, 'all_Noise normal_N': {'3DQuadric': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'PC-MLS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], '2-Monge': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'Varifolds': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'WaveJets': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'AvgHexagram': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'ShapeOperator': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'PCA': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'ASO': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'APSS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'Sphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'UnorientedSphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'Cov2D': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'NormCov2D': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'Mean': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]], 'JetFitting': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [52206.35, 52206.35, 52206.35, 52206.35, 52206.35, 52206.35]]}, 'all_Noise normal_Neighbors count': {'3DQuadric': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [986.6666178571428, 986.2912560714286, 986.4314457142858, 986.9534389285714, 986.6213178571428, 986.5715107142859]], 'PC-MLS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [986.2003435714284, 986.6007053571429, 986.5425967857142, 986.511625, 986.3211492857143, 986.9855299999999]], '2-Monge': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [986.0436396428571, 986.5425132142858, 986.7886846428571, 986.670647857143, 986.8877242857143, 986.6353628571428]], 'Varifolds': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [986.3117689285714, 986.8151750000001, 986.7613935714286, 986.9548467857144, 986.487945, 986.3256628571429]], 'WaveJets': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [985.4389325000001, 985.4474389285714, 985.3854074999999, 985.3505639285714, 985.3922035714287, 985.3356485714286]], 'AvgHexagram': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [988.074432142857, 989.756759642857, 987.5929778571427, 988.2725857142858, 989.5925603571429, 988.6813603571427]], 'ShapeOperator': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [986.20591, 987.0695153571428, 986.6858739285714, 987.1354139285716, 986.6263514285714, 986.6715274999999]], 'PCA': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [988.5729410714284, 988.0327017857144, 988.5203810714285, 987.2004903571428, 987.5010914285713, 987.0314364285714]], 'ASO': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [976.2844060714286, 976.9940550000001, 976.0079878571429, 976.2180132142856, 976.064104642857, 975.9745196428572]], 'APSS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [977.0827796428572, 976.9990789285713, 977.8216464285714, 978.1646614285714, 977.3164092857144, 977.0231317857143]], 'Sphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [963.2366482142858, 962.712682142857, 962.9637285714288, 963.1583235714285, 963.0509075000001, 963.6393974999999]], 'UnorientedSphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [993.2498557142857, 993.3999353571429, 993.8343835714286, 993.7659175, 993.6005810714286, 993.655727142857]], 'Cov2D': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [987.0293053571428, 987.4273303571428, 987.8305271428571, 987.0050674999998, 988.0944342857143, 988.40043]], 'NormCov2D': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [986.8161017857145, 986.8557767857143, 987.0640292857141, 986.6574675, 987.188267142857, 986.9358610714287]], 'Mean': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [990.2665342857142, 989.455679642857, 989.050999642857, 987.8305721428571, 989.3327071428571, 988.2000142857144]], 'JetFitting': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [1170.0116971428572, 1170.0116971428572, 1170.0116971428572, 1170.0116971428572, 1170.0116971428572, 1170.0116971428572]]}, 'all_Noise normal_RMSAE Normal': {'3DQuadric': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [25.916694173913044, 25.916694173913044, 25.916694173913044, 25.916694173913044, 25.916694173913044, 25.916694173913044]], 'PC-MLS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [23.351815785714287, 23.351815785714287, 23.351815785714287, 23.351815785714287, 23.351815785714287, 23.351815785714287]], '2-Monge': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [23.173263785714287, 23.173263785714287, 23.173263785714287, 23.173263785714287, 23.173263785714287, 23.173263785714287]], 'Varifolds': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [22.254846321428573, 22.254846321428573, 22.254846321428573, 22.254846321428573, 22.254846321428573, 22.254846321428573]], 'WaveJets': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [23.914796071428572, 23.914796071428572, 23.914796071428572, 23.914796071428572, 23.914796071428572, 23.914796071428572]], 'PCA': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [22.32586975, 22.32586975, 22.32586975, 22.32586975, 22.32586975, 22.32586975]], 'ASO': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [17.21246060714286, 17.312202428571428, 17.31831592857143, 17.32846064285714, 17.341840142857144, 17.382580821428572]], 'APSS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [20.914104124513617, 20.853055535714287, 20.86194142857143, 20.87712935714286, 20.898118249999996, 20.960210892857145]], 'Sphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [28.287065464285714, 28.287065464285714, 28.287065464285714, 28.287065464285714, 28.287065464285714, 28.287065464285714]], 'UnorientedSphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [20.03010333333333, 19.58842525, 19.60372775, 19.62889617857143, 19.664584714285713, 19.762342107142857]], 'Mean': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [22.822703837209303, 22.716554785714283, 22.74803921428571, 22.79343175, 22.850618035714287, 22.995818035714287]], 'JetFitting': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [21.462809915254237, 20.904562928571426, 20.917374571428567, 20.93646228571429, 20.960310500000002, 21.018467428571427]]}, 'all_Noise normal_Timings (ms)': {'3DQuadric': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.03712970385714286, 0.03710012371428571, 0.03718016485714286, 0.037351905607142855, 0.03676403807142857, 0.03786878460714286]], 'PC-MLS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.04815218667857143, 0.04713551096428572, 0.04571146160714286, 0.045389613178571424, 0.045503213, 0.04499482817857143]], '2-Monge': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.03190432135714286, 0.03090892632142857, 0.030599810821428576, 0.030697385214285715, 0.03102972096428571, 0.03135540575]], 'Varifolds': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.0015721333107142858, 0.0014357145107142858, 0.0015100578821428572, 0.0014722054392857144, 0.0014035526214285713, 0.0014915136571428571]], 'WaveJets': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.3413344203214286, 0.33913772282142857, 0.33682117325, 0.3415584600714286, 0.33873735892857143, 0.34170828807142856]], 'AvgHexagram': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.002160422678571428, 0.001796597935714286, 0.001771507317857143, 0.001895581164285714, 0.0018182606357142856, 0.0018051071178571433]], 'ShapeOperator': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.001344168057142857, 0.0012440244035714285, 0.0012213523464285714, 0.001256658107142857, 0.0013334290571428572, 0.001327067792857143]], 'PCA': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.0013433295964285716, 0.001461444207142857, 0.0014150061214285715, 0.0014462322928571426, 0.0014156711749999998, 0.0013159539464285715]], 'ASO': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.0038173705000000002, 0.0036484008571428576, 0.0038144290000000003, 0.003932041892857142, 0.0037807969285714284, 0.0038329351785714285]], 'APSS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.00035644939285714287, 0.00038668293214285716, 0.0003405481785714286, 0.00034627462857142856, 0.00038904882142857145, 0.0004127409892857143]], 'Sphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.016637617500000004, 0.016841928214285713, 0.016366835714285714, 0.016233647035714286, 0.016459397749999997, 0.016168380964285717]], 'UnorientedSphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.008047229607142858, 0.009110813785714288, 0.009308658464285715, 0.0097555745, 0.009208152035714285, 0.010276262999999999]], 'Cov2D': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.0015233451642857143, 0.0014956589035714288, 0.0014085094642857143, 0.0014162790035714284, 0.0015228840964285715, 0.0014691358]], 'NormCov2D': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.001391472117857143, 0.0013836132464285715, 0.001438598764285714, 0.0014122576642857142, 0.0014044542464285714, 0.0014356095821428572]], 'Mean': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.0001394713264285714, 0.00019038357214285712, 0.00016040322357142856, 0.00013937599928571427, 0.00015779564357142856, 0.0001840606575]], 'JetFitting': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.7642326185714285, 0.8048750942857144, 0.8195801907142857, 0.8097665270714286, 0.8163896454285716, 0.786063015]]}, 'all_Noise normal_Non-stable ratio': {'3DQuadric': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.003886089417857143, 0.003886089417857143, 0.003886089417857143, 0.003886089417857143, 0.003886089417857143, 0.003886089417857143]], 'PC-MLS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], '2-Monge': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], 'Varifolds': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], 'WaveJets': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], 'AvgHexagram': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], 'ShapeOperator': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.5396685000000005e-05, 3.5396685000000005e-05, 3.5396685000000005e-05, 3.5396685000000005e-05, 3.5396685000000005e-05, 3.5396685000000005e-05]], 'PCA': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], 'ASO': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.00044941100785714287, 0.0004494558021428571, 0.00045005244499999995, 0.00045012865928571434, 0.00044937958785714287, 0.00045084559571428564]], 'APSS': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.00044941100785714287, 0.0004494558021428571, 0.00045005244499999995, 0.00045012865928571434, 0.00044937958785714287, 0.00045084559571428564]], 'Sphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.0004478093696428571, 0.0004478093696428571, 0.0004478093696428571, 0.0004478093696428571, 0.0004478093696428571, 0.0004478093696428571]], 'UnorientedSphere': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.00045013305785714287, 0.0004501778521428572, 0.0004495054235714286, 0.0004495054235714286, 0.0004495054235714286, 0.0004503747885714285]], 'Cov2D': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], 'NormCov2D': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], 'Mean': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05, 3.4051899285714285e-05]], 'JetFitting': [[0.0, 0.025, 0.05, 0.075, 0.1, 0.15], [0.01919947793, 0.01919947793, 0.01919947793, 0.01919947793, 0.01919947793, 0.01919947793]]}, 'all_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [81209.5, 49765.5, 24558.5, 91462.0, 32008.5, 13477.5, 64732.5, 87283.5, 28044.0, 49522.0]]}, 'all_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [701.7981821428572, 548.8991077380952, 1104.8775446428572, 1871.730657738095, 335.2882285714286, 99.67803869047619, 1269.885019642857, 876.8570011904762, 1172.4353053571429, 1884.4435595238097]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [701.4712261904762, 548.577569642857, 1104.4336446428572, 1871.2739744047617, 335.7043636904762, 100.19763988095238, 1269.2594160714284, 877.4346309523809, 1172.1336160714286, 1884.7838351190478]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [701.5052464285715, 548.0653333333333, 1104.2276970238095, 1872.065505952381, 335.8537416666667, 99.66361904761905, 1269.8839488095236, 876.9246190476191, 1172.969105952381, 1884.7888035714284]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [701.6662202380952, 548.5014738095239, 1104.7231440476191, 1870.9661476190477, 336.227368452381, 100.05231190476191, 1270.0065666666667, 876.7739970238096, 1171.9467797619047, 1885.2306440476193]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [700.4460803571428, 547.2507053571429, 1103.4721125, 1870.1995160714287, 334.6387303571429, 99.22723035714287, 1268.0665166666665, 875.8494553571429, 1171.0443226190478, 1883.7223220238097]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [703.0524059523809, 550.3734648809524, 1105.5079363095238, 1872.988514285714, 339.0320113095238, 100.98883988095237, 1270.698651190476, 878.7150630952381, 1175.8299839285714, 1889.4309226190478]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [701.7527916666668, 548.2903958333333, 1105.0951351190477, 1871.6735928571427, 335.7782172619048, 99.64430238095238, 1270.2557273809525, 877.1997214285714, 1171.9990827380952, 1885.6353535714284]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [702.8295089285715, 549.0613988095238, 1106.372199404762, 1873.5126035714288, 336.592519047619, 100.62938154761906, 1270.9416642857143, 878.0681630952382, 1174.3015452380953, 1885.7894196428572]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [701.5029642857144, 545.3976422619047, 1096.3269351190477, 1847.0456642857143, 324.8145714285714, 99.93474285714287, 1249.5919517857142, 875.8250125000001, 1134.8538410714286, 1887.2784851190477]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [703.1141761904762, 545.8302660714286, 1095.0023666666666, 1848.4306160714284, 327.0680660714286, 100.28413273809524, 1251.4461285714285, 877.065243452381, 1137.1941416666668, 1888.5777083333332]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [696.5549410714286, 536.3284452380952, 1069.5996922619047, 1860.3692910714287, 329.72900535714285, 99.31518630952381, 1198.5071571428573, 874.1568029761904, 1096.253969642857, 1870.4549880952381]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [703.4875178571428, 553.3730874999999, 1111.0469940476191, 1880.5940642857142, 340.5731517857143, 101.06964047619047, 1281.8863464285716, 878.1847428571429, 1192.2621374999999, 1893.3663178571428]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [702.3766928571429, 549.2809369047619, 1105.790051190476, 1872.4919261904763, 337.72360654761906, 100.25539702380952, 1269.898888690476, 878.0042297619048, 1174.6262, 1885.8638952380952]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [702.4901910714286, 548.7879815476191, 1104.3003547619048, 1871.5647630952383, 335.95171428571433, 100.15331785714285, 1270.0570160714287, 877.6153791666667, 1172.6970833333332, 1885.578038095238]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [703.0100827380953, 549.6220494047619, 1105.4159470238096, 1876.1629833333336, 339.84573630952383, 102.39892857142857, 1271.0922077380953, 880.1687172619048, 1174.835756547619, 1887.6751029761904]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [851.039542857143, 668.0074928571428, 1162.366664285714, 2459.5348642857143, 434.8471071428571, 108.34405, 1480.4105714285718, 1063.8221785714286, 1190.6706428571429, 2281.073857142858]]}, 'all_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [25.827600000000004, 22.87028375, 21.51285769230769, 19.640465, 24.737757142857145, 26.39132142857143, 26.706848, 16.51653857142857, 28.618124999999996, 40.487975]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [20.020588571428572, 16.377869285714286, 23.4198, 19.394714285714286, 25.22905357142857, 17.485844642857142, 26.287362500000004, 13.702857142857143, 31.357532142857146, 40.242535714285715]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.740730714285714, 16.123715357142856, 23.387164285714285, 18.599160714285716, 24.773939285714288, 17.62764857142857, 26.56080964285714, 13.064926428571425, 31.55575, 40.29879285714286]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.925642857142854, 15.7156775, 21.666452142857143, 18.915657142857143, 23.728635714285712, 16.61700892857143, 24.2461525, 12.913075714285712, 30.05997857142857, 39.76018214285715]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [20.935881785714287, 16.625252142857143, 25.271614285714286, 18.920642857142855, 25.103967857142855, 18.992831071428572, 25.52504464285714, 15.216768928571426, 31.17290714285714, 41.38305]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.98323607142857, 15.757256785714286, 21.781403571428573, 18.94691428571429, 23.87169642857143, 16.55430392857143, 24.280068571428572, 12.92527142857143, 30.099264285714288, 40.05928214285715]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [14.41434625, 8.44450630952381, 20.07628648809524, 13.007823035714285, 19.304294940476193, 10.161802142857145, 16.88906613095238, 9.318258988095238, 24.45599345238095, 37.08738988095239]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [16.70281843373494, 11.987094523809523, 23.687950595238092, 17.196259107142858, 26.363856227544908, 12.877483116883118, 21.63157910714286, 11.672411547619049, 29.64520535714286, 37.065703703703704]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [23.23540714285714, 22.713878214285717, 25.319360714285715, 20.657546428571425, 25.32800357142857, 29.85982142857143, 26.341435714285712, 35.05626928571429, 32.790625000000006, 41.568307142857144]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [15.656859760479046, 11.147938154761905, 25.28820892857143, 13.992490476190477, 20.50262626506024, 11.768522272727273, 23.391484761904763, 10.819520357142856, 31.744481547619042, 32.4796509202454]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.112398988095237, 13.655250773809525, 27.42080297619048, 17.382486845238095, 28.07244524096386, 14.046721688311687, 24.96019226190476, 13.349918452380951, 33.14978869047619, 37.9327462962963]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [17.966216750000008, 14.621687901234573, 27.463408433734944, 15.043787804878049, 21.936961728395058, 12.504673506493507, 22.879941666666664, 9.550497976190476, 27.91229285714285, 39.66543414634146]]}, 'all_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.037426339880952376, 0.036070294642857145, 0.039159371428571434, 0.03720874226190476, 0.03819687857142857, 0.03258681988095238, 0.03850246071428571, 0.03584089547619048, 0.03975307452380953, 0.037579657142857145]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.03878982285714286, 0.03575829297619048, 0.053969726964285716, 0.05547161089285714, 0.03405921470238095, 0.029405947916666668, 0.05342350142857143, 0.04088982976190476, 0.05982537857142857, 0.059884696607142865]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.025547202023809525, 0.02317536035714286, 0.03631578422619047, 0.037269828690476195, 0.022085127976190475, 0.018592424940476193, 0.036153966130952384, 0.0270473719047619, 0.04390150517857143, 0.04073737928571428]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0014469357678571428, 0.0013647865773809523, 0.0015038464642857141, 0.0015738967916666667, 0.0014400568095238096, 0.0014824851964285715, 0.001620395357142857, 0.0012338026369047618, 0.0016508812023809526, 0.001491542232142857]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.2197391994047619, 0.17224765, 0.37611674464285716, 0.5554916291666666, 0.15167275595238094, 0.07283283136904761, 0.4432121559523809, 0.27679353571428567, 0.5682478607142857, 0.5624746761904762]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.001206678511904762, 0.001073044982142857, 0.0011354470892857142, 0.0013196969107142856, 0.0020975090714285714, 0.006762336172619048, 0.001298205886904762, 0.0011787746964285713, 0.001472188619047619, 0.0012019128095238094]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0013170393095238095, 0.0012514097321428572, 0.001434589125, 0.0013958494285714286, 0.001400577125, 0.001151876523809524, 0.001278529464285714, 0.0010464934047619047, 0.0013012824642857144, 0.001300186363095238]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.001463236363095238, 0.001355511494047619, 0.001356053011904762, 0.0014776481190476192, 0.0014622624880952383, 0.001345092642857143, 0.0013852385059523811, 0.0011882376488095237, 0.001551834029761905, 0.0014109479285714288]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0036901612499999994, 0.003743390714285714, 0.0037724967261904764, 0.003901033392857143, 0.003913180178571429, 0.0038117203571428576, 0.003834926964285714, 0.003729525595238096, 0.003773694226190476, 0.0038731611904761903]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00034880504761904764, 0.00035611436904761906, 0.00039565043452380956, 0.0004354477797619047, 0.0003398277916666667, 0.00032441771428571426, 0.000373580375, 0.00037778895833333337, 0.00037120447023809524, 0.0003967379642857143]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.016344854702380954, 0.01667146773809524, 0.016718104523809525, 0.01732229714285714, 0.016879313392857143, 0.016242421726190476, 0.01729291107142857, 0.01424810779761905, 0.017283040535714285, 0.015510493333333333]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.009580722559523807, 0.009027258988095237, 0.009325535238095237, 0.008785980476190476, 0.009592300476190477, 0.008919109345238097, 0.009555819940476192, 0.008669213333333333, 0.009964714880952382, 0.009423830416666668]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0014642026607142855, 0.0014621845535714283, 0.001542937488095238, 0.0015595581666666665, 0.0016499331666666665, 0.0013832961726190477, 0.001458578273809524, 0.0011577485416666667, 0.0015846442202380952, 0.0014632708095238093]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.001428655869047619, 0.001422977613095238, 0.001299417732142857, 0.0015599531845238099, 0.001593466476190476, 0.0013293539166666667, 0.0014913308928571427, 0.0011778477202380952, 0.0014935737916666667, 0.0013134321726190478]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00015478535952380952, 0.00015650205416666666, 0.00016923633452380952, 0.00015580679345238095, 0.0001331255851190476, 0.00015717926488095237, 0.00014043576250000002, 0.0001447534785714286, 0.00021530626547619047, 0.00019201980595238096]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.5730611535714286, 0.46304094166666654, 0.7785361619047619, 1.5788292595238096, 0.33402659761904757, 0.12525846726190476, 1.008021713095238, 0.7079784380952381, 0.9268341916666668, 1.5059248940476189]]}, 'all_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0018090299142857144, 0.0046072554285714286, 3.288307142857143e-06, 1.881347857142857e-05, 0.00022568660714285716, 0.03217042667857143, 1.9370317857142858e-05, 4.828892857142857e-07, 0.0, 6.5405571428571426e-06]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00034292200000000006, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [2.175452142857143e-05, 2.8060928571428573e-05, 1.64415e-06, 4.4794059523809525e-06, 7.977170238095238e-05, 0.004361603595238094, 6.566214285714285e-07, 0.0, 0.0, 8.175714285714287e-07]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [2.175452142857143e-05, 2.8060928571428573e-05, 1.64415e-06, 4.4794059523809525e-06, 7.977170238095238e-05, 0.004361603595238094, 6.566214285714285e-07, 0.0, 0.0, 8.175714285714287e-07]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.464019285714286e-05, 3.152480357142857e-05, 1.64415e-06, 4.031464285714286e-06, 6.783125e-05, 0.004336947642857142, 6.566214285714285e-07, 0.0, 0.0, 8.175714285714287e-07]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [2.175452142857143e-05, 2.8060928571428573e-05, 1.64415e-06, 4.4794059523809525e-06, 6.732315476190477e-05, 0.004373933595238095, 6.566214285714285e-07, 0.0, 0.0, 8.175714285714287e-07]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.938714285714284e-07, 9.051928571428571e-07, 0.0, 0.0, 9.145785714285714e-06, 0.00032947414285714285, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.04546784410714286, 0.054595412142857146, 1.9729857142857146e-05, 8.242103571428571e-05, 0.00713697952142857, 0.08463529, 1.4445642857142857e-05, 1.1589357142857143e-05, 0.0, 3.1067635714285716e-05]]}, 'all_struct_N': {'3DQuadric': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'PC-MLS': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], '2-Monge': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'Varifolds': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'WaveJets': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'AvgHexagram': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'ShapeOperator': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'PCA': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'ASO': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'APSS': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'Sphere': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'UnorientedSphere': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'Cov2D': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'NormCov2D': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'Mean': [['kD-Tree', 'kNN-graph'], [52206.35, 52206.35]], 'JetFitting': [['kD-Tree'], [52206.35]]}, 'all_struct_Neighbors count': {'3DQuadric': [['kD-Tree', 'kNN-graph'], [1172.3234201190476, 800.8551089285714]], 'PC-MLS': [['kD-Tree', 'kNN-graph'], [1172.2561275, 800.7978558333334]], '2-Monge': [['kD-Tree', 'kNN-graph'], [1172.3218884523808, 800.8676357142857]], 'Varifolds': [['kD-Tree', 'kNN-graph'], [1172.3584114285713, 800.8605192857143]], 'WaveJets': [['kD-Tree', 'kNN-graph'], [1170.3802120238095, 800.4031863095238]], 'AvgHexagram': [['kD-Tree', 'kNN-graph'], [1176.2067052380953, 801.1168534523811]], 'ShapeOperator': [['kD-Tree', 'kNN-graph'], [1172.6515275, 800.8133365476191]], 'PCA': [['kD-Tree', 'kNN-graph'], [1174.4119126190474, 801.2077680952382]], 'ASO': [['kD-Tree', 'kNN-graph'], [1151.9142020238096, 800.6001601190477]], 'APSS': [['kD-Tree', 'kNN-graph'], [1154.0575207142856, 800.7450484523808]], 'Sphere': [['kD-Tree', 'kNN-graph'], [1125.6590101190475, 800.5948857142856]], 'UnorientedSphere': [['kD-Tree', 'kNN-graph'], [1186.257896547619, 800.9109035714287]], 'Cov2D': [['kD-Tree', 'kNN-graph'], [1174.3965686904762, 800.8657961904761]], 'NormCov2D': [['kD-Tree', 'kNN-graph'], [1173.0255351190474, 800.8136327380952]], 'Mean': [['kD-Tree', 'kNN-graph'], [1176.5346684523809, 801.5108339285714]], 'JetFitting': [['kD-Tree'], [1170.0116971428572]]}, 'all_struct_RMSAE Normal': {'3DQuadric': [['kD-Tree', 'kNN-graph'], [22.064297913043475, 29.769090434782612]], 'PC-MLS': [['kD-Tree', 'kNN-graph'], [20.499974142857145, 26.20365742857143]], '2-Monge': [['kD-Tree', 'kNN-graph'], [20.632170714285717, 25.714356857142857]], 'Varifolds': [['kD-Tree', 'kNN-graph'], [19.902982857142856, 24.606709785714287]], 'WaveJets': [['kD-Tree', 'kNN-graph'], [21.430667, 26.39892514285714]], 'PCA': [['kD-Tree', 'kNN-graph'], [19.97844692857143, 24.673292571428572]], 'ASO': [['kD-Tree', 'kNN-graph'], [17.608435, 17.023518523809525]], 'APSS': [['kD-Tree', 'kNN-graph'], [21.47382704463209, 20.313103466183577]], 'Sphere': [['kD-Tree', 'kNN-graph'], [25.285465928571426, 31.288664999999998]], 'UnorientedSphere': [['kD-Tree', 'kNN-graph'], [19.81524599517491, 19.602365512665866]], 'Mean': [['kD-Tree', 'kNN-graph'], [22.308450156815436, 23.333898335343786]], 'JetFitting': [['kD-Tree'], [21.02178050122249]]}, 'all_struct_Timings (ms)': {'3DQuadric': [['kD-Tree', 'kNN-graph'], [0.023859290678571426, 0.05060561622619048]], 'PC-MLS': [['kD-Tree', 'kNN-graph'], [0.017742170845238096, 0.07455343369047619]], '2-Monge': [['kD-Tree', 'kNN-graph'], [0.011010688869047621, 0.05115450127380952]], 'Varifolds': [['kD-Tree', 'kNN-graph'], [0.0009986150892857142, 0.0019631107178571428]], 'WaveJets': [['kD-Tree', 'kNN-graph'], [0.33574929175, 0.3440165160714285]], 'AvgHexagram': [['kD-Tree', 'kNN-graph'], [0.002090689633333333, 0.0016584693166666665]], 'ShapeOperator': [['kD-Tree', 'kNN-graph'], [0.0009220206476190476, 0.0016535459404761904]], 'PCA': [['kD-Tree', 'kNN-graph'], [0.0010452882773809523, 0.001753924169047619]], 'ASO': [['kD-Tree', 'kNN-graph'], [0.0030043829404761903, 0.004604275178571428]], 'APSS': [['kD-Tree', 'kNN-graph'], [0.0002725598523809524, 0.0004713551285714286]], 'Sphere': [['kD-Tree', 'kNN-graph'], [0.012288445416666668, 0.020614156976190477]], 'UnorientedSphere': [['kD-Tree', 'kNN-graph'], [0.007071948023809524, 0.011496949107142858]], 'Cov2D': [['kD-Tree', 'kNN-graph'], [0.0010291031726190477, 0.0019161676380952384]], 'NormCov2D': [['kD-Tree', 'kNN-graph'], [0.0010060060488095237, 0.001815995825]], 'Mean': [['kD-Tree', 'kNN-graph'], [0.00011685615940476191, 0.00020697398142857147]], 'JetFitting': [['kD-Tree'], [0.8001511818452381]]}, 'all_struct_Non-stable ratio': {'3DQuadric': [['kD-Tree', 'kNN-graph'], [0.0036366043542857157, 0.004135574481428573]], 'PC-MLS': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], '2-Monge': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], 'Varifolds': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], 'WaveJets': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], 'AvgHexagram': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], 'ShapeOperator': [['kD-Tree', 'kNN-graph'], [3.5396685000000005e-05, 3.5396685000000005e-05]], 'PCA': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], 'ASO': [['kD-Tree', 'kNN-graph'], [0.00045000587345238086, 0.0004497518258333333]], 'APSS': [['kD-Tree', 'kNN-graph'], [0.00045000587345238086, 0.0004497518258333333]], 'Sphere': [['kD-Tree', 'kNN-graph'], [0.0004462009357142857, 0.0004494178035714285]], 'UnorientedSphere': [['kD-Tree', 'kNN-graph'], [0.00044986699488095235, 0.00044986699488095235]], 'Cov2D': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], 'NormCov2D': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], 'Mean': [['kD-Tree', 'kNN-graph'], [3.4051899285714285e-05, 3.4051899285714285e-05]], 'JetFitting': [['kD-Tree'], [0.019199477930000004]]}, 'No noise kD-Tree_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]]}, 'No noise kD-Tree_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.700849999999996, 86.88649000000001, 166.40046999999998, 268.7507, 393.2188, 547.1543, 708.9401]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.95958, 86.91285, 166.44142000000002, 272.8047, 393.1874, 538.0748, 702.8792]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.668279999999996, 86.92154000000001, 168.07785, 269.35880000000003, 393.2062, 541.1984, 705.4502]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.29806, 88.52278, 170.13927, 268.7855, 393.26980000000003, 539.9091999999999, 701.1460000000001]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.477529999999994, 87.36668, 166.35065999999998, 268.9242, 393.4198, 538.3655, 702.4372000000001]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.905280000000005, 95.17854000000001, 172.63109000000003, 268.8239, 403.19, 542.7230000000001, 706.383]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.74156, 88.26774, 168.54538000000002, 268.6587, 397.692, 538.0639000000001, 703.0308]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.722640000000006, 104.7337, 170.45325, 277.368, 407.2145, 542.2038, 716.3603999999999]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [37.24500999999999, 87.04819, 167.94342999999998, 261.99429999999995, 377.17749999999995, 510.2179, 663.6825]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.135200000000005, 86.79244000000001, 162.20209000000003, 264.0097, 379.43050000000005, 511.0556, 662.1874999999999]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.73206, 72.58806, 136.41083999999998, 232.57880999999998, 344.4651, 507.67510000000004, 675.8686]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [37.253249999999994, 95.62739, 172.96343, 282.7287, 403.27259999999995, 552.1605999999999, 718.7221]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.542199999999994, 87.00678000000002, 167.83094999999997, 268.75429999999994, 395.2079, 538.1838, 705.4457]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.49055, 92.31692000000001, 167.86353, 271.5783, 393.3321, 538.1219, 706.2643]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.73576, 86.93853, 168.51588999999996, 294.2791, 432.65440000000007, 556.8473, 701.5323999999999]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.66178, 86.86998, 166.34331000000003, 268.59749999999997, 393.14480000000003, 537.9916000000001, 701.1059000000001]]}, 'No noise kD-Tree_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [28.017719999999997, 24.454133333333335, 24.317333333333334, 25.1524, 26.767428571428574, 27.944585714285715, 27.496437500000003]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.721266999999997, 15.1454, 17.186738, 19.304721, 21.073445999999997, 22.6616, 24.18694]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.851977, 15.260656, 17.283575000000003, 19.487469999999995, 21.182869, 22.61095, 24.140590000000003]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.108135999999998, 15.085275999999999, 17.292838, 19.452840000000002, 21.40248, 23.084249999999997, 24.66279]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.185525, 15.839237, 18.074574000000002, 20.139264999999998, 22.21747, 24.0315, 25.29166]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.634305000000001, 15.254266999999999, 17.401201, 19.55193, 21.487109999999998, 23.13278, 24.692339999999998]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [8.069063000000002, 13.701742999999999, 15.061583000000002, 17.283052, 19.247172, 20.958016999999998, 22.89582]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [10.19558125, 14.96006857142857, 19.25349625, 24.601866666666666, 27.186644444444443, 29.51186666666667, 31.453400000000002]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.373520000000003, 29.68843, 29.588969999999996, 29.24189, 29.660050000000002, 29.13121, 29.04298]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [9.649572857142859, 14.60109875, 18.234575000000003, 22.487692222222222, 23.852632222222226, 24.902555555555555, 25.854933333333335]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [11.086087142857142, 15.228327499999999, 19.19173625, 24.483511111111113, 27.168666666666667, 29.93887777777778, 32.23095555555555]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18.194098333333333, 18.925731, 20.212764, 21.000010000000003, 22.754665, 23.9467, 25.359730000000003]]}, 'No noise kD-Tree_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.01270521, 0.01939164, 0.02168851, 0.02169664, 0.02928257, 0.033600809999999995, 0.032020520000000004]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.01839895, 0.01955352, 0.013231899, 0.015707117, 0.02014669, 0.02309188, 0.01775049]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.013700749000000002, 0.01048626, 0.014118767, 0.015364329999999999, 0.014962070000000003, 0.014368639999999998, 0.015088575000000002]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0006603908, 0.0010059702, 0.0008457698999999999, 0.0008647346, 0.0016614364, 0.001015983, 0.0015038927]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.030146890000000003, 0.051766690000000004, 0.05908012999999999, 0.11022632000000002, 0.16176616, 0.28180703, 0.38537699999999997]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0049111458, 0.0026960036999999996, 0.0026435752, 0.0016663619000000002, 0.0035476524999999994, 0.0027536032000000004, 0.0013258520000000002]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008587621, 0.0009908736, 0.0011794579000000002, 0.0013271709999999998, 0.0013825673, 0.0014325044, 0.0017393568]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0012865987000000001, 0.0007967642, 0.0011852986000000002, 0.0015589623999999998, 0.0012097248, 0.0011597965, 0.0013820711]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.002884009, 0.0037408009999999998, 0.0039084689999999995, 0.0036856470000000002, 0.004305003999999999, 0.00418786, 0.003918971]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00018793880000000002, 0.00042541920000000003, 0.0005059035999999999, 0.00036018880000000006, 0.0003135615, 0.00037435489999999996, 0.00035240650000000005]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.014241319999999998, 0.016399169999999998, 0.017760039999999998, 0.01800705, 0.011948205, 0.01925999, 0.018984189]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005963813, 0.006274750999999999, 0.008232231, 0.009250366999999999, 0.007241931, 0.006879697, 0.009243277999999999]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0009160118000000002, 0.0009781077, 0.0013915143, 0.0011344437999999998, 0.0013115781, 0.0014807238, 0.0007790294999999999]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0009069691999999999, 0.0012571874, 0.0013120769, 0.0008564884999999999, 0.0012618863000000001, 0.0017845815, 0.0011831569000000002]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [6.408899e-05, 9.001522e-05, 7.368133999999998e-05, 0.00013267085, 9.123852999999999e-05, 0.00017091526, 0.00019578892]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.07828078000000001, 0.15460702999999998, 0.2328513, 0.35074900000000003, 0.41951, 0.5555194, 0.711154]]}, 'No noise kD-Tree_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0088535144, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.18448931000000002, 2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'No noise kD-Tree_Noise normal_N': {'3DQuadric': [[0.0], [18327.1]], 'PC-MLS': [[0.0], [18327.1]], '2-Monge': [[0.0], [18327.1]], 'Varifolds': [[0.0], [18327.1]], 'WaveJets': [[0.0], [18327.1]], 'AvgHexagram': [[0.0], [18327.1]], 'ShapeOperator': [[0.0], [18327.1]], 'PCA': [[0.0], [18327.1]], 'ASO': [[0.0], [18327.1]], 'APSS': [[0.0], [18327.1]], 'Sphere': [[0.0], [18327.1]], 'UnorientedSphere': [[0.0], [18327.1]], 'Cov2D': [[0.0], [18327.1]], 'NormCov2D': [[0.0], [18327.1]], 'Mean': [[0.0], [18327.1]], 'JetFitting': [[0.0], [18327.1]]}, 'No noise kD-Tree_Noise normal_Neighbors count': {'3DQuadric': [[0.0], [315.00738714285717]], 'PC-MLS': [[0.0], [313.7514214285714]], '2-Monge': [[0.0], [313.98303857142855]], 'Varifolds': [[0.0], [313.7243728571428]], 'WaveJets': [[0.0], [313.04879571428575]], 'AvgHexagram': [[0.0], [317.6906871428572]], 'ShapeOperator': [[0.0], [313.85715428571433]], 'PCA': [[0.0], [321.7223271428571]], 'ASO': [[0.0], [300.7584042857143]], 'APSS': [[0.0], [299.97328999999996]], 'Sphere': [[0.0], [285.75979571428576]], 'UnorientedSphere': [[0.0], [323.2468671428571]], 'Cov2D': [[0.0], [313.85309]], 'NormCov2D': [[0.0], [314.99537142857145]], 'Mean': [[0.0], [324.92905428571424]], 'JetFitting': [[0.0], [312.5306957142857]]}, 'No noise kD-Tree_Noise normal_RMSAE Normal': {'3DQuadric': [[0.0], [26.368608888888886]], 'PC-MLS': [[0.0], [19.182873142857144]], '2-Monge': [[0.0], [19.259726714285716]], 'Varifolds': [[0.0], [19.298372857142862]], 'WaveJets': [[0.0], [20.25417585714286]], 'PCA': [[0.0], [19.450561857142855]], 'ASO': [[0.0], [16.74520714285714]], 'APSS': [[0.0], [22.96774745762712]], 'Sphere': [[0.0], [29.675292857142857]], 'UnorientedSphere': [[0.0], [20.408690169491532]], 'Mean': [[0.0], [23.34510542372881]], 'JetFitting': [[0.0], [21.68425136363636]]}, 'No noise kD-Tree_Noise normal_Timings (ms)': {'3DQuadric': [[0.0], [0.024340842857142858]], 'PC-MLS': [[0.0], [0.01826864942857143]], '2-Monge': [[0.0], [0.014012770142857142]], 'Varifolds': [[0.0], [0.0010797396571428572]], 'WaveJets': [[0.0], [0.15431003142857141]], 'AvgHexagram': [[0.0], [0.0027920277571428574]], 'ShapeOperator': [[0.0], [0.001272956157142857]], 'PCA': [[0.0], [0.0012256023285714289]], 'ASO': [[0.0], [0.0038043944285714284]], 'APSS': [[0.0], [0.00035996761428571435]], 'Sphere': [[0.0], [0.01665713771428572]], 'UnorientedSphere': [[0.0], [0.007583724000000001]], 'Cov2D': [[0.0], [0.0011416298571428572]], 'NormCov2D': [[0.0], [0.001223192385714286]], 'Mean': [[0.0], [0.00011691415857142857]], 'JetFitting': [[0.0], [0.35752450142857145]]}, 'No noise kD-Tree_Noise normal_Non-stable ratio': {'3DQuadric': [[0.0], [0.0012647877714285713]], 'PC-MLS': [[0.0], [0.0]], '2-Monge': [[0.0], [0.0]], 'Varifolds': [[0.0], [0.0]], 'WaveJets': [[0.0], [0.0]], 'AvgHexagram': [[0.0], [0.0]], 'ShapeOperator': [[0.0], [0.0]], 'PCA': [[0.0], [0.0]], 'ASO': [[0.0], [3.0588714285714285e-06]], 'APSS': [[0.0], [3.0588714285714285e-06]], 'Sphere': [[0.0], [3.0588714285714285e-06]], 'UnorientedSphere': [[0.0], [3.0588714285714285e-06]], 'Cov2D': [[0.0], [0.0]], 'NormCov2D': [[0.0], [0.0]], 'Mean': [[0.0], [0.0]], 'JetFitting': [[0.0], [0.026358674585714288]]}, 'No noise kD-Tree_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]]}, 'No noise kD-Tree_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [128.94452857142858, 148.07031428571426, 252.47307142857144, 361.5269714285714, 196.05391428571428, 122.89508571428573, 439.76744285714284, 203.1757142857143, 941.9946285714286, 355.17220000000003]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [127.75491428571429, 148.81844285714286, 252.3190285714286, 360.85041428571424, 196.3333714285714, 122.95431428571429, 429.6700142857143, 201.0280285714286, 943.2920000000001, 354.4936857142857]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.43324285714286, 150.75015714285715, 252.3310857142857, 360.47818571428576, 196.53675714285714, 122.94001428571427, 433.51988571428575, 201.12622857142858, 941.8597857142857, 356.85504285714285]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [124.76662857142856, 148.0991, 256.33092857142856, 355.92088571428576, 196.11831428571426, 122.98401428571427, 429.7483428571428, 204.2601714285714, 941.9380428571429, 357.0773]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [124.48581428571427, 148.73605714285713, 252.29681428571425, 355.8623571428571, 196.47039999999998, 124.0713, 430.0432428571429, 201.4908714285714, 942.6235285714286, 354.40757142857143]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.60024285714287, 152.33665714285715, 252.56228571428574, 356.2774857142857, 196.9095142857143, 122.98075714285714, 429.8802428571429, 211.38284285714286, 973.4383, 357.5385428571429]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.48421428571429, 148.1274142857143, 252.38918571428573, 357.8098428571429, 198.97535714285712, 122.9292857142857, 429.7319857142857, 207.1605142857143, 941.9329571428572, 356.0307857142857]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [147.59975714285716, 148.18608571428572, 268.4543428571429, 386.82827142857144, 196.10901428571427, 122.99184285714286, 435.7832142857143, 202.57500000000002, 954.2088285714286, 354.4869142857143]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [126.70387142857143, 146.43637142857142, 247.85314285714284, 330.29715714285715, 180.19972857142855, 129.09837142857143, 414.3507142857143, 202.89255714285716, 874.1324285714287, 355.6197]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.96671428571429, 143.0273, 247.9464857142857, 333.72135714285713, 176.9763857142857, 127.60369999999999, 414.6387571428572, 202.32481428571427, 873.7425999999999, 355.7847857142857]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.13048571428571, 124.38538571428572, 218.90555714285716, 347.6805428571429, 192.39485714285715, 124.77541428571429, 351.0806714285714, 205.6868, 824.4693714285714, 346.0888714285714]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [131.53214285714284, 154.34560000000002, 259.6442571428571, 363.6959142857143, 214.34674285714286, 123.81697142857145, 444.38417142857145, 206.3662, 977.2394285714287, 357.0972428571428]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [126.2449857142857, 149.27135714285714, 252.42820000000003, 355.9481, 202.0633714285714, 123.82867142857143, 430.9578428571429, 201.17092857142856, 941.9744571428572, 354.6429857142857]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.51138571428571, 148.13202857142855, 252.4574142857143, 359.5450285714286, 196.16237142857145, 130.08302857142857, 429.8145142857143, 208.54577142857144, 945.0841428571429, 356.61802857142857]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.53475714285716, 151.01918571428573, 252.5919428571429, 400.9588857142857, 214.10215714285715, 123.12532857142857, 429.9792714285714, 210.95327142857144, 964.4006857142857, 378.62505714285714]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.40822857142858, 148.04184285714288, 252.29647142857144, 355.8573, 195.99067142857143, 122.88451428571429, 429.6451428571428, 201.01864285714285, 941.7628571428571, 354.40128571428573]]}, 'No noise kD-Tree_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [28.20957142857143, 15.3572, 20.772333333333336, 13.919385714285713, 20.037085714285716, -1, 32.1703, -1, 31.275457142857142, 42.28497142857144]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.10277142857143, 9.686401428571429, 18.46517142857143, 14.18732857142857, 18.691971428571428, 8.927004285714286, 21.678797142857142, 8.417028571428572, 33.083414285714284, 39.588842857142865]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.16164285714286, 9.770704285714286, 18.36337142857143, 14.234742857142857, 18.830700000000004, 8.910408571428572, 22.055757142857143, 8.351011428571429, 33.29555714285715, 39.62337142857143]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.97852857142857, 9.739635714285713, 18.14300857142857, 14.039414285714287, 18.2053, 9.713531428571429, 21.73952142857143, 10.00546, 32.66014285714286, 39.759185714285714]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [20.580728571428573, 10.075294285714287, 21.864142857142856, 14.161642857142857, 19.080514285714283, 11.30697142857143, 22.123338571428572, 9.087225714285713, 32.902471428571424, 41.35942857142857]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.0941, 9.809554285714285, 18.367785714285713, 14.101485714285715, 18.459471428571426, 9.746157142857143, 21.804772857142858, 10.025719999999998, 32.72098571428571, 40.37558571428571]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [17.539155714285716, 6.7298228571428576, 18.012594285714282, 13.12119857142857, 17.809608571428573, 7.7079757142857135, 14.914972857142857, 8.467114285714286, 25.044199999999996, 38.10542857142856]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [21.463683333333336, 12.632894285714285, 22.595142857142857, 24.026271428571423, 28.091552857142858, -1, 21.421207142857146, 11.320945714285713, 31.079371428571427, 42.035825]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [25.729285714285716, 22.98237142857143, 23.976914285714287, 17.169842857142857, 20.436071428571427, 34.18281428571429, 25.45467142857143, 48.90927142857144, 35.34858571428571, 42.563100000000006]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.37864285714286, 10.132821428571427, 24.998357142857145, 14.336594285714288, 20.116566666666667, -1, 22.23506857142857, 7.815004285714286, 33.29407142857142, 39.51985]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [21.535185714285717, 12.464979999999999, 24.468700000000002, 18.770485714285712, 32.039433333333335, -1, 22.775171428571433, 12.11378, 33.077214285714284, 42.171499999999995]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [22.886049999999997, 17.529066666666665, 29.892771428571425, 16.800571428571427, 18.567783333333335, 8.930975, 23.164357142857146, 8.829448571428571, 29.020657142857146, 38.53181428571428]]}, 'No noise kD-Tree_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.02486642857142857, 0.025639142857142857, 0.020554985714285715, 0.02617965714285714, 0.025897114285714284, 0.02317702857142857, 0.025990985714285708, 0.021756442857142854, 0.024505257142857145, 0.024841385714285714]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.019109885714285714, 0.018999824285714284, 0.01631064857142857, 0.017916657142857142, 0.016886655714285714, 0.0165477, 0.01961788, 0.018000214285714283, 0.020669914285714287, 0.018627114285714286]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.014836685714285714, 0.014804985714285715, 0.012677972857142856, 0.013176292857142858, 0.01616657142857143, 0.012024442857142856, 0.013850228571428569, 0.012786707142857142, 0.014766657142857144, 0.015037157142857142]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0009593762857142857, 0.0011240948571428573, 0.0017957502857142858, 0.0008679762857142857, 0.0010462727142857141, 0.0008578290000000001, 0.0009020130000000001, 0.0007489562857142857, 0.001002706142857143, 0.0014924217142857142]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.06304994285714285, 0.06585695714285715, 0.11495792857142859, 0.16300117142857143, 0.10215965714285714, 0.06941898571428572, 0.21811585714285714, 0.0957434, 0.48554057142857143, 0.16525584285714287]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0008763944285714284, 0.0009659182857142855, 0.0007343354285714286, 0.001207931857142857, 0.019531259999999998, 0.0007714372857142859, 0.0007372052857142858, 0.0006290648571428572, 0.0014207820000000002, 0.0010459481428571429]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0009561391428571427, 0.0011481111428571428, 0.0017326247142857142, 0.001597545857142857, 0.0010407685714285716, 0.0010261054285714286, 0.0010134261428571428, 0.0006194405714285714, 0.0015787199999999998, 0.00201668]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0012617361428571428, 0.0009578375714285715, 0.0020622895714285717, 0.0014043567142857144, 0.0011735537142857143, 0.0010272375714285714, 0.0012424655714285712, 0.0009480865714285716, 0.001275140428571429, 0.0009033194285714286]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0029770357142857137, 0.00349688, 0.0036379271428571428, 0.00314016, 0.004035198571428571, 0.0036990028571428574, 0.004270844285714286, 0.003708605714285714, 0.004109012857142857, 0.004969277142857143]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.000226699, 0.0003131242857142857, 0.0001444107142857143, 0.0003177044285714286, 0.00036784499999999995, 0.00021592200000000004, 0.0008297271428571428, 0.0004549628571428572, 0.000353885, 0.00037539571428571434]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.01635874857142857, 0.01786434285714286, 0.014641105714285714, 0.018546057142857144, 0.016360864285714285, 0.014733457142857143, 0.018261131428571425, 0.014643242857142856, 0.018243271428571427, 0.016919155714285712]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.008897848571428571, 0.006956824285714286, 0.0059856485714285725, 0.007249105714285714, 0.008469719999999998, 0.006244645714285715, 0.009165985714285715, 0.003915092857142857, 0.009275888571428569, 0.00967648]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0012697272857142858, 0.0012687297142857143, 0.0008043957142857142, 0.0013212532857142857, 0.0012885415714285714, 0.0011890368571428572, 0.001123787, 0.0006893644285714286, 0.001269510714285714, 0.001191952]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0009254992857142859, 0.0014949807142857143, 0.0007161611428571428, 0.0013928370000000003, 0.001466175857142857, 0.0013938705714285713, 0.0017375022857142857, 0.001000519, 0.000919963857142857, 0.001184414142857143]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00010808862857142856, 0.00023587855714285715, 6.364272857142857e-05, 0.00015403924285714286, 0.00012783224285714285, 0.00012155428571428571, 6.480222857142857e-05, 7.699205714285715e-05, 0.00015385620000000003, 6.245541428571429e-05]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.18561215714285714, 0.20387905714285712, 0.3007482571428572, 0.3781133, 0.25442421428571427, 0.1670487, 0.4562424285714286, 0.24266975714285716, 0.9919235714285713, 0.3945835714285714]]}, 'No noise kD-Tree_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.003555942857142857, 0.009040714285714286, 0.0, 0.0, 2.4979428571428572e-05, 2.6241142857142855e-05, 0.0, 0.0, 0.0, 0.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.09055801728571429, 0.10845400000000001, 0.0, 0.0, 0.01325572857142857, 0.051319000000000004, 0.0, 0.0, 0.0, 0.0]]}, 'No noise kD-Tree_struct_N': {'3DQuadric': [['kD-Tree'], [18327.1]], 'PC-MLS': [['kD-Tree'], [18327.1]], '2-Monge': [['kD-Tree'], [18327.1]], 'Varifolds': [['kD-Tree'], [18327.1]], 'WaveJets': [['kD-Tree'], [18327.1]], 'AvgHexagram': [['kD-Tree'], [18327.1]], 'ShapeOperator': [['kD-Tree'], [18327.1]], 'PCA': [['kD-Tree'], [18327.1]], 'ASO': [['kD-Tree'], [18327.1]], 'APSS': [['kD-Tree'], [18327.1]], 'Sphere': [['kD-Tree'], [18327.1]], 'UnorientedSphere': [['kD-Tree'], [18327.1]], 'Cov2D': [['kD-Tree'], [18327.1]], 'NormCov2D': [['kD-Tree'], [18327.1]], 'Mean': [['kD-Tree'], [18327.1]], 'JetFitting': [['kD-Tree'], [18327.1]]}, 'No noise kD-Tree_struct_Neighbors count': {'3DQuadric': [['kD-Tree'], [315.00738714285717]], 'PC-MLS': [['kD-Tree'], [313.7514214285714]], '2-Monge': [['kD-Tree'], [313.98303857142855]], 'Varifolds': [['kD-Tree'], [313.7243728571428]], 'WaveJets': [['kD-Tree'], [313.04879571428575]], 'AvgHexagram': [['kD-Tree'], [317.6906871428572]], 'ShapeOperator': [['kD-Tree'], [313.85715428571433]], 'PCA': [['kD-Tree'], [321.7223271428571]], 'ASO': [['kD-Tree'], [300.7584042857143]], 'APSS': [['kD-Tree'], [299.97328999999996]], 'Sphere': [['kD-Tree'], [285.75979571428576]], 'UnorientedSphere': [['kD-Tree'], [323.2468671428571]], 'Cov2D': [['kD-Tree'], [313.85309]], 'NormCov2D': [['kD-Tree'], [314.99537142857145]], 'Mean': [['kD-Tree'], [324.92905428571424]], 'JetFitting': [['kD-Tree'], [312.5306957142857]]}, 'No noise kD-Tree_struct_RMSAE Normal': {'3DQuadric': [['kD-Tree'], [26.368608888888886]], 'PC-MLS': [['kD-Tree'], [19.182873142857144]], '2-Monge': [['kD-Tree'], [19.259726714285716]], 'Varifolds': [['kD-Tree'], [19.298372857142862]], 'WaveJets': [['kD-Tree'], [20.25417585714286]], 'PCA': [['kD-Tree'], [19.450561857142855]], 'ASO': [['kD-Tree'], [16.74520714285714]], 'APSS': [['kD-Tree'], [22.96774745762712]], 'Sphere': [['kD-Tree'], [29.675292857142857]], 'UnorientedSphere': [['kD-Tree'], [20.408690169491532]], 'Mean': [['kD-Tree'], [23.34510542372881]], 'JetFitting': [['kD-Tree'], [21.68425136363636]]}, 'No noise kD-Tree_struct_Timings (ms)': {'3DQuadric': [['kD-Tree'], [0.024340842857142858]], 'PC-MLS': [['kD-Tree'], [0.01826864942857143]], '2-Monge': [['kD-Tree'], [0.014012770142857142]], 'Varifolds': [['kD-Tree'], [0.0010797396571428572]], 'WaveJets': [['kD-Tree'], [0.15431003142857141]], 'AvgHexagram': [['kD-Tree'], [0.0027920277571428574]], 'ShapeOperator': [['kD-Tree'], [0.001272956157142857]], 'PCA': [['kD-Tree'], [0.0012256023285714289]], 'ASO': [['kD-Tree'], [0.0038043944285714284]], 'APSS': [['kD-Tree'], [0.00035996761428571435]], 'Sphere': [['kD-Tree'], [0.01665713771428572]], 'UnorientedSphere': [['kD-Tree'], [0.007583724000000001]], 'Cov2D': [['kD-Tree'], [0.0011416298571428572]], 'NormCov2D': [['kD-Tree'], [0.001223192385714286]], 'Mean': [['kD-Tree'], [0.00011691415857142857]], 'JetFitting': [['kD-Tree'], [0.35752450142857145]]}, 'No noise kD-Tree_struct_Non-stable ratio': {'3DQuadric': [['kD-Tree'], [0.0012647877714285713]], 'PC-MLS': [['kD-Tree'], [0.0]], '2-Monge': [['kD-Tree'], [0.0]], 'Varifolds': [['kD-Tree'], [0.0]], 'WaveJets': [['kD-Tree'], [0.0]], 'AvgHexagram': [['kD-Tree'], [0.0]], 'ShapeOperator': [['kD-Tree'], [0.0]], 'PCA': [['kD-Tree'], [0.0]], 'ASO': [['kD-Tree'], [3.0588714285714285e-06]], 'APSS': [['kD-Tree'], [3.0588714285714285e-06]], 'Sphere': [['kD-Tree'], [3.0588714285714285e-06]], 'UnorientedSphere': [['kD-Tree'], [3.0588714285714285e-06]], 'Cov2D': [['kD-Tree'], [0.0]], 'NormCov2D': [['kD-Tree'], [0.0]], 'Mean': [['kD-Tree'], [0.0]], 'JetFitting': [['kD-Tree'], [0.026358674585714288]]}, 'Helios kD-Tree_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]]}, 'Helios kD-Tree_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [278.79949999999997, 645.29951, 1150.11239, 1791.7283000000002, 2549.2687, 3421.9952000000003, 4374.000300000001]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [278.32070999999996, 641.6238700000001, 1150.2454700000003, 1795.8861000000002, 2547.9658, 3419.3762, 4373.517699999999]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [277.66288999999995, 643.33404, 1148.2317, 1792.58658, 2546.1043, 3417.9437, 4374.471100000001]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [277.00532, 644.5636000000001, 1150.76368, 1793.63148, 2548.5942, 3419.1859000000004, 4377.1063]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [276.81475, 641.8905699999999, 1147.93079, 1791.5472300000001, 2545.5236, 3417.9622000000004, 4372.8182]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [278.18534999999997, 644.3697999999999, 1155.78579, 1800.6175699999997, 2549.8057, 3422.6431, 4378.447900000001]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [277.90799000000004, 644.32082, 1149.9857900000002, 1793.05402, 2546.656, 3422.2034999999996, 4375.3936]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [277.23294, 643.7348300000001, 1151.9561, 1791.7336199999997, 2546.7575000000006, 3420.4255000000003, 4380.4312]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [278.3224, 637.8182300000001, 1139.2617, 1769.79742, 2513.6636000000003, 3368.9357999999993, 4314.7835000000005]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [281.56039, 648.6764000000001, 1140.91852, 1775.9011499999997, 2515.9089, 3371.9482000000003, 4316.255]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [273.38384, 623.65562, 1105.0373800000002, 1727.7218100000002, 2458.36, 3307.4066, 4267.151900000001]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [280.03794, 649.4126400000001, 1163.5800999999997, 1815.1191299999998, 2574.097, 3445.2792999999997, 4402.9486]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [282.00733, 646.76987, 1148.00517, 1794.20703, 2548.517, 3420.4494, 4384.3054]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [287.42810999999995, 643.68304, 1151.44848, 1792.4470800000004, 2547.5243, 3418.936, 4373.955400000001]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [288.85208, 643.97872, 1160.45799, 1798.3017599999998, 2551.1279999999997, 3423.1087999999995, 4378.9703]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [276.80526999999995, 641.4544500000001, 1147.5894099999998, 1791.2408600000003, 2545.1965, 3417.6195999999995, 4372.5428]]}, 'Helios kD-Tree_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.250003, 15.966919, 17.52967, 19.252345, 20.935622, 21.972842, 23.173285]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.233438, 18.182138000000002, 20.08074, 21.666890000000002, 23.48422, 25.414170000000002, 26.65793]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.340049, 18.336824, 20.295619999999996, 21.849, 23.68581, 25.65539, 26.86961]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.105377999999998, 16.887082999999997, 19.077469, 20.564300000000003, 21.87264, 23.838770000000004, 25.20751]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18.813567, 19.057679999999998, 21.227030000000003, 22.55929, 23.81919, 25.683500000000002, 27.089850000000002]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.138413, 16.890956, 19.067835, 20.55019, 21.862589999999997, 23.830510000000004, 25.20383]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.419564, 15.737991, 16.700769, 18.70868, 20.105749999999997, 21.53501, 22.706899999999997]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.616558000000001, 16.514474999999997, 18.710079999999998, 20.710330000000003, 22.432290000000002, 23.85707, 25.063600000000005]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.064853, 17.58163, 19.44348, 20.98912, 22.53258, 24.0922, 25.56561]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.437569, 16.132167000000003, 18.28476, 20.25272, 21.95234, 23.22901, 24.36949]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.347817999999998, 17.34073, 19.81204, 21.83784, 23.76208, 25.468359999999997, 26.620870000000004]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.823223333333333, 18.144550000000002, 21.63448875, 21.258577777777777, 21.683922222222222, 22.717244444444443, 22.63895]]}, 'Helios kD-Tree_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.023156857, 0.030123730000000005, 0.019936139999999998, 0.02525446, 0.02467369, 0.020561959999999997, 0.02541474]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.019181860000000002, 0.012377561, 0.01852632, 0.017432089999999997, 0.01979336, 0.01663156, 0.01542884]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.008169599, 0.007173720999999999, 0.006907554000000001, 0.006127632, 0.008589926000000001, 0.008103107, 0.009345547999999999]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008353411, 0.0007802449999999999, 0.0009714302000000003, 0.0009844215999999999, 0.001017769, 0.0007592412, 0.0008698584000000001]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.084515139, 0.19961354999999997, 0.27150039, 0.41258385000000003, 0.59344191, 0.87696872, 1.19187505]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.017950363900000002, 0.0005197365999999999, 0.0005252843, 0.0005333981, 0.0007971934, 0.0006663488, 0.0006734531]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008905009, 0.0008296106999999999, 0.0006983086, 0.0006789973000000001, 0.0006332849999999999, 0.0008007812000000002, 0.0007797946000000001]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0005912353000000001, 0.0007062423, 0.0006295875, 0.0005854864, 0.0009557137, 0.0009468511000000001, 0.0009266761]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0023023899999999996, 0.0022698450000000004, 0.0019381580000000002, 0.002018758, 0.002143368, 0.0021162439999999998, 0.002541053]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0001872757, 0.00024736349999999996, 0.0001677248, 0.0001763272, 0.00018692409999999997, 0.0002125249, 0.00021500030000000002]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.009048602999999999, 0.007372217, 0.007281267999999999, 0.007947721000000001, 0.009026919999999999, 0.009260504, 0.008045295]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.003523089, 0.005215948, 0.0037408959999999996, 0.005298133, 0.005253684, 0.00408934, 0.00464024]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0009828776999999999, 0.0005684174000000001, 0.000614658, 0.0009364460999999999, 0.0009115926, 0.0006508108, 0.0010687729999999999]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008807957999999999, 0.0006483616, 0.0008651770999999999, 0.0007076438, 0.0008109587, 0.0007715434, 0.0008942182000000002]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [9.444639e-05, 6.513145e-05, 6.80122e-05, 9.403018e-05, 9.37305e-05, 8.123576e-05, 7.83988e-05]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.24696853000000002, 0.37910253000000005, 0.6568834699999999, 1.0115607, 1.4563188200000001, 1.9481095, 2.4976416]]}, 'Helios kD-Tree_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.041198271960000005, 0.0004935463, 0.00016944399999999999, 6.58948e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00029786879, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00576609026, 0.00020408605, 0.00011296200000000001, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00576609026, 0.00020408605, 0.00011296200000000001, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0057200822499999995, 0.00020408605, 0.00011296200000000001, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00575630396, 0.00021350005, 0.000122376, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.07832102210000001, 0.005216043930000001, 0.00047190989000000003, 0.00013179, 5.6481200000000004e-05, 5.6481200000000004e-05, 2.8240600000000002e-05]]}, 'Helios kD-Tree_Noise normal_N': {'3DQuadric': [[0.0], [86085.6]], 'PC-MLS': [[0.0], [86085.6]], '2-Monge': [[0.0], [86085.6]], 'Varifolds': [[0.0], [86085.6]], 'WaveJets': [[0.0], [86085.6]], 'AvgHexagram': [[0.0], [86085.6]], 'ShapeOperator': [[0.0], [86085.6]], 'PCA': [[0.0], [86085.6]], 'ASO': [[0.0], [86085.6]], 'APSS': [[0.0], [86085.6]], 'Sphere': [[0.0], [86085.6]], 'UnorientedSphere': [[0.0], [86085.6]], 'Cov2D': [[0.0], [86085.6]], 'NormCov2D': [[0.0], [86085.6]], 'Mean': [[0.0], [86085.6]], 'JetFitting': [[0.0], [86085.6]]}, 'Helios kD-Tree_Noise normal_Neighbors count': {'3DQuadric': [[0.0], [2030.171985714286]], 'PC-MLS': [[0.0], [2029.5622642857147]], '2-Monge': [[0.0], [2028.6191871428566]], 'Varifolds': [[0.0], [2030.1214971428572]], 'WaveJets': [[0.0], [2027.7839057142855]], 'AvgHexagram': [[0.0], [2032.8364585714282]], 'ShapeOperator': [[0.0], [2029.9316742857145]], 'PCA': [[0.0], [2030.324527142857]], 'ASO': [[0.0], [2003.2260928571425]], 'APSS': [[0.0], [2007.3097942857141]], 'Sphere': [[0.0], [1966.1024500000003]], 'UnorientedSphere': [[0.0], [2047.210672857143]], 'Cov2D': [[0.0], [2032.0373142857138]], 'NormCov2D': [[0.0], [2030.7746300000003]], 'Mean': [[0.0], [2034.971092857142]], 'JetFitting': [[0.0], [2027.4926985714285]]}, 'Helios kD-Tree_Noise normal_RMSAE Normal': {'3DQuadric': [[0.0], [19.29724085714286]], 'PC-MLS': [[0.0], [21.817075142857146]], '2-Monge': [[0.0], [22.004614714285715]], 'Varifolds': [[0.0], [20.50759285714285]], 'WaveJets': [[0.0], [22.607158142857145]], 'PCA': [[0.0], [20.506331999999997]], 'ASO': [[0.0], [18.273523428571426]], 'APSS': [[0.0], [20.272057571428572]], 'Sphere': [[0.0], [20.895639000000003]], 'UnorientedSphere': [[0.0], [19.808293714285714]], 'Mean': [[0.0], [21.31281971428571]], 'JetFitting': [[0.0], [21.181749615384618]]}, 'Helios kD-Tree_Noise normal_Timings (ms)': {'3DQuadric': [[0.0], [0.024160225285714286]], 'PC-MLS': [[0.0], [0.017053084428571428]], '2-Monge': [[0.0], [0.0077738695714285695]], 'Varifolds': [[0.0], [0.0008883295]], 'WaveJets': [[0.0], [0.5186426584285714]], 'AvgHexagram': [[0.0], [0.003095111171428571]], 'ShapeOperator': [[0.0], [0.0007587540428571428]], 'PCA': [[0.0], [0.0007631132]], 'ASO': [[0.0], [0.002189973714285714]], 'APSS': [[0.0], [0.00019902007142857142]], 'Sphere': [[0.0], [0.008283218285714286]], 'UnorientedSphere': [[0.0], [0.004537332857142857]], 'Cov2D': [[0.0], [0.0008190822285714284]], 'NormCov2D': [[0.0], [0.0007969569428571428]], 'Mean': [[0.0], [8.21407542857143e-05]], 'JetFitting': [[0.0], [1.1709407357142858]]}, 'Helios kD-Tree_Noise normal_Non-stable ratio': {'3DQuadric': [[0.0], [0.006008420937142858]], 'PC-MLS': [[0.0], [6.810379857142857e-05]], '2-Monge': [[0.0], [6.810379857142857e-05]], 'Varifolds': [[0.0], [6.810379857142857e-05]], 'WaveJets': [[0.0], [6.810379857142857e-05]], 'AvgHexagram': [[0.0], [6.810379857142857e-05]], 'ShapeOperator': [[0.0], [7.079337000000001e-05]], 'PCA': [[0.0], [6.810379857142857e-05]], 'ASO': [[0.0], [0.0008959155728571427]], 'APSS': [[0.0], [0.0008959155728571427]], 'Sphere': [[0.0], [0.000889343]], 'UnorientedSphere': [[0.0], [0.0008972072442857143]], 'Cov2D': [[0.0], [6.810379857142857e-05]], 'NormCov2D': [[0.0], [6.810379857142857e-05]], 'Mean': [[0.0], [6.810379857142857e-05]], 'JetFitting': [[0.0], [0.012040281274285716]]}, 'Helios kD-Tree_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]]}, 'Helios kD-Tree_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1581.6064285714285, 1188.1448571428573, 2078.199714285714, 4566.635, 675.6421, 93.84218571428572, 2537.3067142857144, 1930.5401428571427, 1441.626, 4208.176714285714]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1580.8974285714287, 1189.854857142857, 2073.0941428571427, 4565.5224285714285, 676.6658857142858, 95.33304285714287, 2533.749714285714, 1929.4214285714286, 1441.7671428571427, 4209.3165714285715]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1580.7578571428571, 1190.9958571428572, 2072.692857142857, 4564.811000000001, 674.6454142857143, 93.85531428571429, 2532.3920000000003, 1927.6185714285712, 1439.7677142857142, 4208.655285714286]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1580.4234285714285, 1192.139, 2076.1954285714287, 4565.214, 678.0912142857143, 93.88547142857144, 2533.6708571428576, 1928.488714285714, 1439.7518571428573, 4213.3550000000005]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1578.7527142857143, 1188.2531428571426, 2072.4995714285715, 4563.458571428571, 674.1039285714286, 93.81798571428574, 2531.537857142857, 1927.3305714285718, 1439.6427142857142, 4208.442]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1584.6425714285717, 1195.5631428571428, 2079.1694285714284, 4570.505, 674.0045571428572, 94.00945714285714, 2537.185571428571, 1926.1471428571429, 1453.6757142857143, 4213.462]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1580.9239999999998, 1190.836, 2076.4612857142856, 4565.147285714285, 677.1803142857143, 93.8712857142857, 2534.43, 1928.218, 1442.5152857142857, 4209.733285714286]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1581.9644285714282, 1190.068142857143, 2072.7514285714287, 4569.5109999999995, 675.6880428571429, 94.03637142857143, 2534.0617142857145, 1930.6424285714286, 1443.7452857142855, 4210.776428571428]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1582.2804285714285, 1183.4742857142858, 2038.7440000000001, 4501.572714285714, 652.6467285714285, 94.00748571428572, 2471.7554285714286, 1925.5982857142856, 1362.9327142857142, 4219.248857142857]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1591.0221428571429, 1188.554, 2039.7187142857142, 4504.300857142857, 660.8223, 94.00007142857145, 2475.5885714285714, 1925.8832857142856, 1368.1452857142856, 4225.062714285714]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1570.1152857142858, 1165.8642857142856, 1965.5435714285716, 4534.126142857143, 663.8044714285714, 93.2128857142857, 2329.4628571428575, 1918.7697142857146, 1258.7117142857144, 4161.413571428571]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1583.507, 1201.8175714285715, 2093.3661428571427, 4591.9349999999995, 684.9994428571429, 94.25028571428571, 2568.3722857142857, 1930.9075714285716, 1484.1937142857146, 4238.757714285714]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1585.154142857143, 1189.7389999999998, 2073.9345714285714, 4568.292, 676.7317, 98.28915714285714, 2534.2691428571425, 1929.529857142857, 1451.945857142857, 4212.487714285714]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1580.3671428571429, 1192.3712857142857, 2077.541, 4566.081428571429, 676.3094000000001, 95.13018571428572, 2534.8467142857144, 1929.974, 1443.9681428571425, 4211.157]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1587.439285714286, 1190.4474285714284, 2087.6448571428573, 4580.666, 683.1959142857143, 94.07601428571427, 2532.131857142857, 1936.4978571428571, 1440.615142857143, 4216.996571428572]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1578.6708571428571, 1187.9731428571429, 2072.436857142857, 4563.212428571429, 673.7035428571428, 93.80358571428572, 2531.176, 1926.625714285714, 1439.5784285714287, 4207.746428571429]]}, 'Helios kD-Tree_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [16.099985714285715, 13.96149142857143, 19.6456, 13.637245714285713, 21.90154285714286, 17.153214285714284, 20.020780000000002, 5.3277342857142855, 25.044271428571427, 40.18054285714286]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [13.85131142857143, 14.14886857142857, 25.25874285714286, 16.123014285714284, 23.62345714285714, 16.770614285714284, 26.957528571428572, 11.030928571428571, 30.54104285714286, 39.86524285714286]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [14.216251428571427, 14.380155714285715, 25.674814285714287, 16.282542857142857, 23.709699999999998, 16.943757142857145, 27.220771428571425, 11.00499714285714, 30.76034285714286, 39.852814285714295]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [12.849328571428572, 12.828645714285715, 22.668428571428567, 15.321557142857143, 23.009942857142857, 16.098742857142856, 23.378471428571427, 10.763440000000001, 28.48277142857143, 39.674600000000005]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [14.573298571428571, 15.109854285714286, 26.37842857142857, 16.30122857142857, 24.357157142857144, 18.56245714285714, 25.886671428571425, 12.9654, 30.45565714285715, 41.481428571428566]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [12.846444285714284, 12.845430000000002, 22.686357142857144, 15.329999999999998, 23.066857142857145, 15.963557142857143, 23.38367142857143, 10.766502857142857, 28.498842857142858, 39.67565714285714]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [11.676177142857144, 10.322051428571427, 21.70982857142857, 13.050282857142857, 22.0422, 12.373815714285714, 19.216828571428575, 9.999421428571427, 23.653557142857146, 38.69107142857143]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [13.080182857142857, 12.980814285714285, 24.512814285714285, 14.777215714285715, 26.66351428571429, 14.469442857142857, 22.714828571428573, 11.950462857142856, 27.93774285714286, 33.63355714285715]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [12.72397142857143, 12.76647, 23.938171428571426, 14.7818, 23.82051428571429, 16.121414285714287, 23.6745, 11.084962857142857, 29.412742857142856, 40.631842857142864]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [12.929115714285714, 12.708125714285712, 25.73692857142857, 14.040657142857143, 22.836985714285714, 13.583938571428572, 25.237871428571427, 12.900542857142856, 30.658299999999997, 27.45047142857143]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [13.56319, 14.023812857142856, 27.686271428571427, 15.611985714285714, 25.794985714285712, 13.838822857142857, 25.44282857142857, 13.075042857142858, 30.34165714285714, 33.7496]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [14.980449999999998, 13.606459999999998, 26.175833333333333, 12.665180000000001, 22.249900000000004, 14.8022, 22.595471428571425, 10.27144, 26.80392857142857, 41.87368]]}, 'Helios kD-Tree_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.022391085714285712, 0.023702628571428568, 0.027466871428571432, 0.02342161428571429, 0.025269471428571433, 0.023692952857142856, 0.02638072857142857, 0.02294097142857143, 0.023922685714285716, 0.02241324285714286]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.015963585714285713, 0.016712157142857145, 0.019947085714285714, 0.014781287142857143, 0.01688874285714286, 0.01764537142857143, 0.01786297142857143, 0.01508164285714286, 0.01758077142857143, 0.01806722857142857]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.007507337142857143, 0.007916894285714285, 0.00868125142857143, 0.007526308571428571, 0.007961285714285714, 0.007767138571428572, 0.008309141428571427, 0.007453248571428571, 0.006795992857142857, 0.007820097142857144]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0009011987142857143, 0.0008715905714285714, 0.000840629, 0.000888862, 0.0009681222857142858, 0.0009865922857142857, 0.0007661605714285714, 0.0008347317142857141, 0.0008341161428571428, 0.0009912917142857144]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.4317571428571428, 0.2737563857142858, 0.5801311428571428, 1.1241334285714284, 0.17020967142857144, 0.03650044142857143, 0.675669142857143, 0.5139287428571429, 0.33783948571428574, 1.0425010000000001]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0006593788571428572, 0.0006069175714285715, 0.0005664602857142857, 0.0006553265714285715, 0.0006643164285714285, 0.025402111571428573, 0.0006462807142857142, 0.0005201151428571429, 0.0005790204285714286, 0.0006511841428571429]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0007330505714285713, 0.0009695032857142857, 0.0008398090000000001, 0.0006565868571428571, 0.0008979228571428571, 0.0004693442857142857, 0.0007738641428571428, 0.0005820587142857143, 0.000932694142857143, 0.0007327065714285715]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0007331661428571429, 0.0007222984285714287, 0.0008610258571428571, 0.0008305795714285715, 0.0006714791428571429, 0.0007036432857142858, 0.0007694747142857143, 0.0007528432857142859, 0.000726784142857143, 0.0008598374285714287]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.002051684285714286, 0.0022071185714285712, 0.0023713871428571423, 0.0022960214285714284, 0.0020795657142857146, 0.0017301499999999997, 0.0021257828571428572, 0.0021816442857142855, 0.002745635714285714, 0.002110747142857143]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.000245865, 0.00019664457142857145, 0.00018038499999999997, 0.00020223985714285715, 0.000238882, 0.00013757771428571426, 0.00019456071428571427, 0.00020350714285714285, 0.0001710454285714286, 0.00021949328571428572]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00891273, 0.007865438571428572, 0.009084417142857142, 0.0073324471428571425, 0.00891366, 0.00795039857142857, 0.009236137142857145, 0.006434018571428571, 0.008781704285714285, 0.008321231428571428]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.004925874285714287, 0.004889199999999999, 0.004361884285714286, 0.004631758571428571, 0.004649941428571428, 0.003124812857142857, 0.00457677, 0.0036330242857142855, 0.00551053, 0.005069532857142857]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0007839175714285714, 0.0007030175714285715, 0.0007907894285714285, 0.0008111148571428573, 0.0008506132857142856, 0.0009283119999999999, 0.000835824, 0.0008269652857142856, 0.0008789481428571428, 0.000781320142857143]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0008283838571428572, 0.0008297697142857142, 0.0006221168571428572, 0.0007294285714285713, 0.0007927461428571429, 0.0008726184285714286, 0.0007231215714285714, 0.0007927445714285715, 0.0007755304285714285, 0.0010031092857142856]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [7.861291428571427e-05, 7.499554285714285e-05, 9.11054857142857e-05, 8.881805714285715e-05, 8.35121e-05, 6.222342857142858e-05, 8.546857142857144e-05, 7.63434e-05, 7.962398571428571e-05, 0.00010070405714285715]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.906555, 0.6912274285714286, 1.1702722857142855, 2.6122645714285713, 0.40371042857142864, 0.08130664285714286, 1.4464305714285715, 1.104974142857143, 0.8188372857142857, 2.473829]]}, 'Helios kD-Tree_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [5.863847142857143e-05, 0.00017017514285714287, 6.576614285714286e-06, 3.762695714285714e-05, 0.00033839442857142856, 0.059453150428571445, 6.566214285714286e-06, 0.0, 0.0, 1.3081114285714285e-05]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.000685844, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.00016157578571428572, 0.00871423814285714, 1.313242857142857e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.00016157578571428572, 0.00871423814285714, 1.313242857142857e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.1926457142857144e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.0001371867857142857, 0.008673895285714285, 1.313242857142857e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.0001341382142857143, 0.008754592428571427, 1.313242857142857e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0003776709285714286, 0.0007368242857142857, 3.9459714285714285e-05, 0.00016484207142857145, 0.0010182304714285715, 0.11795157999999999, 2.8891285714285715e-05, 2.3178714285714287e-05, 0.0, 6.213527142857143e-05]]}, 'Helios kD-Tree_struct_N': {'3DQuadric': [['kD-Tree'], [86085.6]], 'PC-MLS': [['kD-Tree'], [86085.6]], '2-Monge': [['kD-Tree'], [86085.6]], 'Varifolds': [['kD-Tree'], [86085.6]], 'WaveJets': [['kD-Tree'], [86085.6]], 'AvgHexagram': [['kD-Tree'], [86085.6]], 'ShapeOperator': [['kD-Tree'], [86085.6]], 'PCA': [['kD-Tree'], [86085.6]], 'ASO': [['kD-Tree'], [86085.6]], 'APSS': [['kD-Tree'], [86085.6]], 'Sphere': [['kD-Tree'], [86085.6]], 'UnorientedSphere': [['kD-Tree'], [86085.6]], 'Cov2D': [['kD-Tree'], [86085.6]], 'NormCov2D': [['kD-Tree'], [86085.6]], 'Mean': [['kD-Tree'], [86085.6]], 'JetFitting': [['kD-Tree'], [86085.6]]}, 'Helios kD-Tree_struct_Neighbors count': {'3DQuadric': [['kD-Tree'], [2030.171985714286]], 'PC-MLS': [['kD-Tree'], [2029.5622642857147]], '2-Monge': [['kD-Tree'], [2028.6191871428566]], 'Varifolds': [['kD-Tree'], [2030.1214971428572]], 'WaveJets': [['kD-Tree'], [2027.7839057142855]], 'AvgHexagram': [['kD-Tree'], [2032.8364585714282]], 'ShapeOperator': [['kD-Tree'], [2029.9316742857145]], 'PCA': [['kD-Tree'], [2030.324527142857]], 'ASO': [['kD-Tree'], [2003.2260928571425]], 'APSS': [['kD-Tree'], [2007.3097942857141]], 'Sphere': [['kD-Tree'], [1966.1024500000003]], 'UnorientedSphere': [['kD-Tree'], [2047.210672857143]], 'Cov2D': [['kD-Tree'], [2032.0373142857138]], 'NormCov2D': [['kD-Tree'], [2030.7746300000003]], 'Mean': [['kD-Tree'], [2034.971092857142]], 'JetFitting': [['kD-Tree'], [2027.4926985714285]]}, 'Helios kD-Tree_struct_RMSAE Normal': {'3DQuadric': [['kD-Tree'], [19.29724085714286]], 'PC-MLS': [['kD-Tree'], [21.817075142857146]], '2-Monge': [['kD-Tree'], [22.004614714285715]], 'Varifolds': [['kD-Tree'], [20.50759285714285]], 'WaveJets': [['kD-Tree'], [22.607158142857145]], 'PCA': [['kD-Tree'], [20.506331999999997]], 'ASO': [['kD-Tree'], [18.273523428571426]], 'APSS': [['kD-Tree'], [20.272057571428572]], 'Sphere': [['kD-Tree'], [20.895639000000003]], 'UnorientedSphere': [['kD-Tree'], [19.808293714285714]], 'Mean': [['kD-Tree'], [21.31281971428571]], 'JetFitting': [['kD-Tree'], [21.181749615384618]]}, 'Helios kD-Tree_struct_Timings (ms)': {'3DQuadric': [['kD-Tree'], [0.024160225285714286]], 'PC-MLS': [['kD-Tree'], [0.017053084428571428]], '2-Monge': [['kD-Tree'], [0.0077738695714285695]], 'Varifolds': [['kD-Tree'], [0.0008883295]], 'WaveJets': [['kD-Tree'], [0.5186426584285714]], 'AvgHexagram': [['kD-Tree'], [0.003095111171428571]], 'ShapeOperator': [['kD-Tree'], [0.0007587540428571428]], 'PCA': [['kD-Tree'], [0.0007631132]], 'ASO': [['kD-Tree'], [0.002189973714285714]], 'APSS': [['kD-Tree'], [0.00019902007142857142]], 'Sphere': [['kD-Tree'], [0.008283218285714286]], 'UnorientedSphere': [['kD-Tree'], [0.004537332857142857]], 'Cov2D': [['kD-Tree'], [0.0008190822285714284]], 'NormCov2D': [['kD-Tree'], [0.0007969569428571428]], 'Mean': [['kD-Tree'], [8.21407542857143e-05]], 'JetFitting': [['kD-Tree'], [1.1709407357142858]]}, 'Helios kD-Tree_struct_Non-stable ratio': {'3DQuadric': [['kD-Tree'], [0.006008420937142858]], 'PC-MLS': [['kD-Tree'], [6.810379857142857e-05]], '2-Monge': [['kD-Tree'], [6.810379857142857e-05]], 'Varifolds': [['kD-Tree'], [6.810379857142857e-05]], 'WaveJets': [['kD-Tree'], [6.810379857142857e-05]], 'AvgHexagram': [['kD-Tree'], [6.810379857142857e-05]], 'ShapeOperator': [['kD-Tree'], [7.079337000000001e-05]], 'PCA': [['kD-Tree'], [6.810379857142857e-05]], 'ASO': [['kD-Tree'], [0.0008959155728571427]], 'APSS': [['kD-Tree'], [0.0008959155728571427]], 'Sphere': [['kD-Tree'], [0.000889343]], 'UnorientedSphere': [['kD-Tree'], [0.0008972072442857143]], 'Cov2D': [['kD-Tree'], [6.810379857142857e-05]], 'NormCov2D': [['kD-Tree'], [6.810379857142857e-05]], 'Mean': [['kD-Tree'], [6.810379857142857e-05]], 'JetFitting': [['kD-Tree'], [0.012040281274285716]]}, 'Noise normal kD-Tree_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]]}, 'Noise normal kD-Tree_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.82284, 87.026004, 167.63211000000004, 272.15762, 395.23824, 539.3703199999999, 703.70682]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.365516, 87.198184, 169.31353199999998, 271.215, 393.605, 540.37164, 705.4884]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.711788, 88.24999999999999, 169.07939, 275.80602, 396.2164000000001, 540.51898, 703.79162]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [36.892888, 88.12339399999999, 167.43246599999998, 273.31222, 396.64878, 540.7571, 704.7741799999999]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.454004, 87.03551200000001, 166.71437400000002, 268.90462, 393.55312000000004, 538.31872, 701.69238]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.210378, 87.60789600000003, 172.85534399999997, 276.79580000000004, 407.49690000000004, 548.24298, 714.95542]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [36.557114, 87.734488, 169.44022399999997, 270.51068, 397.48697999999996, 542.2054999999999, 707.6582400000001]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [36.737118, 89.90726599999999, 171.269226, 272.28862, 398.45048, 547.42176, 707.0070799999999]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.797074, 93.93144199999999, 162.638068, 259.37694000000005, 376.0428, 510.62175999999994, 664.8034399999998]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.255202000000004, 94.11000200000001, 165.61822800000002, 260.09566199999995, 378.50881999999996, 513.41954, 670.73124]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.162566, 72.496164, 137.935232, 229.964072, 346.20764, 510.7487200000001, 670.3118400000001]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.914662, 93.097948, 176.60965600000003, 284.43766000000005, 406.41693999999995, 555.58462, 716.6927000000001]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.644976, 91.71206999999998, 171.84941199999997, 275.97086, 398.34460000000007, 541.4624, 709.6986199999999]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.549369999999996, 89.411792, 169.845144, 274.16846000000004, 398.53306, 541.0226200000001, 703.9679]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.818107999999995, 88.47350799999998, 169.75491399999999, 275.10798, 398.00816, 541.72878, 715.2719400000001]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.66178, 86.86998, 166.34330999999997, 268.59749999999997, 393.1448, 537.9916000000001, 701.1059]]}, 'Noise normal kD-Tree_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [28.01772, 24.454133333333335, 24.317333333333334, 25.152400000000004, 26.767428571428567, 27.944585714285708, 27.496437499999995]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.721266999999997, 15.145400000000004, 17.186738000000002, 19.304721, 21.073446000000004, 22.6616, 24.186939999999996]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.851977000000002, 15.260655999999997, 17.283574999999995, 19.48747, 21.182869, 22.610950000000003, 24.140590000000003]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.108136, 15.085276, 17.292837999999996, 19.452840000000002, 21.402480000000004, 23.08425, 24.662790000000005]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.185525, 15.839236999999999, 18.074574, 20.139264999999998, 22.217470000000002, 24.031500000000005, 25.29166]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.634305, 15.254267, 17.401201, 19.55193, 21.48711, 23.132780000000004, 24.692339999999994]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [8.4221024, 13.889282000000001, 15.2419468, 17.4698302, 19.4568558, 21.177577599999996, 23.151201999999998]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.854443199999999, 17.2389266, 20.634564800000003, 23.481754000000002, 25.987376000000005, 28.210574, 30.108233999999996]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.37352, 29.688429999999997, 29.58897, 29.24189, 29.660050000000005, 29.13121, 29.042980000000007]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [11.631223, 15.6101172, 18.889469, 21.153044799999996, 22.504012, 23.569665999999998, 24.520533999999998]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.496897200000001, 17.5456984, 20.952374, 23.823098, 26.469516, 29.160192, 31.3494]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.8946366, 18.925788999999998, 20.212764, 21.000009999999996, 22.754665, 23.9467, 25.35973]]}, 'Noise normal kD-Tree_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0160300452, 0.01768167, 0.022203122, 0.025676127999999996, 0.028019754000000004, 0.033133806, 0.029773402]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.016935198999999998, 0.0162730822, 0.0145395132, 0.022373536000000006, 0.017369775200000003, 0.024582669999999997, 0.018053529999999998]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.011583805199999998, 0.011505460200000001, 0.0130495874, 0.014091877, 0.012674454599999998, 0.014661600999999998, 0.015386288000000001]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008534700800000001, 0.0009886012, 0.00093067492, 0.00136292542, 0.00111107398, 0.00151469196, 0.0012122743]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0287939728, 0.04745009199999999, 0.08518865399999999, 0.139153866, 0.17794557400000002, 0.27136963000000003, 0.27949714]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0007345159600000001, 0.0009364853, 0.0010581815, 0.00085622428, 0.0011965934, 0.00100396024, 0.0012431149599999999]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008123170999999999, 0.00097902958, 0.0008509642400000001, 0.00106845538, 0.0015483016199999999, 0.0012909768199999999, 0.0011550057200000001]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008690733800000002, 0.0009697837600000001, 0.0013490981399999998, 0.00136077182, 0.00152641986, 0.00164841176, 0.0011865733800000002]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0036797308000000003, 0.0038561884, 0.0031401073999999998, 0.0041674654, 0.0037234171999999998, 0.0043660006, 0.0046445235999999996]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00029465022, 0.00029072852, 0.00034966988, 0.00022943082, 0.00039615362, 0.00040803126000000004, 0.00025578909999999995]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.015824423599999998, 0.017497818, 0.019022042000000003, 0.0133195112, 0.012166387, 0.01864984, 0.013667468999999998]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.009152861, 0.008726669199999999, 0.010140543600000001, 0.0096135036, 0.0093474414, 0.0097737396, 0.0098640044]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00103835578, 0.00120811274, 0.0013556967199999997, 0.00153155172, 0.00118267058, 0.0012029889799999999, 0.00114581312]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00106770184, 0.0013952059600000003, 0.00102889928, 0.0011072795, 0.0016037902399999998, 0.0015576563999999998, 0.0009521874]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [9.6035018e-05, 0.00010647827199999998, 0.00014537972199999997, 0.000158302572, 0.00019960839999999996, 0.000147803866, 0.0001293008]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.06880421600000002, 0.14014844, 0.21878658399999998, 0.31122256, 0.44541270000000005, 0.5723284599999999, 0.7346816199999999]]}, 'Noise normal kD-Tree_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.008853514399999998, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.18448931000000002, 2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'Noise normal kD-Tree_Noise normal_N': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]]}, 'Noise normal kD-Tree_Noise normal_Neighbors count': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [314.3943457142858, 313.1711028571429, 315.55629571428574, 313.09176428571425, 314.46788714285714]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [314.48811714285716, 315.2142842857143, 313.4109385714286, 313.8224685714285, 315.60509999999994]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [315.2080942857142, 315.6198871428571, 315.0234114285714, 315.28493857142865, 315.5595242857143]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [316.6793442857143, 315.7245, 315.18014428571433, 315.15871000000004, 314.35803571428573]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [313.2432014285714, 312.83398571428575, 312.87358285714294, 312.97990142857145, 312.83556428571427]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [324.05505714285727, 319.00108000000006, 318.3035757142857, 321.6147114285714, 318.5718028571428]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [316.4761442857143, 315.8787357142857, 316.3060514285714, 315.5583057142857, 315.49021]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [317.4597671428572, 322.1161014285714, 316.5609985714286, 315.84187, 315.93665571428573]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [303.36791571428574, 299.3831042857143, 300.37871285714283, 299.3590157142857, 299.0909114285714]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [301.9198557142857, 303.6586514285714, 304.0876871428571, 301.6873942857143, 301.31690714285713]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [284.6360328571429, 285.11556285714295, 285.37045000000006, 284.55405285714284, 287.34264]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [324.25282428571427, 323.7235028571428, 324.5179685714286, 324.5510314285714, 323.4933771428571]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [316.88733857142853, 317.8261242857143, 315.21115714285713, 319.2760171428572, 319.1443185714285]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [316.39613142857144, 315.5383599999999, 314.6918628571429, 318.5974942857143, 315.13211285714283]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [316.99382714285707, 319.46811714285724, 315.0955428571429, 319.80343, 317.32721857142855]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [312.5306957142857, 312.5306957142857, 312.5306957142857, 312.5306957142857, 312.5306957142857]]}, 'Noise normal kD-Tree_Noise normal_RMSAE Normal': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [26.368608888888886, 26.368608888888886, 26.368608888888886, 26.368608888888886, 26.368608888888886]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.182873142857144, 19.182873142857144, 19.182873142857144, 19.182873142857144, 19.182873142857144]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.259726714285716, 19.259726714285716, 19.259726714285716, 19.259726714285716, 19.259726714285716]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.298372857142862, 19.298372857142862, 19.298372857142862, 19.298372857142862, 19.298372857142862]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [20.25417585714286, 20.25417585714286, 20.25417585714286, 20.25417585714286, 20.25417585714286]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.450561857142855, 19.450561857142855, 19.450561857142855, 19.450561857142855, 19.450561857142855]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [16.93697057142857, 16.94610128571429, 16.960580142857133, 16.98035271428571, 17.03942157142857]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [22.598098428571426, 22.608686142857145, 22.62815442857143, 22.654557142857147, 22.736127142857146]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [29.675292857142857, 29.675292857142857, 29.675292857142857, 29.675292857142857, 29.675292857142857]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.605741714285717, 19.62951157142857, 19.667508571428566, 19.720428571428574, 19.861142428571426]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [23.04300257142857, 23.109017571428573, 23.203304285714285, 23.32003971428571, 23.608332714285716]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [21.37015157142857, 21.392276428571424, 21.424683857142856, 21.46442014285714, 21.558678428571426]]}, 'Noise normal kD-Tree_Noise normal_Timings (ms)': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.023879849714285712, 0.024889265428571433, 0.024051558571428572, 0.023794341428571435, 0.026612075714285713]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.019749679142857142, 0.018405053142857144, 0.017814148285714287, 0.01810055785714286, 0.018878637]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.012828594142857142, 0.013013429857142858, 0.013312410428571429, 0.013304829714285713, 0.013935788285714285]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0011540081142857146, 0.0011150986857142858, 0.0012156444285714289, 0.0010330294857142856, 0.0011777277571428575]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.13561527, 0.14209509428571426, 0.14709758000000003, 0.1600036914285714, 0.15047331342857143]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0009713212571428572, 0.0010306682857142853, 0.0010368578285714285, 0.0009721759999999999, 0.0010097449428571428]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0010805781, 0.001090663442857143, 0.0011537184428571429, 0.0010699818, 0.0011086656857142857]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.001236966014285714, 0.0013290542999999998, 0.001248341914285714, 0.0013318121285714288, 0.0012182057142857143]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.003790238285714286, 0.004023847857142857, 0.004042855142857142, 0.003994783285714286, 0.0038464421428571435]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.00031847368571428575, 0.00033582955714285713, 0.00032252690000000004, 0.00029847511428571433, 0.00031359004285714284]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.016594348285714284, 0.014204022142857143, 0.015218105000000001, 0.016566123999999998, 0.016094179714285718]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.009195741714285713, 0.009529948428571428, 0.009389864714285715, 0.00915581842857143, 0.010313457285714287]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0013288279857142857, 0.0011923569000000002, 0.0012572673999999998, 0.0012567354142857144, 0.001154233471428571]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0011374093, 0.0012755953857142856, 0.0013460999428571427, 0.001177440257142857, 0.0012868269857142856]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0001670415357142857, 0.00012726797857142856, 0.00011353531428571429, 0.00012691285428571427, 0.0001673199242857143]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.34923284, 0.3617423742857144, 0.3438118757142857, 0.37163493, 0.35313839428571425]]}, 'Noise normal kD-Tree_Noise normal_Non-stable ratio': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0012647877714285713, 0.0012647877714285713, 0.0012647877714285713, 0.0012647877714285713, 0.0012647877714285713]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.026358674585714288, 0.026358674585714288, 0.026358674585714288, 0.026358674585714288, 0.026358674585714288]]}, 'Noise normal kD-Tree_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]]}, 'Noise normal kD-Tree_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [125.58994, 148.6694942857143, 255.80687714285716, 356.1053228571428, 197.08956571428567, 123.35500571428572, 432.67471142857147, 202.98712, 944.0821800000001, 355.0025742857143]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [125.09364, 151.70293142857142, 254.92272000000003, 356.6218485714286, 197.4906314285714, 124.52639714285714, 432.26442285714285, 203.4634057142857, 942.7816342857143, 356.21418571428575]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [126.59412571428571, 149.00110571428573, 252.72527142857143, 361.25114, 198.5822742857143, 124.1425142857143, 435.38025999999996, 203.06928, 948.1774028571429, 354.46833714285714]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [126.11006285714286, 150.21810571428574, 253.25255714285714, 357.93038857142864, 199.91081142857138, 123.51227714285716, 436.61086857142857, 203.14794571428573, 944.7500657142857, 358.7583857142857]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [124.07287142857143, 148.0507742857143, 252.99569714285718, 356.3723342857143, 196.39912285714288, 123.08175714285717, 429.92464285714294, 201.41691714285713, 942.1482885714286, 355.0700657142857]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [128.4666057142857, 150.61958857142858, 253.49204, 362.4295742857143, 212.87555714285716, 127.07569714285715, 434.9091685714286, 208.1485742857143, 952.4260371428574, 372.64961142857146]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [125.17275142857143, 150.25899428571432, 255.85602285714282, 360.52429428571423, 197.83597714285716, 124.16501142857142, 437.0504714285715, 204.66612285714282, 945.9977771428572, 357.89147142857144]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [125.46336285714285, 151.96421142857145, 259.9516828571429, 361.56465428571425, 199.8997714285714, 126.65781714285716, 437.9784714285714, 205.81009428571434, 946.5654742857142, 359.97524571428573]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [124.07405142857144, 144.25946000000002, 258.47386, 324.76852857142853, 178.41986, 123.8629057142857, 415.38865999999996, 202.52854571428574, 873.6415, 357.74194857142857]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [126.57683428571428, 145.11427714285716, 252.40195714285713, 327.4109028571429, 182.53167999999997, 126.85574571428572, 418.9180657142858, 205.6414142857143, 880.9215714285716, 358.96854285714284]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [118.03922, 124.85972857142858, 224.85997142857144, 347.67862285714284, 191.45486857142853, 123.42616285714284, 353.07330285714283, 202.6987857142857, 821.032977142857, 346.9138371428571]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [129.21709714285714, 156.42347428571432, 260.97774, 372.2572885714286, 203.45905142857143, 127.99300285714287, 444.91012857142863, 206.6817, 976.5577142857142, 362.6002114285714]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [128.42888, 152.1178942857143, 258.5928342857143, 361.97995142857144, 203.4269971428571, 126.14873714285713, 435.6772628571428, 206.2048571428571, 946.5483142857142, 357.5641828571428]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [129.3097685714286, 151.61334571428574, 252.40157714285712, 358.93654857142855, 199.46169999999998, 125.71761714285715, 434.4291314285714, 205.05267999999998, 946.3495542857144, 357.44000000000005]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [127.94510571428572, 151.5832514285714, 252.56579142857137, 363.50488000000007, 208.02671714285717, 128.19010571428575, 434.5905257142857, 208.74272000000002, 947.5102657142858, 354.7169085714286]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.40822857142858, 148.04184285714288, 252.29647142857144, 355.85730000000007, 195.99067142857143, 122.8845142857143, 429.64514285714284, 201.01864285714282, 941.7628571428572, 354.4012857142858]]}, 'Noise normal kD-Tree_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [28.209571428571433, 15.3572, 20.772333333333336, 13.919385714285713, 20.037085714285713, -1, 32.170300000000005, -1, 31.275457142857153, 42.28497142857143]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.10277142857143, 9.686401428571427, 18.46517142857142, 14.187328571428573, 18.691971428571424, 8.927004285714283, 21.67879714285714, 8.417028571428572, 33.08341428571429, 39.58884285714286]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.161642857142855, 9.770704285714288, 18.363371428571426, 14.234742857142859, 18.8307, 8.910408571428572, 22.055757142857143, 8.351011428571429, 33.29555714285714, 39.62337142857143]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.978528571428573, 9.739635714285713, 18.143008571428567, 14.039414285714287, 18.205300000000005, 9.713531428571429, 21.739521428571432, 10.00546, 32.660142857142866, 39.75918571428572]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [20.580728571428565, 10.075294285714286, 21.864142857142856, 14.161642857142857, 19.080514285714283, 11.306971428571432, 22.123338571428576, 9.087225714285715, 32.902471428571424, 41.359428571428566]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.0941, 9.809554285714283, 18.36778571428572, 14.101485714285717, 18.45947142857143, 9.74615714285714, 21.804772857142858, 10.025719999999998, 32.72098571428571, 40.37558571428572]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [17.745548857142857, 7.005280857142857, 18.315708857142855, 13.396140571428573, 18.023796, 7.987161142857144, 15.14193885714286, 8.701963142857144, 25.311437142857145, 38.09787714285714]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [20.980568571428574, 13.02242057142857, 22.87066571428571, 24.156814285714283, 28.473442285714285, 11.229173142857146, 21.721445714285718, 11.597816285714288, 31.467017142857145, 40.93188285714286]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [25.729285714285712, 22.982371428571426, 23.976914285714287, 17.169842857142857, 20.43607142857143, 34.18281428571428, 25.45467142857143, 48.90927142857142, 35.348585714285704, 42.5631]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.90169714285714, 10.422593999999998, 24.50271428571429, 14.183417428571428, 18.01962885714286, 9.031838285714285, 22.346907142857145, 9.031182857142857, 32.796588571428565, 37.73209714285716]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [21.819117142857145, 12.991842857142858, 24.819354285714283, 20.26496571428571, 30.065217142857144, 11.946167142857144, 23.22801142857143, 12.420515142857145, 33.86338857142857, 41.14881428571429]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [22.254037142857143, 16.094860571428573, 29.892771428571432, 16.80057142857143, 20.997674285714282, 8.834228857142856, 23.164357142857146, 8.82944857142857, 29.020657142857143, 38.53181428571429]]}, 'Noise normal kD-Tree_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.02493266, 0.023900334285714284, 0.024881291428571425, 0.024382639999999997, 0.026370119999999997, 0.022945640000000003, 0.02512516285714286, 0.02501043828571429, 0.024111166285714285, 0.024794728571428573]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.019095718285714287, 0.017863454285714286, 0.017158065142857143, 0.01775652914285714, 0.020561987428571425, 0.019179462857142858, 0.01885876114285714, 0.019735522000000002, 0.017890438571428573, 0.017796212]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.014045397428571428, 0.013402866285714285, 0.012529878, 0.01376509, 0.013299493428571427, 0.013772756857142857, 0.012603154285714286, 0.013423303428571428, 0.013448490285714286, 0.012499674857142857]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0011616147142857144, 0.0012661263428571429, 0.0011341429142857145, 0.0011561868571428571, 0.0011279669142857142, 0.0009991728285714285, 0.0013027786, 0.0008823396000000001, 0.0013401180857142857, 0.0010205700857142857]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.06912534, 0.07689865714285715, 0.12486125714285716, 0.17411175428571432, 0.09213626857142858, 0.06758543542857143, 0.19231986571428572, 0.09789858285714287, 0.41084611428571427, 0.16478662285714288]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0010670253142857143, 0.0008349867428571429, 0.0007867895428571429, 0.0011879056, 0.0010166222857142858, 0.0008869014285714285, 0.0011936456571428574, 0.0011240022, 0.001127893114285714, 0.0008157647428571428]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0011097241142857142, 0.0010242333714285715, 0.0007057397428571429, 0.0013312823714285713, 0.0012145197714285715, 0.0011471909714285715, 0.0012012552857142858, 0.000940247942857143, 0.0011738069142857143, 0.001159214457142857]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0013441785428571428, 0.0013822271142857143, 0.0012264125142857141, 0.0014039279714285716, 0.0013957068285714287, 0.0009732394285714285, 0.0015610605428571427, 0.0009897049428571427, 0.0012943529714285714, 0.0011579492857142857]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0038826159999999998, 0.004149810857142857, 0.003209298, 0.004045551999999999, 0.004237035142857142, 0.004405970857142856, 0.004108366285714286, 0.0038378488571428576, 0.003783508285714286, 0.003736327142857143]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00022934337142857143, 0.00035312762857142853, 0.0002145228857142857, 0.0004091231428571428, 0.0003198880857142857, 0.0002622734, 0.0003468751142857143, 0.00037622728571428565, 0.0003649548571428571, 0.0003014548285714286]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.016604001142857143, 0.015676315999999996, 0.014185438857142857, 0.01659605285714286, 0.01680642314285714, 0.015017794571428572, 0.016789532000000003, 0.014186737999999999, 0.016183772285714285, 0.01530748942857143]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.009693287142857141, 0.009689586571428571, 0.008349635714285715, 0.008974346857142858, 0.009482709714285711, 0.009413017714285713, 0.010079585142857143, 0.00982737742857143, 0.010161489714285715, 0.009498625142857145]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0010285630857142856, 0.0011848189142857142, 0.0011890974285714286, 0.0013894344857142858, 0.0014568679142857143, 0.0010381696285714287, 0.0013524603428571426, 0.0009362734, 0.0015478239999999997, 0.001255333142857143]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0012436592857142856, 0.0013751844, 0.000997636485714286, 0.0014646521142857145, 0.0013485268285714285, 0.0011315354285714287, 0.0012489770571428571, 0.0009128346857142857, 0.0015894911714285714, 0.0011342462857142856]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [8.65554657142857e-05, 0.00015670828857142858, 0.00011715074000000001, 0.0001324237142857143, 0.00013916341428571428, 0.00010525737142857142, 0.00015897528857142858, 0.00016603017142857143, 0.0002181573828571429, 0.00012373337714285718]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.1725637371428571, 0.19381944857142855, 0.29471779428571426, 0.38464596285714286, 0.23112855428571427, 0.16543765714285716, 0.4618222257142857, 0.2521139, 0.9771841742857142, 0.4256873742857143]]}, 'Noise normal kD-Tree_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.003555942857142857, 0.009040714285714284, 0.0, 0.0, 2.4979428571428572e-05, 2.6241142857142855e-05, 0.0, 0.0, 0.0, 0.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.09055801728571429, 0.108454, 0.0, 0.0, 0.01325572857142857, 0.051319000000000004, 0.0, 0.0, 0.0, 0.0]]}, 'Noise normal kD-Tree_struct_N': {'3DQuadric': [['kD-Tree'], [18327.1]], 'PC-MLS': [['kD-Tree'], [18327.1]], '2-Monge': [['kD-Tree'], [18327.1]], 'Varifolds': [['kD-Tree'], [18327.1]], 'WaveJets': [['kD-Tree'], [18327.1]], 'AvgHexagram': [['kD-Tree'], [18327.1]], 'ShapeOperator': [['kD-Tree'], [18327.1]], 'PCA': [['kD-Tree'], [18327.1]], 'ASO': [['kD-Tree'], [18327.1]], 'APSS': [['kD-Tree'], [18327.1]], 'Sphere': [['kD-Tree'], [18327.1]], 'UnorientedSphere': [['kD-Tree'], [18327.1]], 'Cov2D': [['kD-Tree'], [18327.1]], 'NormCov2D': [['kD-Tree'], [18327.1]], 'Mean': [['kD-Tree'], [18327.1]], 'JetFitting': [['kD-Tree'], [18327.1]]}, 'Noise normal kD-Tree_struct_Neighbors count': {'3DQuadric': [['kD-Tree'], [314.1362791428571]], 'PC-MLS': [['kD-Tree'], [314.5081817142857]], '2-Monge': [['kD-Tree'], [315.3391711428572]], 'Varifolds': [['kD-Tree'], [315.42014685714287]], 'WaveJets': [['kD-Tree'], [312.95324714285715]], 'AvgHexagram': [['kD-Tree'], [320.30924542857144]], 'ShapeOperator': [['kD-Tree'], [315.94188942857147]], 'PCA': [['kD-Tree'], [317.58307857142853]], 'ASO': [['kD-Tree'], [300.31593200000003]], 'APSS': [['kD-Tree'], [302.5340991428572]], 'Sphere': [['kD-Tree'], [285.4037477142857]], 'UnorientedSphere': [['kD-Tree'], [324.10774085714286]], 'Cov2D': [['kD-Tree'], [317.6689911428571]], 'NormCov2D': [['kD-Tree'], [316.0711922857143]], 'Mean': [['kD-Tree'], [317.73762714285715]], 'JetFitting': [['kD-Tree'], [312.5306957142857]]}, 'Noise normal kD-Tree_struct_RMSAE Normal': {'3DQuadric': [['kD-Tree'], [26.36860888888889]], 'PC-MLS': [['kD-Tree'], [19.18287314285714]], '2-Monge': [['kD-Tree'], [19.259726714285712]], 'Varifolds': [['kD-Tree'], [19.29837285714286]], 'WaveJets': [['kD-Tree'], [20.254175857142858]], 'PCA': [['kD-Tree'], [19.45056185714286]], 'ASO': [['kD-Tree'], [16.972685257142853]], 'APSS': [['kD-Tree'], [22.64512465714286]], 'Sphere': [['kD-Tree'], [29.675292857142853]], 'UnorientedSphere': [['kD-Tree'], [19.696866571428572]], 'Mean': [['kD-Tree'], [23.256739371428573]], 'JetFitting': [['kD-Tree'], [21.44204208571428]]}, 'Noise normal kD-Tree_struct_Timings (ms)': {'3DQuadric': [['kD-Tree'], [0.02464541817142857]], 'PC-MLS': [['kD-Tree'], [0.018589615085714287]], '2-Monge': [['kD-Tree'], [0.013279010485714287]], 'Varifolds': [['kD-Tree'], [0.0011391016942857142]], 'WaveJets': [['kD-Tree'], [0.1470569898285714]], 'AvgHexagram': [['kD-Tree'], [0.001004153662857143]], 'ShapeOperator': [['kD-Tree'], [0.0011007214942857144]], 'PCA': [['kD-Tree'], [0.0012728760142857144]], 'ASO': [['kD-Tree'], [0.003939633342857143]], 'APSS': [['kD-Tree'], [0.00031777906]], 'Sphere': [['kD-Tree'], [0.01573535582857143]], 'UnorientedSphere': [['kD-Tree'], [0.009516966114285713]], 'Cov2D': [['kD-Tree'], [0.0012378842342857142]], 'NormCov2D': [['kD-Tree'], [0.0012446743742857145]], 'Mean': [['kD-Tree'], [0.00014041552142857143]], 'JetFitting': [['kD-Tree'], [0.3559120828571428]]}, 'Noise normal kD-Tree_struct_Non-stable ratio': {'3DQuadric': [['kD-Tree'], [0.0012647877714285715]], 'PC-MLS': [['kD-Tree'], [0.0]], '2-Monge': [['kD-Tree'], [0.0]], 'Varifolds': [['kD-Tree'], [0.0]], 'WaveJets': [['kD-Tree'], [0.0]], 'AvgHexagram': [['kD-Tree'], [0.0]], 'ShapeOperator': [['kD-Tree'], [0.0]], 'PCA': [['kD-Tree'], [0.0]], 'ASO': [['kD-Tree'], [3.058871428571429e-06]], 'APSS': [['kD-Tree'], [3.058871428571429e-06]], 'Sphere': [['kD-Tree'], [3.058871428571429e-06]], 'UnorientedSphere': [['kD-Tree'], [3.058871428571429e-06]], 'Cov2D': [['kD-Tree'], [0.0]], 'NormCov2D': [['kD-Tree'], [0.0]], 'Mean': [['kD-Tree'], [0.0]], 'JetFitting': [['kD-Tree'], [0.026358674585714285]]}, 'Helios + noise normal kD-Tree_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]]}, 'Helios + noise normal kD-Tree_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [280.04364, 644.1565639999999, 1152.2769839999999, 1793.426894, 2547.56232, 3419.7144, 4375.647580000001]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [278.61305000000004, 644.762474, 1151.191918, 1793.9691079999998, 2547.24848, 3420.21048, 4375.710999999999]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [279.35811, 644.443956, 1150.2879560000001, 1793.6401500000002, 2546.43116, 3418.91164, 4374.917440000001]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [278.644116, 643.4009339999999, 1149.414694, 1793.691282, 2547.8115, 3419.15076, 4374.18278]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [277.082922, 641.8415279999999, 1147.9741960000001, 1791.488904, 2545.5674000000004, 3417.85892, 4372.73518]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [277.889828, 644.914222, 1152.4303719999998, 1796.3152639999998, 2552.1607, 3422.16584, 4381.493700000001]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [278.986534, 643.5918, 1150.1987479999998, 1793.2592739999998, 2548.6622199999997, 3418.8829600000004, 4374.06654]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [279.504522, 643.95384, 1151.1077799999998, 1794.7457640000002, 2548.72814, 3420.2002000000007, 4375.932739999999]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [277.670898, 638.081218, 1139.7737, 1771.2712579999998, 2514.13576, 3369.1606600000005, 4314.27528]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [280.919498, 641.78979, 1140.4824979999999, 1773.7756300000003, 2516.0083799999998, 3370.7784400000005, 4316.4771]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [272.113018, 620.167272, 1106.074366, 1729.485956, 2456.7092, 3309.1068600000003, 4266.98132]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [282.15836, 650.98038, 1165.5638680000002, 1813.9811120000002, 2575.2088999999996, 3446.0146599999994, 4407.83064]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [279.958224, 645.750316, 1151.598702, 1793.884468, 2551.0075800000004, 3423.8824000000004, 4375.85116]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [278.474774, 643.7675519999999, 1149.514514, 1794.891802, 2547.1319999999996, 3420.81306, 4375.65894]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [281.278106, 647.603884, 1157.4698839999999, 1796.42002, 2553.6791, 3423.2623399999998, 4378.0455]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [276.80527000000006, 641.45445, 1147.5894100000003, 1791.2408599999994, 2545.1964999999996, 3417.6196, 4372.542800000001]]}, 'Helios + noise normal kD-Tree_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.250003000000003, 15.966919000000003, 17.52967, 19.252345, 20.935622000000002, 21.972842, 23.173284999999996]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.233438, 18.182138, 20.080740000000002, 21.666889999999995, 23.48422, 25.414170000000002, 26.657930000000007]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.340049, 18.336824, 20.29562, 21.849, 23.68581, 25.65539, 26.86961]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.105377999999998, 16.887083, 19.077469, 20.5643, 21.87264, 23.838769999999997, 25.20751]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18.813567, 19.057679999999998, 21.22703, 22.55928999999999, 23.81919, 25.683500000000002, 27.08985]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.138412999999996, 16.890956, 19.067835000000002, 20.55019, 21.86259, 23.83051, 25.203829999999993]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.4466282, 15.750499799999998, 16.7076944, 18.712452, 20.114608, 21.541836, 22.71297]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.6703566, 16.5495646, 18.730406000000002, 20.719998, 22.437434000000003, 23.862038, 25.06756]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [16.064853, 17.58163, 19.443480000000005, 20.989120000000003, 22.53258, 24.092200000000002, 25.565610000000007]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.4833018, 16.1609332, 18.316918, 20.27958, 21.972782000000002, 23.248584, 24.382748000000003]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.441334, 17.448768, 19.907476000000003, 21.922629999999998, 23.820103999999997, 25.505026, 26.646417999999997]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.445056, 19.552794, 20.347129, 20.57279, 20.812780000000004, 21.800209999999996, 22.639044000000002]]}, 'Helios + noise normal kD-Tree_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0249898468, 0.021076753999999996, 0.021995076, 0.023659518, 0.020791498000000002, 0.024433411999999998, 0.023470555999999997]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.016934538600000004, 0.016306476, 0.016418298, 0.018836334, 0.018732432, 0.0170816956, 0.014180963]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0090825184, 0.009565112399999999, 0.007747744800000001, 0.010003388799999999, 0.0079275478, 0.0084327272, 0.0087661646]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0007903261400000001, 0.0008369190800000001, 0.0008718518799999999, 0.00082620996, 0.0009068667799999999, 0.00091056456, 0.0009049864199999999]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0735977368, 0.17672832, 0.30370502000000005, 0.44348228999999995, 0.6207863659999999, 0.8619060980000001, 1.188849576]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.01580341194, 0.0006290111800000001, 0.0007116543399999999, 0.0006836016399999999, 0.0006819086199999999, 0.0006558946600000001, 0.0006870333199999999]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0007001391799999999, 0.0006769764200000002, 0.00066195414, 0.0007228797399999999, 0.0006898263200000001, 0.0007327854599999999, 0.0007559408799999999]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00079373948, 0.0008412014000000001, 0.00088486494, 0.00083425404, 0.0008302190000000002, 0.00080723354, 0.0008749968199999999]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0018571917999999996, 0.0019719092, 0.002060742, 0.0021039404, 0.0019835682000000003, 0.0022349052, 0.0022918277999999996]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00024865673999999996, 0.00026844814, 0.00020372539999999998, 0.00022399450000000005, 0.00020899535999999999, 0.00022235134, 0.00019579785999999997]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.009019409400000001, 0.0081226184, 0.008705594200000001, 0.0093857888, 0.0086820854, 0.0086086164, 0.0088577812]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0053977042, 0.004523688600000001, 0.005070382, 0.0048330406000000005, 0.0050220154, 0.005047197, 0.005326456599999998]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008535000600000001, 0.000788296, 0.0008402987199999999, 0.0007385488399999998, 0.00095753198, 0.00085800996, 0.00084256118]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0007564994000000001, 0.0007707371399999998, 0.0007503064000000001, 0.00074902364, 0.0007821730200000001, 0.0007756948600000001, 0.0007755374799999999]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [8.444939000000002e-05, 0.00011155755599999999, 0.00011329240800000001, 0.00010341765799999999, 8.9688408e-05, 0.00010180143400000001, 9.739109599999999e-05]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.18638858499999997, 0.379284476, 0.656749032, 1.01297455, 2.12748734, 1.94195718, 2.50646278]]}, 'Helios + noise normal kD-Tree_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.04119827196000001, 0.0004935463000000001, 0.00016944399999999999, 6.58948e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00029786879, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005774803602, 0.00020408605, 0.000112962, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005774803602, 0.00020408605, 0.000112962, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00572008225, 0.00020408605, 0.000112962, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005759365302000001, 0.00020596885000000002, 0.000122376, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.07832102210000001, 0.00521604393, 0.0004719098900000001, 0.00013179, 5.6481200000000004e-05, 5.6481200000000004e-05, 2.8240600000000002e-05]]}, 'Helios + noise normal kD-Tree_Noise normal_N': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]]}, 'Helios + noise normal kD-Tree_Noise normal_Neighbors count': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [2029.0572700000007, 2030.5590328571432, 2030.3714528571431, 2031.637574285715, 2030.394942857143]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [2030.4399000000005, 2029.7306285714278, 2031.2138071428574, 2029.9109428571428, 2029.9236571428578]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [2029.3984371428573, 2029.6826342857144, 2030.1408514285713, 2030.4970257142854, 2028.845631428571]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [2029.0854785714291, 2029.9842057142855, 2029.4702257142856, 2029.5308685714292, 2029.2835542857144]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [2027.8833628571426, 2027.7712485714283, 2027.8002742857145, 2027.8002957142855, 2027.7084257142856]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [2031.1671785714288, 2029.9296228571434, 2032.9552114285711, 2035.0984899999999, 2033.2565871428574]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [2029.7203285714284, 2029.1132800000005, 2030.0518371428575, 2029.418117142857, 2030.0164914285717]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [2031.6852885714288, 2029.4140728571426, 2030.422332857143, 2031.8052328571428, 2029.6537771428577]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [2003.405275714286, 2003.5075042857145, 2003.4452442857137, 2003.5114842857138, 2003.5367585714291]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [2004.695434285714, 2006.4946214285717, 2006.7247600000003, 2006.1472757142851, 2004.6745771428575]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [1964.8953057142855, 1965.4964771428574, 1966.3164385714285, 1966.2717785714285, 1966.047137142857]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [2047.6096557142862, 2050.3704157142856, 2048.6341285714284, 2048.332164285714, 2049.15215]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [2031.6206485714295, 2031.4231571428566, 2031.4602771428576, 2031.80911, 2032.2102714285709]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [2029.0852914285704, 2031.128751428571, 2030.108337142857, 2029.0313600000006, 2030.8267185714283]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [2034.6549700000007, 2033.327207142857, 2033.649474285714, 2035.5587042857144, 2032.6373828571432]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [2027.4926985714285, 2027.4926985714285, 2027.4926985714285, 2027.4926985714285, 2027.4926985714285]]}, 'Helios + noise normal kD-Tree_Noise normal_RMSAE Normal': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.29724085714286, 19.29724085714286, 19.29724085714286, 19.29724085714286, 19.29724085714286]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [21.817075142857146, 21.817075142857146, 21.817075142857146, 21.817075142857146, 21.817075142857146]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [22.004614714285715, 22.004614714285715, 22.004614714285715, 22.004614714285715, 22.004614714285715]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [20.50759285714285, 20.50759285714285, 20.50759285714285, 20.50759285714285, 20.50759285714285]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [22.607158142857145, 22.607158142857145, 22.607158142857145, 22.607158142857145, 22.607158142857145]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [20.506331999999997, 20.506331999999997, 20.506331999999997, 20.506331999999997, 20.506331999999997]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [18.274798142857144, 18.277429714285713, 18.28113042857143, 18.28587214285714, 18.299832714285714]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [20.274053428571424, 20.27836871428571, 20.285580571428568, 20.29480314285715, 20.32244928571428]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [20.895639000000003, 20.895639000000003, 20.895639000000003, 20.895639000000003, 20.895639000000003]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.809914428571428, 19.81537857142857, 19.824923857142856, 19.840173000000004, 19.884500857142854]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [21.32820214285714, 21.348724142857144, 21.373341285714282, 21.40192657142857, 21.47048871428571]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [20.438974285714284, 20.442472714285714, 20.448240714285717, 20.456200857142857, 20.47825642857143]]}, 'Helios + noise normal kD-Tree_Noise normal_Timings (ms)': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.022588439428571427, 0.022578356000000004, 0.023789803285714287, 0.023461678857142856, 0.022165051571428573]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.017359666142857142, 0.01598349328571429, 0.017861415857142862, 0.017994947000000004, 0.015436718571428571]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.008190307285714283, 0.008460789142857144, 0.009050243285714285, 0.009000121285714285, 0.009245113285714285]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008176892142857143, 0.0008593895428571428, 0.0009470296571428572, 0.0008338012285714285, 0.0008618937999999999]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.5330850868571427, 0.5233521044285714, 0.5328384849999999, 0.5061177085714287, 0.5253604771428572]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0028140186000000004, 0.002640563985714286, 0.0030454558428571433, 0.0028774394142857145, 0.0028028905142857144]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0006173116857142858, 0.0007356923571428571, 0.0007375519857142857, 0.0007215711714285715, 0.0007168029]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008857178571428573, 0.0007468773428571428, 0.0008778110142857143, 0.0009314516428571429, 0.0007485058714285716]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.002108443857142857, 0.0022141757142857144, 0.0020494627142857136, 0.002005461285714286, 0.0019825168571428573]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.00020837098571428573, 0.0002325693428571429, 0.00024377561428571426, 0.00022326041428571424, 0.00021485888571428572]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.008611891571428571, 0.008384693714285713, 0.008397023571428568, 0.009322879999999999, 0.009127721]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.004665090285714286, 0.004833722142857142, 0.005165706714285714, 0.004684656571428571, 0.005808313142857142]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008960032285714284, 0.0008549368714285715, 0.0007968557142857142, 0.0008557700428571429, 0.000795538957142857]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0007062894714285714, 0.0007966102142857143, 0.000755427557142857, 0.0007621981999999999, 0.0008080259428571428]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.00010485864857142857, 8.746714714285715e-05, 9.990579142857143e-05, 0.00010800114285714286, 0.00010090866285714286]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [1.260517348571429, 1.2774180071428571, 1.2757211784285716, 1.2611443608571433, 1.2189876357142857]]}, 'Helios + noise normal kD-Tree_Noise normal_Non-stable ratio': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.006008420937142858, 0.006008420937142858, 0.006008420937142858, 0.006008420937142858, 0.006008420937142858]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [7.079337000000001e-05, 7.079337000000001e-05, 7.079337000000001e-05, 7.079337000000001e-05, 7.079337000000001e-05]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008960051614285714, 0.0008973508757142857, 0.0008973508757142857, 0.0008960051614285714, 0.0008990896057142856]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008960051614285714, 0.0008973508757142857, 0.0008973508757142857, 0.0008960051614285714, 0.0008990896057142856]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.000889343, 0.000889343, 0.000889343, 0.000889343, 0.000889343]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.000897296832857143, 0.0008959519757142857, 0.0008959519757142857, 0.0008959519757142857, 0.0008976907057142857]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'JetFitting': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.012040281274285716, 0.012040281274285716, 0.012040281274285716, 0.012040281274285716, 0.012040281274285716]]}, 'Helios + noise normal kD-Tree_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]]}, 'Helios + noise normal kD-Tree_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1581.1392285714285, 1194.8283142857142, 2075.1035714285713, 4567.324314285714, 675.4495542857143, 95.35653428571428, 2533.861942857143, 1927.6768285714286, 1442.4688571428571, 4210.8314]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1580.8329999999999, 1189.9111428571427, 2075.162485714286, 4566.1862, 676.7488028571429, 95.1137257142857, 2533.400942857142, 1931.338057142857, 1442.409057142857, 4211.334457142857]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1580.636657142857, 1189.7325428571428, 2074.9712, 4565.219714285715, 675.5638600000001, 94.96055714285716, 2533.185285714286, 1928.923457142857, 1441.8073714285715, 4212.128514285714]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1581.079, 1190.939514285714, 2075.7891714285715, 4564.688371428571, 675.98172, 94.87837428571427, 2532.960028571428, 1928.0127428571432, 1440.6330857142857, 4209.746657142857]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1578.967085714286, 1188.2668571428574, 2072.960942857143, 4563.457114285715, 673.93292, 94.02177999999999, 2531.5206857142857, 1926.9631714285717, 1439.8377142857144, 4207.9989428571425]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1583.6630285714284, 1196.5334857142855, 2079.356085714285, 4567.431028571429, 677.7858742857144, 95.99164857142856, 2535.9292571428573, 1929.9776, 1442.4962857142857, 4215.649885714286]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1581.7248857142858, 1190.1610857142855, 2075.5839428571426, 4564.847628571428, 676.0197914285715, 94.28423142857142, 2533.2936, 1928.307114285714, 1439.7261714285714, 4212.691657142856]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1582.8875142857144, 1190.2724285714285, 2076.2701714285713, 4565.650771428572, 676.7577999999999, 93.93235142857142, 2533.8762857142856, 1929.8737428571426, 1445.6762, 4210.764142857142]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1582.3353142857145, 1183.9644857142857, 2039.6163714285715, 4501.492771428571, 652.012582857143, 95.07678, 2471.783542857143, 1925.5268285714285, 1363.3366857142857, 4219.667171428571]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1585.4997428571428, 1185.462142857143, 2039.3452571428568, 4504.444028571428, 656.5550057142857, 93.96458857142858, 2475.6621142857143, 1927.3809142857147, 1366.1650571428572, 4222.9944857142855]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1568.216485714286, 1167.2062857142855, 1966.679142857143, 4532.084742857142, 657.8066142857143, 93.61471714285715, 2330.5131714285712, 1918.1466857142855, 1261.0686, 4162.717828571429]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1584.6965428571427, 1203.6801142857144, 2094.8298285714286, 4589.7602, 687.3634085714287, 94.82742, 2572.192685714286, 1930.4879142857144, 1490.4929142857143, 4239.866000000001]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1581.3848857142862, 1191.8790571428574, 2077.2876571428574, 4566.928657142857, 678.1956514285715, 93.91521999999999, 2532.8187714285714, 1930.8029142857142, 1450.082485714286, 4213.751628571429]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1582.1075142857142, 1190.927542857143, 2074.6672285714285, 4564.9358571428575, 675.8248457142857, 93.94112857142856, 2535.074314285714, 1929.035057142857, 1441.7538285714286, 4212.093599999999]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1583.9647428571427, 1193.875457142857, 2079.293885714286, 4570.884, 680.4486628571428, 94.08958571428572, 2538.828542857143, 1934.2627142857145, 1445.4225714285715, 4218.585314285714]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1578.6708571428571, 1187.9731428571429, 2072.4368571428568, 4563.212428571428, 673.7035428571428, 93.80358571428572, 2531.1760000000004, 1926.6257142857141, 1439.5784285714287, 4207.7464285714295]]}, 'Helios + noise normal kD-Tree_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [16.099985714285715, 13.961491428571426, 19.645599999999998, 13.637245714285713, 21.901542857142854, 17.153214285714288, 20.020780000000002, 5.327734285714286, 25.04427142857143, 40.18054285714286]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [13.851311428571428, 14.14886857142857, 25.258742857142856, 16.123014285714284, 23.62345714285714, 16.770614285714277, 26.95752857142857, 11.030928571428575, 30.54104285714286, 39.86524285714286]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [14.216251428571429, 14.380155714285715, 25.674814285714287, 16.282542857142854, 23.709699999999998, 16.943757142857145, 27.220771428571428, 11.004997142857142, 30.760342857142852, 39.852814285714295]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [12.849328571428572, 12.828645714285715, 22.66842857142857, 15.32155714285714, 23.009942857142853, 16.098742857142856, 23.37847142857143, 10.763440000000001, 28.482771428571425, 39.6746]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [14.57329857142857, 15.109854285714286, 26.378428571428575, 16.301228571428567, 24.357157142857144, 18.562457142857138, 25.88667142857143, 12.965400000000002, 30.455657142857138, 41.481428571428566]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [12.846444285714288, 12.84543, 22.686357142857144, 15.329999999999998, 23.066857142857142, 15.963557142857145, 23.383671428571432, 10.766502857142859, 28.498842857142858, 39.67565714285715]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [11.679521714285716, 10.32661942857143, 21.71180285714286, 13.056898571428572, 22.06189142857143, 12.425120857142856, 19.220628571428573, 10.001385714285716, 23.662894285714284, 38.69136285714286]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [13.091375714285716, 12.990220571428571, 24.521462857142854, 14.78273285714286, 26.668614285714284, 14.576562857142857, 22.723348571428573, 11.959252571428571, 27.96133714285714, 33.63560285714286]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [12.723971428571426, 12.766469999999998, 23.938171428571433, 14.781799999999999, 23.820514285714285, 16.121414285714287, 23.674500000000002, 11.084962857142859, 29.412742857142856, 40.631842857142864]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [12.95175142857143, 12.723802571428571, 25.743554285714286, 14.061222857142857, 22.886648571428566, 13.742047428571428, 25.224688571428572, 12.924337142857144, 30.657582857142852, 27.434145714285716]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [13.57496857142857, 14.052351428571429, 27.694694285714288, 15.643242571428573, 26.234525714285713, 13.981176857142856, 25.45535142857143, 13.084377714285715, 30.373500000000007, 33.75117714285714]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [13.176226857142856, 12.795139999999998, 24.7689, 13.275448571428571, 23.40911714285715, 16.722108571428574, 22.595537142857147, 10.271568857142858, 26.80392857142857, 40.71031428571429]]}, 'Helios + noise normal kD-Tree_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.02329723142857143, 0.02254188285714286, 0.024257677142857145, 0.02168166857142857, 0.02453071142857143, 0.021023495428571428, 0.02171392, 0.02234557714285714, 0.02494860857142857, 0.02282588571428571]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.016259482857142855, 0.016387184285714285, 0.01876884885714286, 0.016141085714285717, 0.018284891999999997, 0.016915904285714285, 0.017551475428571425, 0.014756520857142855, 0.018473384285714288, 0.015733703142857144]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.008693724857142857, 0.008631373142857142, 0.00921153, 0.00846542742857143, 0.009080437999999998, 0.008799307428571428, 0.009372249142857142, 0.007628296285714285, 0.009018973142857144, 0.008991829142857143]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0008434158857142857, 0.0008467488, 0.0008987951428571429, 0.0008304018857142857, 0.0008601596857142858, 0.0007534569428571428, 0.0008824778857142858, 0.000807819142857143, 0.0010895473428571428, 0.0008267841714285715]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.41032193142857143, 0.2755467257142857, 0.5425033571428571, 1.2098548857142857, 0.18173419142857145, 0.036179826857142855, 0.6669991085714285, 0.46543548571428567, 0.42132461142857136, 1.0316075999999998]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0006899050857142857, 0.0006153802857142858, 0.0006243774285714287, 0.0006499455428571429, 0.0006868002, 0.022442593371428572, 0.0006445539428571429, 0.0006567381714285715, 0.0006654857428571429, 0.0006849569428571429]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0007513164857142857, 0.0006670613428571428, 0.0007286390571428572, 0.0006670919714285713, 0.0007034261428571428, 0.0006316508285714286, 0.0007572784857142856, 0.0006656962571428572, 0.0007551218857142856, 0.0007305777428571428]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0008404716000000001, 0.0007895596, 0.0008851383142857144, 0.0008085953142857143, 0.0008537979142857143, 0.0007464158571428572, 0.0009129458285714287, 0.0007893249428571427, 0.0009436696857142857, 0.0008108084]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0021525034285714293, 0.0020361165714285717, 0.0019561245714285716, 0.0019709794285714282, 0.002028801428571428, 0.002198202285714286, 0.0021811302857142863, 0.001958776571428571, 0.0021847257142857146, 0.0020527605714285705]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00023308485714285715, 0.00021869037142857145, 0.00022869671428571426, 0.00022367885714285715, 0.00023011057142857146, 0.00017297042857142855, 0.00022308500000000004, 0.00023279717142857145, 0.00024035594285714285, 0.00024220057142857149]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.008471525714285713, 0.008849348571428571, 0.008875830571428572, 0.008577520285714286, 0.008151616857142857, 0.009448989142857142, 0.008679915142857144, 0.008065831428571427, 0.009773059428571429, 0.008794782571428572]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0050723334285714275, 0.004774073142857143, 0.005341287428571429, 0.004526028857142857, 0.005587111142857142, 0.0044620437142857145, 0.005378187142857143, 0.0045184019999999995, 0.005550430857142858, 0.0051050800000000006]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0008386831714285714, 0.0008387366571428571, 0.0008470766571428572, 0.0007996949428571428, 0.0009336653142857145, 0.000796247857142857, 0.0008847387714285715, 0.0007855753142857142, 0.0008529013999999999, 0.0008208895428571428]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0007292012000000001, 0.0007185871714285714, 0.0007827912, 0.0007352222, 0.000789760942857143, 0.0007556840000000001, 0.0007761254571428571, 0.0007150384, 0.0008099453142857144, 0.0008447468857142856]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00010624368857142859, 8.731309999999999e-05, 0.00010123587428571428, 9.524792857142858e-05, 0.00011238879142857146, 7.888513714285714e-05, 8.836097142857143e-05, 0.00011952390285714285, 0.00012033168000000002, 9.275171142857143e-05]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.9843496000000002, 0.7384575142857143, 1.2795648857142856, 2.8064686857142855, 0.43890835142857143, 0.08551159571428572, 1.5768952857142855, 1.1775055714285714, 0.8850657142857142, 2.6148498571428567]]}, 'Helios + noise normal kD-Tree_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [5.863847142857142e-05, 0.00017017514285714287, 6.576614285714286e-06, 3.762695714285715e-05, 0.0003383944285714286, 0.05945315042857142, 6.566214285714286e-06, 0.0, 0.0, 1.3081114285714287e-05]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.000685844, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 9.13798857142857e-06, 0.0001621855, 0.008725001000000001, 1.3132428571428569e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 9.13798857142857e-06, 0.0001621855, 0.008725001000000001, 1.3132428571428569e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.1926457142857144e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.0001371867857142857, 0.008673895285714286, 1.3132428571428569e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 9.13798857142857e-06, 0.00013474792857142857, 0.008746522142857142, 1.3132428571428569e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'JetFitting': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00037767092857142855, 0.0007368242857142857, 3.9459714285714285e-05, 0.00016484207142857142, 0.0010182304714285715, 0.11795158000000003, 2.889128571428571e-05, 2.3178714285714287e-05, 0.0, 6.213527142857143e-05]]}, 'Helios + noise normal kD-Tree_struct_N': {'3DQuadric': [['kD-Tree'], [86085.6]], 'PC-MLS': [['kD-Tree'], [86085.6]], '2-Monge': [['kD-Tree'], [86085.6]], 'Varifolds': [['kD-Tree'], [86085.6]], 'WaveJets': [['kD-Tree'], [86085.6]], 'AvgHexagram': [['kD-Tree'], [86085.6]], 'ShapeOperator': [['kD-Tree'], [86085.6]], 'PCA': [['kD-Tree'], [86085.6]], 'ASO': [['kD-Tree'], [86085.6]], 'APSS': [['kD-Tree'], [86085.6]], 'Sphere': [['kD-Tree'], [86085.6]], 'UnorientedSphere': [['kD-Tree'], [86085.6]], 'Cov2D': [['kD-Tree'], [86085.6]], 'NormCov2D': [['kD-Tree'], [86085.6]], 'Mean': [['kD-Tree'], [86085.6]], 'JetFitting': [['kD-Tree'], [86085.6]]}, 'Helios + noise normal kD-Tree_struct_Neighbors count': {'3DQuadric': [['kD-Tree'], [2030.4040545714288]], 'PC-MLS': [['kD-Tree'], [2030.2437871428572]], '2-Monge': [['kD-Tree'], [2029.7129160000002]], 'Varifolds': [['kD-Tree'], [2029.4708665714286]], 'WaveJets': [['kD-Tree'], [2027.7927214285712]], 'AvgHexagram': [['kD-Tree'], [2032.4814180000003]], 'ShapeOperator': [['kD-Tree'], [2029.6640108571428]], 'PCA': [['kD-Tree'], [2030.5961408571427]], 'ASO': [['kD-Tree'], [2003.4812534285716]], 'APSS': [['kD-Tree'], [2005.7473337142858]], 'Sphere': [['kD-Tree'], [1965.8054274285719]], 'UnorientedSphere': [['kD-Tree'], [2048.8197028571426]], 'Cov2D': [['kD-Tree'], [2031.7046928571428]], 'NormCov2D': [['kD-Tree'], [2030.036091714286]], 'Mean': [['kD-Tree'], [2033.9655477142855]], 'JetFitting': [['kD-Tree'], [2027.4926985714292]]}, 'Helios + noise normal kD-Tree_struct_RMSAE Normal': {'3DQuadric': [['kD-Tree'], [19.297240857142857]], 'PC-MLS': [['kD-Tree'], [21.817075142857142]], '2-Monge': [['kD-Tree'], [22.00461471428571]], 'Varifolds': [['kD-Tree'], [20.50759285714286]], 'WaveJets': [['kD-Tree'], [22.607158142857145]], 'PCA': [['kD-Tree'], [20.506332]], 'ASO': [['kD-Tree'], [18.28381262857143]], 'APSS': [['kD-Tree'], [20.291051028571427]], 'Sphere': [['kD-Tree'], [20.895638999999996]], 'UnorientedSphere': [['kD-Tree'], [19.834978142857143]], 'Mean': [['kD-Tree'], [21.38453657142857]], 'JetFitting': [['kD-Tree'], [20.452829]]}, 'Helios + noise normal kD-Tree_struct_Timings (ms)': {'3DQuadric': [['kD-Tree'], [0.022916665828571426]], 'PC-MLS': [['kD-Tree'], [0.01692724817142857]], '2-Monge': [['kD-Tree'], [0.008789314857142858]], 'Varifolds': [['kD-Tree'], [0.0008639606885714286]], 'WaveJets': [['kD-Tree'], [0.5241507724]], 'AvgHexagram': [['kD-Tree'], [0.0028360736714285713]], 'ShapeOperator': [['kD-Tree'], [0.0007057860199999999]], 'PCA': [['kD-Tree'], [0.0008380727457142857]], 'ASO': [['kD-Tree'], [0.0020720120857142857]], 'APSS': [['kD-Tree'], [0.0002245670485714286]], 'Sphere': [['kD-Tree'], [0.00876884197142857]], 'UnorientedSphere': [['kD-Tree'], [0.005031497771428571]], 'Cov2D': [['kD-Tree'], [0.0008398209628571429]], 'NormCov2D': [['kD-Tree'], [0.0007657102771428573]], 'Mean': [['kD-Tree'], [0.00010022827857142857]], 'JetFitting': [['kD-Tree'], [1.258757706142857]]}, 'Helios + noise normal kD-Tree_struct_Non-stable ratio': {'3DQuadric': [['kD-Tree'], [0.006008420937142857]], 'PC-MLS': [['kD-Tree'], [6.810379857142856e-05]], '2-Monge': [['kD-Tree'], [6.810379857142856e-05]], 'Varifolds': [['kD-Tree'], [6.810379857142856e-05]], 'WaveJets': [['kD-Tree'], [6.810379857142856e-05]], 'AvgHexagram': [['kD-Tree'], [6.810379857142856e-05]], 'ShapeOperator': [['kD-Tree'], [7.079337e-05]], 'PCA': [['kD-Tree'], [6.810379857142856e-05]], 'ASO': [['kD-Tree'], [0.0008971603359999998]], 'APSS': [['kD-Tree'], [0.0008971603359999998]], 'Sphere': [['kD-Tree'], [0.0008893429999999999]], 'UnorientedSphere': [['kD-Tree'], [0.0008965686931428571]], 'Cov2D': [['kD-Tree'], [6.810379857142856e-05]], 'NormCov2D': [['kD-Tree'], [6.810379857142856e-05]], 'Mean': [['kD-Tree'], [6.810379857142856e-05]], 'JetFitting': [['kD-Tree'], [0.012040281274285712]]}, 'No noise kNN-graph_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]]}, 'No noise kNN-graph_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.770850000000003, 79.03768, 149.62296999999995, 247.23367, 366.23310000000004, 502.5197, 654.2581]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.77558, 77.89712, 149.19218, 247.70531, 365.37870000000004, 503.89469999999994, 653.1724]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.877529999999997, 78.06601, 150.03394, 248.29135000000002, 365.9954, 502.4506, 653.4442]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.494350000000004, 77.39896, 149.37234999999998, 248.10805, 366.07579999999996, 502.0053999999999, 653.9445000000001]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.47231, 77.62483999999999, 149.03828000000001, 247.58442, 366.0214, 501.8634, 654.03]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.03181, 78.68586, 148.94358999999997, 247.23238999999995, 368.3115, 502.94669999999985, 653.4602]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.776500000000006, 78.59492, 150.18827000000002, 247.43714999999997, 365.78319999999997, 501.7281, 653.8005]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.789740000000002, 81.61666, 149.05648000000002, 248.79134, 365.40459999999996, 506.63629999999995, 653.9947]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.77928, 77.50206, 149.84916, 248.33181, 365.6287, 503.3272999999999, 654.0822]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.78342, 78.50348, 149.10017, 248.99076000000005, 365.3845, 502.18149999999997, 653.4435]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.41581, 77.98549999999999, 149.25521999999998, 247.83288000000002, 365.835, 501.7132, 653.4783]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.84718, 78.3726, 149.58765999999997, 248.43807999999999, 367.00960000000003, 504.0727, 653.612]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.16995, 77.96319, 151.156, 249.45555, 366.92690000000005, 502.8867, 654.2186]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.98659, 78.15718999999999, 149.38102999999998, 248.86169, 365.39059999999995, 501.73589999999996, 654.8181]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.780190000000005, 77.39833999999999, 148.97466000000003, 247.88769999999994, 366.6952, 502.13769999999994, 653.4906]]}, 'No noise kNN-graph_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [27.564959999999996, 25.603233333333332, 25.318933333333334, 25.521649999999998, 26.239342857142862, 27.054514285714284, 27.336100000000005]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.136464999999998, 15.022539, 16.910204, 18.812846999999998, 20.659439, 22.21945, 23.58726]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.265563, 15.133349, 16.993933000000002, 19.001652, 20.771999, 22.176700000000004, 23.55488]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.554673000000001, 14.968433, 17.016704, 18.974027, 21.015800000000002, 22.65899, 24.08798]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.528002, 15.634102000000002, 17.741414999999996, 19.659851, 21.800312, 23.54289, 24.68278]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.038577999999998, 15.131198000000001, 17.127177, 19.073142999999998, 21.104070000000004, 22.70804, 24.11937]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [8.002463, 13.640829, 15.053967, 17.186546, 19.030016999999997, 20.624202, 22.455319999999997]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [10.370111428571429, 14.312584285714285, 17.93077375, 22.961101111111113, 25.319566666666667, 27.59758888888889, 29.62228888888889]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.34667, 31.087290000000003, 29.688650000000003, 29.7825, 30.18801, 30.147610000000004, 29.603479999999998]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [9.641735714285716, 14.186152857142856, 20.189849999999996, 22.302444444444443, 23.601888888888894, 24.617355555555555, 25.550511111111106]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [11.160114285714284, 15.434994999999999, 19.013203750000002, 24.073577777777775, 26.5899, 29.080711111111114, 31.189744444444443]]}, 'No noise kNN-graph_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.043671850000000005, 0.05068862, 0.05130672000000001, 0.053997, 0.05182844999999999, 0.05549726999999999, 0.05407324]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.037657989999999995, 0.047163010000000005, 0.05161775, 0.06360809, 0.07073542, 0.08023665999999999, 0.08582202000000001]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.024572710000000005, 0.02943461, 0.03683082, 0.04848364, 0.05761175, 0.06327631, 0.07893549]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.002809943, 0.0026379793, 0.0027363509999999997, 0.0033214414000000006, 0.0038891718999999997, 0.0037270647, 0.003520440999999999]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.06328991999999999, 0.11052216000000001, 0.19671686, 0.3059096, 0.46659950000000006, 0.6140283, 0.7617723]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0015144349999999997, 0.0021102011, 0.0021913805, 0.0018281438999999996, 0.0026819612999999997, 0.002405845, 0.0026249298]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0017958136000000003, 0.0030611142, 0.0029616715, 0.003229141, 0.0020110765000000003, 0.002727071, 0.0033647375]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.002077209, 0.0027839958000000003, 0.0026351776, 0.00221399, 0.0025134338, 0.0032268035, 0.0035814152]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0066797490000000005, 0.0068947439999999995, 0.009792052999999998, 0.008878192, 0.007747609, 0.007587561999999999, 0.006773342999999999]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0004019465000000001, 0.0005126208, 0.0008342999, 0.0009363597000000001, 0.0005477451999999999, 0.0010046011000000002, 0.0007252478]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.03486139, 0.032762330000000006, 0.03812336000000001, 0.03193631, 0.030679190000000005, 0.036164220000000004, 0.03382474]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.011577811, 0.015185125000000002, 0.013418553, 0.015161065999999997, 0.013374249999999999, 0.019017998, 0.015882987999999997]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0026401415000000005, 0.0033348130000000003, 0.0028197321, 0.0036466137, 0.0030535940000000006, 0.0039623006, 0.0026828413]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0020369769999999997, 0.0021407864, 0.003453746999999999, 0.0018760368, 0.0030506008, 0.0026057167999999995, 0.003039601]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00013756918999999998, 0.00069401628, 0.00018976949, 0.00027545458, 0.00040997894000000006, 6.140684e-05, 7.452800999999999e-05]]}, 'No noise kNN-graph_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0088593429, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [6.858224999999999e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'No noise kNN-graph_Noise normal_N': {'3DQuadric': [[0.0], [18327.1]], 'PC-MLS': [[0.0], [18327.1]], '2-Monge': [[0.0], [18327.1]], 'Varifolds': [[0.0], [18327.1]], 'WaveJets': [[0.0], [18327.1]], 'AvgHexagram': [[0.0], [18327.1]], 'ShapeOperator': [[0.0], [18327.1]], 'PCA': [[0.0], [18327.1]], 'ASO': [[0.0], [18327.1]], 'APSS': [[0.0], [18327.1]], 'Sphere': [[0.0], [18327.1]], 'UnorientedSphere': [[0.0], [18327.1]], 'Cov2D': [[0.0], [18327.1]], 'NormCov2D': [[0.0], [18327.1]], 'Mean': [[0.0], [18327.1]]}, 'No noise kNN-graph_Noise normal_Neighbors count': {'3DQuadric': [[0.0], [289.95372428571426]], 'PC-MLS': [[0.0], [289.71657000000005]], '2-Monge': [[0.0], [289.8798614285715]], 'Varifolds': [[0.0], [289.9142014285714]], 'WaveJets': [[0.0], [289.6620928571429]], 'AvgHexagram': [[0.0], [290.2302928571429]], 'ShapeOperator': [[0.0], [289.7583771428571]], 'PCA': [[0.0], [290.8985457142856]], 'ASO': [[0.0], [289.9286442857143]], 'APSS': [[0.0], [289.7696185714286]], 'Sphere': [[0.0], [289.78798714285716]], 'UnorientedSphere': [[0.0], [290.84854571428576]], 'Cov2D': [[0.0], [290.5395557142856]], 'NormCov2D': [[0.0], [290.04729999999995]], 'Mean': [[0.0], [289.62348428571426]]}, 'No noise kNN-graph_Noise normal_RMSAE Normal': {'3DQuadric': [[0.0], [26.405188888888883]], 'PC-MLS': [[0.0], [18.621171999999998]], '2-Monge': [[0.0], [18.699725142857144]], 'Varifolds': [[0.0], [18.753801000000003]], 'WaveJets': [[0.0], [19.655621714285715]], 'PCA': [[0.0], [18.900225142857142]], 'ASO': [[0.0], [16.570477714285715]], 'APSS': [[0.0], [21.82293051724138]], 'Sphere': [[0.0], [30.406315714285718]], 'UnorientedSphere': [[0.0], [20.56192661016949]], 'Mean': [[0.0], [22.917148983050843]]}, 'No noise kNN-graph_Noise normal_Timings (ms)': {'3DQuadric': [[0.0], [0.05158045]], 'PC-MLS': [[0.0], [0.06240584857142856]], '2-Monge': [[0.0], [0.04844933285714285]], 'Varifolds': [[0.0], [0.003234627471428571]], 'WaveJets': [[0.0], [0.35983409142857153]], 'AvgHexagram': [[0.0], [0.0021938423714285716]], 'ShapeOperator': [[0.0], [0.002735803614285714]], 'PCA': [[0.0], [0.0027188606999999994]], 'ASO': [[0.0], [0.0077647502857142855]], 'APSS': [[0.0], [0.0007089744285714287]], 'Sphere': [[0.0], [0.03405021999999999]], 'UnorientedSphere': [[0.0], [0.01480254157142857]], 'Cov2D': [[0.0], [0.003162862314285714]], 'NormCov2D': [[0.0], [0.0026004951142857145]], 'Mean': [[0.0], [0.00026324618999999997]]}, 'No noise kNN-graph_Noise normal_Non-stable ratio': {'3DQuadric': [[0.0], [0.0012656204142857143]], 'PC-MLS': [[0.0], [0.0]], '2-Monge': [[0.0], [0.0]], 'Varifolds': [[0.0], [0.0]], 'WaveJets': [[0.0], [0.0]], 'AvgHexagram': [[0.0], [0.0]], 'ShapeOperator': [[0.0], [0.0]], 'PCA': [[0.0], [0.0]], 'ASO': [[0.0], [3.0588714285714285e-06]], 'APSS': [[0.0], [3.0588714285714285e-06]], 'Sphere': [[0.0], [9.797464285714285e-06]], 'UnorientedSphere': [[0.0], [3.0588714285714285e-06]], 'Cov2D': [[0.0], [0.0]], 'NormCov2D': [[0.0], [0.0]], 'Mean': [[0.0], [0.0]]}, 'No noise kNN-graph_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]]}, 'No noise kNN-graph_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.48452857142856, 105.45031428571428, 251.58838571428572, 218.37498571428574, 196.55334285714284, 121.93131428571428, 405.29171428571425, 203.6675142857143, 918.9083857142857, 354.2867571428572]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.43061428571427, 106.14577142857142, 251.57374285714286, 217.73414285714287, 196.1123857142857, 121.93904285714287, 404.9793285714286, 201.03210000000004, 919.6803857142856, 355.53818571428576]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.48555714285716, 105.44595714285715, 251.59787142857144, 217.96014285714287, 196.35405714285713, 122.74158571428572, 405.79931428571433, 201.61962857142856, 919.5147857142857, 355.2797142857143]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.71751428571429, 105.87977142857143, 251.58339999999998, 219.23039999999997, 196.13607142857146, 124.58554285714285, 405.80915714285715, 201.0292857142857, 918.9147428571429, 354.25612857142863]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.63987142857142, 106.28702857142856, 251.5852857142857, 217.85561428571427, 195.58744285714286, 122.65004285714284, 405.7429428571428, 201.35047142857144, 919.5957571428571, 354.32647142857144]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.53225714285713, 106.97547142857142, 251.60670000000002, 219.04171428571428, 196.01141428571427, 121.9265, 408.06892857142856, 201.03034285714287, 919.1339714285714, 355.9756285714285]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.93205714285715, 106.5062, 251.5726857142857, 218.11735714285717, 195.7572, 122.04292857142856, 405.4580714285714, 201.7030142857143, 919.2392, 354.2550571428571]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.8523857142857, 107.32355714285714, 251.6129142857143, 217.5839, 198.12535714285715, 123.66334285714285, 407.4700857142857, 204.62287142857141, 922.4658999999999, 354.26514285714285]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.77304285714285, 106.66014285714286, 251.9220857142857, 217.57694285714288, 195.74545714285713, 122.72952857142857, 405.9416285714286, 201.72331428571428, 919.4054857142856, 354.8088142857143]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.2496, 105.66615714285714, 251.58571428571426, 217.5746142857143, 195.6006857142857, 124.13959999999999, 405.2627428571428, 201.4648142857143, 918.8931428571428, 354.25911428571436]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.91960000000002, 106.26771428571429, 251.59812857142856, 218.50858571428574, 195.81137142857142, 122.70385714285713, 405.7017142857143, 201.53388571428573, 919.5738857142857, 354.2611285714286]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.31180000000002, 107.94134285714286, 254.04504285714282, 219.7162142857143, 197.81651428571428, 123.31977142857143, 405.2724714285714, 201.2761, 921.5310142857143, 354.2551857142857]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.70662857142858, 108.85482857142857, 251.62272857142855, 218.33754285714286, 195.98510000000002, 122.59207142857143, 406.6929, 201.96315714285714, 919.5687714285715, 357.0718285714286]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.27594285714285, 105.78518571428572, 251.5854, 218.83215714285714, 195.60817142857144, 122.13232857142854, 408.4087, 202.91958571428572, 918.9217142857143, 355.00381428571427]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.15775714285714, 105.4508, 251.6265142857143, 217.59165714285714, 195.60561428571427, 123.69374285714285, 405.2855714285714, 202.53420000000003, 919.0261714285714, 354.2628142857143]]}, 'No noise kNN-graph_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [27.834728571428574, 20.7911, 21.290533333333332, 13.924357142857144, 20.13914285714286, -1, 27.47713333333333, -1, 32.58072857142857, 42.273585714285716]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.67612857142857, 8.038035714285714, 18.55605714285714, 13.975457142857142, 18.60314285714286, 8.927702857142858, 20.57776714285714, 8.417028571428572, 30.858214285714286, 39.58218571428571]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.73557142857143, 8.141387142857143, 18.445728571428567, 14.014442857142855, 18.73852857142857, 8.912028571428571, 20.953609999999998, 8.351011428571429, 31.082528571428572, 39.622414285714285]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.537114285714285, 8.194971428571428, 18.295042857142857, 13.829571428571429, 18.106099999999998, 9.714247142857143, 20.649274285714284, 10.00546, 30.407485714285716, 39.79874285714286]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [20.08577142857143, 8.256002857142857, 21.970999999999997, 13.829657142857142, 18.97037142857143, 11.307795714285716, 21.063954285714285, 9.087221428571429, 30.664457142857145, 41.31998571428572]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.651257142857144, 8.273514285714286, 18.505085714285713, 13.883042857142856, 18.358185714285714, 9.746515714285712, 20.71583, 10.025719999999998, 30.471085714285714, 40.372014285714286]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [17.515719999999998, 6.096101428571428, 18.01320857142857, 12.728331428571428, 17.40563428571428, 7.711939999999999, 14.674642857142857, 8.46769857142857, 25.019457142857142, 38.072042857142854]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [21.4001, 9.680794285714285, 22.596700000000002, 15.735014285714284, 31.40088333333333, -1, 21.05089142857143, 11.320738571428572, 31.156114285714285, 42.035575]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [26.072157142857144, 22.863028571428572, 24.934014285714284, 14.108257142857141, 21.46577142857143, 38.58882857142857, 24.485685714285715, 51.303757142857144, 36.99798571428572, 43.24367142857143]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [19.86945, 8.860608571428573, 24.981257142857142, 13.88286142857143, 20.105716666666666, -1, 22.328601428571428, 7.813924285714286, 33.26445714285715, 39.076139999999995]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [21.506028571428573, 10.718832857142855, 24.471885714285712, 16.594328571428573, 32.01238333333333, -1, 22.631085714285714, 12.11378, 33.585657142857144, 42.171575000000004]]}, 'No noise kNN-graph_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.046273400000000006, 0.049392314285714285, 0.05040237142857144, 0.050912985714285715, 0.05938215714285715, 0.039194957142857145, 0.05884847142857143, 0.05015808571428571, 0.054189828571428574, 0.05704992857142858]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0528161, 0.045562171428571434, 0.0656242, 0.06050025714285713, 0.05411832857142857, 0.05492609999999999, 0.07167955714285713, 0.06143692857142857, 0.09659792857142858, 0.06079691428571428]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0362774, 0.037593328571428566, 0.05059438571428572, 0.04357017142857143, 0.04184215714285715, 0.032406142857142856, 0.05683205714285714, 0.04244252857142857, 0.09521642857142856, 0.04771872857142857]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.003351029285714286, 0.0015742505714285715, 0.0036259291428571427, 0.0040234114285714285, 0.002927537142857143, 0.003600152857142857, 0.004387112857142857, 0.0017636134285714286, 0.003936962857142857, 0.003156275142857143]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.15340892857142857, 0.1549979, 0.38289415714285713, 0.26732505714285715, 0.2799025571428571, 0.1665289, 0.4833947571428571, 0.252632, 1.066005857142857, 0.3912508]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0025267714285714285, 0.001343006, 0.0012218024285714287, 0.0029095985714285713, 0.002474167142857143, 0.0026856068571428577, 0.001933464857142857, 0.0012133724285714287, 0.0031909228571428577, 0.002439711142857143]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.002247523, 0.002142565857142857, 0.0029091705714285707, 0.0033200508571428573, 0.003589361428571429, 0.0029662399999999998, 0.0031954885714285714, 0.001917280857142857, 0.0023088349999999995, 0.00276152]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0026399328571428573, 0.0022092432857142856, 0.0024362212857142853, 0.002492927142857143, 0.0025846514285714287, 0.0029938165714285714, 0.003083675714285714, 0.001899364, 0.0035932014285714286, 0.003255573285714286]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0074511, 0.007590915714285713, 0.008533141428571428, 0.007814442857142856, 0.007912044285714286, 0.008867752857142858, 0.008434947142857143, 0.0072606257142857145, 0.007109754285714287, 0.006672778571428571]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0004980992857142858, 0.0005330554285714286, 0.0011292142857142857, 0.0009318460000000001, 0.000845409, 0.00044960814285714283, 0.0006164031428571428, 0.0007532894285714285, 0.0007982958571428573, 0.0005345237142857143]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.03511762857142857, 0.03568328571428571, 0.03562014285714286, 0.03313867142857143, 0.033095985714285715, 0.033549214285714286, 0.04023968571428571, 0.029964571428571427, 0.034644828571428574, 0.029448185714285712]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.01800422857142857, 0.013646517142857143, 0.017195535714285715, 0.01416327142857143, 0.016486057142857145, 0.012078018571428572, 0.01824394285714286, 0.007658865714285715, 0.014404364285714287, 0.016144614285714284]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0039157571428571425, 0.0019057807142857143, 0.00609993857142857, 0.0030770722857142857, 0.0042254300000000005, 0.002741388142857143, 0.00266881, 0.0021082475714285713, 0.002396662857142857, 0.0024895358571428573]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.003283649142857143, 0.0026613699999999997, 0.0017036381428571427, 0.0027142957142857146, 0.0029234885714285717, 0.0021614514285714288, 0.003090364285714286, 0.0015390695714285715, 0.0029157357142857135, 0.0030118885714285715]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00031096954285714283, 0.000343118, 0.00021569421428571433, 6.522825714285713e-05, 0.0002500062142857143, 0.00022732720000000006, 0.00015481927142857146, 0.00022916791428571429, 0.00023542198571428573, 0.0006007093]]}, 'No noise kNN-graph_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.003555942857142857, 0.009040714285714286, 0.0, 0.0, 3.330585714285714e-05, 2.6241142857142855e-05, 0.0, 0.0, 0.0, 0.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [8.411914285714286e-05, 1.38555e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'No noise kNN-graph_struct_N': {'3DQuadric': [['kNN-graph'], [18327.1]], 'PC-MLS': [['kNN-graph'], [18327.1]], '2-Monge': [['kNN-graph'], [18327.1]], 'Varifolds': [['kNN-graph'], [18327.1]], 'WaveJets': [['kNN-graph'], [18327.1]], 'AvgHexagram': [['kNN-graph'], [18327.1]], 'ShapeOperator': [['kNN-graph'], [18327.1]], 'PCA': [['kNN-graph'], [18327.1]], 'ASO': [['kNN-graph'], [18327.1]], 'APSS': [['kNN-graph'], [18327.1]], 'Sphere': [['kNN-graph'], [18327.1]], 'UnorientedSphere': [['kNN-graph'], [18327.1]], 'Cov2D': [['kNN-graph'], [18327.1]], 'NormCov2D': [['kNN-graph'], [18327.1]], 'Mean': [['kNN-graph'], [18327.1]]}, 'No noise kNN-graph_struct_Neighbors count': {'3DQuadric': [['kNN-graph'], [289.95372428571426]], 'PC-MLS': [['kNN-graph'], [289.71657000000005]], '2-Monge': [['kNN-graph'], [289.8798614285715]], 'Varifolds': [['kNN-graph'], [289.9142014285714]], 'WaveJets': [['kNN-graph'], [289.6620928571429]], 'AvgHexagram': [['kNN-graph'], [290.2302928571429]], 'ShapeOperator': [['kNN-graph'], [289.7583771428571]], 'PCA': [['kNN-graph'], [290.8985457142856]], 'ASO': [['kNN-graph'], [289.9286442857143]], 'APSS': [['kNN-graph'], [289.7696185714286]], 'Sphere': [['kNN-graph'], [289.78798714285716]], 'UnorientedSphere': [['kNN-graph'], [290.84854571428576]], 'Cov2D': [['kNN-graph'], [290.5395557142856]], 'NormCov2D': [['kNN-graph'], [290.04729999999995]], 'Mean': [['kNN-graph'], [289.62348428571426]]}, 'No noise kNN-graph_struct_RMSAE Normal': {'3DQuadric': [['kNN-graph'], [26.405188888888883]], 'PC-MLS': [['kNN-graph'], [18.621171999999998]], '2-Monge': [['kNN-graph'], [18.699725142857144]], 'Varifolds': [['kNN-graph'], [18.753801000000003]], 'WaveJets': [['kNN-graph'], [19.655621714285715]], 'PCA': [['kNN-graph'], [18.900225142857142]], 'ASO': [['kNN-graph'], [16.570477714285715]], 'APSS': [['kNN-graph'], [21.82293051724138]], 'Sphere': [['kNN-graph'], [30.406315714285718]], 'UnorientedSphere': [['kNN-graph'], [20.56192661016949]], 'Mean': [['kNN-graph'], [22.917148983050843]]}, 'No noise kNN-graph_struct_Timings (ms)': {'3DQuadric': [['kNN-graph'], [0.05158045]], 'PC-MLS': [['kNN-graph'], [0.06240584857142856]], '2-Monge': [['kNN-graph'], [0.04844933285714285]], 'Varifolds': [['kNN-graph'], [0.003234627471428571]], 'WaveJets': [['kNN-graph'], [0.35983409142857153]], 'AvgHexagram': [['kNN-graph'], [0.0021938423714285716]], 'ShapeOperator': [['kNN-graph'], [0.002735803614285714]], 'PCA': [['kNN-graph'], [0.0027188606999999994]], 'ASO': [['kNN-graph'], [0.0077647502857142855]], 'APSS': [['kNN-graph'], [0.0007089744285714287]], 'Sphere': [['kNN-graph'], [0.03405021999999999]], 'UnorientedSphere': [['kNN-graph'], [0.01480254157142857]], 'Cov2D': [['kNN-graph'], [0.003162862314285714]], 'NormCov2D': [['kNN-graph'], [0.0026004951142857145]], 'Mean': [['kNN-graph'], [0.00026324618999999997]]}, 'No noise kNN-graph_struct_Non-stable ratio': {'3DQuadric': [['kNN-graph'], [0.0012656204142857143]], 'PC-MLS': [['kNN-graph'], [0.0]], '2-Monge': [['kNN-graph'], [0.0]], 'Varifolds': [['kNN-graph'], [0.0]], 'WaveJets': [['kNN-graph'], [0.0]], 'AvgHexagram': [['kNN-graph'], [0.0]], 'ShapeOperator': [['kNN-graph'], [0.0]], 'PCA': [['kNN-graph'], [0.0]], 'ASO': [['kNN-graph'], [3.0588714285714285e-06]], 'APSS': [['kNN-graph'], [3.0588714285714285e-06]], 'Sphere': [['kNN-graph'], [9.797464285714285e-06]], 'UnorientedSphere': [['kNN-graph'], [3.0588714285714285e-06]], 'Cov2D': [['kNN-graph'], [0.0]], 'NormCov2D': [['kNN-graph'], [0.0]], 'Mean': [['kNN-graph'], [0.0]]}, 'Helios kNN-graph_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]]}, 'Helios kNN-graph_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.72356000000002, 350.81051, 657.95733, 1081.05144, 1621.5311299999998, 2275.3088500000003, 3044.3508]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.83351999999996, 351.77950999999996, 658.00988, 1081.79243, 1621.63655, 2275.07644, 3044.2694999999994]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [150.27645, 351.23411, 657.6335499999999, 1081.2560099999998, 1621.45836, 2274.8304200000002, 3045.1584]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.78367999999995, 351.42568, 657.56377, 1080.95454, 1621.43385, 2275.14051, 3044.107]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.62946, 350.70277999999996, 657.34059, 1080.9236299999998, 1621.35882, 2274.66237, 3044.2089]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.66839, 351.43743000000006, 657.64822, 1080.89394, 1622.41711, 2274.91934, 3043.7976000000003]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.5671, 350.78812, 657.58735, 1080.87266, 1621.38051, 2274.9169, 3043.8224]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.55459000000002, 351.02121999999997, 657.35549, 1080.99282, 1621.6983100000002, 2274.77232, 3044.0298]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.47696000000002, 350.86175999999995, 657.43116, 1080.88457, 1621.3544399999998, 2274.6885900000007, 3043.8738999999996]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.49666, 351.19393, 657.46989, 1080.87228, 1621.38358, 2274.6768700000002, 3043.8557]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.48682, 350.73667, 657.80205, 1080.8715699999998, 1621.39713, 2274.79698, 3043.9833]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.50217, 351.92283000000003, 657.4583399999999, 1081.1598000000001, 1622.11778, 2275.45894, 3044.2335]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [150.26504, 351.31683, 657.71488, 1081.13145, 1621.71823, 2275.7938999999997, 3043.8705]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.63411, 350.9441, 658.00236, 1080.9574, 1621.6948799999998, 2274.9124899999997, 3043.9844000000003]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.4735, 350.98295, 657.58326, 1081.13746, 1622.08201, 2275.23276, 3044.3056]]}, 'Helios kNN-graph_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [36.74734, 33.67817, 31.94409, 30.96546, 30.403279999999995, 30.06427, 29.718580000000003]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [36.278389999999995, 35.25981, 33.86446, 33.05541999999999, 32.750299999999996, 32.727, 32.567620000000005]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.848150000000004, 33.015339999999995, 32.10334, 31.80491, 32.10798, 32.54085, 32.68235]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.916430000000005, 31.837290000000003, 30.292800000000007, 29.580220000000004, 29.031, 29.25122, 29.308369999999996]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.946760000000005, 34.04880000000001, 32.96178, 32.440290000000005, 32.048629999999996, 32.29273, 32.256609999999995]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.89426, 31.828630000000004, 30.277479999999997, 29.55814, 29.01642, 29.24425, 29.30534]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.184903000000002, 14.46196, 15.774866, 17.579120000000003, 19.02194, 20.333349999999996, 21.468300000000003]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.055772999999999, 15.398323000000001, 17.423730000000003, 19.341010000000004, 21.07578, 22.49002, 23.72073]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.02002, 33.26662, 32.267669999999995, 31.71259, 31.22558, 30.936230000000002, 30.768390000000004]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.352882, 15.822519, 17.97009, 19.86952, 21.61532, 22.826259999999998, 23.935380000000002]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.02493, 19.76212, 22.66029, 24.75147, 26.274849999999997, 27.519440000000003, 28.69562]]}, 'Helios kNN-graph_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.026238111, 0.04388915, 0.04990162, 0.04750796, 0.05698147, 0.05256018, 0.06198258999999999]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.03967905, 0.04927690999999999, 0.06661954, 0.09057151, 0.12948915, 0.14014777, 0.14838422]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.018143899999999998, 0.02401546, 0.03368083000000001, 0.048758550000000005, 0.06875551, 0.10338361, 0.10493133000000002]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0009363682999999999, 0.0010895796, 0.0009886075, 0.0010958618, 0.001089067, 0.0011690111, 0.001232361]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.046996460000000004, 0.09051176, 0.16139947000000002, 0.26059884, 0.39496022000000003, 0.56959996, 0.8037895899999998]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.000437391, 0.0006373161, 0.0005284468000000001, 0.000561895, 0.0005498536, 0.0005822821, 0.0006277813]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0005951999999999999, 0.0005555023000000001, 0.000645678, 0.000587981, 0.0006318851000000001, 0.0006533965, 0.000594466]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0005991426, 0.0006284138, 0.0006998337, 0.0006739513, 0.0006546945, 0.0007135243, 0.0006906349]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.001426243, 0.001546834, 0.001572458, 0.0014872050000000001, 0.001467942, 0.0015194289999999999, 0.001552434]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0001373835, 0.00016524649999999998, 0.00016236750000000002, 0.0001421964, 0.0001863373, 0.00015481059999999998, 0.00015650640000000002]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005859122999999999, 0.0059281970000000005, 0.005975449999999999, 0.00600743, 0.006147313, 0.006696505, 0.016305240000000002]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.004400682, 0.005434795, 0.005228438, 0.005172194, 0.0052290439999999995, 0.00505305, 0.0063390370000000005]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0009427609, 0.0010781281, 0.0008214027000000001, 0.0008684514, 0.0008852106, 0.0010799311, 0.001112759]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0007406469000000001, 0.0008608632, 0.0008814503000000001, 0.0009071675999999999, 0.0011830866, 0.0009173361, 0.0011261575]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [9.422076e-05, 9.085043e-05, 8.548738999999999e-05, 9.154739e-05, 0.00013272927, 9.099027000000001e-05, 8.326391e-05]]}, 'Helios kNN-graph_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.04544224079999999, 0.0031130522900000004, 0.00019081699, 9.668129e-05, 7.785419e-05, 7.785419e-05, 4.020009e-05]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00029786879, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00576395626, 0.00020408605, 0.00011296200000000001, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00576395626, 0.00020408605, 0.00011296200000000001, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0057179482499999995, 0.00020408605, 0.00011296200000000001, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00575630396, 0.00021350005, 0.000122376, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.88271e-05]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]]}, 'Helios kNN-graph_Noise normal_N': {'3DQuadric': [[0.0], [86085.6]], 'PC-MLS': [[0.0], [86085.6]], '2-Monge': [[0.0], [86085.6]], 'Varifolds': [[0.0], [86085.6]], 'WaveJets': [[0.0], [86085.6]], 'AvgHexagram': [[0.0], [86085.6]], 'ShapeOperator': [[0.0], [86085.6]], 'PCA': [[0.0], [86085.6]], 'ASO': [[0.0], [86085.6]], 'APSS': [[0.0], [86085.6]], 'Sphere': [[0.0], [86085.6]], 'UnorientedSphere': [[0.0], [86085.6]], 'Cov2D': [[0.0], [86085.6]], 'NormCov2D': [[0.0], [86085.6]], 'Mean': [[0.0], [86085.6]]}, 'Helios kNN-graph_Noise normal_Neighbors count': {'3DQuadric': [[0.0], [1311.5333742857144]], 'PC-MLS': [[0.0], [1311.7711185714286]], '2-Monge': [[0.0], [1311.6924714285717]], 'Varifolds': [[0.0], [1311.4870042857142]], 'WaveJets': [[0.0], [1311.2609357142856]], 'AvgHexagram': [[0.0], [1311.5402900000001]], 'ShapeOperator': [[0.0], [1311.2764342857145]], 'PCA': [[0.0], [1311.3463642857143]], 'ASO': [[0.0], [1311.2244828571431]], 'APSS': [[0.0], [1311.2784157142855]], 'Sphere': [[0.0], [1311.29636]], 'UnorientedSphere': [[0.0], [1311.693337142857]], 'Cov2D': [[0.0], [1311.6872614285717]], 'NormCov2D': [[0.0], [1311.4471057142857]], 'Mean': [[0.0], [1311.542505714286]]}, 'Helios kNN-graph_Noise normal_RMSAE Normal': {'3DQuadric': [[0.0], [31.93159857142857]], 'PC-MLS': [[0.0], [33.78614285714286]], '2-Monge': [[0.0], [32.728988571428566]], 'Varifolds': [[0.0], [30.45961857142857]], 'WaveJets': [[0.0], [33.142228571428575]], 'PCA': [[0.0], [30.44636]], 'ASO': [[0.0], [17.260634142857143]], 'APSS': [[0.0], [19.07219514285714]], 'Sphere': [[0.0], [32.17101428571429]], 'UnorientedSphere': [[0.0], [19.484567285714288]], 'Mean': [[0.0], [23.812674285714287]]}, 'Helios kNN-graph_Noise normal_Timings (ms)': {'3DQuadric': [[0.0], [0.04843729728571428]], 'PC-MLS': [[0.0], [0.09488116428571429]], '2-Monge': [[0.0], [0.05738131285714287]], 'Varifolds': [[0.0], [0.0010858366142857143]], 'WaveJets': [[0.0], [0.33255090000000004]], 'AvgHexagram': [[0.0], [0.0005607094142857143]], 'ShapeOperator': [[0.0], [0.0006091584142857143]], 'PCA': [[0.0], [0.000665742157142857]], 'ASO': [[0.0], [0.0015103635714285712]], 'APSS': [[0.0], [0.00015783545714285715]], 'Sphere': [[0.0], [0.007559894000000002]], 'UnorientedSphere': [[0.0], [0.00526532]], 'Cov2D': [[0.0], [0.0009698062571428568]], 'NormCov2D': [[0.0], [0.0009452440285714286]], 'Mean': [[0.0], [9.558420285714287e-05]]}, 'Helios kNN-graph_Noise normal_Non-stable ratio': {'3DQuadric': [[0.0], [0.0070055285485714274]], 'PC-MLS': [[0.0], [6.810379857142857e-05]], '2-Monge': [[0.0], [6.810379857142857e-05]], 'Varifolds': [[0.0], [6.810379857142857e-05]], 'WaveJets': [[0.0], [6.810379857142857e-05]], 'AvgHexagram': [[0.0], [6.810379857142857e-05]], 'ShapeOperator': [[0.0], [7.079337000000001e-05]], 'PCA': [[0.0], [6.810379857142857e-05]], 'ASO': [[0.0], [0.0008956107157142857]], 'APSS': [[0.0], [0.0008956107157142857]], 'Sphere': [[0.0], [0.0008890381428571428]], 'UnorientedSphere': [[0.0], [0.0008972072442857143]], 'Cov2D': [[0.0], [6.810379857142857e-05]], 'NormCov2D': [[0.0], [6.810379857142857e-05]], 'Mean': [[0.0], [6.810379857142857e-05]]}, 'Helios kNN-graph_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]]}, 'Helios kNN-graph_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.6949999999999, 746.7438857142857, 1836.4685714285715, 2344.468857142857, 272.2182142857143, 57.23950000000001, 1705.438142857143, 1174.0764285714286, 1383.5601428571429, 2617.4249999999997]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.6847142857142, 747.4969571428571, 1836.5907142857143, 2343.7044285714287, 272.71387142857145, 57.24064285714286, 1705.5564285714283, 1173.9651428571428, 1384.3778571428572, 2618.3804285714286]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.7717142857143, 747.1701857142858, 1837.0974285714285, 2343.569142857142, 273.34031428571427, 57.25092857142857, 1705.298, 1174.5882857142856, 1383.5031428571426, 2617.3355714285717]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.376, 747.2343857142857, 1836.4682857142857, 2343.4151428571427, 273.6219571428572, 57.2484142857143, 1705.633142857143, 1173.698, 1382.842142857143, 2617.3325714285716]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.2575714285714, 746.745, 1836.6094285714285, 2343.010142857143, 272.3394857142857, 57.650442857142856, 1705.1512857142857, 1173.722, 1382.8702857142857, 2617.2537142857145]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.8765714285715, 746.9750857142857, 1836.429, 2342.9559999999997, 274.7393, 57.26508571428571, 1705.2694285714283, 1173.685714285714, 1382.9168571428575, 2617.2898571428573]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.3602857142856, 746.9267142857143, 1836.3774285714285, 2343.282857142857, 272.2895857142857, 57.27732857142856, 1705.3155714285713, 1173.6665714285716, 1382.8964285714285, 2617.3715714285713]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.3261428571428, 746.8318285714286, 1836.3655714285712, 2343.4938571428575, 272.31338571428574, 57.30857142857143, 1705.1738571428573, 1174.2898571428573, 1382.9804285714285, 2617.380142857143]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.2887142857144, 746.7866142857143, 1836.4141428571427, 2343.0858571428575, 272.2575285714286, 57.28225714285714, 1705.3075714285712, 1173.6640000000002, 1382.896142857143, 2617.2619999999997]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.2861428571429, 746.7699571428572, 1836.4504285714283, 2342.977142857143, 272.9008, 57.2744, 1705.2001428571427, 1173.6477142857143, 1382.8841428571427, 2617.3932857142854]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.2629999999999, 746.9279, 1836.5574285714285, 2343.0894285714285, 272.2483857142857, 57.92431428571428, 1705.181142857143, 1173.6088571428572, 1382.9182857142857, 2617.244857142857]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.7498571428571, 747.0387571428572, 1837.328, 2343.6130000000003, 272.97217142857147, 57.26701428571429, 1705.5317142857143, 1173.8115714285716, 1384.0907142857143, 2617.5305714285714]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.4897142857143, 747.5915571428571, 1836.4114285714284, 2343.493142857143, 273.37298571428573, 58.56135714285714, 1705.2147142857143, 1173.767285714286, 1383.2557142857142, 2617.7147142857143]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.3544285714286, 747.0113285714285, 1836.8385714285712, 2343.3281428571427, 272.80327142857146, 57.272028571428564, 1705.2361428571426, 1174.1567142857143, 1382.9984285714286, 2617.4719999999993]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [978.0651428571429, 747.6940142857144, 1836.6371428571426, 2343.725142857143, 272.2936, 57.28615714285714, 1705.463857142857, 1173.8408571428572, 1382.8988571428574, 2617.520285714286]]}, 'Helios kNN-graph_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [31.166114285714283, 33.1494, 24.205414285714284, 37.08087142857143, 36.87325714285714, 35.62942857142857, 30.721314285714282, 27.705342857142856, 25.572042857142858, 37.2128]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [28.452142857142853, 33.63817142857143, 31.399228571428576, 33.293057142857144, 39.99764285714286, 35.31805714285714, 35.93535714285714, 26.94644285714286, 30.947457142857143, 41.93387142857143]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [26.849457142857148, 32.20261428571428, 31.064742857142864, 29.864914285714292, 37.81682857142857, 35.7444, 36.0131, 24.552685714285712, 31.084571428571422, 42.09657142857143]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [25.337600000000002, 32.09945714285714, 27.559328571428573, 32.47208571428572, 35.5932, 30.941514285714288, 31.21734285714286, 20.87794285714286, 28.689514285714285, 39.8082]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [28.503728571428574, 33.05985714285715, 30.87288571428572, 31.390042857142852, 38.00782857142858, 34.7941, 33.02621428571428, 29.727228571428572, 30.66904285714286, 41.37135714285715]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [25.34114285714286, 32.100528571428576, 27.566385714285712, 32.473128571428575, 35.60227142857143, 30.76098571428571, 31.216000000000005, 20.88314285714286, 28.706142857142854, 39.813871428571424]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [10.561431428571428, 10.106647142857144, 22.05805714285714, 12.688474285714287, 19.513157142857143, 12.268528571428572, 18.363657142857143, 9.932845714285715, 23.630214285714285, 33.48332857142857]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [11.85703142857143, 11.94734, 24.56974285714286, 13.860558571428571, 21.41024285714286, 13.815990000000001, 20.82894285714286, 11.607317142857141, 27.72017142857143, 33.104614285714284]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [28.416214285714286, 32.24364285714286, 28.42834285714286, 36.57028571428571, 35.58965714285714, 30.54622857142857, 31.75088571428572, 28.927085714285713, 29.403185714285712, 39.83461428571429]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [11.717427142857144, 12.236322857142858, 26.24274285714286, 13.898600000000002, 22.323757142857144, 14.22916714285714, 23.605514285714285, 12.675112857142858, 30.587314285714285, 27.32971428571429]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [15.348528571428572, 16.557342857142856, 32.45905714285714, 16.702071428571426, 25.51564285714286, 17.564714285714285, 28.231257142857142, 15.565328571428571, 34.236000000000004, 35.946799999999996]]}, 'Helios kNN-graph_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.04547924285714285, 0.043967785714285716, 0.05306487142857143, 0.04870667142857143, 0.04534692857142857, 0.043290358571428565, 0.04903347142857143, 0.04612508571428571, 0.05666794285714286, 0.05269061428571429]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0730668, 0.062235314285714285, 0.13480325714285715, 0.14267045714285714, 0.041869342857142854, 0.031991014285714284, 0.11684427142857143, 0.07969244285714286, 0.11383968571428572, 0.15179905714285713]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.04221998571428571, 0.03655451428571428, 0.08296617142857143, 0.08697418571428572, 0.022912914285714285, 0.016847157142857144, 0.07204345714285713, 0.048390185714285716, 0.06259502857142858, 0.10230952857142857]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.000984809857142857, 0.0010443365714285714, 0.0012399481428571428, 0.001082951142857143, 0.0010307871428571428, 0.0011590324285714285, 0.0010264465714285712, 0.001157251142857143, 0.0008268390000000001, 0.001305964142857143]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.2300521142857143, 0.1895206857142857, 0.514995, 0.5928579714285714, 0.07095268571428572, 0.02276035714285714, 0.4313101142857142, 0.2802183142857143, 0.3478796714285714, 0.6449620857142857]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0005705212857142857, 0.0005338508571428572, 0.0005894002857142857, 0.000581039, 0.0005175697142857143, 0.0005354412857142857, 0.0005292938571428571, 0.00043938942857142855, 0.0006592869999999999, 0.0006513014285714285]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0005636974285714285, 0.000647056857142857, 0.0006773741428571428, 0.0006127355714285714, 0.0004871307142857143, 0.0004940028571428571, 0.0005787098571428571, 0.0005801324285714286, 0.0007982844285714287, 0.0006524598571428571]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0006439878571428571, 0.0006228142857142857, 0.0006739085714285714, 0.0007158055714285713, 0.000650698, 0.0007498852857142857, 0.0006484342857142856, 0.0006509981428571429, 0.000637923142857143, 0.0006629664285714285]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0014067528571428572, 0.0016266114285714286, 0.0016250971428571428, 0.0015694271428571428, 0.0014375600000000003, 0.0012528014285714286, 0.0015475799999999998, 0.0015389842857142857, 0.0015491885714285713, 0.0015496328571428571]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00014949371428571426, 0.00015051828571428568, 0.00015846057142857145, 0.0001571282857142857, 0.00015341885714285713, 0.0001847087142857143, 0.0001558837142857143, 0.00013885814285714287, 0.00016078185714285716, 0.00016910242857142856]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.007359325714285715, 0.007358632857142856, 0.008077452857142857, 0.007918884285714287, 0.00745129, 0.0073611157142857144, 0.007664374285714285, 0.0064132842857142856, 0.008134591428571428, 0.007859988571428571]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.005464115714285714, 0.005390582857142856, 0.0054396857142857144, 0.005970925714285715, 0.004589035714285713, 0.004270104285714286, 0.005732317142857143, 0.0037446057142857146, 0.006053219999999999, 0.005998607142857143]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00084054, 0.0011097474285714285, 0.0008731107142857143, 0.001153114, 0.000870291857142857, 0.0007695172857142856, 0.0010658775714285714, 0.0010231485714285713, 0.000951575, 0.0010411401428571429]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0008635709999999999, 0.000915375142857143, 0.0010309192857142857, 0.0009024608571428572, 0.0010913702857142857, 0.0010055090000000001, 0.0009038048571428571, 0.0008324122857142857, 0.0010002741428571428, 0.0009067434285714287]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [9.974470000000001e-05, 8.290134285714286e-05, 9.955548571428572e-05, 0.00011556004285714285, 9.060437142857141e-05, 0.00011350137142857144, 0.00010166217142857141, 8.90474e-05, 7.805987142857144e-05, 8.520527142857143e-05]]}, 'Helios kNN-graph_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [6.559547142857143e-05, 0.000177418, 6.576614285714286e-06, 3.762695714285714e-05, 0.0005060667142857143, 0.069176074, 7.091505714285713e-05, 1.9315571428571427e-06, 0.0, 1.3081114285714285e-05]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.000685844, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.0001585272142857143, 0.00871423814285714, 1.313242857142857e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.0001585272142857143, 0.00871423814285714, 1.313242857142857e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.1926457142857144e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.0001341382142857143, 0.008673895285714285, 1.313242857142857e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.0001341382142857143, 0.008754592428571427, 1.313242857142857e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857143e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142858, 0.0, 0.0, 0.0, 0.0]]}, 'Helios kNN-graph_struct_N': {'3DQuadric': [['kNN-graph'], [86085.6]], 'PC-MLS': [['kNN-graph'], [86085.6]], '2-Monge': [['kNN-graph'], [86085.6]], 'Varifolds': [['kNN-graph'], [86085.6]], 'WaveJets': [['kNN-graph'], [86085.6]], 'AvgHexagram': [['kNN-graph'], [86085.6]], 'ShapeOperator': [['kNN-graph'], [86085.6]], 'PCA': [['kNN-graph'], [86085.6]], 'ASO': [['kNN-graph'], [86085.6]], 'APSS': [['kNN-graph'], [86085.6]], 'Sphere': [['kNN-graph'], [86085.6]], 'UnorientedSphere': [['kNN-graph'], [86085.6]], 'Cov2D': [['kNN-graph'], [86085.6]], 'NormCov2D': [['kNN-graph'], [86085.6]], 'Mean': [['kNN-graph'], [86085.6]]}, 'Helios kNN-graph_struct_Neighbors count': {'3DQuadric': [['kNN-graph'], [1311.5333742857144]], 'PC-MLS': [['kNN-graph'], [1311.7711185714286]], '2-Monge': [['kNN-graph'], [1311.6924714285717]], 'Varifolds': [['kNN-graph'], [1311.4870042857142]], 'WaveJets': [['kNN-graph'], [1311.2609357142856]], 'AvgHexagram': [['kNN-graph'], [1311.5402900000001]], 'ShapeOperator': [['kNN-graph'], [1311.2764342857145]], 'PCA': [['kNN-graph'], [1311.3463642857143]], 'ASO': [['kNN-graph'], [1311.2244828571431]], 'APSS': [['kNN-graph'], [1311.2784157142855]], 'Sphere': [['kNN-graph'], [1311.29636]], 'UnorientedSphere': [['kNN-graph'], [1311.693337142857]], 'Cov2D': [['kNN-graph'], [1311.6872614285717]], 'NormCov2D': [['kNN-graph'], [1311.4471057142857]], 'Mean': [['kNN-graph'], [1311.542505714286]]}, 'Helios kNN-graph_struct_RMSAE Normal': {'3DQuadric': [['kNN-graph'], [31.93159857142857]], 'PC-MLS': [['kNN-graph'], [33.78614285714286]], '2-Monge': [['kNN-graph'], [32.728988571428566]], 'Varifolds': [['kNN-graph'], [30.45961857142857]], 'WaveJets': [['kNN-graph'], [33.142228571428575]], 'PCA': [['kNN-graph'], [30.44636]], 'ASO': [['kNN-graph'], [17.260634142857143]], 'APSS': [['kNN-graph'], [19.07219514285714]], 'Sphere': [['kNN-graph'], [32.17101428571429]], 'UnorientedSphere': [['kNN-graph'], [19.484567285714288]], 'Mean': [['kNN-graph'], [23.812674285714287]]}, 'Helios kNN-graph_struct_Timings (ms)': {'3DQuadric': [['kNN-graph'], [0.04843729728571428]], 'PC-MLS': [['kNN-graph'], [0.09488116428571429]], '2-Monge': [['kNN-graph'], [0.05738131285714287]], 'Varifolds': [['kNN-graph'], [0.0010858366142857143]], 'WaveJets': [['kNN-graph'], [0.33255090000000004]], 'AvgHexagram': [['kNN-graph'], [0.0005607094142857143]], 'ShapeOperator': [['kNN-graph'], [0.0006091584142857143]], 'PCA': [['kNN-graph'], [0.000665742157142857]], 'ASO': [['kNN-graph'], [0.0015103635714285712]], 'APSS': [['kNN-graph'], [0.00015783545714285715]], 'Sphere': [['kNN-graph'], [0.007559894000000002]], 'UnorientedSphere': [['kNN-graph'], [0.00526532]], 'Cov2D': [['kNN-graph'], [0.0009698062571428568]], 'NormCov2D': [['kNN-graph'], [0.0009452440285714286]], 'Mean': [['kNN-graph'], [9.558420285714287e-05]]}, 'Helios kNN-graph_struct_Non-stable ratio': {'3DQuadric': [['kNN-graph'], [0.0070055285485714274]], 'PC-MLS': [['kNN-graph'], [6.810379857142857e-05]], '2-Monge': [['kNN-graph'], [6.810379857142857e-05]], 'Varifolds': [['kNN-graph'], [6.810379857142857e-05]], 'WaveJets': [['kNN-graph'], [6.810379857142857e-05]], 'AvgHexagram': [['kNN-graph'], [6.810379857142857e-05]], 'ShapeOperator': [['kNN-graph'], [7.079337000000001e-05]], 'PCA': [['kNN-graph'], [6.810379857142857e-05]], 'ASO': [['kNN-graph'], [0.0008956107157142857]], 'APSS': [['kNN-graph'], [0.0008956107157142857]], 'Sphere': [['kNN-graph'], [0.0008890381428571428]], 'UnorientedSphere': [['kNN-graph'], [0.0008972072442857143]], 'Cov2D': [['kNN-graph'], [6.810379857142857e-05]], 'NormCov2D': [['kNN-graph'], [6.810379857142857e-05]], 'Mean': [['kNN-graph'], [6.810379857142857e-05]]}, 'Noise normal kNN-graph_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1, 18327.1]]}, 'Noise normal kNN-graph_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.155162, 77.716124, 150.07945800000002, 247.52025, 365.57316, 502.98742, 654.5397]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.314213999999996, 78.27813, 149.467882, 247.67278999999996, 365.74728000000005, 502.02488, 654.3292799999999]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.329469999999997, 78.75757800000001, 150.03274199999998, 247.710862, 365.93273999999997, 501.88833999999997, 654.7425]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.131203999999997, 78.12967599999999, 149.893664, 248.220772, 366.21418, 502.50104000000005, 654.09902]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.197086, 77.69158200000001, 149.336312, 247.55499, 365.50939999999997, 501.94303999999994, 653.65032]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.893816, 78.88384400000001, 150.78948799999998, 248.00097399999999, 366.6351, 502.64038000000005, 653.6456199999999]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.271036, 78.349002, 150.510506, 248.50646799999998, 366.45084, 503.14259999999996, 653.8049599999999]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.017336, 78.944418, 149.63037599999998, 248.26614, 367.07307999999995, 504.69438, 654.56404]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.200143999999995, 78.25094200000001, 149.806334, 247.70591599999997, 366.25196000000005, 502.29792000000003, 653.8065]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.552418, 78.493804, 150.284828, 247.75659399999998, 366.31006, 502.83579999999995, 654.3972399999999]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.632184, 77.79461599999999, 149.480584, 247.963806, 365.5825, 502.46896, 654.14158]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.470233999999994, 78.149068, 149.54551800000002, 247.39665399999998, 365.55922, 502.3677599999999, 653.7055399999999]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [31.340373999999997, 78.999914, 150.80796200000003, 247.57605600000002, 365.89853999999997, 502.9236400000001, 653.82854]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.536626, 77.48776, 149.378664, 247.53497000000004, 366.4279600000001, 503.16486000000003, 654.51278]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [30.937498, 80.58123199999999, 152.091362, 248.557794, 366.90878, 503.79982, 655.4934199999999]]}, 'Noise normal kNN-graph_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [27.56496, 25.603233333333332, 25.318933333333334, 25.52165, 26.239342857142855, 27.054514285714287, 27.336099999999995]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.136464999999998, 15.022539000000002, 16.910204, 18.812847, 20.659439000000003, 22.219450000000005, 23.587260000000004]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.265562999999997, 15.133348999999999, 16.993933, 19.001652, 20.771998999999997, 22.1767, 23.554880000000004]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.554672999999998, 14.968432999999997, 17.016703999999997, 18.974027000000003, 21.01579999999999, 22.658990000000003, 24.087979999999998]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.528002, 15.634102000000002, 17.741415000000003, 19.659851, 21.800311999999998, 23.542889999999996, 24.68278]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.038578000000003, 15.131198, 17.127176999999996, 19.073143, 21.10407, 22.708040000000004, 24.119369999999993]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [8.3761202, 13.841985000000005, 15.2372508, 17.3872062, 19.2470862, 20.874534200000003, 22.700886]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.855096000000001, 16.7827452, 19.594032, 22.0370254, 24.342716, 26.526286, 28.489137999999997]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [32.346669999999996, 31.087290000000003, 29.688650000000003, 29.7825, 30.18801, 30.14761, 29.603480000000005]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [11.621616000000001, 15.5093318, 18.755650999999997, 21.011715199999998, 22.306284, 23.337487999999997, 24.268995999999998]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [13.5352148, 17.649136400000003, 20.750927400000002, 23.32703, 25.828629999999997, 28.25287399999999, 30.295550000000002]]}, 'Noise normal kNN-graph_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.044655876000000004, 0.048444448, 0.052768121999999994, 0.05258184, 0.051321578, 0.056090832, 0.055924868]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.039337555999999996, 0.04378455, 0.05175406, 0.058838919999999996, 0.06761173200000001, 0.075997174, 0.086132028]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.028112342000000002, 0.03247038, 0.03844618, 0.045066804, 0.054183140000000005, 0.063337138, 0.075236848]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0023655779, 0.002940125439999999, 0.0023701198000000002, 0.0026557453599999996, 0.0028307632000000005, 0.0030773913199999997, 0.0030859816599999993]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.05763333400000001, 0.11358432800000001, 0.20034911, 0.30463199, 0.43679768, 0.58999544, 0.77376654]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00222870986, 0.00270796432, 0.0027823696400000003, 0.00259330758, 0.0033970916000000003, 0.0030603224599999993, 0.0032735737399999998]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00214843698, 0.0024734320000000002, 0.00274585182, 0.0027765703999999996, 0.0031402558999999997, 0.00303264784, 0.0025945490000000002]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00221346242, 0.0026307639199999997, 0.00283659552, 0.0031069149799999997, 0.0028485764399999998, 0.00305916886, 0.0032414556400000003]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0067929272, 0.0077327202, 0.008010693, 0.007903146, 0.007518702399999999, 0.0081930132, 0.0077957697999999995]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00076071082, 0.0007392228399999999, 0.00064113776, 0.0008826556400000001, 0.0008694060399999999, 0.0009315643200000001, 0.0007958857800000001]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.031180755999999997, 0.031989512, 0.033032394, 0.032760368, 0.033707698, 0.033860082, 0.033448964]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.016264966999999998, 0.016299396, 0.0157870026, 0.018502933200000002, 0.017873751599999998, 0.019532610000000002, 0.0191629174]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0021521949200000003, 0.0026402813, 0.00294972792, 0.00274324866, 0.00296276938, 0.00279787844, 0.0034350128]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00209485918, 0.0028522571400000003, 0.00296459498, 0.00265827876, 0.0026863003600000003, 0.0029270982399999994, 0.00309730504]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00025092707, 0.000186537626, 0.000328146944, 0.000575819918, 0.00045078742400000006, 0.00022388164399999997, 0.00027774132200000004]]}, 'Noise normal kNN-graph_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.008859342899999999, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [6.858224999999999e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [2.14121e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'Noise normal kNN-graph_Noise normal_N': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [18327.1, 18327.1, 18327.1, 18327.1, 18327.1]]}, 'Noise normal kNN-graph_Noise normal_Neighbors count': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [290.04016, 289.78497, 290.2352400000001, 290.01081000000005, 289.6225871428572]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [289.70263571428575, 289.6148828571429, 289.7574057142857, 290.05055142857134, 290.04199285714293]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [289.92044714285714, 290.28937285714284, 289.82739571428573, 289.96031571428574, 290.2840628571428]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [289.85111571428575, 289.93570142857146, 290.5022485714286, 289.77436714285716, 290.0719642857143]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [289.4739457142857, 289.6343785714286, 289.51514, 289.54627285714287, 289.6036414285714]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [290.89114, 289.9891057142857, 290.2961357142857, 290.1282714285714, 291.18764857142855]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [290.78923000000003, 290.33307857142853, 290.92152714285714, 290.2075642857142, 289.9167514285714]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [291.4062671428572, 290.86517571428567, 290.3742414285714, 291.0307142857143, 290.74486571428577]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [289.74572714285716, 289.92163142857146, 289.8208357142857, 290.0325071428571, 289.9933814285714]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [290.14518857142855, 289.8073071428571, 290.4252314285714, 290.1212614285714, 290.66582857142856]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [289.88673285714293, 289.90087857142856, 289.6589185714286, 290.0919585714285, 289.7931042857143]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [290.04347714285717, 289.66163857142857, 289.6620071428572, 289.7622457142857, 289.5806271428571]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [289.74622999999997, 290.63068428571427, 289.9361799999999, 289.85144142857143, 290.81762571428567]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [290.28383428571425, 290.00868857142854, 290.38190714285724, 289.71675000000005, 290.3542628571429]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [291.66551, 291.87599, 290.70899999999995, 290.52497714285715, 291.20302714285714]]}, 'Noise normal kNN-graph_Noise normal_RMSAE Normal': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [26.405188888888883, 26.405188888888883, 26.405188888888883, 26.405188888888883, 26.405188888888883]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [18.621171999999998, 18.621171999999998, 18.621171999999998, 18.621171999999998, 18.621171999999998]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [18.699725142857144, 18.699725142857144, 18.699725142857144, 18.699725142857144, 18.699725142857144]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [18.753801000000003, 18.753801000000003, 18.753801000000003, 18.753801000000003, 18.753801000000003]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.655621714285715, 19.655621714285715, 19.655621714285715, 19.655621714285715, 19.655621714285715]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [18.900225142857142, 18.900225142857142, 18.900225142857142, 18.900225142857142, 18.900225142857142]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [16.774989142857144, 16.78296028571429, 16.797570000000004, 16.816100714285714, 16.874857428571428]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [21.464930857142857, 21.47762385714286, 21.499006714285713, 21.530022285714285, 21.619158142857145]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [30.406315714285718, 30.406315714285718, 30.406315714285718, 30.406315714285718, 30.406315714285718]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.45162242857143, 19.47566114285714, 19.51455942857143, 19.567733571428573, 19.712624857142856]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [22.678877285714286, 22.712642285714285, 22.76677857142857, 22.838733, 23.031085]]}, 'Noise normal kNN-graph_Noise normal_Timings (ms)': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.052704548571428575, 0.051893458571428575, 0.05096769714285714, 0.05022796285714285, 0.05262602142857143]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.06083495571428573, 0.05906936428571429, 0.06046190714285713, 0.06082169857142857, 0.06128066]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.04810988, 0.04706632714285714, 0.047635232857142856, 0.04881382142857143, 0.04898390428571429]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.002707322714285714, 0.0030020171142857138, 0.0025763330714285715, 0.002659434485714286, 0.0028589673857142856]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.35650331857142853, 0.3472146171428572, 0.35351899142857146, 0.35563079571428574, 0.35624543571428574]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0028027900857142854, 0.002866572042857143, 0.002948257042857143, 0.0028662441714285714, 0.0028328075142857144]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0026740928571428574, 0.002457043199999999, 0.0025350414857142852, 0.002935735628571428, 0.0029064753571428573]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0030636900000000004, 0.0029063158714285713, 0.002958307185714286, 0.0027134615285714287, 0.0025988952571428573]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.00716619342857143, 0.007542995857142855, 0.008139557000000002, 0.007632874, 0.008051931]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008650344857142857, 0.0006409328857142859, 0.0006602157428571429, 0.0008802966142857143, 0.0009682225571428572]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.03366148714285714, 0.03442223, 0.03311913714285715, 0.031712631428571426, 0.03135578142857143]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.016690163285714283, 0.01720647857142857, 0.018502375142857144, 0.016890647571428576, 0.018870033857142855]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0028520388, 0.0026477073142857147, 0.0026412934857142855, 0.0029666118142857145, 0.0029502867428571433]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0028184995285714287, 0.0028143078857142856, 0.002651149328571428, 0.002753485742857143, 0.0027344815857142856]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0003850908342857143, 0.0003348306357142857, 0.00024619789714285716, 0.00029761678999999994, 0.00037472237714285717]]}, 'Noise normal kNN-graph_Noise normal_Non-stable ratio': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0012656204142857143, 0.0012656204142857143, 0.0012656204142857143, 0.0012656204142857143, 0.0012656204142857143]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [9.797464285714285e-06, 9.797464285714285e-06, 9.797464285714285e-06, 9.797464285714285e-06, 9.797464285714285e-06]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06, 3.0588714285714285e-06]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0, 0.0, 0.0, 0.0, 0.0]]}, 'Noise normal kNN-graph_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18681.0, 20621.0, 5673.0, 23464.0, 17157.0, 16332.0, 20683.0, 26648.0, 22335.0, 11677.0]]}, 'Noise normal kNN-graph_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.58729428571428, 106.33190571428572, 251.5834457142857, 218.8784142857143, 196.35438571428574, 122.92618000000002, 405.6347514285714, 201.84441142857142, 919.8814257142858, 354.36532]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.77988285714287, 105.68986571428573, 251.59339142857144, 218.25597428571427, 195.82302857142855, 123.15528285714286, 406.5606485714286, 201.7179685714286, 919.4259314285714, 354.33296285714283]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.43486857142858, 105.86705714285715, 252.81036857142857, 218.64410857142857, 196.68416, 122.24314857142856, 405.96493999999996, 201.90432000000004, 919.8755628571429, 355.1346542857143]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.21779428571429, 105.82393142857143, 252.58263999999997, 217.92032, 196.3543542857143, 122.66617142857145, 405.97220857142855, 201.87934857142858, 920.0862057142857, 354.76782]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.36786285714284, 105.74663714285715, 251.67739428571429, 218.01497714285713, 196.00137142857142, 122.11889714285714, 405.5597714285714, 201.3023142857143, 919.1664028571428, 354.59112857142856]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.96932857142856, 107.18948, 252.87279999999996, 219.5022542857143, 195.59401142857143, 122.48475714285716, 406.62638000000004, 203.20686285714285, 919.7822600000001, 354.7564685714286]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [123.12050857142856, 106.09937142857142, 253.15430857142854, 218.69314000000003, 196.41043714285715, 123.31613428571428, 406.57395142857143, 201.6724057142857, 919.5970742857141, 355.69897142857144]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.06005142857141, 107.73565142857143, 251.59782285714286, 218.91929428571427, 197.68079714285716, 124.90898571428572, 406.7193142857143, 202.7341142857143, 920.2071685714285, 356.2793285714286]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.66465142857142, 106.17878285714286, 252.68466857142855, 217.99863999999997, 195.95412857142856, 122.85345428571428, 406.1649828571429, 201.39291142857144, 919.4424971428571, 354.6934485714286]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.44794857142858, 105.54206571428571, 252.61862000000002, 217.8849742857143, 197.0251257142857, 122.63535428571429, 406.9668514285714, 202.39305714285715, 919.5305028571427, 355.2851342857143]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.54788, 106.62606857142858, 251.5937, 218.10097714285715, 196.2173342857143, 122.56664571428571, 405.61437428571435, 201.48267428571432, 919.5372542857143, 355.3762771428572]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.91682857142857, 106.18951714285716, 251.59257142857138, 217.63785142857145, 196.95231714285714, 122.15189428571429, 405.7212914285714, 201.82832000000002, 919.022942857143, 354.40645714285716]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [121.66012285714285, 106.39124285714286, 252.32793999999998, 218.50365142857146, 197.2467, 123.23843142857142, 406.1980257142856, 202.14111428571428, 919.3833428571428, 354.8737514285715]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.50079714285714, 105.89800857142859, 253.3103057142857, 218.8263057142857, 196.16543714285717, 122.7095142857143, 405.5938742857142, 201.44772571428572, 919.2579028571429, 355.7810142857143]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [122.61524571428573, 106.72532571428573, 251.62071999999998, 219.28036, 196.82318285714288, 126.93975142857144, 407.66738857142855, 202.92405714285712, 921.3555371428572, 356.00543999999996]]}, 'Noise normal kNN-graph_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [27.834728571428574, 20.7911, 21.290533333333336, 13.924357142857142, 20.139142857142858, -1, 27.477133333333338, -1, 32.58072857142858, 42.273585714285716]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.67612857142857, 8.038035714285712, 18.556057142857146, 13.975457142857145, 18.60314285714286, 8.927702857142854, 20.57776714285714, 8.417028571428572, 30.85821428571429, 39.582185714285714]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.735571428571426, 8.141387142857143, 18.44572857142857, 14.014442857142857, 18.738528571428567, 8.912028571428573, 20.953609999999994, 8.351011428571429, 31.082528571428565, 39.62241428571428]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.53711428571428, 8.19497142857143, 18.295042857142853, 13.829571428571427, 18.1061, 9.714247142857143, 20.649274285714284, 10.00546, 30.40748571428572, 39.79874285714286]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [20.085771428571423, 8.256002857142857, 21.971, 13.829657142857144, 18.97037142857143, 11.307795714285716, 21.063954285714292, 9.087221428571429, 30.664457142857138, 41.31998571428572]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.651257142857144, 8.273514285714285, 18.505085714285713, 13.883042857142858, 18.35818571428571, 9.746515714285716, 20.71583, 10.025719999999998, 30.471085714285717, 40.37201428571429]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [17.72209571428571, 6.427732571428572, 18.317608571428572, 12.967837428571428, 17.681948285714288, 7.990554571428572, 14.899101142857145, 8.70256257142857, 25.307971428571427, 38.07554285714286]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [20.92381142857143, 10.102626857142857, 22.872082857142857, 16.04538857142857, 28.58420114285714, 11.232670857142857, 21.343142857142862, 11.597610571428572, 31.54958285714286, 40.93036571428571]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [26.072157142857144, 22.863028571428565, 24.934014285714284, 14.108257142857145, 21.465771428571422, 38.58882857142856, 24.48568571428572, 51.30375714285715, 36.997985714285704, 43.243671428571425]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [18.887405714285716, 9.316518000000002, 24.492842857142854, 13.757648571428572, 18.006267142857144, 9.036306857142858, 22.43105714285714, 9.030682285714287, 32.76651428571429, 37.719159999999995]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [21.78928857142857, 11.17142142857143, 24.82219142857143, 17.279668571428573, 30.02808314285714, 11.946332571428572, 23.074848571428575, 12.420515142857145, 34.37679428571429, 41.147088571428576]]}, 'Noise normal kNN-graph_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.05440702, 0.05038464285714286, 0.05292303714285714, 0.05157585142857144, 0.05230252857142857, 0.04555848571428572, 0.05520787714285714, 0.050418, 0.054436177142857145, 0.04962575714285715]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.05140916571428571, 0.04912631428571429, 0.05593487999999999, 0.057117965714285714, 0.05746309428571429, 0.04986509142857142, 0.06914889714285714, 0.053280728571428564, 0.09888300000000003, 0.06270803428571427]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.03801875714285714, 0.03550173142857142, 0.045884837142857154, 0.04495075142857143, 0.04320908857142858, 0.03717674285714285, 0.05609094, 0.04049122285714286, 0.09064210285714287, 0.04925215714285714]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.002647094857142857, 0.002466255371428571, 0.0025505164, 0.003030632714285714, 0.0025949718285714282, 0.0030605221142857137, 0.0030740918, 0.002392632171428572, 0.0029843384857142856, 0.0028070938]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.1621339857142857, 0.1525439028571429, 0.32302278000000006, 0.2660535514285714, 0.2614682885714285, 0.16897814571428568, 0.4813252714285714, 0.2597815085714285, 1.0599940257142855, 0.4029248571428571]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.002579829628571429, 0.0024331856571428567, 0.002789912942857143, 0.002852573485714286, 0.003169358, 0.0027518177142857145, 0.003056343542857143, 0.0027918247142857144, 0.0035418837142857144, 0.0026666123142857143]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.002974261457142857, 0.0027366083428571426, 0.0036159658285714285, 0.0028533620857142854, 0.002956259514285714, 0.002273646657142857, 0.0024636592, 0.002099841257142857, 0.0025690989142857145, 0.0024740738]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0031173697999999994, 0.0027530179714285712, 0.002490417085714286, 0.0030992325428571424, 0.0030923070857142854, 0.0029714690857142855, 0.0023456573142857143, 0.002435753428571428, 0.0032154636571428575, 0.0029606517142857143]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0074253457142857155, 0.007360872571428572, 0.008073577428571429, 0.008188095999999999, 0.008086028857142857, 0.0072369725714285715, 0.007305740571428572, 0.0077166760000000004, 0.007465458285714287, 0.00820833457142857]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0008313156857142857, 0.0007421821428571429, 0.0009700993714285713, 0.0009719568857142856, 0.0006084661714285714, 0.0007818018571428572, 0.0007071656285714286, 0.0007462104, 0.0007270156857142856, 0.000943190742857143]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.03203347714285714, 0.03373766, 0.034827468571428565, 0.03570184571428572, 0.035298874285714286, 0.03226116285714286, 0.033945865714285726, 0.027534454285714285, 0.034128371428571426, 0.02907335428571428]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.018168242, 0.01669582285714286, 0.01832271, 0.01635179142857143, 0.018041554285714287, 0.017958914571428567, 0.01712972514285714, 0.018228868571428573, 0.018396088571428576, 0.01702567942857143]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0028529761142857143, 0.0031082122571428564, 0.0025822686285714284, 0.002962084942857143, 0.0031905149142857146, 0.0027844122285714287, 0.0026752636, 0.002021267914285714, 0.003092677142857143, 0.0028461985714285714]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0028416862000000005, 0.002718006285714286, 0.0026813151999999993, 0.003173967428571429, 0.0033869292571428572, 0.0025609669428571426, 0.002959248971428571, 0.0023586214571428574, 0.002700937542857143, 0.0021621688571428575]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0003440802, 0.00026372624, 0.0003985589428571428, 0.0003488460771428571, 0.0001911012742857143, 0.0003538805914285714, 0.00024574154571428567, 0.0002200009142857143, 0.00047150198571428584, 0.00043947929714285714]]}, 'Noise normal kNN-graph_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.003555942857142857, 0.009040714285714284, 0.0, 0.0, 3.330585714285714e-05, 2.6241142857142855e-05, 0.0, 0.0, 0.0, 0.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [8.411914285714285e-05, 1.38555e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [3.058871428571429e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'Noise normal kNN-graph_struct_N': {'3DQuadric': [['kNN-graph'], [18327.1]], 'PC-MLS': [['kNN-graph'], [18327.1]], '2-Monge': [['kNN-graph'], [18327.1]], 'Varifolds': [['kNN-graph'], [18327.1]], 'WaveJets': [['kNN-graph'], [18327.1]], 'AvgHexagram': [['kNN-graph'], [18327.1]], 'ShapeOperator': [['kNN-graph'], [18327.1]], 'PCA': [['kNN-graph'], [18327.1]], 'ASO': [['kNN-graph'], [18327.1]], 'APSS': [['kNN-graph'], [18327.1]], 'Sphere': [['kNN-graph'], [18327.1]], 'UnorientedSphere': [['kNN-graph'], [18327.1]], 'Cov2D': [['kNN-graph'], [18327.1]], 'NormCov2D': [['kNN-graph'], [18327.1]], 'Mean': [['kNN-graph'], [18327.1]]}, 'Noise normal kNN-graph_struct_Neighbors count': {'3DQuadric': [['kNN-graph'], [289.93875342857143]], 'PC-MLS': [['kNN-graph'], [289.8334937142857]], '2-Monge': [['kNN-graph'], [290.0563188571429]], 'Varifolds': [['kNN-graph'], [290.0270794285714]], 'WaveJets': [['kNN-graph'], [289.5546757142857]], 'AvgHexagram': [['kNN-graph'], [290.49846028571426]], 'ShapeOperator': [['kNN-graph'], [290.43363028571423]], 'PCA': [['kNN-graph'], [290.8842528571429]], 'ASO': [['kNN-graph'], [289.90281657142856]], 'APSS': [['kNN-graph'], [290.2329634285714]], 'Sphere': [['kNN-graph'], [289.86631857142856]], 'UnorientedSphere': [['kNN-graph'], [289.74199914285714]], 'Cov2D': [['kNN-graph'], [290.1964322857143]], 'NormCov2D': [['kNN-graph'], [290.1490885714286]], 'Mean': [['kNN-graph'], [291.19570085714287]]}, 'Noise normal kNN-graph_struct_RMSAE Normal': {'3DQuadric': [['kNN-graph'], [26.405188888888887]], 'PC-MLS': [['kNN-graph'], [18.621172]], '2-Monge': [['kNN-graph'], [18.699725142857144]], 'Varifolds': [['kNN-graph'], [18.753801]], 'WaveJets': [['kNN-graph'], [19.655621714285715]], 'PCA': [['kNN-graph'], [18.900225142857142]], 'ASO': [['kNN-graph'], [16.809295514285715]], 'APSS': [['kNN-graph'], [21.51814837142857]], 'Sphere': [['kNN-graph'], [30.406315714285718]], 'UnorientedSphere': [['kNN-graph'], [19.544440285714284]], 'Mean': [['kNN-graph'], [22.805623228571427]]}, 'Noise normal kNN-graph_struct_Timings (ms)': {'3DQuadric': [['kNN-graph'], [0.05168393771428571]], 'PC-MLS': [['kNN-graph'], [0.060493717142857145]], '2-Monge': [['kNN-graph'], [0.048121833142857146]], 'Varifolds': [['kNN-graph'], [0.0027608149542857146]], 'WaveJets': [['kNN-graph'], [0.3538226317142857]], 'AvgHexagram': [['kNN-graph'], [0.002863334171428571]], 'ShapeOperator': [['kNN-graph'], [0.002701677705714286]], 'PCA': [['kNN-graph'], [0.002848133968571429]], 'ASO': [['kNN-graph'], [0.007706710257142857]], 'APSS': [['kNN-graph'], [0.0008029404571428571]], 'Sphere': [['kNN-graph'], [0.032854253428571435]], 'UnorientedSphere': [['kNN-graph'], [0.017631939685714283]], 'Cov2D': [['kNN-graph'], [0.0028115876314285717]], 'NormCov2D': [['kNN-graph'], [0.002754384814285714]], 'Mean': [['kNN-graph'], [0.0003276917068571429]]}, 'Noise normal kNN-graph_struct_Non-stable ratio': {'3DQuadric': [['kNN-graph'], [0.0012656204142857143]], 'PC-MLS': [['kNN-graph'], [0.0]], '2-Monge': [['kNN-graph'], [0.0]], 'Varifolds': [['kNN-graph'], [0.0]], 'WaveJets': [['kNN-graph'], [0.0]], 'AvgHexagram': [['kNN-graph'], [0.0]], 'ShapeOperator': [['kNN-graph'], [0.0]], 'PCA': [['kNN-graph'], [0.0]], 'ASO': [['kNN-graph'], [3.058871428571429e-06]], 'APSS': [['kNN-graph'], [3.058871428571429e-06]], 'Sphere': [['kNN-graph'], [9.797464285714285e-06]], 'UnorientedSphere': [['kNN-graph'], [3.058871428571429e-06]], 'Cov2D': [['kNN-graph'], [0.0]], 'NormCov2D': [['kNN-graph'], [0.0]], 'Mean': [['kNN-graph'], [0.0]]}, 'Helios + noise normal kNN-graph_Radius_N': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6, 86085.6]]}, 'Helios + noise normal kNN-graph_Radius_Neighbors count': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.797924, 351.517518, 657.8336959999999, 1081.742344, 1621.63044, 2275.401676, 3044.7890199999993]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [150.10545199999999, 351.2767960000001, 657.7520020000001, 1081.3578459999999, 1622.055812, 2275.38611, 3044.5527400000005]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [150.092288, 351.36900799999995, 657.9004759999999, 1081.24047, 1621.9866740000004, 2275.2098459999997, 3044.1820199999997]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [151.70109000000002, 351.191188, 657.54759, 1081.310958, 1621.8070739999998, 2274.8172400000003, 3043.93034]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.48371799999998, 350.77585400000004, 657.374872, 1080.899344, 1621.511234, 2274.697618, 3043.8559200000004]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [150.046936, 352.92933, 657.7287239999999, 1081.225354, 1621.7885960000003, 2275.00626, 3044.0699000000004]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.59252, 350.872856, 657.459874, 1081.033248, 1621.529246, 2274.7613220000003, 3043.9308399999995]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.74013599999998, 351.2873680000001, 657.6206240000001, 1081.703336, 1621.475102, 2274.9140939999997, 3044.2172000000005]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.5412, 350.86337199999997, 657.641048, 1080.9849940000001, 1621.3867780000003, 2274.862204, 3043.8689999999997]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.810528, 350.96023199999996, 657.542698, 1081.129198, 1621.3873100000003, 2274.6969160000003, 3043.89194]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.52474599999996, 350.81359199999997, 657.451674, 1080.98844, 1621.37025, 2275.209482, 3044.0535800000002]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [150.29259799999997, 351.214738, 657.928806, 1081.3778439999999, 1622.1769140000001, 2276.33791, 3044.22174]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.72209800000002, 351.017916, 657.6226099999999, 1080.995876, 1621.689284, 2275.0587819999996, 3043.94624]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [149.69987600000002, 351.02987599999994, 657.62089, 1081.237496, 1621.816362, 2275.1123219999995, 3044.01642]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [154.293494, 351.438442, 657.569898, 1081.2879639999999, 1621.9525599999997, 2274.90682, 3043.93054]]}, 'Helios + noise normal kNN-graph_Radius_RMSAE Normal': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [36.74734, 33.67817, 31.944089999999996, 30.965460000000004, 30.403279999999995, 30.064269999999997, 29.718580000000003]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [36.27839, 35.259809999999995, 33.86446, 33.055420000000005, 32.7503, 32.727, 32.56762]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [34.84815, 33.01534000000001, 32.103339999999996, 31.80491, 32.10798, 32.54085, 32.68235]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.91643, 31.837290000000003, 30.292800000000003, 29.580220000000004, 29.031000000000002, 29.251220000000004, 29.308370000000004]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.94676, 34.0488, 32.961780000000005, 32.440290000000005, 32.04863, 32.29273, 32.256609999999995]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [33.89426, 31.828630000000004, 30.277480000000004, 29.558139999999995, 29.016419999999997, 29.24425, 29.305339999999998]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [12.237333999999999, 14.496757000000002, 15.792649, 17.590754, 19.032165999999997, 20.341222000000002, 21.475603999999997]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.141663, 15.455247199999999, 17.455133999999997, 19.364022000000002, 21.092283999999996, 22.503178000000002, 23.730754]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [35.02002, 33.26662, 32.267669999999995, 31.71259, 31.22558, 30.936229999999995, 30.76839]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [14.4261604, 15.8752362, 18.009286000000003, 19.898594, 21.64637, 22.848845999999998, 23.950178]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [17.084069999999997, 19.793432, 22.680632, 24.765778, 26.290551999999998, 27.533668, 28.70856]]}, 'Helios + noise normal kNN-graph_Radius_Timings (ms)': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0398156204, 0.04628074, 0.04687672400000001, 0.05035490199999999, 0.054397662, 0.055108468, 0.055527826]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.036722114, 0.04829006999999999, 0.068227074, 0.09604077400000001, 0.104653932, 0.12668262200000002, 0.12822326200000003]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0180282754, 0.025576846, 0.034825544, 0.051074898, 0.069565072, 0.07886020199999998, 0.09644904800000001]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00098743696, 0.0011176267400000001, 0.0010725275199999999, 0.0009683436200000002, 0.00110629774, 0.0011446592799999999, 0.0012090138]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.042426296599999996, 0.0902747634, 0.16061426, 0.26230907800000003, 0.41085490999999996, 0.590961642, 0.7759391099999999]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00050068756, 0.0005407747000000001, 0.00052276546, 0.000609388, 0.00057483496, 0.00057505078, 0.00063907136]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00054820512, 0.00056023382, 0.00058568608, 0.00057976014, 0.00061702674, 0.00065851358, 0.0006354555400000001]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0006854329599999999, 0.00062964784, 0.0006675233799999999, 0.0006765190999999999, 0.0007165634800000001, 0.0006794049799999999, 0.0007354525199999999]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0014626624, 0.0014539798, 0.0014917276000000002, 0.0014274838, 0.001477269, 0.0014952191999999997, 0.0016113500000000001]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00015387764, 0.00015468898, 0.00015814901999999998, 0.00014957597999999998, 0.00015279158000000004, 0.00015619608, 0.00015936984]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0057701936, 0.005830491399999999, 0.0061101264, 0.006005554600000001, 0.0063779002, 0.0152067094, 0.012782928000000002]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0056830384, 0.005926867800000001, 0.0060793296, 0.005887526999999999, 0.0058522318000000005, 0.0058151738, 0.0063859925999999985]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0008222775800000001, 0.0009094765800000001, 0.0008844990399999999, 0.0009337689399999999, 0.0009643557000000001, 0.00110736164, 0.0011030274200000002]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.0007984794600000001, 0.00080382258, 0.00087717172, 0.00088360684, 0.00091440966, 0.0010146663, 0.0009718448000000002]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [8.701824199999998e-05, 9.073780799999999e-05, 0.00011708042799999998, 0.000105618206, 0.00010337396999999999, 0.00011089547799999999, 6.6234258e-05]]}, 'Helios + noise normal kNN-graph_Radius_Non-stable ratio': {'3DQuadric': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.04544224079999999, 0.00311305229, 0.00019081699, 9.668129000000001e-05, 7.785419e-05, 7.785419e-05, 4.0200089999999994e-05]], 'PC-MLS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00029786879, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'PCA': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'ASO': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005770962402, 0.00020408605, 0.000112962, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'APSS': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005770962402, 0.00020408605, 0.000112962, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'Sphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005717948250000001, 0.00020408605, 0.000112962, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'UnorientedSphere': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.005759365302000001, 0.00020596885000000002, 0.000122376, 5.6481200000000004e-05, 5.6481200000000004e-05, 5.6481200000000004e-05, 1.8827099999999998e-05]], 'Cov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]], 'Mean': [[0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2], [0.00027904179, 0.00013179, 6.58948e-05, 0.0, 0.0, 0.0, 0.0]]}, 'Helios + noise normal kNN-graph_Noise normal_N': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [86085.6, 86085.6, 86085.6, 86085.6, 86085.6]]}, 'Helios + noise normal kNN-graph_Noise normal_Neighbors count': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.6732485714288, 1312.2106771428573, 1311.6507671428571, 1311.7451228571429, 1311.8006257142858]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.7721685714284, 1311.6105914285713, 1311.6643485714285, 1311.5006342857146, 1312.3713699999998]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.6430742857144, 1311.5628442857137, 1311.690932857143, 1311.8086171428572, 1311.852232857143]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.6447614285714, 1311.4011671428573, 1312.6667685714285, 1311.4878342857146, 1311.5890971428569]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.1892457142856, 1311.302017142857, 1311.2132585714285, 1311.2423442857144, 1311.1949628571429]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [1312.9136628571425, 1311.452102857143, 1311.5354200000002, 1311.5287685714286, 1311.7094028571432]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.2923585714286, 1311.4184014285718, 1311.2622399999998, 1311.3214185714285, 1311.262657142857]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.5794842857144, 1311.6861742857145, 1311.4443885714286, 1311.3265485714285, 1311.790447142857]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.4573014285716, 1311.2197114285716, 1311.2272600000001, 1311.3534114285715, 1311.277027142857]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.2358371428572, 1311.3260057142859, 1311.4209671428569, 1311.3097057142859, 1311.4352142857142]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.4326571428574, 1311.3419957142858, 1311.2874871428571, 1311.2858400000002, 1311.3747085714288]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.693784285714, 1311.581977142857, 1312.2495657142858, 1311.7568828571427, 1312.396754285714]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.4551042857142, 1311.442142857143, 1311.4126557142858, 1311.4411685714285, 1311.4295042857145]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [1311.65785, 1311.5803171428572, 1311.4477628571426, 1311.4074642857142, 1311.4303499999999]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [1314.5084114285714, 1311.532684285714, 1311.8682714285715, 1311.4437171428572, 1311.6324285714284]]}, 'Helios + noise normal kNN-graph_Noise normal_RMSAE Normal': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [31.93159857142857, 31.93159857142857, 31.93159857142857, 31.93159857142857, 31.93159857142857]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [33.78614285714286, 33.78614285714286, 33.78614285714286, 33.78614285714286, 33.78614285714286]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [32.728988571428566, 32.728988571428566, 32.728988571428566, 32.728988571428566, 32.728988571428566]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [30.45961857142857, 30.45961857142857, 30.45961857142857, 30.45961857142857, 30.45961857142857]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [33.142228571428575, 33.142228571428575, 33.142228571428575, 33.142228571428575, 33.142228571428575]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [30.44636, 30.44636, 30.44636, 30.44636, 30.44636]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [17.262051857142854, 17.26677242857143, 17.274562000000003, 17.285035, 17.316211571428575]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.07513942857143, 19.083086999999995, 19.09577571428572, 19.11309042857143, 19.163109]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [32.17101428571429, 32.17101428571429, 32.17101428571429, 32.17101428571429, 32.17101428571429]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [19.48642242857142, 19.49435971428571, 19.50859285714286, 19.53000371428571, 19.591100285714283]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [23.816137142857148, 23.821772857142854, 23.830302857142858, 23.841772857142857, 23.87336571428572]]}, 'Helios + noise normal kNN-graph_Noise normal_Timings (ms)': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.049227657142857144, 0.04935957942857144, 0.05059856342857143, 0.049572169142857135, 0.05007198971428571]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.09059774285714287, 0.08938793571428572, 0.08542098142857142, 0.08509564857142855, 0.08438329714285715]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.054506923857142855, 0.05385869714285715, 0.05279165428571428, 0.053000111428571424, 0.05325681714285715]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0010638379999999997, 0.0010637261857142858, 0.0011498145999999996, 0.0010879452857142854, 0.001067465685714286]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.33134721585714283, 0.33462287714285716, 0.33277878385714293, 0.33319724, 0.3347539259999999]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0005982618, 0.000548224957142857, 0.0005517539428571428, 0.0005571829571428572, 0.0005749855]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0006041149714285717, 0.0006020103857142856, 0.0006003205142857144, 0.0006064276285714286, 0.0005763272285714286]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0006594029571428572, 0.0006777769714285715, 0.0007004690571428572, 0.0006859594, 0.0006982089428571428]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.001528727857142857, 0.0014766965714285716, 0.0014962927142857143, 0.0014900691428571431, 0.0014508507142857142]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.00015485257142857145, 0.00015286092857142857, 0.0001585802571428571, 0.00015416314285714288, 0.00015429247142857144]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.008499985857142858, 0.008456397, 0.00820032242857143, 0.00823595557142857, 0.008095841714285715]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.005892259857142857, 0.005664484714285715, 0.005964351428571429, 0.00610148557142857, 0.006113247714285714]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0009057655999999999, 0.0009390367714285715, 0.0009696994142857143, 0.0010124191142857144, 0.0009764840285714287]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008722546857142859, 0.0008678815714285713, 0.0008963538285714285, 0.0009246927857142857, 0.0009131038142857141]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.00010454327, 9.204713285714286e-05, 9.786499428571428e-05, 9.865178714285715e-05, 9.32916657142857e-05]]}, 'Helios + noise normal kNN-graph_Noise normal_Non-stable ratio': {'3DQuadric': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0070055285485714274, 0.0070055285485714274, 0.0070055285485714274, 0.0070055285485714274, 0.0070055285485714274]], 'PC-MLS': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], '2-Monge': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'Varifolds': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'WaveJets': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'AvgHexagram': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'ShapeOperator': [[0.025, 0.05, 0.075, 0.1, 0.15], [7.079337000000001e-05, 7.079337000000001e-05, 7.079337000000001e-05, 7.079337000000001e-05, 7.079337000000001e-05]], 'PCA': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'ASO': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008957003042857144, 0.0008967411614285714, 0.0008970460185714287, 0.0008953954471428571, 0.0008981750342857142]], 'APSS': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008957003042857144, 0.0008967411614285714, 0.0008970460185714287, 0.0008953954471428571, 0.0008981750342857142]], 'Sphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.0008890381428571428, 0.0008890381428571428, 0.0008890381428571428, 0.0008890381428571428, 0.0008890381428571428]], 'UnorientedSphere': [[0.025, 0.05, 0.075, 0.1, 0.15], [0.000897296832857143, 0.0008959519757142857, 0.0008959519757142857, 0.0008959519757142857, 0.0008976907057142857]], 'Cov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'NormCov2D': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]], 'Mean': [[0.025, 0.05, 0.075, 0.1, 0.15], [6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05, 6.810379857142857e-05]]}, 'Helios + noise normal kNN-graph_Shape_N': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [143738.0, 78910.0, 43444.0, 159460.0, 46860.0, 10623.0, 108782.0, 147919.0, 33753.0, 87367.0]]}, 'Helios + noise normal kNN-graph_Shape_Neighbors count': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.9687142857142, 747.2041285714287, 1837.1723714285715, 2343.797942857143, 272.3964771428572, 57.63524857142857, 1705.7158857142858, 1174.1132857142857, 1384.0391714285715, 2618.1176571428578]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.6018285714285, 747.4051885714285, 1836.8873714285712, 2343.4887714285715, 272.95338, 58.65985714285715, 1705.4280857142858, 1174.0774571428572, 1383.8012571428571, 2617.5350285714285]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.6698571428572, 747.2404628571428, 1837.0422571428571, 2343.435771428571, 273.09235714285717, 57.681582857142864, 1705.5106285714285, 1174.3505714285714, 1383.4622857142858, 2617.629628571428]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.7342857142856, 747.1550714285713, 1836.9311142857143, 2343.3423428571427, 272.8509714285714, 59.453585714285715, 1705.5161142857141, 1173.9799142857144, 1383.1858285714288, 2617.430028571429]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.3061714285715, 746.7348714285714, 1836.4338857142857, 2343.075914285714, 272.23224, 57.43031714285715, 1705.2191142857143, 1173.6162000000004, 1382.9138857142857, 2617.3210571428576]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.822257142857, 747.0800057142858, 1836.7636857142857, 2343.225971428572, 272.7652542857143, 59.957968571428566, 1705.8078857142857, 1174.0500571428572, 1383.4463714285714, 2617.359257142857]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.4551428571428, 746.7951828571429, 1836.5022571428572, 2343.0967142857144, 272.62874571428574, 57.303108571428574, 1705.3223428571428, 1173.7634, 1382.9578000000001, 2617.289457142857]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.4221714285713, 747.0404999999998, 1836.9300285714285, 2343.2423714285715, 272.85856285714283, 57.921851428571436, 1705.4481428571428, 1173.8832, 1383.5184857142856, 2617.388771428571]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.331, 746.8344714285714, 1836.6077142857143, 2343.0527142857145, 272.55348285714285, 57.27009714285714, 1705.2331142857142, 1173.7361428571428, 1383.0043999999998, 2617.4462857142858]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.3186, 747.0633085714286, 1836.505257142857, 2343.0122571428574, 272.55487142857146, 57.30459428571429, 1705.2563428571427, 1173.8336571428572, 1383.1817142857144, 2617.424857142857]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.3744571428572, 746.9953971428571, 1836.4247714285714, 2343.227314285714, 272.36859142857145, 57.38207428571428, 1705.3482285714285, 1173.7046571428573, 1383.2455714285716, 2617.3743142857143]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.6894571428571, 747.6690600000001, 1836.7487428571428, 2343.4041428571427, 272.9493771428572, 60.43114857142857, 1705.5182285714288, 1173.816542857143, 1383.3737142857144, 2617.7575142857145]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.615142857143, 747.0689542857142, 1836.7044285714285, 2343.3348285714287, 272.5733314285714, 57.26926571428571, 1705.3936857142855, 1173.9851714285714, 1382.8426571428572, 2617.5736857142856]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.5330571428572, 747.0834485714287, 1836.5781142857145, 2343.2547999999997, 272.93960285714286, 57.44415142857143, 1705.5151428571428, 1173.8991428571426, 1383.3902285714287, 2617.4098000000004]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [977.8839142857142, 747.0795171428572, 1836.8160571428575, 2343.324742857143, 272.92151428571424, 62.65916571428571, 1705.5840285714287, 1174.1151142857143, 1383.5350857142855, 2618.051885714286]]}, 'Helios + noise normal kNN-graph_Shape_RMSAE Normal': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [31.166114285714283, 33.1494, 24.20541428571428, 37.080871428571434, 36.87325714285714, 35.629428571428576, 30.721314285714282, 27.705342857142853, 25.57204285714285, 37.2128]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [28.45214285714286, 33.63817142857142, 31.39922857142857, 33.293057142857144, 39.99764285714286, 35.318057142857135, 35.93535714285715, 26.94644285714286, 30.947457142857143, 41.933871428571436]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [26.849457142857148, 32.202614285714276, 31.06474285714286, 29.864914285714285, 37.81682857142858, 35.7444, 36.0131, 24.552685714285712, 31.08457142857143, 42.09657142857143]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [25.3376, 32.09945714285714, 27.559328571428573, 32.47208571428572, 35.59320000000001, 30.941514285714284, 31.21734285714285, 20.87794285714286, 28.68951428571429, 39.8082]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [28.50372857142857, 33.05985714285714, 30.87288571428572, 31.390042857142863, 38.007828571428576, 34.7941, 33.026214285714296, 29.727228571428576, 30.669042857142852, 41.371357142857136]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [25.341142857142863, 32.10052857142857, 27.566385714285712, 32.47312857142857, 35.60227142857143, 30.76098571428571, 31.215999999999998, 20.883142857142857, 28.706142857142858, 39.813871428571424]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [10.583198857142857, 10.123072857142855, 22.062317142857147, 12.69901657142857, 19.53886, 12.361361714285716, 18.37182857142857, 9.948315714285712, 23.63698, 33.484314285714284]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [11.887806, 11.974417142857142, 24.583071428571426, 13.877296, 21.45092857142857, 13.965432285714286, 20.840468571428573, 11.633003142857142, 27.740368571428572, 33.10761142857143]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [28.416214285714286, 32.24364285714285, 28.42834285714286, 36.57028571428571, 35.589657142857156, 30.54622857142857, 31.75088571428572, 28.927085714285717, 29.403185714285712, 39.83461428571429]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [11.753505142857144, 12.259612857142857, 26.252434285714287, 13.929922857142857, 22.401085714285717, 14.408684285714285, 23.595062857142857, 12.706578571428572, 30.591997142857146, 27.322074285714287]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [15.365554285714285, 16.576594285714286, 32.46643142857143, 16.712285714285713, 25.573334285714285, 17.65119142857143, 28.23464285714286, 15.580614285714287, 34.257197142857144, 35.94885714285714]]}, 'Helios + noise normal kNN-graph_Shape_Timings (ms)': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.049207488571428565, 0.04777018, 0.05560515714285714, 0.051117617142857154, 0.04896252285714286, 0.041018054857142855, 0.050714119999999994, 0.04606616571428571, 0.05546166285714285, 0.05173694857142857]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.06723550857142857, 0.05956096, 0.11985585714285715, 0.12807442, 0.04122164285714285, 0.030966054285714285, 0.10567273714285715, 0.0736561657142857, 0.10217733428571428, 0.14135053142857143]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.041700408571428565, 0.03433181428571429, 0.07570556285714286, 0.08146451714285714, 0.02264300857142857, 0.015685856285714287, 0.06526571714285714, 0.04607002857142858, 0.06174283714285714, 0.09021865714285715]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0010538834, 0.0010489905428571426, 0.0011345572571428574, 0.0011648429714285712, 0.0011346303999999997, 0.0009820557428571427, 0.0011022028285714287, 0.0009385512285714286, 0.0011901010285714287, 0.0011157641142857143]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.23751327428571425, 0.18497304857142854, 0.4963773342857143, 0.5868761028571429, 0.0680455657142857, 0.017812445714285717, 0.42507612857142857, 0.27698890285714284, 0.3879718628571429, 0.6517654199999999]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0005286836285714286, 0.0005771246857142856, 0.0006266664285714286, 0.000573341342857143, 0.0005578004, 0.0004989817142857142, 0.0005675961714285715, 0.0005251650857142858, 0.0005612403428571427, 0.0006442185142857143]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0005864045999999999, 0.0005974162285714286, 0.0006038874857142856, 0.0006109570000000001, 0.0006455280571428572, 0.0004853803428571429, 0.0006024507142857143, 0.0005776003714285713, 0.0006244214, 0.000644355257142857]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0006657499999999999, 0.0006792117714285714, 0.0007003974857142858, 0.0006922213428571428, 0.0006609716571428573, 0.0006704037714285714, 0.0006806710857142857, 0.0006384990000000001, 0.0007487071999999999, 0.0007068013428571429]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0014749942857142859, 0.0014371702857142858, 0.0016354737142857143, 0.0015563225714285713, 0.0013385257142857145, 0.0013451705714285715, 0.0015365814285714288, 0.001450449428571429, 0.0015773217142857144, 0.0015332642857142855]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.00015648891428571426, 0.00015668031428571429, 0.00016330900000000002, 0.00016360674285714283, 0.0001515976, 0.00014259602857142858, 0.00015674511428571427, 0.00014802862857142858, 0.00015265334285714287, 0.00015779305714285714]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.007796612000000001, 0.008005380571428572, 0.008873540000000001, 0.00888439542857143, 0.007599429999999999, 0.008516840571428572, 0.00851039457142857, 0.007112870285714286, 0.008912512285714286, 0.008765029428571429]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.005595192285714286, 0.005994735714285714, 0.006152385142857143, 0.005917526857142857, 0.006092716285714286, 0.005834232571428571, 0.005736635142857143, 0.005247258285714286, 0.006673821714285715, 0.006227154571428572]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.000945962, 0.0008892629428571429, 0.0010740103428571429, 0.0010621539428571428, 0.0008916557142857143, 0.0008953410571428572, 0.0009498532857142856, 0.0008845312000000001, 0.0010135503714285715, 0.001000489]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [0.0008627808285714285, 0.0008382155714285715, 0.0009608951428571429, 0.0009661291142857143, 0.0008686658857142857, 0.0008460225428571429, 0.0008830782, 0.0008342254285714286, 0.0009464793428571427, 0.0009420813142857143]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [8.660721428571429e-05, 9.608354285714287e-05, 0.00010138926571428571, 8.662576857142856e-05, 8.595834285714286e-05, 0.00011151611428571427, 9.966340571428572e-05, 9.495155428571428e-05, 0.00011408661714285715, 9.59158742857143e-05]]}, 'Helios + noise normal kNN-graph_Shape_Non-stable ratio': {'3DQuadric': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [6.559547142857143e-05, 0.00017741800000000001, 6.576614285714286e-06, 3.762695714285715e-05, 0.0005060667142857143, 0.06917607399999999, 7.091505714285715e-05, 1.9315571428571427e-06, 0.0, 1.3081114285714287e-05]], 'PC-MLS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.000685844, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 9.13798857142857e-06, 0.00015669807142857145, 0.008725001000000001, 1.3132428571428569e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'APSS': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 9.13798857142857e-06, 0.00015669807142857145, 0.008725001000000001, 1.3132428571428569e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'Sphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.1926457142857144e-05, 5.612185714285714e-05, 3.2883e-06, 8.062928571428572e-06, 0.0001341382142857143, 0.008673895285714286, 1.3132428571428569e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'UnorientedSphere': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.2920328571428573e-05, 5.612185714285714e-05, 3.2883e-06, 9.13798857142857e-06, 0.00013474792857142857, 0.008746522142857142, 1.3132428571428569e-06, 0.0, 0.0, 1.6351428571428571e-06]], 'Cov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['0033', '0255', '0614', '0679', '4163', '4194', '4227', '4257', '4449', '4913'], [1.987742857142857e-06, 1.8103857142857145e-06, 0.0, 0.0, 1.8291571428571428e-05, 0.0006589482857142856, 0.0, 0.0, 0.0, 0.0]]}, 'Helios + noise normal kNN-graph_struct_N': {'3DQuadric': [['kNN-graph'], [86085.6]], 'PC-MLS': [['kNN-graph'], [86085.6]], '2-Monge': [['kNN-graph'], [86085.6]], 'Varifolds': [['kNN-graph'], [86085.6]], 'WaveJets': [['kNN-graph'], [86085.6]], 'AvgHexagram': [['kNN-graph'], [86085.6]], 'ShapeOperator': [['kNN-graph'], [86085.6]], 'PCA': [['kNN-graph'], [86085.6]], 'ASO': [['kNN-graph'], [86085.6]], 'APSS': [['kNN-graph'], [86085.6]], 'Sphere': [['kNN-graph'], [86085.6]], 'UnorientedSphere': [['kNN-graph'], [86085.6]], 'Cov2D': [['kNN-graph'], [86085.6]], 'NormCov2D': [['kNN-graph'], [86085.6]], 'Mean': [['kNN-graph'], [86085.6]]}, 'Helios + noise normal kNN-graph_struct_Neighbors count': {'3DQuadric': [['kNN-graph'], [1311.8160882857142]], 'PC-MLS': [['kNN-graph'], [1311.7838225714288]], '2-Monge': [['kNN-graph'], [1311.7115402857144]], 'Varifolds': [['kNN-graph'], [1311.7579257142856]], 'WaveJets': [['kNN-graph'], [1311.228365714286]], 'AvgHexagram': [['kNN-graph'], [1311.8278714285714]], 'ShapeOperator': [['kNN-graph'], [1311.311415142857]], 'PCA': [['kNN-graph'], [1311.5654085714284]], 'ASO': [['kNN-graph'], [1311.3069422857143]], 'APSS': [['kNN-graph'], [1311.345546]], 'Sphere': [['kNN-graph'], [1311.3445377142857]], 'UnorientedSphere': [['kNN-graph'], [1311.9357928571428]], 'Cov2D': [['kNN-graph'], [1311.4361151428573]], 'NormCov2D': [['kNN-graph'], [1311.5047488571429]], 'Mean': [['kNN-graph'], [1312.1971025714286]]}, 'Helios + noise normal kNN-graph_struct_RMSAE Normal': {'3DQuadric': [['kNN-graph'], [31.93159857142857]], 'PC-MLS': [['kNN-graph'], [33.78614285714286]], '2-Monge': [['kNN-graph'], [32.72898857142857]], 'Varifolds': [['kNN-graph'], [30.45961857142857]], 'WaveJets': [['kNN-graph'], [33.14222857142857]], 'PCA': [['kNN-graph'], [30.446359999999995]], 'ASO': [['kNN-graph'], [17.280926571428573]], 'APSS': [['kNN-graph'], [19.106040314285714]], 'Sphere': [['kNN-graph'], [32.171014285714286]], 'UnorientedSphere': [['kNN-graph'], [19.5220958]], 'Mean': [['kNN-graph'], [23.83667028571429]]}, 'Helios + noise normal kNN-graph_struct_Timings (ms)': {'3DQuadric': [['kNN-graph'], [0.049765991771428576]], 'PC-MLS': [['kNN-graph'], [0.08697712114285715]], '2-Monge': [['kNN-graph'], [0.05348284077142857]], 'Varifolds': [['kNN-graph'], [0.0010865579514285715]], 'WaveJets': [['kNN-graph'], [0.33334000857142854]], 'AvgHexagram': [['kNN-graph'], [0.0005660818314285715]], 'ShapeOperator': [['kNN-graph'], [0.0005978401457142858]], 'PCA': [['kNN-graph'], [0.0006843634657142857]], 'ASO': [['kNN-graph'], [0.0014885274000000003]], 'APSS': [['kNN-graph'], [0.00015494987428571428]], 'Sphere': [['kNN-graph'], [0.008297700514285715]], 'UnorientedSphere': [['kNN-graph'], [0.0059471658571428575]], 'Cov2D': [['kNN-graph'], [0.0009606809857142856]], 'NormCov2D': [['kNN-graph'], [0.0008948573371428571]], 'Mean': [['kNN-graph'], [9.727976999999999e-05]]}, 'Helios + noise normal kNN-graph_struct_Non-stable ratio': {'3DQuadric': [['kNN-graph'], [0.007005528548571428]], 'PC-MLS': [['kNN-graph'], [6.810379857142856e-05]], '2-Monge': [['kNN-graph'], [6.810379857142856e-05]], 'Varifolds': [['kNN-graph'], [6.810379857142856e-05]], 'WaveJets': [['kNN-graph'], [6.810379857142856e-05]], 'AvgHexagram': [['kNN-graph'], [6.810379857142856e-05]], 'ShapeOperator': [['kNN-graph'], [7.079337e-05]], 'PCA': [['kNN-graph'], [6.810379857142856e-05]], 'ASO': [['kNN-graph'], [0.0008966115931428569]], 'APSS': [['kNN-graph'], [0.0008966115931428569]], 'Sphere': [['kNN-graph'], [0.0008890381428571428]], 'UnorientedSphere': [['kNN-graph'], [0.0008965686931428571]], 'Cov2D': [['kNN-graph'], [6.810379857142856e-05]], 'NormCov2D': [['kNN-graph'], [6.810379857142856e-05]], 'Mean': [['kNN-graph'], [6.810379857142856e-05]]}},
-    colorMap: {'PCA': 'rgba(31, 119, 180, 1)', '3DQuadric': 'rgba(174, 199, 232, 1)', 'Mean': 'rgba(255, 127, 14, 1)', 'Cov2D': 'rgba(255, 187, 120, 1)', 'NormCov2D': 'rgba(44, 160, 44, 1)', 'ShapeOperator': 'rgba(152, 223, 138, 1)', '2-Monge': 'rgba(214, 39, 40, 1)', 'PC-MLS': 'rgba(255, 152, 150, 1)', 'JetFitting': 'rgba(148, 103, 189, 1)', 'WaveJets': 'rgba(197, 176, 213, 1)', 'Sphere': 'rgba(140, 86, 75, 1)', 'APSS': 'rgba(196, 156, 148, 1)', 'UnorientedSphere': 'rgba(227, 119, 194, 1)', 'ASO': 'rgba(247, 182, 210, 1)', 'Varifolds': 'rgba(127, 127, 127, 1)', 'VCM': 'rgba(199, 199, 199, 1)', 'AvgHexagram': 'rgba(188, 189, 34, 1)'},
-};
-
-export const getXLabels = (): string[] => CAD.xLabels;
-export const getYLabels = (): string[] => CAD.yLabels;
-export const getDividers = (): string[] => CAD.dividers;
-export const getConstraints = (): string[] => CAD.constraints;
-export const getData = (): { [key: string]: PlotDataType } => CAD.data;
-export const getDataForKey = (key: string): PlotDataType | undefined => CAD.data[key];
-
-export const getSpecificData = (xLabel: string, yLabel: string, divider: string | null, constraint: string | null): PlotDataType | null => {
-    const xIndex = CAD.xLabels.indexOf(xLabel);
-    const yIndex = CAD.yLabels.indexOf(yLabel);
-    
-    if (xIndex === -1 || yIndex === -1) {
-        console.error('Invalid xLabel or yLabel');
-        return null;
-    }
-
-    let key = `${constraint || 'overall'}_${xLabel}_${yLabel}`;
-    if (divider) {
-        key = `${key}_${divider}`;
-    }
-
-    const dataForKey = CAD.data[key];
-    if (!dataForKey) {
-        console.error('No data found for the given parameters');
-        return null;
-    }
-
-    return dataForKey;
-};
-
-export const getColorMap = (): { [method: string]: string } => CAD.colorMap;
-
-const CADAccessors: PlotDataAccessors = {
-    getXLabels,
-    getYLabels,
-    getDividers,
-    getConstraints,
-    getData,
-    getDataForKey,
-    getSpecificData,
-    getColorMap,
-};
-
-export default CADAccessors;
@@ -1,56 +0,0 @@
-
-import { PlotDataType, PlotDataSet, PlotDataAccessors } from '../types';
-
-const PCPNet: PlotDataSet = {
-    xLabels: ['kNN', 'noise_type', 'Shape'],
-    yLabels: ['Timings (ms)', 'RMSAE Normal', 'Non-stable ratio'],
-    dividers: [],
-    constraints: ['all', 'No noise', 'Density', 'Noise position'],
-    data: {'all_kNN_Timings (ms)': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [0.04268471018518518, 0.05072155740740741, 0.05460436574074074, 0.06082639907407407]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [0.03875768240740741, 0.04304228148148149, 0.04578537500000001, 0.043616804629629635]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [0.023994510185185176, 0.02561635277777778, 0.02669213981481482, 0.025246540740740744]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [0.0022565110555555555, 0.0022523313888888888, 0.0021793602777777778, 0.001955552111111111]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [0.057948424074074065, 0.09494367037037037, 0.14347492037037038, 0.2948004074074074]], 'AvgHexagram': [[75.0, 150.0, 300.0, 700.0], [0.0043836074722222226, 0.004594496175925927, 0.005342694898148147, 0.007190259046296295]], 'ShapeOperator': [[75.0, 150.0, 300.0, 700.0], [0.0012930566203703706, 0.00132579487037037, 0.0013350515185185186, 0.0012775426944444444]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [0.001455649462962963, 0.0013917962592592593, 0.0014128434537037035, 0.0014530601203703705]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [0.0033336189814814816, 0.003504973796296296, 0.0033749229629629627, 0.002996533611111111]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [0.00024282590740740739, 0.0002582961296296296, 0.0002626551388888889, 0.00025617625925925924]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [0.010252715092592598, 0.011415738981481481, 0.011459502129629632, 0.011854771574074075]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [0.004685705925925925, 0.005477186944444445, 0.005442092592592594, 0.005682861759259258]], 'Cov2D': [[75.0, 150.0, 300.0, 700.0], [0.001113001537037037, 0.0008612558148148148, 0.0009736166759259262, 0.0009843660185185185]], 'NormCov2D': [[75.0, 150.0, 300.0, 700.0], [0.0009303881944444444, 0.0009238142407407408, 0.0009148412962962963, 0.0009428723148148148]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [0.00011500040277777777, 0.00012150394907407408, 0.00011554982685185184, 0.00010738163611111114]]}, 'all_kNN_RMSAE Normal': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [25.807141142857148, 22.56278298979592, 21.09759145, 21.313709637254902]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [18.27485309259259, 16.31898963888889, 16.356370194444445, 18.357386728971964]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [18.35283697222222, 16.383036138888887, 16.412230935185185, 18.313937666666668]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [17.814417373831773, 16.041951537037036, 16.2267013364486, 18.246192897196263]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [18.623476750000002, 16.67231534259259, 16.812660588785047, 18.72992044859813]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [18.11992058333334, 16.19390787962963, 16.17503828703704, 18.167689787037038]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [14.209879325000001, 13.655557349074073, 14.459358485185188, 16.76884746728972]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [12.958118573033708, 15.008639424242423, 16.984097400000003, 19.48858625471698]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [26.374871243518523, 23.933671747222224, 22.031934332407413, 21.802078396226424]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [11.957216934065935, 13.585446220000003, 15.094308038095237, 17.322013603773584]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [10.396344508196721, 14.26307511904762, 17.01935382178218, 19.760708037735846]]}, 'all_kNN_Non-stable ratio': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [0.0035376449361111113, 0.0010184222435185184, 0.0002978865092592593, 5.425794907407407e-05]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [0.00043562228888888887, 0.00011243936666666669, 2.4656642592592593e-05, 2.3152416666666666e-06]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [0.00043562228888888887, 0.00011243936666666669, 2.4656642592592593e-05, 2.3152416666666666e-06]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [0.0001721720638888889, 3.831311481481482e-05, 7.366507407407408e-06, 9.25925925925926e-08]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [0.00043562228888888887, 0.00011243936666666669, 2.4656642592592593e-05, 2.3152416666666666e-06]], 'AvgHexagram': [[75.0, 150.0, 300.0, 700.0], [0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[75.0, 150.0, 300.0, 700.0], [0.0004501787425925926, 0.00011438832962962964, 2.5027012962962964e-05, 2.3152416666666666e-06]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [0.00043562228888888887, 0.00011243936666666669, 2.4656642592592593e-05, 2.3152416666666666e-06]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [0.0017285735055555555, 0.0004877456935185185, 0.0001266468287037037, 2.0593599074074074e-05]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [0.0017285735055555555, 0.0004877456935185185, 0.0001266468287037037, 2.0593599074074074e-05]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [0.0017461759546296295, 0.0004918594972222223, 0.0001288895787037037, 2.179909537037037e-05]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [0.0017280864407407408, 0.0004868512222222222, 0.00012618170833333337, 2.0686404629629632e-05]], 'Cov2D': [[75.0, 150.0, 300.0, 700.0], [0.00043562228888888887, 0.00011243936666666669, 2.4656642592592593e-05, 2.3152416666666666e-06]], 'NormCov2D': [[75.0, 150.0, 300.0, 700.0], [0.00043562228888888887, 0.00011243936666666669, 2.4656642592592593e-05, 2.3152416666666666e-06]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [0.0, 0.0, 0.0, 0.0]]}, 'all_noise_type_Timings (ms)': {'3DQuadric': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.045612946875, 0.05178965921052632, 0.05365956842105262, 0.05556208815789472, 0.05280685131578948, 0.052890471875]], 'PC-MLS': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.040952137500000006, 0.043756268421052624, 0.043059521052631576, 0.043274494736842105, 0.042965134210526314, 0.0424481703125]], '2-Monge': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.024873284375, 0.02498736447368421, 0.025115831578947367, 0.02506237105263158, 0.026592228947368422, 0.0256541875]], 'Varifolds': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.002070235, 0.002128319328947368, 0.0021104808289473687, 0.002208803815789474, 0.0023312484736842105, 0.002091214]], 'WaveJets': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.1311371796875, 0.14897326842105263, 0.1565810052631579, 0.1563229302631579, 0.15718406710526314, 0.1313225859375]], 'AvgHexagram': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0010940555781250002, 0.013933662039473682, 0.0023826216842105265, 0.009718900039473684, 0.0026534420131578947, 0.001138111]], 'ShapeOperator': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0012328927031250003, 0.0014170786315789471, 0.0012324960394736841, 0.0013629271052631579, 0.0012545891973684213, 0.0013405013906249998]], 'PCA': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.00144093675, 0.0014303461052631574, 0.0013505333684210525, 0.0015057935526315788, 0.0014102284868421054, 0.001435269640625]], 'ASO': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0031478303124999997, 0.0032903043421052634, 0.0032475275000000002, 0.0034208884210526307, 0.0035919893421052637, 0.0030526603125]], 'APSS': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.00026623118750000003, 0.00026009055263157894, 0.00025463457894736845, 0.0002569031052631579, 0.00023244432894736848, 0.0002626040625]], 'Sphere': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0109303915625, 0.011331562236842105, 0.010865878157894736, 0.011643350000000002, 0.011429320526315791, 0.011219704843750001]], 'UnorientedSphere': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0053454796875, 0.005864913552631578, 0.004792266578947369, 0.005441392236842106, 0.005557112894736841, 0.00486163625]], 'Cov2D': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0008715254687499999, 0.001142967355263158, 0.0010408715263157894, 0.0009660655131578949, 0.0009382797105263158, 0.000909410984375]], 'NormCov2D': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.00089838521875, 0.0009229488815789473, 0.0009406204210526315, 0.0009875596052631578, 0.0009139804473684211, 0.0008944057500000001]], 'Mean': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.00010990086875000001, 0.00010641977105263159, 0.00010135532105263158, 0.00012009149868421053, 0.00012597048947368423, 0.0001264655359375]]}, 'all_noise_type_RMSAE Normal': {'3DQuadric': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [18.163681346153847, 37.14074894736842, 17.08374777631579, 25.94858921052632, 15.446018710606063, 18.687075555555555]], 'PC-MLS': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [12.976664546875, 29.482970526315786, 13.13860530263158, 19.608535657894738, 12.413407539473685, 15.292847603174604]], '2-Monge': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [13.069973578125, 29.40505223684211, 13.192858486842105, 19.632780131578947, 12.461432592105263, 15.45032521875]], 'Varifolds': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [13.189396774193549, 29.06179276315789, 13.075317473684212, 19.362936842105263, 12.309087644736843, 14.286289984126984]], 'WaveJets': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [13.516697793650794, 29.815981973684206, 13.611174065789472, 19.984886184210524, 12.943250486842103, 15.245198571428569]], 'PCA': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [12.838441953125, 29.682171315789475, 13.10058852631579, 19.66336289473684, 12.33737767105263, 14.21409046875]], 'ASO': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [12.570689999999999, 23.770133157894737, 11.396746315789473, 16.806807105263157, 10.934866496000001, 12.354769203125]], 'APSS': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [14.384653333333333, 21.563884729729732, 13.781994630136985, 17.33681716216216, 14.827333636363639, 14.623023758620691]], 'Sphere': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [19.302304999999997, 42.69490407894737, 13.730516539473687, 26.815304473684208, 17.713141322972973, 19.552762125]], 'UnorientedSphere': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [12.947611296296296, 19.827136266666663, 12.077795162162161, 15.600805135135134, 12.942661000000001, 13.20872775862069]], 'Mean': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [17.513779970588235, 20.603063333333335, 13.981667072463768, 16.880149420289857, 13.6190603, 15.268421696428573]]}, 'all_noise_type_Non-stable ratio': {'3DQuadric': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.006337976559375, 0.001200715330263158, 1.974655263157895e-06, 0.00018425333289473684, 1.843076315789474e-06, 0.0002954467359375]], 'PC-MLS': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0007389106250000001, 0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05, 3.9570789473684214e-07, 5.6044781250000005e-06]], '2-Monge': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0007389106250000001, 0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05, 3.9570789473684214e-07, 5.6044781250000005e-06]], 'Varifolds': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.00025936185625, 8.202512105263158e-05, 2.638052631578948e-07, 8.078935526315791e-06, 3.9570789473684214e-07, 6.37375e-07]], 'WaveJets': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0007389106250000001, 0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05, 3.9570789473684214e-07, 5.6044781250000005e-06]], 'AvgHexagram': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.00075689015625, 0.00017791985263157894, 2.638052631578948e-07, 1.9473071052631577e-05, 3.9570789473684214e-07, 6.769564062500001e-06]], 'PCA': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0007389106250000001, 0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05, 3.9570789473684214e-07, 5.6044781250000005e-06]], 'ASO': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.003099173771875, 0.0006058555460526317, 7.904447368421054e-07, 8.208394473684212e-05, 6.588657894736843e-07, 7.0683896875e-05]], 'APSS': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.003099173771875, 0.0006058555460526317, 7.904447368421054e-07, 8.208394473684212e-05, 6.588657894736843e-07, 7.0683896875e-05]], 'Sphere': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0031193755000000004, 0.0006143781434210527, 9.220236842105264e-07, 9.007405000000001e-05, 6.588657894736843e-07, 7.31821765625e-05]], 'UnorientedSphere': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0030979256937500002, 0.0006036095000000001, 7.904447368421054e-07, 8.315184736842105e-05, 6.588657894736843e-07, 7.0371396875e-05]], 'Cov2D': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0007389106250000001, 0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05, 3.9570789473684214e-07, 5.6044781250000005e-06]], 'NormCov2D': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0007389106250000001, 0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05, 3.9570789473684214e-07, 5.6044781250000005e-06]], 'Mean': [['gradient', 'high', 'low', 'med', 'no', 'striped'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'all_Shape_Timings (ms)': {'3DQuadric': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0481102, 0.041911125, 0.0487842, 0.048871475, 0.055016899999999994, 0.054529725, 0.054817325, 0.041753399999999996, 0.05693912499999999, 0.0528762, 0.054388025, 0.054463225000000004, 0.05050405, 0.0485541, 0.04658215, 0.04503465, 0.050458350000000006, 0.05612252499999999, 0.052791825, 0.048912975, 0.0568307, 0.05603662500000001, 0.05344965, 0.056966375, 0.0547427, 0.044041874999999994, 0.0522989, 0.051821775, 0.052628175, 0.0570181, 0.0495183, 0.044529225000000006, 0.05010275, 0.0548443, 0.055896775, 0.056195300000000004, 0.0524359, 0.03814265, 0.05579797500000001, 0.05114085, 0.053947925, 0.060424025, 0.051501675, 0.04956635, 0.054285299999999995, 0.057507325000000005, 0.051155325, 0.04590325, 0.0586343, 0.05509465, 0.051519775000000004, 0.053648325, 0.050338274999999995, 0.040686749999999994, 0.052574675, 0.050898700000000005, 0.0512321, 0.056126625, 0.0535552, 0.042246874999999996, 0.049016674999999996, 0.051460000000000006, 0.050210625, 0.059288099999999996, 0.054933024999999996, 0.04537475, 0.054978874999999996, 0.053148625000000005, 0.059039625, 0.05554705, 0.051497275, 0.053317725, 0.056087, 0.052210275, 0.049602175, 0.05402342499999999, 0.063538175, 0.052685499999999996, 0.053210625, 0.048579575, 0.049889925, 0.0410309, 0.04472735, 0.052714625, 0.056318049999999995, 0.049221274999999995, 0.052079075, 0.05431855000000001, 0.052356749999999994, 0.055465225, 0.055755325, 0.054167574999999996, 0.0528116, 0.05270830000000001, 0.057392425, 0.055366124999999995, 0.05306065, 0.052026325, 0.056424625, 0.04806165, 0.05610795, 0.0580181, 0.05310594999999999, 0.04720765, 0.05365665, 0.050510425, 0.0524706, 0.05716925]], 'PC-MLS': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0419917, 0.0390732, 0.040687600000000004, 0.0468159, 0.041247125, 0.041968624999999996, 0.044354599999999994, 0.03973165, 0.048066775000000006, 0.04540795, 0.041581925000000006, 0.044970575, 0.04522215, 0.04122515, 0.04499565, 0.04595197499999999, 0.044116550000000004, 0.039431525, 0.0426764, 0.040569299999999996, 0.042323975, 0.045960225, 0.041846675, 0.041375100000000005, 0.040555025, 0.039702799999999996, 0.037982175, 0.046305575, 0.0418829, 0.04184545, 0.045673200000000004, 0.04445684999999999, 0.039383925, 0.046658624999999995, 0.043801175, 0.045375225000000005, 0.041555175, 0.0414728, 0.037069500000000005, 0.0471349, 0.041298925, 0.048772974999999996, 0.044752375000000004, 0.043791025, 0.046491000000000005, 0.041637125000000004, 0.045867375, 0.0421491, 0.04554065, 0.04298745, 0.0419578, 0.04324885, 0.044065325, 0.03801845, 0.042927049999999994, 0.04077795, 0.04620685, 0.04558335, 0.040839824999999996, 0.03902905, 0.04675142499999999, 0.039431324999999996, 0.04133555, 0.043334700000000004, 0.0453578, 0.04277285, 0.039240175, 0.04571067499999999, 0.045959175000000005, 0.045408375, 0.043844825000000004, 0.041394925, 0.0422109, 0.04315864999999999, 0.045319849999999995, 0.04354335, 0.039352424999999996, 0.04087875, 0.04299105, 0.041515825000000006, 0.04445515, 0.040986175, 0.042838224999999994, 0.04822654999999999, 0.043927275, 0.046378525, 0.043953074999999994, 0.044230425, 0.04371075, 0.042613225, 0.041554650000000005, 0.0404814, 0.040017775, 0.036073299999999996, 0.042153750000000004, 0.043877, 0.038031224999999995, 0.041084125, 0.04072305, 0.04107215, 0.03971005, 0.039655225, 0.04223525000000001, 0.043086374999999996, 0.04841187499999999, 0.0407957, 0.042592525000000006, 0.041680375]], '2-Monge': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.025784750000000002, 0.024782025, 0.027530775, 0.030141025000000002, 0.0253314, 0.0249322, 0.026575500000000002, 0.0247684, 0.026529224999999997, 0.026365674999999998, 0.024132325, 0.0249595, 0.0271236, 0.018877975, 0.0253581, 0.023536425, 0.025269225, 0.0236934, 0.027884525, 0.026174375, 0.026589750000000002, 0.026513575, 0.023063625, 0.0261894, 0.0266161, 0.02655035, 0.02501935, 0.026721150000000003, 0.024257, 0.023150000000000004, 0.02605345, 0.029584125000000003, 0.02677995, 0.027666450000000002, 0.024653775, 0.022997425000000002, 0.0236935, 0.023801199999999998, 0.0285481, 0.0246946, 0.026350725, 0.023480525, 0.027470050000000003, 0.025553350000000002, 0.023268350000000004, 0.024595350000000002, 0.025481625, 0.027354424999999998, 0.021655525000000002, 0.023516324999999998, 0.0259861, 0.024134299999999997, 0.027742825, 0.024257374999999998, 0.02703525, 0.020115175, 0.029745999999999998, 0.02919845, 0.028275375, 0.023115974999999997, 0.024041775, 0.024774075, 0.02502745, 0.025312175, 0.025478599999999997, 0.025366525, 0.026150424999999998, 0.022004424999999998, 0.024890875, 0.026917949999999996, 0.02407975, 0.02554805, 0.024792175, 0.023379125, 0.02120855, 0.025740525, 0.026997875, 0.023523525, 0.025674625, 0.02549985, 0.029309025000000002, 0.0231532, 0.023096500000000002, 0.02487355, 0.024621124999999997, 0.022990800000000002, 0.027559450000000003, 0.024325475, 0.024712025, 0.024888375, 0.0247125, 0.025770025000000002, 0.0234744, 0.025064975, 0.025896225, 0.024714100000000003, 0.029177025000000002, 0.02427695, 0.027871275, 0.024029775, 0.026671125, 0.028071975, 0.025236824999999997, 0.024591574999999997, 0.025994424999999998, 0.02796125, 0.026440275, 0.02471875]], 'Varifolds': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.001487931, 0.0018983525, 0.0012711415, 0.00240049, 0.0019226075000000002, 0.00210459, 0.0026628375, 0.00229674, 0.00212714, 0.002232105, 0.0023642575, 0.00219869, 0.002603335, 0.0020438275, 0.00211176, 0.0021616875, 0.001762475, 0.0027354475, 0.002216815, 0.0014841049999999999, 0.00220578, 0.00157955725, 0.0027874349999999996, 0.00257954, 0.0020882175, 0.0018003025, 0.0019312700000000001, 0.0020633275, 0.0021884925, 0.0019602275, 0.0027107075, 0.0019621225, 0.0016584, 0.0020590225000000004, 0.00198831, 0.0021792700000000005, 0.0021682624999999995, 0.0018915775, 0.001738875, 0.0023694299999999996, 0.0020772675, 0.0023535875, 0.00197172, 0.0017748975, 0.0020177775, 0.002427405, 0.0024872725, 0.001968185, 0.0026299275, 0.0022604, 0.002264625, 0.0024483050000000004, 0.0020769, 0.0025602299999999997, 0.0020423925000000002, 0.0022037525, 0.00204772, 0.00191609, 0.002698495, 0.0017388400000000002, 0.0020379675, 0.0017797249999999998, 0.0022416, 0.0022604549999999998, 0.0025061849999999997, 0.0023537325, 0.0025662224999999997, 0.00221969, 0.0021473825, 0.00213251, 0.00256632, 0.00219531, 0.0021553650000000002, 0.0022566175, 0.00250013475, 0.00199029, 0.00235388, 0.0023230075, 0.0020656625, 0.0022073525000000003, 0.0021538125, 0.0016654150000000002, 0.00194426, 0.00201398, 0.001988825, 0.0018780775, 0.00244993, 0.002399925, 0.0021772074999999998, 0.002483575, 0.0024185375000000003, 0.0026992175, 0.0021822, 0.0017905675, 0.0021506225, 0.001955765, 0.0022791375, 0.0022513100000000003, 0.0024266925, 0.00221572, 0.001958285, 0.0021337624999999997, 0.0023934250000000002, 0.0023144925, 0.00243003, 0.002334165, 0.0014484485, 0.0020223324999999997]], 'WaveJets': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.15621255, 0.125358175, 0.11027490000000001, 0.15968375, 0.15143602500000003, 0.12965725, 0.133537775, 0.127357575, 0.126476275, 0.12601625, 0.161768725, 0.13464505, 0.16322075, 0.13722964999999998, 0.1373715, 0.13323897499999998, 0.16489025000000002, 0.165562225, 0.158248775, 0.1301366, 0.145237775, 0.13363515, 0.14811697499999998, 0.17022579999999998, 0.15749695, 0.13383287500000002, 0.13631417499999998, 0.15694134999999998, 0.15090967500000002, 0.1685227, 0.140647925, 0.112805275, 0.11355432500000001, 0.134264225, 0.126483275, 0.150603125, 0.162034375, 0.11251180000000001, 0.13861225, 0.1453699, 0.16994745, 0.133477, 0.14663695000000002, 0.153298325, 0.15770905000000002, 0.15401330000000002, 0.1558349, 0.14050095, 0.12445385, 0.16134102500000003, 0.159196925, 0.198964775, 0.13251495000000002, 0.15319482499999998, 0.129962525, 0.1415073, 0.1703306, 0.17283732499999999, 0.160789575, 0.139309525, 0.13493614999999998, 0.1542512, 0.157926725, 0.14634039999999998, 0.162352575, 0.1221846, 0.11584734999999999, 0.15029794999999999, 0.18349635, 0.163513925, 0.152328425, 0.1203106, 0.1406123, 0.144533325, 0.13728864999999998, 0.161490525, 0.16508235, 0.158646125, 0.154171475, 0.1389101, 0.17931797500000002, 0.123510175, 0.140908975, 0.15974644999999998, 0.1688987, 0.17502362500000002, 0.17063095, 0.13178355, 0.1572851, 0.12079242500000001, 0.1535969, 0.12983072499999998, 0.12471035, 0.173858475, 0.150972375, 0.133476625, 0.167933525, 0.138859825, 0.1338463, 0.1638182, 0.136209875, 0.172822725, 0.1680791, 0.1512617, 0.148042375, 0.148260575, 0.1680009, 0.179256775]], 'AvgHexagram': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00070089625, 0.000763759, 0.000811777, 0.0007932614999999999, 0.0011592339999999999, 0.0008861317499999999, 0.00110969175, 0.0012596649999999999, 0.001257101, 0.00100402975, 0.0013055879999999999, 0.0014180669999999999, 0.00111081125, 0.0012251072499999999, 0.001103391, 0.0009023880000000001, 0.001477247, 0.00103835275, 0.0008363660000000001, 0.00080134775, 0.0010794985, 0.00098916375, 0.0007006605, 0.0009980575, 0.0012883624999999999, 0.00107210675, 0.001149761, 0.0010356240000000002, 0.00116053575, 0.00116645775, 0.0009397915, 0.0013223365, 0.0012176094999999999, 0.0012491535, 0.0009321617500000001, 0.00110014375, 0.0010570472499999998, 0.0008237112500000001, 0.00096129, 0.0011051595, 0.0009798740000000002, 0.000960717, 0.001424355, 0.00130884975, 0.00117207275, 0.00121067675, 0.0013338875000000001, 0.00095429425, 0.0013163150000000002, 0.00125598625, 0.0012626265000000002, 0.00115109525, 0.00129005, 0.00113741225, 0.0013204649999999998, 0.00099586975, 0.001110059, 0.0012923592500000002, 0.001222625, 0.0011766135000000001, 0.0015332800000000001, 0.0013473105, 0.00120758575, 0.0012269825, 0.0010047252499999998, 0.00111190325, 0.0009309687499999999, 0.000947996, 0.00115538675, 0.0010785175, 0.0011362497499999998, 0.0013746074999999999, 0.001228928, 0.0014668100000000002, 0.00104735225, 0.00108792025, 0.029767112749999998, 0.24374625, 0.0247556525, 0.16441, 0.0011075652500000001, 0.0010653552500000001, 0.00116889175, 0.00128540975, 0.0011570682500000001, 0.0008490692499999999, 0.0010410744999999999, 0.00122968775, 0.00086042975, 0.0009410730000000001, 0.00114135675, 0.00109515825, 0.0009644582500000002, 0.0012882025000000002, 0.0014246985, 0.001257464, 0.001755805, 0.000871394, 0.0011595232499999998, 0.0012973775, 0.0013301182500000002, 0.00143401, 0.001147625, 0.0014501175, 0.001006518, 0.001491049, 0.0010714607499999998, 0.0011520055]], 'ShapeOperator': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0007704610000000001, 0.0009356065, 0.0008687012499999999, 0.001336303, 0.00119180675, 0.0009428232499999999, 0.0012105125000000001, 0.0013347324999999999, 0.00153126, 0.0013948175, 0.00133691775, 0.00099005025, 0.00110856925, 0.00106272875, 0.0013869945, 0.0013480950000000001, 0.0011155524999999999, 0.001728781, 0.000990596, 0.00122769, 0.0013016590000000001, 0.0018694200000000001, 0.00117799975, 0.0015688149999999999, 0.001221705, 0.0010592095000000001, 0.0015819527500000002, 0.001571251, 0.0012754827500000001, 0.001717595, 0.0012536732499999997, 0.00122654225, 0.00133154575, 0.00160875175, 0.0010580272499999999, 0.00147253, 0.0010056065, 0.00128105, 0.00127320575, 0.0014622175, 0.0011240597500000002, 0.0016598725000000001, 0.001416465, 0.0011724399999999999, 0.0014064225, 0.0014927175000000001, 0.0012883570000000002, 0.0018160125, 0.0014174182499999998, 0.0017455699999999999, 0.0010991192499999998, 0.00121592, 0.0015318, 0.0014415267499999999, 0.0012691949999999999, 0.0015898375, 0.0010537805000000002, 0.0009851615, 0.0012906865, 0.0013166575, 0.0011657590000000002, 0.0016636025, 0.0015585125, 0.0013349672500000001, 0.0012400422499999999, 0.001227232, 0.00147741875, 0.0011032515000000001, 0.00116708925, 0.0013186200000000002, 0.0012283675, 0.0009580400000000001, 0.0012712875, 0.00117268075, 0.0013925399999999998, 0.001330924, 0.0011001385, 0.0013878542499999999, 0.0011093115000000001, 0.0015533600000000002, 0.0014516675, 0.0011411975, 0.00139832625, 0.0014873224999999999, 0.0015472325, 0.00120066125, 0.001182097, 0.0010762785, 0.0013124920000000002, 0.0016634475000000001, 0.0014566725000000002, 0.00124953675, 0.0015444974999999999, 0.0013477150000000002, 0.0012791265, 0.0011509295, 0.001635795, 0.0013145725000000001, 0.00140605475, 0.00113514, 0.00099596725, 0.0013539075, 0.0014539824999999999, 0.00113394825, 0.0012227462500000001, 0.00145194575, 0.0012159845, 0.001214532]], 'PCA': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0011760720000000002, 0.00106651425, 0.001168669, 0.00122344725, 0.0010658047499999999, 0.00112624375, 0.0012960455, 0.0015217157500000003, 0.001308445, 0.0012898875, 0.0016094975, 0.0013594935000000002, 0.0013697225, 0.00143133975, 0.001446395, 0.00121799775, 0.00153645125, 0.0014778125000000002, 0.00093332775, 0.00160846, 0.0013055655, 0.0014599927499999998, 0.0014422725, 0.0010145425, 0.0016169374999999999, 0.0016266149999999999, 0.0011670292499999999, 0.0015163132500000001, 0.00117096525, 0.0019358599999999998, 0.0015571425, 0.0015277275000000002, 0.0013598949999999999, 0.0015741175, 0.0012637224999999998, 0.001447952, 0.001374219, 0.00103692325, 0.00132689125, 0.0015624649999999999, 0.001445317, 0.0015714927500000001, 0.001591939, 0.00137967575, 0.0013760975, 0.0017775725, 0.0013309975, 0.001354485, 0.0013979675000000001, 0.001245596, 0.001477237, 0.0019326950000000001, 0.0014421825, 0.00143537675, 0.00099672175, 0.0018539, 0.001330795, 0.001437705, 0.00127762425, 0.001244335, 0.001290125, 0.0016097799999999999, 0.0013060790000000001, 0.0013286862499999998, 0.00124482175, 0.00121953275, 0.0017864325, 0.0014076825, 0.00180038, 0.0017769074999999998, 0.00143370075, 0.0018726250000000002, 0.00146037, 0.0013567924999999998, 0.00132793, 0.00156948, 0.0014957775, 0.001335605, 0.0010630665, 0.0016106725, 0.0017082234999999998, 0.0014446100000000003, 0.001760585, 0.0015150325, 0.00133793775, 0.001678985, 0.0016360749999999999, 0.0012645832500000002, 0.00122132, 0.00153587475, 0.0015366725, 0.00156507, 0.001780285, 0.00126802, 0.0011701530000000002, 0.00111548025, 0.00114205025, 0.0012042005, 0.00142371, 0.0013580775, 0.0015031889999999998, 0.00108136175, 0.0016308100000000001, 0.0018954574999999999, 0.0019852274999999997, 0.0017376100000000001, 0.0012119185, 0.00183126]], 'ASO': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0033866825, 0.0032364875000000003, 0.0034054775000000002, 0.002905925, 0.0038020099999999998, 0.0037117725, 0.0037486450000000005, 0.0037491800000000004, 0.0028216574999999997, 0.0037658875, 0.0032847375, 0.0033996275000000003, 0.0035497199999999997, 0.00244005, 0.0033024425000000002, 0.0038799875, 0.0026909675, 0.00332309, 0.0033321825, 0.0031558925, 0.00243289, 0.0030837175000000003, 0.0028407199999999997, 0.0034427525, 0.0035482400000000002, 0.00299871, 0.00313626, 0.002501215, 0.0035579125000000005, 0.0031859475000000003, 0.0038232525000000002, 0.0034233500000000004, 0.0032149675, 0.0028351, 0.0036154474999999997, 0.0030102824999999997, 0.0040086575, 0.0034651925, 0.0025411625, 0.0034638950000000003, 0.0028102475, 0.0036802600000000003, 0.0030864250000000003, 0.0029149224999999996, 0.0036659325, 0.003516025, 0.003846445, 0.0035600025, 0.0031382625, 0.0040347075, 0.0030092900000000004, 0.0034362625000000004, 0.0034349925, 0.0031358700000000002, 0.0028283024999999997, 0.0039830675, 0.0033497674999999998, 0.0034783799999999997, 0.0036837075, 0.002769005, 0.002341855, 0.0030549275, 0.0036336025000000003, 0.0030110725, 0.0033898825, 0.0028147175, 0.00398492, 0.003079925, 0.0026714449999999997, 0.0039322, 0.003668835, 0.002703055, 0.003573245, 0.0029265425, 0.0038372, 0.002730905, 0.0033763875000000004, 0.00311509, 0.003526675, 0.0029748199999999995, 0.0035018075, 0.00311691, 0.00264899, 0.003708265, 0.0036175550000000006, 0.0032964149999999996, 0.0040136675, 0.0028593925, 0.0030668725, 0.004612867499999999, 0.0033554699999999997, 0.00339552, 0.003049005, 0.0028353174999999997, 0.0031874525, 0.0032108625, 0.0042795125, 0.0033036225, 0.0031017974999999996, 0.0036115925, 0.002520475, 0.003495985, 0.0032132849999999998, 0.00309772, 0.0033213300000000004, 0.003956305, 0.0030147125000000003, 0.0035473525]], 'APSS': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0001828455, 0.00021531350000000002, 0.00027503175, 0.000214772, 0.00019446175, 0.000261964, 0.000268446, 0.000254303, 0.00021139749999999998, 0.00028463125, 0.0002369645, 0.00033254275, 0.0001829185, 0.00038184125000000004, 0.00024882425, 0.0003050045, 0.000267238, 0.00023728575000000001, 0.0001771215, 0.00023672975, 0.00021812149999999997, 0.00033371275, 0.00018003475000000002, 0.00025155, 0.000269302, 0.00020979650000000003, 0.00024749875, 0.00018044674999999997, 0.00029627075, 0.00024568175, 0.0002511265, 0.000187415, 0.00029506724999999996, 0.00022392124999999998, 0.00025411525, 0.00019477725, 0.00024255324999999998, 0.00033793375, 0.00016515749999999999, 0.00023652424999999998, 0.000170792, 0.00022587724999999998, 0.00024292625, 0.00020251, 0.000245785, 0.00016381799999999998, 0.00022198075, 0.00024138749999999998, 0.00023587675, 0.00028492175000000003, 0.00026959525, 0.00035770974999999993, 0.00026429175000000003, 0.00024444525, 0.00029296424999999997, 0.0001923575, 0.00037499500000000004, 0.00021165074999999998, 0.00022089175, 0.0002501795, 0.00028277225, 0.00024492025, 0.00019957149999999998, 0.00023629374999999998, 0.0002017165, 0.00024935125, 0.00020948849999999998, 0.000253964, 0.00036207075, 0.00029088225, 0.0003185585, 0.0003570675, 0.00041052025, 0.0002964305, 0.00021696025000000001, 0.00023789074999999997, 0.00025057175, 0.00033729075, 0.00023034, 0.00032304575000000003, 0.00024238925, 0.0002145155, 0.0002203655, 0.00022611299999999998, 0.00018205650000000003, 0.00027698675, 0.0003036205, 0.00031895074999999996, 0.00031248575, 0.00021576375, 0.0002280885, 0.000246151, 0.00020174349999999998, 0.00027321875, 0.00032196199999999996, 0.00029776075000000003, 0.00018290625000000002, 0.00038444999999999994, 0.0002487875, 0.00025561350000000003, 0.0002886645, 0.00024441925, 0.00016418725, 0.00024881875000000003, 0.00043804799999999996, 0.000276417, 0.00023369350000000002, 0.00027525875]], 'Sphere': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0100782675, 0.0091893175, 0.00974075, 0.01062888, 0.009877114999999999, 0.011856175, 0.011562064999999998, 0.0131702975, 0.008409795, 0.0088178275, 0.00915794, 0.011897225, 0.011520760000000001, 0.0091335975, 0.0114012475, 0.012101822500000001, 0.0116262, 0.013070677499999999, 0.0101919525, 0.00894681, 0.01107308, 0.013939975, 0.00921113, 0.012263017500000003, 0.014600925, 0.010434607500000002, 0.012430695, 0.0114977, 0.01291009, 0.0103546575, 0.01310585, 0.008917605, 0.014173502499999999, 0.012980317500000001, 0.0113585275, 0.0099786575, 0.011026415, 0.01315352, 0.01108109, 0.007994897499999999, 0.0118152575, 0.0117975075, 0.012766075, 0.011940277499999999, 0.009676460000000001, 0.01050238, 0.01286431, 0.010079052500000001, 0.0093307175, 0.010774875, 0.00968335, 0.0141423525, 0.0101855825, 0.007330312499999999, 0.0085183425, 0.01094144, 0.0088602125, 0.0156999, 0.008871872500000001, 0.011742342499999999, 0.009108600000000001, 0.009703005, 0.0107213175, 0.013406125, 0.008787, 0.0115406875, 0.0100583175, 0.01334005, 0.014474182500000002, 0.010180765, 0.0093979275, 0.0124542825, 0.01154595, 0.0127361975, 0.0132411175, 0.0093035725, 0.010796135, 0.01057163, 0.012444679999999998, 0.0106271325, 0.0122025175, 0.014556824999999999, 0.0127579125, 0.009617135, 0.009102155, 0.0134512, 0.0132729025, 0.009621709999999999, 0.0095099025, 0.01082457, 0.012795150000000002, 0.011032077500000001, 0.014806525000000001, 0.014201897500000001, 0.012425242500000001, 0.010252567499999999, 0.0122079525, 0.009827905, 0.013058285, 0.01327553, 0.010378135, 0.009734000000000001, 0.01092343, 0.013377024999999999, 0.0120204675, 0.010614515, 0.00997867, 0.011881167500000001]], 'UnorientedSphere': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0041192325, 0.002912095, 0.0042520125, 0.00539475, 0.0028410625000000003, 0.004363745, 0.006696875, 0.006520140000000001, 0.004643545, 0.0045617875, 0.003987940000000001, 0.0062423475, 0.007556225, 0.0055881725, 0.00528051, 0.007513682499999999, 0.00705264, 0.0074735175000000004, 0.0038715500000000005, 0.0041671925, 0.003100315, 0.005367162500000001, 0.0039467025000000005, 0.0044643224999999995, 0.0056474049999999994, 0.0054712075, 0.005385559999999999, 0.0060461225, 0.00563812, 0.006650315, 0.005841597499999999, 0.00631792, 0.0056474, 0.0077585275, 0.004401505, 0.006045795, 0.005059145, 0.0033638375, 0.00277578, 0.0042039475, 0.0034233125, 0.0046064825, 0.0051678675, 0.0057580125000000005, 0.00396747, 0.004151510000000001, 0.006551875, 0.0070592825, 0.005682275, 0.006726567500000001, 0.006106965, 0.0056262225, 0.0047786074999999996, 0.005001505, 0.0031301849999999997, 0.0056676025000000005, 0.004378802499999999, 0.003960544999999999, 0.005915869999999999, 0.0061573224999999995, 0.0059560475000000005, 0.0059161775, 0.00477002, 0.00677923, 0.00464479, 0.0041976775, 0.004964194999999999, 0.0065514675, 0.005043395, 0.0061605175000000005, 0.0047749925, 0.0053458725, 0.0066607075, 0.005772982499999999, 0.0058556325, 0.0048092675000000005, 0.0023243350000000003, 0.0035373625000000002, 0.0017722125000000002, 0.0020230725, 0.0066052525, 0.0059419425, 0.0046846875, 0.0042930425, 0.0044336825, 0.005524055, 0.005973075, 0.0060979599999999995, 0.0037353449999999997, 0.005002629999999999, 0.00727915, 0.00550801, 0.0050769775000000005, 0.006645587499999999, 0.0067574625, 0.005699555, 0.0062347875, 0.0054932775, 0.0063905724999999995, 0.006402875, 0.007499862499999999, 0.006765005, 0.006542512499999999, 0.00648222, 0.00415541, 0.00721774, 0.0054409325, 0.0070383175]], 'Cov2D': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00063903225, 0.0007304402499999999, 0.0006501510000000001, 0.00105310975, 0.0010169755, 0.0009995505, 0.00118301725, 0.000724168, 0.001156924, 0.0010974185, 0.00099823325, 0.0008654055, 0.0009225335, 0.000895112, 0.0010244439999999998, 0.0015114142499999999, 0.00117814925, 0.0009099005, 0.0008929727499999999, 0.000615403, 0.0007006715, 0.00111935575, 0.00106495075, 0.0009214047500000001, 0.00073173875, 0.00101596725, 0.00092865225, 0.00121964525, 0.0009255559999999999, 0.0007618039999999999, 0.00085331, 0.0007714822500000001, 0.000793194, 0.0011241089999999999, 0.0010346205, 0.001033692, 0.0009842709999999999, 0.0007646294999999999, 0.0008704672500000001, 0.001056689, 0.001033378, 0.00070586125, 0.00072338, 0.0009396004999999999, 0.0009865005000000001, 0.0011752105, 0.0010083975, 0.0009138182499999999, 0.00099133875, 0.0012917175, 0.00089543875, 0.0012071324999999998, 0.0010649855, 0.00090196275, 0.00121041975, 0.0010575405, 0.0007187494999999999, 0.0011173490000000001, 0.00120674725, 0.000869579, 0.0009708305, 0.0011586572499999999, 0.0011543812500000002, 0.0008156275, 0.00096441425, 0.00092174925, 0.0008438917500000001, 0.00107585075, 0.0011809685, 0.0009164922500000002, 0.0008401264999999999, 0.0011864840000000002, 0.000940121, 0.0013467475, 0.0012055850000000001, 0.001056981, 0.0008742975, 0.0008753809999999999, 0.0008184775, 0.00108090825, 0.000975679, 0.0008164235000000001, 0.00092281375, 0.0011909215, 0.001026224, 0.0009173865, 0.00072652475, 0.00102041125, 0.001245389, 0.00092927275, 0.001067833, 0.000971398, 0.0008306555, 0.00119307825, 0.0010705379999999998, 0.00103635525, 0.00108637525, 0.000959508, 0.0007792677500000001, 0.0012080917500000002, 0.0010544422500000001, 0.0008844720000000001, 0.0010816785000000002, 0.0008862824999999999, 0.000936733, 0.0011766405, 0.0011680015, 0.00102043875]], 'NormCov2D': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0005583049999999999, 0.00061090675, 0.0006170545, 0.00088865525, 0.00097889475, 0.0009006455, 0.0009057525, 0.0007883335, 0.0007936977499999999, 0.0008501082499999999, 0.0012453009999999999, 0.0007473065, 0.0008661187500000001, 0.0011729, 0.0009733149999999999, 0.0008229155, 0.00102969825, 0.000898177, 0.00062365725, 0.00115649025, 0.00073439275, 0.0007028997500000001, 0.000932424, 0.00099451, 0.00098588125, 0.000702459, 0.00071246875, 0.0007727945, 0.00065759475, 0.000999271, 0.00091856225, 0.0008817515, 0.00113889575, 0.0010475855, 0.0007899362499999998, 0.0013223299999999998, 0.000909644, 0.000829439, 0.0008804654999999999, 0.0008470545, 0.00080209125, 0.00106208775, 0.0007843482499999999, 0.00105725325, 0.001039557, 0.0010325915, 0.0008994535, 0.0007615790000000001, 0.00094481375, 0.00101632475, 0.0007567382499999999, 0.00084149425, 0.00088817375, 0.0007950644999999999, 0.00101740975, 0.0009742525000000001, 0.0009419962500000002, 0.00121289375, 0.001082774, 0.0012562724999999999, 0.00088557325, 0.0010821197500000001, 0.0008427867499999999, 0.00105143875, 0.0010730834999999998, 0.0011159562499999998, 0.000829067, 0.0010807672500000001, 0.0011459950000000001, 0.000834424, 0.0010685725, 0.000773136, 0.0008778624999999999, 0.0009068925, 0.0010382454999999999, 0.0008920285, 0.00072901825, 0.0009697029999999999, 0.0011575584999999999, 0.000969541, 0.0007275692499999999, 0.000856189, 0.0009745235, 0.00087445375, 0.0010074955, 0.001243582, 0.0008768644999999999, 0.0009089195000000001, 0.00094860625, 0.00098295175, 0.0009105947500000001, 0.0008153514999999999, 0.000993077, 0.0008086430000000001, 0.0008968575, 0.00103765, 0.0012933375, 0.00097154925, 0.00092905375, 0.0009059765, 0.00086095675, 0.000770506, 0.00126391775, 0.0008867855, 0.0010088215, 0.00101870975, 0.0007990545, 0.00097020325]], 'Mean': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00013967332500000002, 8.09999e-05, 0.00010195972500000001, 8.009625e-05, 0.000134621225, 7.31241e-05, 0.00010876487499999999, 0.00012003322499999999, 0.00013114775, 9.036627500000002e-05, 0.0001004288, 0.0001375336, 0.00010062407499999999, 7.7354975e-05, 0.000135398225, 0.000104671575, 6.626107499999999e-05, 9.2598325e-05, 0.00011641615000000002, 0.0001478895, 0.00011589022500000003, 0.000138758425, 8.40376e-05, 0.00011210035, 0.00019102815, 0.000136153375, 0.0001480235, 9.863385e-05, 8.6389925e-05, 0.00010730040000000001, 0.00014243775000000002, 6.410827499999999e-05, 9.098479999999998e-05, 0.00010890814999999999, 6.9527225e-05, 0.00011504474999999999, 0.00010116180000000002, 8.7998775e-05, 0.000150835275, 0.00011711685000000001, 7.4878125e-05, 8.743105e-05, 0.00023351855000000002, 9.320024999999999e-05, 0.00012935515, 0.00010370522500000002, 0.00011489272500000001, 0.0001642356, 0.00011676815, 0.00010605900000000001, 9.94372e-05, 0.00013444472500000003, 9.6314825e-05, 0.00012273095, 0.00017131520000000002, 7.578637499999999e-05, 8.511385e-05, 0.00014479455, 9.69427e-05, 0.00011081120000000001, 0.00015026107499999997, 7.645814999999999e-05, 8.849945e-05, 0.00015569119999999997, 0.00016501642500000002, 8.82013e-05, 0.0001037296, 0.00015686925, 6.812945e-05, 0.000131757525, 7.6388e-05, 0.00011805715000000002, 0.000124798375, 0.00012134632499999999, 0.0001151115, 0.000139727425, 0.0001113838, 0.00012907754999999998, 0.00015706297499999997, 0.0001084079, 0.00011775722500000001, 7.8482025e-05, 0.00011577105, 0.000103825275, 0.00011201020000000001, 0.00014323917499999998, 0.000127274, 8.9688275e-05, 7.4233025e-05, 0.00010841957500000001, 0.00013991134999999998, 0.000140987, 9.4905325e-05, 0.0001762909, 0.00013551805, 0.000122785, 0.0001186748, 0.000134592125, 7.6248875e-05, 8.148655e-05, 0.0001065932, 0.000137023125, 9.5258775e-05, 8.5778525e-05, 0.000195411425, 7.3336375e-05, 0.000138543075, 0.00012661047499999998]]}, 'all_Shape_RMSAE Normal': {'3DQuadric': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [-1, -1, -1, 37.944725000000005, 17.4544025, 22.586025, 10.1346725, 13.13625, 10.58421, 31.106, 11.67214, 18.937350000000002, 32.456025, 26.784175, 29.718125, 53.3344, 33.09525, 44.630675, -1, -1, -1, 38.001925, 21.492775, 27.1071, 38.571275, 36.6613, 37.483425, 56.761700000000005, 37.353325, 50.555475, 39.9531, 39.894999999999996, 39.168400000000005, 45.498275, 34.42715, 38.65004999999999, 28.314550000000004, 34.082525, 35.0823, 24.10445, 9.243765, 15.463700000000001, 1.0324697500000002, 27.719995, 2.321306, 14.174622499999998, 22.8661, 20.5246, 21.911175, 40.441950000000006, 22.893250000000002, 28.725050000000003, 5.48818, 7.3197475, 4.9035075, 22.0003, 11.935469999999999, 12.47222, 23.551975, 20.391425, 22.8232, 38.492125, 22.699375, 28.20835, 7.816839999999999, 13.2890875, 11.01122, 43.42825, 14.5145, 27.02235, 6.966715, 8.4456075, 7.5040025, 40.837375, 11.716639999999998, 26.987875000000003, 6.530009999999999, 55.013125, 20.041765, 45.974975, 1.8174074999999998, 6.341960000000001, 2.916625, 18.867585, 1.7417574999999998, 8.7864075, 0.29701397500000004, 18.841075, 1.55727175, 8.68967, 11.67285, 11.56255, 11.685025, 37.490500000000004, 16.505925, 23.592549999999996, 18.0763, 16.6874, 16.90025, 46.736225, 24.65735, 34.42505, 8.351975000000001, 9.29743, 9.03418, 29.054250000000003, 9.267790000000002, 16.033699999999996]], 'PC-MLS': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [7.340629999999999, 6.17256, 8.7550725, 25.048650000000002, 7.684122500000001, 13.866999999999999, 7.37772, 6.34979, 10.7391125, 22.07255, 7.616350000000001, 12.894325, 29.639049999999997, 24.223475, 28.442475, 49.007375, 30.346824999999995, 40.049699999999994, 14.942675000000001, 14.56955, 16.947400000000002, 29.267899999999997, 15.327550000000002, 20.441725, 34.19345, 26.440824999999997, 32.4636, 54.35, 34.43155, 47.19307500000001, 32.7655, 32.283625, 31.625975, 41.054175, 32.9268, 35.867125, 7.255610000000001, 7.7533875000000005, 9.0750675, 15.293675, 7.4327875, 9.9005775, 0.24264925, 17.077005000000003, 1.142791, 7.256819999999999, 17.780025000000002, 14.636775, 18.8082, 33.63895, 18.0803, 23.65265, 6.310600000000001, 6.212045, 5.50854, 15.462275000000002, 6.4381474999999995, 9.030864999999999, 18.49915, 14.618925, 18.635775000000002, 33.51885, 18.80235, 24.224649999999997, 7.0161575, 8.0258675, 10.680467499999999, 33.77695, 7.3448775, 13.581600000000002, 6.8992775, 8.960650000000001, 9.797765, 34.743700000000004, 7.2826200000000005, 17.16145, 9.302495, 36.504825000000004, 15.662025, 28.0642, 0.823922, 2.1506102499999997, 0.88022725, 11.312025000000002, 1.16739975, 4.4866624999999996, 0.133042, 11.260634999999999, 0.7680450000000001, 4.377602499999999, 11.180869999999999, 11.0471575, 12.733, 31.703950000000003, 11.642310000000002, 18.943025, 18.162625, 18.40455, 19.6018, 42.1412, 19.2534, 29.791850000000004, 5.989295, 5.77684, 7.5450075000000005, 22.94175, 6.28325, 11.777275]], '2-Monge': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [7.412492500000001, 6.309525, 9.2326275, 24.955650000000002, 7.7613325, 13.895249999999999, 7.5296400000000006, 6.5634675, 11.239465000000001, 22.046325, 7.7708925, 13.008875, 29.653975000000003, 24.31295, 28.728324999999998, 48.9324, 30.384299999999996, 40.019425, 14.887649999999999, 14.564024999999999, 17.04035, 29.23205, 15.278475, 20.46735, 33.7457, 26.422475, 32.458025, 54.33125, 34.127175, 47.189274999999995, 32.901225, 32.461425000000006, 31.901575, 41.07205, 33.06462499999999, 35.986824999999996, 7.2907425, 7.7979175000000005, 9.1248425, 15.24095, 7.4667025, 9.9404725, 0.3860235, 16.8804125, 1.19881775, 7.200307499999999, 17.78775, 14.821025, 19.286425, 33.58215, 18.10185, 23.6942, 6.3054825, 6.267774999999999, 6.3610375, 15.361225, 6.4371875, 9.043109999999999, 18.539275000000004, 14.860824999999998, 19.34205, 33.44775, 18.85135, 24.26205, 7.04359, 8.0767325, 10.81486, 33.71235, 7.37329, 13.587050000000001, 6.9140725, 8.8761875, 9.996569999999998, 34.707125, 7.288740000000001, 17.210275000000003, 9.4540275, 36.32, 15.905425, 27.903899999999997, 0.8548990000000001, 2.19477975, 1.094111, 11.177719999999999, 1.19578725, 4.496177499999999, 0.26653425000000003, 11.13586, 0.8191437500000001, 4.38953, 11.3853075, 11.212394999999999, 13.023925, 31.619175000000002, 11.8482125, 19.024224999999998, 18.23765, 18.396875, 19.761574999999997, 42.097125, 19.3333, 29.865875000000003, 6.1711825, 5.9811974999999995, 7.79944, 22.844425, 6.457705, 11.83865]], 'Varifolds': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [7.30606, 6.1669374999999995, 7.04513, 24.5248, 7.6772575000000005, 13.58195, 6.969, 6.3076675, 9.503845, 21.653225, 7.240815, 12.64865, 29.552525000000003, 23.971799999999998, 27.231325000000002, 48.7582, 30.2804, 39.777274999999996, 15.750575, 14.884549999999999, 16.0663, 28.879500000000004, 15.991074999999999, 20.394375, 33.259225, 25.482825, 31.084, 54.222425, 33.899125, 46.983374999999995, 32.459375, 31.786075000000004, 30.8649, 40.80905, 32.620625000000004, 35.66605, 7.799545, 8.414095, 8.4320625, 14.872900000000001, 7.9106925, 9.9745825, 0.2343325, 16.39251, 1.138682, 6.8584075, 17.84515, 14.594475, 17.433275000000002, 33.2435, 18.128725, 23.447525000000002, 6.318925, 6.550545, 5.28444, 14.958575, 6.44797, 8.9155525, 18.440549999999998, 14.456, 17.67415, 33.120725, 18.736525, 24.012225, 7.6263000000000005, 8.4901325, 9.012880000000001, 33.438575, 7.8464275, 13.252500000000001, 7.2266375, 9.002045, 9.592780000000001, 34.43495, 7.547255, 16.737425, 7.7761675, 36.065000000000005, 14.90933, 27.53355, 0.8237685000000001, 2.8590725000000003, 0.87829475, 10.7092725, 1.1666765, 4.3379775, 0.13242674999999998, 10.675705, 0.766776, 4.2303975000000005, 10.695795, 10.674624999999999, 11.3462225, 31.229324999999996, 11.17255, 18.597450000000002, 18.0605, 18.642375, 19.08395, 41.80565000000001, 19.005975, 29.452350000000003, 5.5958075, 5.4277025, 5.7966225, 22.380174999999998, 5.9441500000000005, 11.4941825]], 'WaveJets': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [7.884155, 6.2673175, 8.3964575, 25.43935, 8.2555025, 14.390275, 7.35653, 6.4285375, 10.31193, 22.404124999999997, 7.583119999999999, 12.994824999999999, 30.010624999999997, 24.51665, 28.05555, 49.13195, 30.68085, 40.264525, 16.0238, 15.50995, 17.336850000000002, 29.597424999999998, 16.295125, 20.874825, 33.240025, 25.707325, 31.774475, 54.40152500000001, 33.7363, 47.184799999999996, 32.918775, 32.437850000000005, 31.728025, 41.20175, 33.0604, 35.973575, 8.41059, 8.285887500000001, 9.28077, 15.8049, 8.539525, 10.588515, 0.299656, 17.5063025, 1.30531, 7.7314775, 18.525275, 14.978024999999999, 18.58365, 33.924625, 18.7724, 24.040025, 6.5076225, 6.378483333333334, 5.717276666666667, 16.01265, 6.66081, 9.4928675, 19.128325, 14.861775, 18.711725, 33.812599999999996, 19.405525, 24.640175, 8.3078125, 8.7367625, 10.1068475, 34.038574999999994, 8.5474875, 14.016975, 8.16631, 9.969205, 9.896215000000002, 34.968275, 8.33493, 17.3598, 9.227432499999999, 36.650999999999996, 15.39055, 28.3051, 0.83486625, 2.1697177500000002, 0.916555, 12.006585, 1.28956475, 5.091514999999999, 0.1899645, 11.956869999999999, 0.932265, 5.005912499999999, 11.7882025, 11.591362499999999, 12.44947, 31.99435, 12.092032500000002, 19.359724999999997, 20.732924999999998, 20.750525, 21.22995, 42.290775, 21.043875, 30.073449999999998, 6.3688675, 5.8932375, 7.045450000000001, 23.360025, 6.6867350000000005, 12.324475]], 'PCA': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [7.3107625, 5.8071, 7.0469075, 25.30715, 7.6816825, 13.992049999999999, 6.996947499999999, 6.12537, 9.5267725, 22.18895, 7.2692975, 12.731774999999999, 29.5975, 23.99255, 27.260350000000003, 49.114325, 30.318224999999998, 40.16095, 15.764325, 14.89335, 16.086, 29.419675, 16.003700000000002, 20.549625, 33.41525, 25.555675, 31.223750000000003, 54.40265, 34.0426, 47.247474999999994, 32.46195, 31.76715, 30.868875, 41.101150000000004, 32.621224999999995, 35.699225, 7.80771, 7.9782150000000005, 8.43985, 15.502450000000001, 7.918505, 10.0377425, 0.2350295, 17.4610625, 1.1392107500000002, 7.475759999999999, 17.856825, 14.427575000000001, 17.455199999999998, 33.800824999999996, 18.140349999999998, 23.69585, 6.3201225, 6.1475124999999995, 5.92945, 15.758175000000001, 6.44905, 9.09169, 18.463549999999998, 14.3077, 17.712525, 33.70025, 18.7576, 24.289475000000003, 7.63328, 8.3986975, 9.01689, 33.908525, 7.852755, 13.584125, 7.2368325, 9.0028575, 9.604345, 34.866074999999995, 7.5479199999999995, 17.009725, 7.824372499999999, 36.732825000000005, 14.9681875, 28.337600000000002, 0.823893, 2.1376512500000002, 0.8801675, 11.6503975, 1.1669067499999999, 4.572325, 0.13327825, 11.59012, 0.7670045, 4.451415, 10.76788, 10.719585, 11.389315, 31.939625, 11.2339, 19.0275, 18.125325, 18.718825000000002, 19.16165, 42.28845, 19.048099999999998, 29.804825, 5.6353425, 5.4352575, 5.8233999999999995, 23.228575000000003, 5.9849625, 11.8447625]], 'ASO': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [4.70801, 5.814665, 4.894045, 20.13245, 5.182425, 10.991375, 4.83687, 5.798534999999999, 5.503752499999999, 13.3843, 4.98873, 8.008769999999998, 25.45145, 20.467125000000003, 22.950375, 43.892825, 26.4552, 36.191925, 14.035125, 13.898674999999999, 14.275725, 25.679750000000002, 14.268975000000001, 18.534525000000002, 29.38955, 21.997374999999998, 27.418375000000005, 51.148925, 31.610799999999998, 43.7197, 33.34225, 32.777775, 31.3205, 39.0491, 33.434749999999994, 35.45505, 6.812645, 9.1421175, 7.64084, 12.494724999999999, 6.909704999999999, 8.757735, 0.074455725, 11.3816575, 0.8821559999999998, 4.8258575, 15.24145, 13.392125, 14.669487499999999, 28.7026, 15.550574999999998, 20.747, 5.44777, 7.0260625, 5.2010725, 11.882275, 5.5727225, 7.639645, 15.693850000000001, 12.977049999999998, 15.02937, 29.028574999999996, 16.061975, 21.47985, 6.9650975, 8.5802325, 7.857482500000001, 17.420399999999997, 7.1804775, 10.626832499999999, 7.10573, 10.22692, 7.2970825, 17.614475000000002, 7.3206050000000005, 10.708475, 3.1064249999999998, 32.3836, 5.953665, 20.9268, 0.8140425, 4.11796, 0.82936225, 7.3109475, 1.0413925, 3.2314225000000003, 0.02809476666666667, 7.211275, 0.595964, 3.0965575000000003, 9.318085, 10.347480000000001, 9.701815, 26.6255, 9.774282500000002, 16.559175, 17.976575, 19.597275, 18.417675, 37.884675, 18.752000000000002, 27.965249999999997, 4.688295, 4.9696675, 4.669347500000001, 18.404474999999998, 5.00178, 9.863389999999999]], 'APSS': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [7.70268, 7.401530000000001, 7.0488775, 17.799950000000003, 7.935242499999999, 11.748715, 9.0060875, 6.58288, 8.810285, 13.76125, 9.09623, 10.6905775, 29.3014, 23.522925, 26.237474999999996, 41.804175, 29.916525, 36.241474999999994, 16.95495, 16.197925, 16.69945, 24.778124999999996, 17.0987, 19.900125, 37.877449999999996, 28.2205, 34.038050000000005, 50.680675, 39.19625, 47.557675, 36.95686666666666, 38.1887, 36.0494, 39.67463333333333, 36.99883333333333, 37.86496666666667, 8.235759999999999, 9.58239, 9.518306666666666, 11.383875, 8.2831675, 9.30114, 0.350011, 5.5677075, 0.53689875, 3.1344100000000004, 18.860999999999997, 15.573775, 17.5945, 28.15045, 19.054000000000002, 22.631625, 7.82212, -1, 7.37076, 9.721883333333333, 7.852405, 7.9878133333333325, 19.206225, 15.328025, 17.93835, 27.908425, 19.413425, 22.942074999999996, 8.177265, 9.752146666666667, 9.708516666666666, 13.998000000000001, 8.29874, 10.4596125, 8.57909, 11.4125425, 8.5847475, 15.023025, 8.7036825, 11.065175, 10.66239, 25.150025, 12.55547, 21.08695, 0.80369975, 4.119365, 0.8259645, 3.98278, 0.83678925, 2.161735, -1, 3.9045925, 0.2826815, 2.065295, 11.12894, 11.617412499999999, 11.40201, 24.966324999999998, 11.445224999999999, 16.952600000000004, 20.7441, 23.22986666666667, 21.012325, 36.60735, 21.283425, 28.503975, 5.6937549999999995, 5.593885, 5.7116125, 16.417749999999998, 5.909622499999999, 9.8983725]], 'Sphere': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [36.592925, 40.27485, 38.662925, 41.73685, 7.5663425, 22.733375, 9.35553, 6.83567, 9.6097775, 35.4646, 9.452065, 15.830675, 29.618499999999997, 23.936275, 26.933124999999997, 54.942375, 30.312450000000002, 48.361549999999994, 41.037425, 41.0593, 42.577200000000005, 42.634975, 16.392425, 25.697675, 35.391574999999996, 30.027099999999997, 33.61135, 57.70287499999999, 35.38705, 54.051075, 38.534225, 37.0735, 36.310225, 48.327799999999996, 35.2639, 39.143074999999996, 23.74395, 26.359175, 24.556525, 29.216275000000003, 7.922615, 12.354265, 0.17905025000000002, 41.3375, 1.1355225, 20.11049, 18.378300000000003, 15.198699999999999, 17.34775, 46.07985, 18.650425000000002, 30.0686, 5.686086666666667, 7.379085, 5.895614999999999, 33.153175, 6.4488025, 13.8250975, 18.792275, 14.792575, 17.6267, 46.509475, 19.07655, 31.156575, 8.104765, 11.392425000000001, 10.206485, 43.813674999999996, 8.095062500000001, 21.386575, 8.8924475, 10.1327225, 9.0497075, 44.20655, 9.11666, 22.34825, 14.012519999999999, 48.577774999999995, 13.781705, 44.895525000000006, 0.8139400000000001, 4.120380000000001, 0.8373814999999999, 31.3552675, 1.1613845, 10.131594999999999, 0.02809563333333333, 31.176685000000003, 0.7564522499999999, 10.1871625, 11.97261, 11.966704999999997, 11.7094725, 44.933825, 12.349155000000001, 28.285075000000003, 21.982499999999998, 22.580875, 22.134275000000002, 50.719875, 21.663275000000002, 39.256, 6.0049399999999995, 5.707542500000001, 5.7756799999999995, 39.31377499999999, 6.3479725, 19.668149999999997]], 'UnorientedSphere': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [6.804125000000001, 6.90108, 6.5172725, 17.74395, 7.0472325, 11.0969525, 7.1408450000000006, 6.29245, 7.017615, 10.969974999999998, 7.21211, 8.6100675, 27.891150000000003, 22.398224999999996, 24.959175000000002, 40.0161, 28.464999999999996, 34.7338, 14.016974999999999, 13.203400000000002, 14.0729, 25.759349999999998, 14.272224999999999, 18.820449999999997, 31.511924999999998, 24.6238, 28.996000000000002, 44.040725, 31.840899999999998, 39.123575, 33.417233333333336, 34.4363, 33.13165, 36.5878, 33.4544, 34.38473333333334, 6.3140175, 7.492850000000001, 7.6471599999999995, 11.429, 6.40407, 8.18333, 0.233823, 5.9353, 0.53844825, 3.3051825000000004, 17.817149999999998, 14.93035, 16.97505, 26.613425000000003, 18.007424999999998, 21.357675, 7.607645, -1, 7.227275, 9.51924, 7.007273333333333, 7.810953333333333, 18.658025000000002, 15.181449999999998, 17.584125, 27.139075, 18.86155, 22.3099, 6.4499450000000005, 7.574156666666666, 8.721763333333334, 15.115825000000001, 6.67468, 10.30445, 7.093775, 8.898729999999999, 7.014819999999999, 12.7427, 7.194650000000001, 9.387385, 7.981835, 14.41645, 9.3232075, 13.579775, 0.80369525, 4.1193625, 0.82596, 4.263895000000001, 0.83684075, 2.2425675, -1, 4.1980699999999995, 0.283114, 2.1506100000000004, 11.1781975, 11.03365, 11.1325675, 24.5319, 11.45664, 16.6765, 18.7553, 20.164166666666667, 18.349225, 33.6451, 19.07105, 25.3784, 5.3889525, 5.4419375, 5.6256875, 16.237875000000003, 5.6038125, 9.70751]], 'Mean': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.114855, 8.340485000000001, 7.673287500000001, 17.971733333333333, 8.3269, 11.7900725, 8.436025, 6.3506800000000005, 9.00961, 17.0353, 8.611947500000001, 12.402102500000002, 29.651525, 25.8543, 26.874125, 42.5561, 30.1828, 36.114525, 17.707925000000003, 18.3528, 17.79855, 24.712400000000002, 20.9283, 20.200875, 40.08525, 33.48523333333333, 36.05435, 51.48095, 40.82525, 48.49816666666666, 37.085033333333335, 38.4417, 36.3929, 39.73726666666667, 37.124766666666666, 37.96273333333333, 8.6470375, -1, 10.162716666666668, 11.2899, 8.685825, 9.509689999999999, 0.30152749999999995, 3.8087966666666673, 0.48659450000000004, 1.9132975, 19.348025, 20.1243, 18.51995, 28.7249, 19.51635, 22.751175, 7.933764999999999, 7.75233, 7.7477800000000006, 9.43426, 7.961449999999999, 8.509225, 25.349, 20.4074, 18.6231, 28.22923333333333, 23.401249999999997, 25.05775, 8.5296825, 10.932065, 10.38614, 13.991900000000001, 8.63426, 10.370425, 8.93435, 13.212233333333332, 9.014755, 16.699299999999997, 9.021482500000001, 11.025715, 8.30724, 26.6256, 9.83279, 19.9477, 0.826683, 0.859539, 0.98839375, 2.35859, 0.85533175, 1.3735700000000002, 0.19424225, 2.2104999999999997, 0.29311575, 1.1128575, 12.363975, 12.6860875, 12.399469999999999, 25.215366666666664, 12.605807500000001, 17.238225, 22.4703, 25.152966666666668, 26.21125, 37.6006, 22.822049999999997, 28.880450000000003, 6.297005, 6.426046666666667, 6.2147049999999995, 16.059275, 6.4941775, 9.909659999999999]]}, 'all_Shape_Non-stable ratio': {'3DQuadric': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.007712500000000001, 0.0005625, 0.00089, 0.0, 2.25e-05, 0.0, 0.010505, 0.0001575, 0.00019, 0.0, 0.0, 0.0, 0.0029556865, 0.0008073235, 0.0030257159249999998, 0.0, 0.0005534460000000001, 0.0, 0.00193083125, 2.00082e-05, 0.0005277417, 0.0, 7.50345e-06, 0.0, 0.0075886437, 0.000939154, 0.00282616975, 0.0, 0.00050967875, 0.0, 0.0025636509999999997, 7.2797e-05, 0.0003113485, 0.0, 2.510875e-06, 0.0, 0.013694999999999999, 0.0003675, 0.0001475, 0.0, 0.0, 0.0, 0.0011625, 0.0, 5.75e-05, 0.0, 0.00938887, 0.000123407, 0.000697992, 0.0, 1.5118975e-05, 0.0, 0.0111225, 0.0002175, 0.0003325, 0.0, 2.5e-06, 7.518450000000001e-06, 0.0119324425, 0.0007069580750000001, 0.0008671233999999999, 7.518450000000001e-06, 2.2555275e-05, 0.0, 0.00663, 0.000255, 0.0005425, 0.0, 1.75e-05, 0.0, 0.001765, 2.25e-05, 0.0006275, 0.0, 1.25e-05, 0.0, 0.0056675, 0.0, 0.0019349999999999999, 0.0, 0.01115, 0.0002775, 0.0003875, 0.0, 5e-06, 0.0, 0.0003475, 0.0, 5e-06, 0.0, 0.0006625, 1.75e-05, 0.00123, 0.0, 6e-05, 2.75e-05, 0.000715, 0.0001575, 0.00235, 3e-05, 0.0002625, 0.0, 0.00109, 2.25e-05, 0.0006825, 0.0, 1e-05]], 'PC-MLS': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.00036500000000000004, 1e-05, 8.75e-05, 0.0, 2.5e-06, 0.0, 0.001395, 0.0, 1.75e-05, 0.0, 0.0, 0.0, 7.9327825e-05, 9.0036e-06, 0.0004926296750000001, 0.0, 5.1695675e-05, 0.0, 5.00215e-06, 0.0, 4.0018399999999996e-05, 0.0, 0.0, 0.0, 0.0005383847000000001, 2.3093975e-05, 0.00041029017499999995, 0.0, 3.8226e-05, 0.0, 9.811805e-05, 0.0, 2.0086974999999998e-05, 0.0, 0.0, 0.0, 0.0024625, 5e-06, 1.75e-05, 0.0, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 0.0, 0.0010918450000000001, 2.5185e-06, 6.2995825e-05, 0.0, 0.0, 0.0, 0.0016300000000000002, 2.5e-06, 3e-05, 0.0, 0.0, 7.518450000000001e-06, 0.0021273922750000003, 2.0055575e-05, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 0.0, 0.0005225000000000001, 2.5e-06, 9.5e-05, 0.0, 0.0, 0.0, 1.75e-05, 0.0, 7.5e-05, 0.0, 0.0, 0.0, 0.001115, 0.0, 0.00021, 0.0, 0.00141, 0.0, 5.75e-05, 0.0, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.0, 1.7500000000000002e-05, 0.0, 0.00015, 0.0, 5e-06, 0.0, 3.2500000000000004e-05, 1.5e-05, 0.00030250000000000003, 0.0, 1.25e-05, 0.0, 3e-05, 0.0, 6e-05, 0.0, 2.5e-06]], '2-Monge': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.00036500000000000004, 1e-05, 8.75e-05, 0.0, 2.5e-06, 0.0, 0.001395, 0.0, 1.75e-05, 0.0, 0.0, 0.0, 7.9327825e-05, 9.0036e-06, 0.0004926296750000001, 0.0, 5.1695675e-05, 0.0, 5.00215e-06, 0.0, 4.0018399999999996e-05, 0.0, 0.0, 0.0, 0.0005383847000000001, 2.3093975e-05, 0.00041029017499999995, 0.0, 3.8226e-05, 0.0, 9.811805e-05, 0.0, 2.0086974999999998e-05, 0.0, 0.0, 0.0, 0.0024625, 5e-06, 1.75e-05, 0.0, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 0.0, 0.0010918450000000001, 2.5185e-06, 6.2995825e-05, 0.0, 0.0, 0.0, 0.0016300000000000002, 2.5e-06, 3e-05, 0.0, 0.0, 7.518450000000001e-06, 0.0021273922750000003, 2.0055575e-05, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 0.0, 0.0005225000000000001, 2.5e-06, 9.5e-05, 0.0, 0.0, 0.0, 1.75e-05, 0.0, 7.5e-05, 0.0, 0.0, 0.0, 0.001115, 0.0, 0.00021, 0.0, 0.00141, 0.0, 5.75e-05, 0.0, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.0, 1.7500000000000002e-05, 0.0, 0.00015, 0.0, 5e-06, 0.0, 3.2500000000000004e-05, 1.5e-05, 0.00030250000000000003, 0.0, 1.25e-05, 0.0, 3e-05, 0.0, 6e-05, 0.0, 2.5e-06]], 'Varifolds': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 7.5e-05, 2.5e-06, 3e-05, 0.0, 2.5e-06, 0.0, 0.00053, 0.0, 1e-05, 0.0, 0.0, 0.0, 1.175225e-05, 0.0, 0.00024935532500000004, 0.0, 1.82455e-05, 0.0, 2.501075e-06, 0.0, 2.00092e-05, 0.0, 0.0, 0.0, 0.000156387875, 7.698e-06, 0.00019877465, 0.0, 1.2741975e-05, 0.0, 2.264265e-05, 0.0, 7.532625e-06, 0.0, 0.0, 0.0, 0.00092, 0.0, 5e-06, 0.0, 0.0, 0.0, 6.25e-05, 0.0, 2.5e-06, 0.0, 0.0003421441, 0.0, 3.0238e-05, 0.0, 0.0, 0.0, 0.00059, 0.0, 1.25e-05, 0.0, 0.0, 7.518450000000001e-06, 0.0008093617499999999, 0.0, 2.75675e-05, 5.0123e-06, 5.0123e-06, 0.0, 0.000155, 0.0, 4.2499999999999996e-05, 0.0, 0.0, 0.0, 7.5e-06, 0.0, 3e-05, 0.0, 0.0, 0.0, 0.0005449999999999999, 0.0, 0.00010750000000000001, 0.0, 0.0005200000000000001, 0.0, 1.5e-05, 0.0, 0.0, 0.0, 1.9999999999999998e-05, 0.0, 0.0, 0.0, 0.0, 0.0, 6.75e-05, 0.0, 2.5e-06, 0.0, 7.5e-06, 0.0, 0.0001525, 0.0, 2.5e-06, 0.0, 0.0, 0.0, 3.2500000000000004e-05, 0.0, 0.0]], 'WaveJets': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.00036500000000000004, 1e-05, 8.75e-05, 0.0, 2.5e-06, 0.0, 0.001395, 0.0, 1.75e-05, 0.0, 0.0, 0.0, 7.9327825e-05, 9.0036e-06, 0.0004926296750000001, 0.0, 5.1695675e-05, 0.0, 5.00215e-06, 0.0, 4.0018399999999996e-05, 0.0, 0.0, 0.0, 0.0005383847000000001, 2.3093975e-05, 0.00041029017499999995, 0.0, 3.8226e-05, 0.0, 9.811805e-05, 0.0, 2.0086974999999998e-05, 0.0, 0.0, 0.0, 0.0024625, 5e-06, 1.75e-05, 0.0, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 0.0, 0.0010918450000000001, 2.5185e-06, 6.2995825e-05, 0.0, 0.0, 0.0, 0.0016300000000000002, 2.5e-06, 3e-05, 0.0, 0.0, 7.518450000000001e-06, 0.0021273922750000003, 2.0055575e-05, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 0.0, 0.0005225000000000001, 2.5e-06, 9.5e-05, 0.0, 0.0, 0.0, 1.75e-05, 0.0, 7.5e-05, 0.0, 0.0, 0.0, 0.001115, 0.0, 0.00021, 0.0, 0.00141, 0.0, 5.75e-05, 0.0, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.0, 1.7500000000000002e-05, 0.0, 0.00015, 0.0, 5e-06, 0.0, 3.2500000000000004e-05, 1.5e-05, 0.00030250000000000003, 0.0, 1.25e-05, 0.0, 3e-05, 0.0, 6e-05, 0.0, 2.5e-06]], 'AvgHexagram': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.00038500000000000003, 1e-05, 8.75e-05, 0.0, 2.5e-06, 0.0, 0.0014125, 0.0, 1.75e-05, 0.0, 0.0, 0.0, 9.1080075e-05, 1.5006e-05, 0.000501752175, 0.0, 5.1695675e-05, 0.0, 5.00215e-06, 0.0, 4.7521899999999996e-05, 0.0, 0.0, 0.0, 0.0005588932, 2.8226e-05, 0.000417936175, 0.0, 4.077425e-05, 0.0, 0.0001031498, 0.0, 2.0086974999999998e-05, 0.0, 0.0, 0.0, 0.0025, 5e-06, 1.75e-05, 0.0, 0.0, 0.0, 0.00014, 0.0, 5e-06, 0.0, 0.0011320975, 2.5185e-06, 6.2995825e-05, 0.0, 0.0, 0.0, 0.00167, 5e-06, 3e-05, 0.0, 0.0, 7.518450000000001e-06, 0.002182519775, 2.2562525e-05, 7.518415e-05, 5.0123e-06, 7.518425000000001e-06, 0.0, 0.0005275, 2.5e-06, 9.750000000000001e-05, 0.0, 0.0, 0.0, 1.75e-05, 0.0, 7.75e-05, 0.0, 0.0, 0.0, 0.0011475, 0.0, 0.00023999999999999998, 0.0, 0.0014425, 0.0, 6e-05, 0.0, 0.0, 0.0, 3.5e-05, 0.0, 0.0, 0.0, 1.7500000000000002e-05, 0.0, 0.000155, 0.0, 5e-06, 0.0, 3.5000000000000004e-05, 1.7500000000000002e-05, 0.0003275, 0.0, 1.5e-05, 0.0, 3e-05, 0.0, 6.25e-05, 0.0, 2.5e-06]], 'PCA': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.00036500000000000004, 1e-05, 8.75e-05, 0.0, 2.5e-06, 0.0, 0.001395, 0.0, 1.75e-05, 0.0, 0.0, 0.0, 7.9327825e-05, 9.0036e-06, 0.0004926296750000001, 0.0, 5.1695675e-05, 0.0, 5.00215e-06, 0.0, 4.0018399999999996e-05, 0.0, 0.0, 0.0, 0.0005383847000000001, 2.3093975e-05, 0.00041029017499999995, 0.0, 3.8226e-05, 0.0, 9.811805e-05, 0.0, 2.0086974999999998e-05, 0.0, 0.0, 0.0, 0.0024625, 5e-06, 1.75e-05, 0.0, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 0.0, 0.0010918450000000001, 2.5185e-06, 6.2995825e-05, 0.0, 0.0, 0.0, 0.0016300000000000002, 2.5e-06, 3e-05, 0.0, 0.0, 7.518450000000001e-06, 0.0021273922750000003, 2.0055575e-05, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 0.0, 0.0005225000000000001, 2.5e-06, 9.5e-05, 0.0, 0.0, 0.0, 1.75e-05, 0.0, 7.5e-05, 0.0, 0.0, 0.0, 0.001115, 0.0, 0.00021, 0.0, 0.00141, 0.0, 5.75e-05, 0.0, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.0, 1.7500000000000002e-05, 0.0, 0.00015, 0.0, 5e-06, 0.0, 3.2500000000000004e-05, 1.5e-05, 0.00030250000000000003, 0.0, 1.25e-05, 0.0, 3e-05, 0.0, 6e-05, 0.0, 2.5e-06]], 'ASO': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.0030525, 0.00013, 0.0004075, 0.0, 7.5e-06, 0.0, 0.005235, 2e-05, 7.75e-05, 0.0, 0.0, 0.0, 0.000854975825, 0.00021308525, 0.0014687631749999998, 0.0, 0.000252396175, 0.0, 0.000420181075, 2.501025e-06, 0.0002125977, 0.0, 5.0023e-06, 0.0, 0.003422583, 0.00027712699999999995, 0.00149845475, 0.0, 0.000244645925, 0.0, 0.0008880942, 1.75717e-05, 0.00013307625000000002, 0.0, 0.0, 0.0, 0.0079125, 7.5e-05, 8e-05, 0.0, 0.0, 0.0, 0.0005600000000000001, 0.0, 1.75e-05, 0.0, 0.0047296477500000005, 1.7629575e-05, 0.00030741915, 0.0, 2.519825e-06, 0.0, 0.0061, 3e-05, 0.000135, 0.0, 0.0, 7.518450000000001e-06, 0.0070887985, 0.00019052780000000002, 0.00038594435, 7.518450000000001e-06, 1.2530725e-05, 0.0, 0.0028274999999999997, 4.75e-05, 0.000235, 0.0, 2.5e-06, 0.0, 0.000325, 0.0, 0.0002825, 0.0, 5e-06, 0.0, 0.0032825, 0.0, 0.0009075, 0.0, 0.0059775, 1.5e-05, 0.0002075, 0.0, 0.0, 0.0, 0.00013250000000000002, 0.0, 2.5e-06, 0.0, 0.00020250000000000002, 2.5e-06, 0.0006425000000000001, 0.0, 1.25e-05, 5e-06, 0.0002475, 8.25e-05, 0.0011949999999999999, 7.5e-06, 8.25e-05, 0.0, 0.00030250000000000003, 1e-05, 0.0002675, 0.0, 5e-06]], 'APSS': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.0030525, 0.00013, 0.0004075, 0.0, 7.5e-06, 0.0, 0.005235, 2e-05, 7.75e-05, 0.0, 0.0, 0.0, 0.000854975825, 0.00021308525, 0.0014687631749999998, 0.0, 0.000252396175, 0.0, 0.000420181075, 2.501025e-06, 0.0002125977, 0.0, 5.0023e-06, 0.0, 0.003422583, 0.00027712699999999995, 0.00149845475, 0.0, 0.000244645925, 0.0, 0.0008880942, 1.75717e-05, 0.00013307625000000002, 0.0, 0.0, 0.0, 0.0079125, 7.5e-05, 8e-05, 0.0, 0.0, 0.0, 0.0005600000000000001, 0.0, 1.75e-05, 0.0, 0.0047296477500000005, 1.7629575e-05, 0.00030741915, 0.0, 2.519825e-06, 0.0, 0.0061, 3e-05, 0.000135, 0.0, 0.0, 7.518450000000001e-06, 0.0070887985, 0.00019052780000000002, 0.00038594435, 7.518450000000001e-06, 1.2530725e-05, 0.0, 0.0028274999999999997, 4.75e-05, 0.000235, 0.0, 2.5e-06, 0.0, 0.000325, 0.0, 0.0002825, 0.0, 5e-06, 0.0, 0.0032825, 0.0, 0.0009075, 0.0, 0.0059775, 1.5e-05, 0.0002075, 0.0, 0.0, 0.0, 0.00013250000000000002, 0.0, 2.5e-06, 0.0, 0.00020250000000000002, 2.5e-06, 0.0006425000000000001, 0.0, 1.25e-05, 5e-06, 0.0002475, 8.25e-05, 0.0011949999999999999, 7.5e-06, 8.25e-05, 0.0, 0.00030250000000000003, 1e-05, 0.0002675, 0.0, 5e-06]], 'Sphere': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.0032325, 0.000155, 0.00042, 0.0, 1.25e-05, 0.0, 0.00524, 2e-05, 8.5e-05, 0.0, 2.5e-06, 0.0, 0.000843223875, 0.000210084, 0.001493090425, 0.0, 0.000261518925, 0.0, 0.000482708575, 2.501025e-06, 0.00022760465, 0.0, 7.50345e-06, 0.0, 0.00341745925, 0.0002950905, 0.0014933599, 0.0, 0.00025229107499999994, 0.0, 0.0009057050499999999, 2.0081925e-05, 0.000145630625, 0.0, 2.510875e-06, 0.0, 0.00801, 7.75e-05, 9e-05, 0.0, 2.5e-06, 0.0, 0.000575, 0.0, 3.7500000000000003e-05, 0.0, 0.004727132750000001, 1.7629575e-05, 0.000317498625, 0.0, 5.03965e-06, 0.0, 0.006095000000000001, 3e-05, 0.000145, 0.0, 7.500000000000001e-06, 7.518450000000001e-06, 0.007073778499999999, 0.00019052780000000002, 0.00040850049999999996, 7.518450000000001e-06, 1.7542975e-05, 0.0, 0.0028299999999999996, 4.75e-05, 0.0002425, 0.0, 7.5e-06, 0.0, 0.000325, 0.0, 0.000295, 0.0, 7.5e-06, 0.0, 0.00321, 2.5e-06, 0.000935, 0.0, 0.0059775, 1.5e-05, 0.00022250000000000001, 0.0, 2e-05, 0.0, 0.000145, 0.0, 7.5e-06, 0.0, 0.00020250000000000002, 2.5e-06, 0.0006600000000000001, 0.0, 2.25e-05, 5e-06, 0.0002425, 7.750000000000001e-05, 0.0012174999999999998, 7.5e-06, 9.250000000000001e-05, 0.0, 0.00030500000000000004, 1e-05, 0.00028, 0.0, 1e-05]], 'UnorientedSphere': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.0030525, 0.00013, 0.0004075, 0.0, 7.5e-06, 0.0, 0.005235, 2e-05, 7.75e-05, 0.0, 0.0, 0.0, 0.0008579158250000001, 0.00021308525, 0.001468762925, 0.0, 0.000252396175, 0.0, 0.000420181075, 2.501025e-06, 0.0002125977, 0.0, 5.0023e-06, 0.0, 0.003407193, 0.00027712699999999995, 0.0014882615, 0.0, 0.000259936075, 0.0, 0.0008855792, 1.75717e-05, 0.00013307625000000002, 0.0, 0.0, 0.0, 0.00791, 7.5e-05, 8e-05, 0.0, 0.0, 0.0, 0.0005600000000000001, 0.0, 1.75e-05, 0.0, 0.00472463275, 1.7629575e-05, 0.00030741915, 0.0, 2.519825e-06, 0.0, 0.0061, 3e-05, 0.0001375, 0.0, 0.0, 7.518450000000001e-06, 0.00709380925, 0.00019052780000000002, 0.00039346297500000003, 7.518450000000001e-06, 1.2530725e-05, 0.0, 0.0028299999999999996, 4.75e-05, 0.0002375, 0.0, 2.5e-06, 0.0, 0.000325, 0.0, 0.0002825, 0.0, 5e-06, 0.0, 0.003225, 0.0, 0.0009125, 0.0, 0.0059775, 1.5e-05, 0.0002075, 0.0, 0.0, 0.0, 0.00013250000000000002, 0.0, 2.5e-06, 0.0, 0.00020250000000000002, 2.5e-06, 0.00064, 0.0, 1.25e-05, 5e-06, 0.0002425, 7.750000000000001e-05, 0.00121, 7.5e-06, 8.25e-05, 0.0, 0.00030250000000000003, 1e-05, 0.0002675, 0.0, 5e-06]], 'Cov2D': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.00036500000000000004, 1e-05, 8.75e-05, 0.0, 2.5e-06, 0.0, 0.001395, 0.0, 1.75e-05, 0.0, 0.0, 0.0, 7.9327825e-05, 9.0036e-06, 0.0004926296750000001, 0.0, 5.1695675e-05, 0.0, 5.00215e-06, 0.0, 4.0018399999999996e-05, 0.0, 0.0, 0.0, 0.0005383847000000001, 2.3093975e-05, 0.00041029017499999995, 0.0, 3.8226e-05, 0.0, 9.811805e-05, 0.0, 2.0086974999999998e-05, 0.0, 0.0, 0.0, 0.0024625, 5e-06, 1.75e-05, 0.0, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 0.0, 0.0010918450000000001, 2.5185e-06, 6.2995825e-05, 0.0, 0.0, 0.0, 0.0016300000000000002, 2.5e-06, 3e-05, 0.0, 0.0, 7.518450000000001e-06, 0.0021273922750000003, 2.0055575e-05, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 0.0, 0.0005225000000000001, 2.5e-06, 9.5e-05, 0.0, 0.0, 0.0, 1.75e-05, 0.0, 7.5e-05, 0.0, 0.0, 0.0, 0.001115, 0.0, 0.00021, 0.0, 0.00141, 0.0, 5.75e-05, 0.0, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.0, 1.7500000000000002e-05, 0.0, 0.00015, 0.0, 5e-06, 0.0, 3.2500000000000004e-05, 1.5e-05, 0.00030250000000000003, 0.0, 1.25e-05, 0.0, 3e-05, 0.0, 6e-05, 0.0, 2.5e-06]], 'NormCov2D': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.00036500000000000004, 1e-05, 8.75e-05, 0.0, 2.5e-06, 0.0, 0.001395, 0.0, 1.75e-05, 0.0, 0.0, 0.0, 7.9327825e-05, 9.0036e-06, 0.0004926296750000001, 0.0, 5.1695675e-05, 0.0, 5.00215e-06, 0.0, 4.0018399999999996e-05, 0.0, 0.0, 0.0, 0.0005383847000000001, 2.3093975e-05, 0.00041029017499999995, 0.0, 3.8226e-05, 0.0, 9.811805e-05, 0.0, 2.0086974999999998e-05, 0.0, 0.0, 0.0, 0.0024625, 5e-06, 1.75e-05, 0.0, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 0.0, 0.0010918450000000001, 2.5185e-06, 6.2995825e-05, 0.0, 0.0, 0.0, 0.0016300000000000002, 2.5e-06, 3e-05, 0.0, 0.0, 7.518450000000001e-06, 0.0021273922750000003, 2.0055575e-05, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 0.0, 0.0005225000000000001, 2.5e-06, 9.5e-05, 0.0, 0.0, 0.0, 1.75e-05, 0.0, 7.5e-05, 0.0, 0.0, 0.0, 0.001115, 0.0, 0.00021, 0.0, 0.00141, 0.0, 5.75e-05, 0.0, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.0, 1.7500000000000002e-05, 0.0, 0.00015, 0.0, 5e-06, 0.0, 3.2500000000000004e-05, 1.5e-05, 0.00030250000000000003, 0.0, 1.25e-05, 0.0, 3e-05, 0.0, 6e-05, 0.0, 2.5e-06]], 'Mean': [['Boxy_smooth100k', 'Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'No noise_kNN_Timings (ms)': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [0.04263548947368421, 0.051883747368421045, 0.05561622631578947, 0.061091942105263156]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [0.03949498947368421, 0.04327383157894736, 0.045311242105263154, 0.04378047368421053]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [0.024354721052631575, 0.02584905263157895, 0.026905868421052633, 0.029259273684210527]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [0.0024161644210526317, 0.0023246705263157896, 0.002271247368421053, 0.0023129115789473687]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [0.05933060000000001, 0.09643519473684212, 0.14687394736842102, 0.32609652631578945]], 'AvgHexagram': [[75.0, 150.0, 300.0, 700.0], [0.0010759963157894734, 0.0010927295263157895, 0.0016621588421052633, 0.006782883368421052]], 'ShapeOperator': [[75.0, 150.0, 300.0, 700.0], [0.0012071858947368423, 0.0012306416315789473, 0.0013378848947368422, 0.0012426443684210526]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [0.001398576, 0.001437095105263158, 0.0013254033684210525, 0.0014798394736842105]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [0.003671252631578947, 0.0038656442105263157, 0.0033915821052631578, 0.0034394784210526317]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [0.00022409847368421053, 0.00023532889473684216, 0.0002259768947368421, 0.00024437305263157893]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [0.00871603157894737, 0.012001372631578947, 0.013481998421052632, 0.01151787947368421]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [0.0060595126315789475, 0.005518903684210525, 0.004802027368421052, 0.005848007894736842]], 'Cov2D': [[75.0, 150.0, 300.0, 700.0], [0.001031901947368421, 0.0006878736842105263, 0.0010390008421052631, 0.0009943423684210528]], 'NormCov2D': [[75.0, 150.0, 300.0, 700.0], [0.0008669738947368421, 0.000972230052631579, 0.0008377879999999999, 0.0009789298421052633]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [0.00013116323684210526, 0.00013782384210526315, 0.00013009354210526315, 0.00010480133684210528]]}, 'No noise_kNN_RMSAE Normal': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [15.178860750000002, 14.4754195625, 15.085833876470588, 16.97115141176471]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [9.828234894736843, 11.234015789473684, 12.90936452631579, 15.68201494736842]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [9.958203947368421, 11.304467894736842, 12.924274842105262, 15.658783684210526]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [9.422736631578948, 11.075482, 12.770025210526319, 15.968106736842104]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [10.131576, 11.707264894736841, 13.487344210526313, 16.446816842105264]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [9.467377736842105, 11.100422842105262, 12.793695315789472, 15.988014789473686]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [7.864171794736843, 9.417610142105262, 11.372734284210528, 15.315509944444443]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [9.7072196, 13.5892181875, 16.195136411764707, 18.902828666666668]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [15.590000226315789, 16.308726510526316, 17.626054415789476, 21.753036235294115]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [8.503877375, 12.1375383125, 14.098600823529413, 16.51219011111111]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [8.8727743125, 12.359678352941176, 14.393895611111112, 18.00869363157895]]}, 'No noise_kNN_Non-stable ratio': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [5.264452631578948e-06, 1.5802421052631582e-06, 5.276105263157896e-07, 0.0]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [5.276105263157896e-07, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [5.276105263157896e-07, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [5.276105263157896e-07, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [5.276105263157896e-07, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'AvgHexagram': [[75.0, 150.0, 300.0, 700.0], [0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[75.0, 150.0, 300.0, 700.0], [5.276105263157896e-07, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [5.276105263157896e-07, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [1.5802421052631582e-06, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [1.5802421052631582e-06, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [1.5802421052631582e-06, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [1.5802421052631582e-06, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'Cov2D': [[75.0, 150.0, 300.0, 700.0], [5.276105263157896e-07, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'NormCov2D': [[75.0, 150.0, 300.0, 700.0], [5.276105263157896e-07, 5.276105263157896e-07, 5.276105263157896e-07, 0.0]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [0.0, 0.0, 0.0, 0.0]]}, 'No noise_noise_type_Timings (ms)': {'3DQuadric': [['no'], [0.05280685131578948]], 'PC-MLS': [['no'], [0.042965134210526314]], '2-Monge': [['no'], [0.026592228947368422]], 'Varifolds': [['no'], [0.0023312484736842105]], 'WaveJets': [['no'], [0.15718406710526314]], 'AvgHexagram': [['no'], [0.0026534420131578947]], 'ShapeOperator': [['no'], [0.0012545891973684213]], 'PCA': [['no'], [0.0014102284868421054]], 'ASO': [['no'], [0.0035919893421052637]], 'APSS': [['no'], [0.00023244432894736848]], 'Sphere': [['no'], [0.011429320526315791]], 'UnorientedSphere': [['no'], [0.005557112894736841]], 'Cov2D': [['no'], [0.0009382797105263158]], 'NormCov2D': [['no'], [0.0009139804473684211]], 'Mean': [['no'], [0.00012597048947368423]]}, 'No noise_noise_type_RMSAE Normal': {'3DQuadric': [['no'], [15.446018710606063]], 'PC-MLS': [['no'], [12.413407539473685]], '2-Monge': [['no'], [12.461432592105263]], 'Varifolds': [['no'], [12.309087644736843]], 'WaveJets': [['no'], [12.943250486842103]], 'PCA': [['no'], [12.33737767105263]], 'ASO': [['no'], [10.934866496000001]], 'APSS': [['no'], [14.827333636363639]], 'Sphere': [['no'], [17.713141322972973]], 'UnorientedSphere': [['no'], [12.942661000000001]], 'Mean': [['no'], [13.6190603]]}, 'No noise_noise_type_Non-stable ratio': {'3DQuadric': [['no'], [1.843076315789474e-06]], 'PC-MLS': [['no'], [3.9570789473684214e-07]], '2-Monge': [['no'], [3.9570789473684214e-07]], 'Varifolds': [['no'], [3.9570789473684214e-07]], 'WaveJets': [['no'], [3.9570789473684214e-07]], 'AvgHexagram': [['no'], [0.0]], 'ShapeOperator': [['no'], [3.9570789473684214e-07]], 'PCA': [['no'], [3.9570789473684214e-07]], 'ASO': [['no'], [6.588657894736843e-07]], 'APSS': [['no'], [6.588657894736843e-07]], 'Sphere': [['no'], [6.588657894736843e-07]], 'UnorientedSphere': [['no'], [6.588657894736843e-07]], 'Cov2D': [['no'], [3.9570789473684214e-07]], 'NormCov2D': [['no'], [3.9570789473684214e-07]], 'Mean': [['no'], [0.0]]}, 'No noise_Shape_Timings (ms)': {'3DQuadric': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0481102, 0.054817325, 0.05050405, 0.052791825, 0.0547427, 0.0495183, 0.0524359, 0.051501675, 0.051155325, 0.050338274999999995, 0.0535552, 0.054933024999999996, 0.051497275, 0.063538175, 0.049889925, 0.052079075, 0.055755325, 0.05306065, 0.05310594999999999]], 'PC-MLS': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0419917, 0.044354599999999994, 0.04522215, 0.0426764, 0.040555025, 0.045673200000000004, 0.041555175, 0.044752375000000004, 0.045867375, 0.044065325, 0.040839824999999996, 0.0453578, 0.043844825000000004, 0.039352424999999996, 0.04445515, 0.043953074999999994, 0.041554650000000005, 0.038031224999999995, 0.04223525000000001]], '2-Monge': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.025784750000000002, 0.026575500000000002, 0.0271236, 0.027884525, 0.0266161, 0.02605345, 0.0236935, 0.027470050000000003, 0.025481625, 0.027742825, 0.028275375, 0.025478599999999997, 0.02407975, 0.026997875, 0.029309025000000002, 0.027559450000000003, 0.0247125, 0.029177025000000002, 0.025236824999999997]], 'Varifolds': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.001487931, 0.0026628375, 0.002603335, 0.002216815, 0.0020882175, 0.0027107075, 0.0021682624999999995, 0.00197172, 0.0024872725, 0.0020769, 0.002698495, 0.0025061849999999997, 0.00256632, 0.00235388, 0.0021538125, 0.00244993, 0.0024185375000000003, 0.0022791375, 0.0023934250000000002]], 'WaveJets': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.15621255, 0.133537775, 0.16322075, 0.158248775, 0.15749695, 0.140647925, 0.162034375, 0.14663695000000002, 0.1558349, 0.13251495000000002, 0.160789575, 0.162352575, 0.152328425, 0.16508235, 0.17931797500000002, 0.17063095, 0.1535969, 0.167933525, 0.1680791]], 'AvgHexagram': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.00070089625, 0.00110969175, 0.00111081125, 0.0008363660000000001, 0.0012883624999999999, 0.0009397915, 0.0010570472499999998, 0.001424355, 0.0013338875000000001, 0.00129005, 0.001222625, 0.0010047252499999998, 0.0011362497499999998, 0.029767112749999998, 0.0011075652500000001, 0.0010410744999999999, 0.00114135675, 0.001755805, 0.001147625]], 'ShapeOperator': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0007704610000000001, 0.0012105125000000001, 0.00110856925, 0.000990596, 0.001221705, 0.0012536732499999997, 0.0010056065, 0.001416465, 0.0012883570000000002, 0.0015318, 0.0012906865, 0.0012400422499999999, 0.0012283675, 0.0011001385, 0.0014516675, 0.001182097, 0.0014566725000000002, 0.001635795, 0.0014539824999999999]], 'PCA': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0011760720000000002, 0.0012960455, 0.0013697225, 0.00093332775, 0.0016169374999999999, 0.0015571425, 0.001374219, 0.001591939, 0.0013309975, 0.0014421825, 0.00127762425, 0.00124482175, 0.00143370075, 0.0014957775, 0.0017082234999999998, 0.0016360749999999999, 0.0015366725, 0.00114205025, 0.0016308100000000001]], 'ASO': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0033866825, 0.0037486450000000005, 0.0035497199999999997, 0.0033321825, 0.0035482400000000002, 0.0038232525000000002, 0.0040086575, 0.0030864250000000003, 0.003846445, 0.0034349925, 0.0036837075, 0.0033898825, 0.003668835, 0.0033763875000000004, 0.0035018075, 0.0040136675, 0.0033554699999999997, 0.0042795125, 0.0032132849999999998]], 'APSS': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0001828455, 0.000268446, 0.0001829185, 0.0001771215, 0.000269302, 0.0002511265, 0.00024255324999999998, 0.00024292625, 0.00022198075, 0.00026429175000000003, 0.00022089175, 0.0002017165, 0.0003185585, 0.00025057175, 0.00024238925, 0.0003036205, 0.0002280885, 0.00018290625000000002, 0.00016418725]], 'Sphere': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0100782675, 0.011562064999999998, 0.011520760000000001, 0.0101919525, 0.014600925, 0.01310585, 0.011026415, 0.012766075, 0.01286431, 0.0101855825, 0.008871872500000001, 0.008787, 0.0093979275, 0.010796135, 0.0122025175, 0.0132729025, 0.012795150000000002, 0.0122079525, 0.01092343]], 'UnorientedSphere': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0041192325, 0.006696875, 0.007556225, 0.0038715500000000005, 0.0056474049999999994, 0.005841597499999999, 0.005059145, 0.0051678675, 0.006551875, 0.0047786074999999996, 0.005915869999999999, 0.00464479, 0.0047749925, 0.0023243350000000003, 0.0066052525, 0.005973075, 0.00727915, 0.0062347875, 0.006542512499999999]], 'Cov2D': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.00063903225, 0.00118301725, 0.0009225335, 0.0008929727499999999, 0.00073173875, 0.00085331, 0.0009842709999999999, 0.00072338, 0.0010083975, 0.0010649855, 0.00120674725, 0.00096441425, 0.0008401264999999999, 0.0008742975, 0.000975679, 0.00072652475, 0.001067833, 0.00108637525, 0.0010816785000000002]], 'NormCov2D': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0005583049999999999, 0.0009057525, 0.0008661187500000001, 0.00062365725, 0.00098588125, 0.00091856225, 0.000909644, 0.0007843482499999999, 0.0008994535, 0.00088817375, 0.001082774, 0.0010730834999999998, 0.0010685725, 0.00072901825, 0.0007275692499999999, 0.0008768644999999999, 0.0009105947500000001, 0.0012933375, 0.00126391775]], 'Mean': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.00013967332500000002, 0.00010876487499999999, 0.00010062407499999999, 0.00011641615000000002, 0.00019102815, 0.00014243775000000002, 0.00010116180000000002, 0.00023351855000000002, 0.00011489272500000001, 9.6314825e-05, 9.69427e-05, 0.00016501642500000002, 7.6388e-05, 0.0001113838, 0.00011775722500000001, 0.000127274, 0.00013991134999999998, 0.0001186748, 9.5258775e-05]]}, 'No noise_Shape_RMSAE Normal': {'3DQuadric': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [-1, 10.1346725, 32.456025, -1, 38.571275, 39.9531, 28.314550000000004, 1.0324697500000002, 22.8661, 5.48818, 23.551975, 7.816839999999999, 6.966715, 6.530009999999999, 1.8174074999999998, 0.29701397500000004, 11.67285, 18.0763, 8.351975000000001]], 'PC-MLS': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [7.340629999999999, 7.37772, 29.639049999999997, 14.942675000000001, 34.19345, 32.7655, 7.255610000000001, 0.24264925, 17.780025000000002, 6.310600000000001, 18.49915, 7.0161575, 6.8992775, 9.302495, 0.823922, 0.133042, 11.180869999999999, 18.162625, 5.989295]], '2-Monge': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [7.412492500000001, 7.5296400000000006, 29.653975000000003, 14.887649999999999, 33.7457, 32.901225, 7.2907425, 0.3860235, 17.78775, 6.3054825, 18.539275000000004, 7.04359, 6.9140725, 9.4540275, 0.8548990000000001, 0.26653425000000003, 11.3853075, 18.23765, 6.1711825]], 'Varifolds': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [7.30606, 6.969, 29.552525000000003, 15.750575, 33.259225, 32.459375, 7.799545, 0.2343325, 17.84515, 6.318925, 18.440549999999998, 7.6263000000000005, 7.2266375, 7.7761675, 0.8237685000000001, 0.13242674999999998, 10.695795, 18.0605, 5.5958075]], 'WaveJets': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [7.884155, 7.35653, 30.010624999999997, 16.0238, 33.240025, 32.918775, 8.41059, 0.299656, 18.525275, 6.5076225, 19.128325, 8.3078125, 8.16631, 9.227432499999999, 0.83486625, 0.1899645, 11.7882025, 20.732924999999998, 6.3688675]], 'PCA': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [7.3107625, 6.996947499999999, 29.5975, 15.764325, 33.41525, 32.46195, 7.80771, 0.2350295, 17.856825, 6.3201225, 18.463549999999998, 7.63328, 7.2368325, 7.824372499999999, 0.823893, 0.13327825, 10.76788, 18.125325, 5.6353425]], 'ASO': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [4.70801, 4.83687, 25.45145, 14.035125, 29.38955, 33.34225, 6.812645, 0.074455725, 15.24145, 5.44777, 15.693850000000001, 6.9650975, 7.10573, 3.1064249999999998, 0.8140425, 0.02809476666666667, 9.318085, 17.976575, 4.688295]], 'APSS': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [7.70268, 9.0060875, 29.3014, 16.95495, 37.877449999999996, 36.95686666666666, 8.235759999999999, 0.350011, 18.860999999999997, 7.82212, 19.206225, 8.177265, 8.57909, 10.66239, 0.80369975, -1, 11.12894, 20.7441, 5.6937549999999995]], 'Sphere': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [36.592925, 9.35553, 29.618499999999997, 41.037425, 35.391574999999996, 38.534225, 23.74395, 0.17905025000000002, 18.378300000000003, 5.686086666666667, 18.792275, 8.104765, 8.8924475, 14.012519999999999, 0.8139400000000001, 0.02809563333333333, 11.97261, 21.982499999999998, 6.0049399999999995]], 'UnorientedSphere': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [6.804125000000001, 7.1408450000000006, 27.891150000000003, 14.016974999999999, 31.511924999999998, 33.417233333333336, 6.3140175, 0.233823, 17.817149999999998, 7.607645, 18.658025000000002, 6.4499450000000005, 7.093775, 7.981835, 0.80369525, -1, 11.1781975, 18.7553, 5.3889525]], 'Mean': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [8.114855, 8.436025, 29.651525, 17.707925000000003, 40.08525, 37.085033333333335, 8.6470375, 0.30152749999999995, 19.348025, 7.933764999999999, 25.349, 8.5296825, 8.93435, 8.30724, 0.826683, 0.19424225, 12.363975, 22.4703, 6.297005]]}, 'No noise_Shape_Non-stable ratio': {'3DQuadric': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2.75e-05, 0.0]], 'PC-MLS': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], '2-Monge': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Varifolds': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'WaveJets': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'AvgHexagram': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'PCA': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ASO': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5e-06, 0.0]], 'APSS': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5e-06, 0.0]], 'Sphere': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5e-06, 0.0]], 'UnorientedSphere': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 5e-06, 0.0]], 'Cov2D': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'NormCov2D': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 7.518450000000001e-06, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'Mean': [['Boxy_smooth100k', 'Cup34100k', 'Liberty100k', 'boxunion2100k', 'column100k', 'column_head100k', 'cylinder100k', 'cylinder_analytic100k', 'galera100k', 'icosahedron100k', 'netsuke100k', 'pipe100k', 'pipe_curve100k', 'sheet_analytic100k', 'sphere100k', 'sphere_analytic100k', 'star_halfsmooth100k', 'star_sharp100k', 'star_smooth100k'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'Density_kNN_Timings (ms)': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [0.0381561, 0.04598150625, 0.052570812499999994, 0.06029841875]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [0.036345753125000005, 0.042843753124999995, 0.044050378125, 0.04356073125]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [0.022732262500000003, 0.025611871874999997, 0.027154040625, 0.02555676875]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [0.0021200736249999998, 0.00220138, 0.0021416625, 0.0018597818750000002]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [0.056614125, 0.0827984875, 0.134841575, 0.25066534375]], 'AvgHexagram': [[75.0, 150.0, 300.0, 700.0], [0.001078217125, 0.00115364009375, 0.0010564545624999998, 0.001176021375]], 'ShapeOperator': [[75.0, 150.0, 300.0, 700.0], [0.001193621, 0.00134912928125, 0.0013902501875, 0.00121378771875]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [0.0015093998124999998, 0.0013977109062499999, 0.00142612225, 0.0014191798125]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [0.0034412596875, 0.00342111625, 0.0032077631249999997, 0.0023308421875]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [0.00027138753125000004, 0.00027241953125000003, 0.000248286875, 0.00026557656250000004]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [0.0104393271875, 0.011003170625, 0.010694931562500001, 0.0121627634375]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [0.0044556134375, 0.005080055, 0.0051326728125, 0.005745890625]], 'Cov2D': [[75.0, 150.0, 300.0, 700.0], [0.0009793352499999999, 0.0008027560312499999, 0.000861722625, 0.0009180589999999999]], 'NormCov2D': [[75.0, 150.0, 300.0, 700.0], [0.0008795262499999999, 0.00082324821875, 0.0009252470312500001, 0.0009575604375000001]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [0.000137463403125, 0.00012442904687499999, 0.00010744833125000001, 0.000103392028125]]}, 'Density_kNN_RMSAE Normal': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [18.1191364, 17.6426384, 18.154620714285716, 19.687134285714283]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [11.241420968749999, 12.57226309375, 14.491504375000002, 18.328706451612906]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [11.4719636875, 12.761015812499998, 14.646179375000001, 18.16143871875]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [10.940709774193548, 12.18065015625, 14.222156806451615, 17.67578064516129]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [11.28815921875, 12.76792821875, 15.072611032258063, 18.546894548387094]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [10.6357295625, 12.124678531250002, 13.9592904375, 17.3853663125]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [10.06709696875, 11.034256875, 12.8064075625, 15.943157]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [10.509819869565218, 11.966473888888888, 15.423006806451612, 18.773315967741933]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [18.386861562500002, 18.67233525, 19.4508588125, 21.200078625]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [10.019306869565218, 10.928103296296296, 13.604651161290324, 16.710651193548387]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [10.080059083333333, 13.473646549999998, 16.822792777777774, 19.543583516129033]]}, 'Density_kNN_Non-stable ratio': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [0.0091466418375, 0.0029936369281249996, 0.0009463273624999999, 0.0001802404625]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [0.00109302171875, 0.00031401775312499996, 7.417679375e-05, 7.813940625e-06]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [0.00109302171875, 0.00031401775312499996, 7.417679375e-05, 7.813940625e-06]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [0.0004001243093750001, 9.921673749999999e-05, 2.0344915625e-05, 3.125e-07]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [0.00109302171875, 0.00031401775312499996, 7.417679375e-05, 7.813940625e-06]], 'AvgHexagram': [[75.0, 150.0, 300.0, 700.0], [0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[75.0, 150.0, 300.0, 700.0], [0.0011275517656249999, 0.000317151940625, 7.480179375e-05, 7.813940625e-06]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [0.00109302171875, 0.00031401775312499996, 7.417679375e-05, 7.813940625e-06]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [0.004452152506249999, 0.001421954340625, 0.000396797709375, 6.881078125e-05]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [0.004452152506249999, 0.001421954340625, 0.000396797709375, 6.881078125e-05]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [0.004486554253125, 0.001428516340625, 0.000399983978125, 7.006078125e-05]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [0.00445061813125, 0.0014203680906249999, 0.000396483959375, 6.9124e-05]], 'Cov2D': [[75.0, 150.0, 300.0, 700.0], [0.00109302171875, 0.00031401775312499996, 7.417679375e-05, 7.813940625e-06]], 'NormCov2D': [[75.0, 150.0, 300.0, 700.0], [0.00109302171875, 0.00031401775312499996, 7.417679375e-05, 7.813940625e-06]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [0.0, 0.0, 0.0, 0.0]]}, 'Density_noise_type_Timings (ms)': {'3DQuadric': [['gradient', 'striped'], [0.045612946875, 0.052890471875]], 'PC-MLS': [['gradient', 'striped'], [0.040952137500000006, 0.0424481703125]], '2-Monge': [['gradient', 'striped'], [0.024873284375, 0.0256541875]], 'Varifolds': [['gradient', 'striped'], [0.002070235, 0.002091214]], 'WaveJets': [['gradient', 'striped'], [0.1311371796875, 0.1313225859375]], 'AvgHexagram': [['gradient', 'striped'], [0.0010940555781250002, 0.001138111]], 'ShapeOperator': [['gradient', 'striped'], [0.0012328927031250003, 0.0013405013906249998]], 'PCA': [['gradient', 'striped'], [0.00144093675, 0.001435269640625]], 'ASO': [['gradient', 'striped'], [0.0031478303124999997, 0.0030526603125]], 'APSS': [['gradient', 'striped'], [0.00026623118750000003, 0.0002626040625]], 'Sphere': [['gradient', 'striped'], [0.0109303915625, 0.011219704843750001]], 'UnorientedSphere': [['gradient', 'striped'], [0.0053454796875, 0.00486163625]], 'Cov2D': [['gradient', 'striped'], [0.0008715254687499999, 0.000909410984375]], 'NormCov2D': [['gradient', 'striped'], [0.00089838521875, 0.0008944057500000001]], 'Mean': [['gradient', 'striped'], [0.00010990086875000001, 0.0001264655359375]]}, 'Density_noise_type_RMSAE Normal': {'3DQuadric': [['gradient', 'striped'], [18.163681346153847, 18.687075555555555]], 'PC-MLS': [['gradient', 'striped'], [12.976664546875, 15.292847603174604]], '2-Monge': [['gradient', 'striped'], [13.069973578125, 15.45032521875]], 'Varifolds': [['gradient', 'striped'], [13.189396774193549, 14.286289984126984]], 'WaveJets': [['gradient', 'striped'], [13.516697793650794, 15.245198571428569]], 'PCA': [['gradient', 'striped'], [12.838441953125, 14.21409046875]], 'ASO': [['gradient', 'striped'], [12.570689999999999, 12.354769203125]], 'APSS': [['gradient', 'striped'], [14.384653333333333, 14.623023758620691]], 'Sphere': [['gradient', 'striped'], [19.302304999999997, 19.552762125]], 'UnorientedSphere': [['gradient', 'striped'], [12.947611296296296, 13.20872775862069]], 'Mean': [['gradient', 'striped'], [17.513779970588235, 15.268421696428573]]}, 'Density_noise_type_Non-stable ratio': {'3DQuadric': [['gradient', 'striped'], [0.006337976559375, 0.0002954467359375]], 'PC-MLS': [['gradient', 'striped'], [0.0007389106250000001, 5.6044781250000005e-06]], '2-Monge': [['gradient', 'striped'], [0.0007389106250000001, 5.6044781250000005e-06]], 'Varifolds': [['gradient', 'striped'], [0.00025936185625, 6.37375e-07]], 'WaveJets': [['gradient', 'striped'], [0.0007389106250000001, 5.6044781250000005e-06]], 'AvgHexagram': [['gradient', 'striped'], [0.0, 0.0]], 'ShapeOperator': [['gradient', 'striped'], [0.00075689015625, 6.769564062500001e-06]], 'PCA': [['gradient', 'striped'], [0.0007389106250000001, 5.6044781250000005e-06]], 'ASO': [['gradient', 'striped'], [0.003099173771875, 7.0683896875e-05]], 'APSS': [['gradient', 'striped'], [0.003099173771875, 7.0683896875e-05]], 'Sphere': [['gradient', 'striped'], [0.0031193755000000004, 7.31821765625e-05]], 'UnorientedSphere': [['gradient', 'striped'], [0.0030979256937500002, 7.0371396875e-05]], 'Cov2D': [['gradient', 'striped'], [0.0007389106250000001, 5.6044781250000005e-06]], 'NormCov2D': [['gradient', 'striped'], [0.0007389106250000001, 5.6044781250000005e-06]], 'Mean': [['gradient', 'striped'], [0.0, 0.0]]}, 'Density_Shape_Timings (ms)': {'3DQuadric': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.041911125, 0.0487842, 0.041753399999999996, 0.05693912499999999, 0.0485541, 0.04658215, 0.048912975, 0.0568307, 0.044041874999999994, 0.0522989, 0.044529225000000006, 0.05010275, 0.03814265, 0.05579797500000001, 0.04590325, 0.0586343, 0.040686749999999994, 0.052574675, 0.042246874999999996, 0.049016674999999996, 0.04537475, 0.054978874999999996, 0.053317725, 0.056087, 0.0410309, 0.04472735, 0.054167574999999996, 0.0528116, 0.052026325, 0.056424625, 0.04720765, 0.05365665]], 'PC-MLS': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0390732, 0.040687600000000004, 0.03973165, 0.048066775000000006, 0.04122515, 0.04499565, 0.040569299999999996, 0.042323975, 0.039702799999999996, 0.037982175, 0.04445684999999999, 0.039383925, 0.0414728, 0.037069500000000005, 0.0421491, 0.04554065, 0.03801845, 0.042927049999999994, 0.03902905, 0.04675142499999999, 0.04277285, 0.039240175, 0.041394925, 0.0422109, 0.040986175, 0.042838224999999994, 0.0404814, 0.040017775, 0.041084125, 0.04072305, 0.043086374999999996, 0.04841187499999999]], '2-Monge': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.024782025, 0.027530775, 0.0247684, 0.026529224999999997, 0.018877975, 0.0253581, 0.026174375, 0.026589750000000002, 0.02655035, 0.02501935, 0.029584125000000003, 0.02677995, 0.023801199999999998, 0.0285481, 0.027354424999999998, 0.021655525000000002, 0.024257374999999998, 0.02703525, 0.023115974999999997, 0.024041775, 0.025366525, 0.026150424999999998, 0.02554805, 0.024792175, 0.0231532, 0.023096500000000002, 0.025770025000000002, 0.0234744, 0.02427695, 0.027871275, 0.024591574999999997, 0.025994424999999998]], 'Varifolds': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0018983525, 0.0012711415, 0.00229674, 0.00212714, 0.0020438275, 0.00211176, 0.0014841049999999999, 0.00220578, 0.0018003025, 0.0019312700000000001, 0.0019621225, 0.0016584, 0.0018915775, 0.001738875, 0.001968185, 0.0026299275, 0.0025602299999999997, 0.0020423925000000002, 0.0017388400000000002, 0.0020379675, 0.0023537325, 0.0025662224999999997, 0.00219531, 0.0021553650000000002, 0.0016654150000000002, 0.00194426, 0.0026992175, 0.0021822, 0.0022513100000000003, 0.0024266925, 0.0023144925, 0.00243003]], 'WaveJets': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.125358175, 0.11027490000000001, 0.127357575, 0.126476275, 0.13722964999999998, 0.1373715, 0.1301366, 0.145237775, 0.13383287500000002, 0.13631417499999998, 0.112805275, 0.11355432500000001, 0.11251180000000001, 0.13861225, 0.14050095, 0.12445385, 0.15319482499999998, 0.129962525, 0.139309525, 0.13493614999999998, 0.1221846, 0.11584734999999999, 0.1203106, 0.1406123, 0.123510175, 0.140908975, 0.12983072499999998, 0.12471035, 0.138859825, 0.1338463, 0.1512617, 0.148042375]], 'AvgHexagram': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.000763759, 0.000811777, 0.0012596649999999999, 0.001257101, 0.0012251072499999999, 0.001103391, 0.00080134775, 0.0010794985, 0.00107210675, 0.001149761, 0.0013223365, 0.0012176094999999999, 0.0008237112500000001, 0.00096129, 0.00095429425, 0.0013163150000000002, 0.00113741225, 0.0013204649999999998, 0.0011766135000000001, 0.0015332800000000001, 0.00111190325, 0.0009309687499999999, 0.0013746074999999999, 0.001228928, 0.0010653552500000001, 0.00116889175, 0.00109515825, 0.0009644582500000002, 0.000871394, 0.0011595232499999998, 0.0014501175, 0.001006518]], 'ShapeOperator': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0009356065, 0.0008687012499999999, 0.0013347324999999999, 0.00153126, 0.00106272875, 0.0013869945, 0.00122769, 0.0013016590000000001, 0.0010592095000000001, 0.0015819527500000002, 0.00122654225, 0.00133154575, 0.00128105, 0.00127320575, 0.0018160125, 0.0014174182499999998, 0.0014415267499999999, 0.0012691949999999999, 0.0013166575, 0.0011657590000000002, 0.001227232, 0.00147741875, 0.0009580400000000001, 0.0012712875, 0.0011411975, 0.00139832625, 0.00124953675, 0.0015444974999999999, 0.0013145725000000001, 0.00140605475, 0.00113394825, 0.0012227462500000001]], 'PCA': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00106651425, 0.001168669, 0.0015217157500000003, 0.001308445, 0.00143133975, 0.001446395, 0.00160846, 0.0013055655, 0.0016266149999999999, 0.0011670292499999999, 0.0015277275000000002, 0.0013598949999999999, 0.00103692325, 0.00132689125, 0.001354485, 0.0013979675000000001, 0.00143537675, 0.00099672175, 0.001244335, 0.001290125, 0.00121953275, 0.0017864325, 0.0018726250000000002, 0.00146037, 0.0014446100000000003, 0.001760585, 0.00156507, 0.001780285, 0.0012042005, 0.00142371, 0.0018954574999999999, 0.0019852274999999997]], 'ASO': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0032364875000000003, 0.0034054775000000002, 0.0037491800000000004, 0.0028216574999999997, 0.00244005, 0.0033024425000000002, 0.0031558925, 0.00243289, 0.00299871, 0.00313626, 0.0034233500000000004, 0.0032149675, 0.0034651925, 0.0025411625, 0.0035600025, 0.0031382625, 0.0031358700000000002, 0.0028283024999999997, 0.002769005, 0.002341855, 0.0028147175, 0.00398492, 0.002703055, 0.003573245, 0.00311691, 0.00264899, 0.00339552, 0.003049005, 0.0033036225, 0.0031017974999999996, 0.00309772, 0.0033213300000000004]], 'APSS': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00021531350000000002, 0.00027503175, 0.000254303, 0.00021139749999999998, 0.00038184125000000004, 0.00024882425, 0.00023672975, 0.00021812149999999997, 0.00020979650000000003, 0.00024749875, 0.000187415, 0.00029506724999999996, 0.00033793375, 0.00016515749999999999, 0.00024138749999999998, 0.00023587675, 0.00024444525, 0.00029296424999999997, 0.0002501795, 0.00028277225, 0.00024935125, 0.00020948849999999998, 0.0003570675, 0.00041052025, 0.0002145155, 0.0002203655, 0.000246151, 0.00020174349999999998, 0.00038444999999999994, 0.0002487875, 0.00024881875000000003, 0.00043804799999999996]], 'Sphere': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0091893175, 0.00974075, 0.0131702975, 0.008409795, 0.0091335975, 0.0114012475, 0.00894681, 0.01107308, 0.010434607500000002, 0.012430695, 0.008917605, 0.014173502499999999, 0.01315352, 0.01108109, 0.010079052500000001, 0.0093307175, 0.007330312499999999, 0.0085183425, 0.011742342499999999, 0.009108600000000001, 0.0115406875, 0.0100583175, 0.0124542825, 0.01154595, 0.014556824999999999, 0.0127579125, 0.011032077500000001, 0.014806525000000001, 0.009827905, 0.013058285, 0.013377024999999999, 0.0120204675]], 'UnorientedSphere': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.002912095, 0.0042520125, 0.006520140000000001, 0.004643545, 0.0055881725, 0.00528051, 0.0041671925, 0.003100315, 0.0054712075, 0.005385559999999999, 0.00631792, 0.0056474, 0.0033638375, 0.00277578, 0.0070592825, 0.005682275, 0.005001505, 0.0031301849999999997, 0.0061573224999999995, 0.0059560475000000005, 0.0041976775, 0.004964194999999999, 0.0053458725, 0.0066607075, 0.0059419425, 0.0046846875, 0.00550801, 0.0050769775000000005, 0.0054932775, 0.0063905724999999995, 0.00648222, 0.00415541]], 'Cov2D': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0007304402499999999, 0.0006501510000000001, 0.000724168, 0.001156924, 0.000895112, 0.0010244439999999998, 0.000615403, 0.0007006715, 0.00101596725, 0.00092865225, 0.0007714822500000001, 0.000793194, 0.0007646294999999999, 0.0008704672500000001, 0.0009138182499999999, 0.00099133875, 0.00090196275, 0.00121041975, 0.000869579, 0.0009708305, 0.00092174925, 0.0008438917500000001, 0.0011864840000000002, 0.000940121, 0.0008164235000000001, 0.00092281375, 0.000971398, 0.0008306555, 0.000959508, 0.0007792677500000001, 0.0008862824999999999, 0.000936733]], 'NormCov2D': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00061090675, 0.0006170545, 0.0007883335, 0.0007936977499999999, 0.0011729, 0.0009733149999999999, 0.00115649025, 0.00073439275, 0.000702459, 0.00071246875, 0.0008817515, 0.00113889575, 0.000829439, 0.0008804654999999999, 0.0007615790000000001, 0.00094481375, 0.0007950644999999999, 0.00101740975, 0.0012562724999999999, 0.00088557325, 0.0011159562499999998, 0.000829067, 0.000773136, 0.0008778624999999999, 0.000856189, 0.0009745235, 0.0008153514999999999, 0.000993077, 0.00097154925, 0.00092905375, 0.0008867855, 0.0010088215]], 'Mean': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [8.09999e-05, 0.00010195972500000001, 0.00012003322499999999, 0.00013114775, 7.7354975e-05, 0.000135398225, 0.0001478895, 0.00011589022500000003, 0.000136153375, 0.0001480235, 6.410827499999999e-05, 9.098479999999998e-05, 8.7998775e-05, 0.000150835275, 0.0001642356, 0.00011676815, 0.00012273095, 0.00017131520000000002, 0.00011081120000000001, 0.00015026107499999997, 8.82013e-05, 0.0001037296, 0.00011805715000000002, 0.000124798375, 7.8482025e-05, 0.00011577105, 0.000140987, 9.4905325e-05, 0.000134592125, 7.6248875e-05, 8.5778525e-05, 0.000195411425]]}, 'Density_Shape_RMSAE Normal': {'3DQuadric': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [-1, -1, 13.13625, 10.58421, 26.784175, 29.718125, -1, -1, 36.6613, 37.483425, 39.894999999999996, 39.168400000000005, 34.082525, 35.0823, 20.5246, 21.911175, 7.3197475, 4.9035075, 20.391425, 22.8232, 13.2890875, 11.01122, 8.4456075, 7.5040025, 6.341960000000001, 2.916625, 11.56255, 11.685025, 16.6874, 16.90025, 9.29743, 9.03418]], 'PC-MLS': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [6.17256, 8.7550725, 6.34979, 10.7391125, 24.223475, 28.442475, 14.56955, 16.947400000000002, 26.440824999999997, 32.4636, 32.283625, 31.625975, 7.7533875000000005, 9.0750675, 14.636775, 18.8082, 6.212045, 5.50854, 14.618925, 18.635775000000002, 8.0258675, 10.680467499999999, 8.960650000000001, 9.797765, 2.1506102499999997, 0.88022725, 11.0471575, 12.733, 18.40455, 19.6018, 5.77684, 7.5450075000000005]], '2-Monge': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [6.309525, 9.2326275, 6.5634675, 11.239465000000001, 24.31295, 28.728324999999998, 14.564024999999999, 17.04035, 26.422475, 32.458025, 32.461425000000006, 31.901575, 7.7979175000000005, 9.1248425, 14.821025, 19.286425, 6.267774999999999, 6.3610375, 14.860824999999998, 19.34205, 8.0767325, 10.81486, 8.8761875, 9.996569999999998, 2.19477975, 1.094111, 11.212394999999999, 13.023925, 18.396875, 19.761574999999997, 5.9811974999999995, 7.79944]], 'Varifolds': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [6.1669374999999995, 7.04513, 6.3076675, 9.503845, 23.971799999999998, 27.231325000000002, 14.884549999999999, 16.0663, 25.482825, 31.084, 31.786075000000004, 30.8649, 8.414095, 8.4320625, 14.594475, 17.433275000000002, 6.550545, 5.28444, 14.456, 17.67415, 8.4901325, 9.012880000000001, 9.002045, 9.592780000000001, 2.8590725000000003, 0.87829475, 10.674624999999999, 11.3462225, 18.642375, 19.08395, 5.4277025, 5.7966225]], 'WaveJets': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [6.2673175, 8.3964575, 6.4285375, 10.31193, 24.51665, 28.05555, 15.50995, 17.336850000000002, 25.707325, 31.774475, 32.437850000000005, 31.728025, 8.285887500000001, 9.28077, 14.978024999999999, 18.58365, 6.378483333333334, 5.717276666666667, 14.861775, 18.711725, 8.7367625, 10.1068475, 9.969205, 9.896215000000002, 2.1697177500000002, 0.916555, 11.591362499999999, 12.44947, 20.750525, 21.22995, 5.8932375, 7.045450000000001]], 'PCA': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [5.8071, 7.0469075, 6.12537, 9.5267725, 23.99255, 27.260350000000003, 14.89335, 16.086, 25.555675, 31.223750000000003, 31.76715, 30.868875, 7.9782150000000005, 8.43985, 14.427575000000001, 17.455199999999998, 6.1475124999999995, 5.92945, 14.3077, 17.712525, 8.3986975, 9.01689, 9.0028575, 9.604345, 2.1376512500000002, 0.8801675, 10.719585, 11.389315, 18.718825000000002, 19.16165, 5.4352575, 5.8233999999999995]], 'ASO': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [5.814665, 4.894045, 5.798534999999999, 5.503752499999999, 20.467125000000003, 22.950375, 13.898674999999999, 14.275725, 21.997374999999998, 27.418375000000005, 32.777775, 31.3205, 9.1421175, 7.64084, 13.392125, 14.669487499999999, 7.0260625, 5.2010725, 12.977049999999998, 15.02937, 8.5802325, 7.857482500000001, 10.22692, 7.2970825, 4.11796, 0.82936225, 10.347480000000001, 9.701815, 19.597275, 18.417675, 4.9696675, 4.669347500000001]], 'APSS': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [7.401530000000001, 7.0488775, 6.58288, 8.810285, 23.522925, 26.237474999999996, 16.197925, 16.69945, 28.2205, 34.038050000000005, 38.1887, 36.0494, 9.58239, 9.518306666666666, 15.573775, 17.5945, -1, 7.37076, 15.328025, 17.93835, 9.752146666666667, 9.708516666666666, 11.4125425, 8.5847475, 4.119365, 0.8259645, 11.617412499999999, 11.40201, 23.22986666666667, 21.012325, 5.593885, 5.7116125]], 'Sphere': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [40.27485, 38.662925, 6.83567, 9.6097775, 23.936275, 26.933124999999997, 41.0593, 42.577200000000005, 30.027099999999997, 33.61135, 37.0735, 36.310225, 26.359175, 24.556525, 15.198699999999999, 17.34775, 7.379085, 5.895614999999999, 14.792575, 17.6267, 11.392425000000001, 10.206485, 10.1327225, 9.0497075, 4.120380000000001, 0.8373814999999999, 11.966704999999997, 11.7094725, 22.580875, 22.134275000000002, 5.707542500000001, 5.7756799999999995]], 'UnorientedSphere': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [6.90108, 6.5172725, 6.29245, 7.017615, 22.398224999999996, 24.959175000000002, 13.203400000000002, 14.0729, 24.6238, 28.996000000000002, 34.4363, 33.13165, 7.492850000000001, 7.6471599999999995, 14.93035, 16.97505, -1, 7.227275, 15.181449999999998, 17.584125, 7.574156666666666, 8.721763333333334, 8.898729999999999, 7.014819999999999, 4.1193625, 0.82596, 11.03365, 11.1325675, 20.164166666666667, 18.349225, 5.4419375, 5.6256875]], 'Mean': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [8.340485000000001, 7.673287500000001, 6.3506800000000005, 9.00961, 25.8543, 26.874125, 18.3528, 17.79855, 33.48523333333333, 36.05435, 38.4417, 36.3929, -1, 10.162716666666668, 20.1243, 18.51995, 7.75233, 7.7477800000000006, 20.4074, 18.6231, 10.932065, 10.38614, 13.212233333333332, 9.014755, 0.859539, 0.98839375, 12.6860875, 12.399469999999999, 25.152966666666668, 26.21125, 6.426046666666667, 6.2147049999999995]]}, 'Density_Shape_Non-stable ratio': {'3DQuadric': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.007712500000000001, 0.0005625, 0.010505, 0.0001575, 0.0029556865, 0.0008073235, 0.00193083125, 2.00082e-05, 0.0075886437, 0.000939154, 0.0025636509999999997, 7.2797e-05, 0.013694999999999999, 0.0003675, 0.00938887, 0.000123407, 0.0111225, 0.0002175, 0.0119324425, 0.0007069580750000001, 0.00663, 0.000255, 0.001765, 2.25e-05, 0.01115, 0.0002775, 0.0006625, 1.75e-05, 0.000715, 0.0001575, 0.00109, 2.25e-05]], 'PC-MLS': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00036500000000000004, 1e-05, 0.001395, 0.0, 7.9327825e-05, 9.0036e-06, 5.00215e-06, 0.0, 0.0005383847000000001, 2.3093975e-05, 9.811805e-05, 0.0, 0.0024625, 5e-06, 0.0010918450000000001, 2.5185e-06, 0.0016300000000000002, 2.5e-06, 0.0021273922750000003, 2.0055575e-05, 0.0005225000000000001, 2.5e-06, 1.75e-05, 0.0, 0.00141, 0.0, 1.7500000000000002e-05, 0.0, 3.2500000000000004e-05, 1.5e-05, 3e-05, 0.0]], '2-Monge': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00036500000000000004, 1e-05, 0.001395, 0.0, 7.9327825e-05, 9.0036e-06, 5.00215e-06, 0.0, 0.0005383847000000001, 2.3093975e-05, 9.811805e-05, 0.0, 0.0024625, 5e-06, 0.0010918450000000001, 2.5185e-06, 0.0016300000000000002, 2.5e-06, 0.0021273922750000003, 2.0055575e-05, 0.0005225000000000001, 2.5e-06, 1.75e-05, 0.0, 0.00141, 0.0, 1.7500000000000002e-05, 0.0, 3.2500000000000004e-05, 1.5e-05, 3e-05, 0.0]], 'Varifolds': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [7.5e-05, 2.5e-06, 0.00053, 0.0, 1.175225e-05, 0.0, 2.501075e-06, 0.0, 0.000156387875, 7.698e-06, 2.264265e-05, 0.0, 0.00092, 0.0, 0.0003421441, 0.0, 0.00059, 0.0, 0.0008093617499999999, 0.0, 0.000155, 0.0, 7.5e-06, 0.0, 0.0005200000000000001, 0.0, 0.0, 0.0, 7.5e-06, 0.0, 0.0, 0.0]], 'WaveJets': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00036500000000000004, 1e-05, 0.001395, 0.0, 7.9327825e-05, 9.0036e-06, 5.00215e-06, 0.0, 0.0005383847000000001, 2.3093975e-05, 9.811805e-05, 0.0, 0.0024625, 5e-06, 0.0010918450000000001, 2.5185e-06, 0.0016300000000000002, 2.5e-06, 0.0021273922750000003, 2.0055575e-05, 0.0005225000000000001, 2.5e-06, 1.75e-05, 0.0, 0.00141, 0.0, 1.7500000000000002e-05, 0.0, 3.2500000000000004e-05, 1.5e-05, 3e-05, 0.0]], 'AvgHexagram': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00038500000000000003, 1e-05, 0.0014125, 0.0, 9.1080075e-05, 1.5006e-05, 5.00215e-06, 0.0, 0.0005588932, 2.8226e-05, 0.0001031498, 0.0, 0.0025, 5e-06, 0.0011320975, 2.5185e-06, 0.00167, 5e-06, 0.002182519775, 2.2562525e-05, 0.0005275, 2.5e-06, 1.75e-05, 0.0, 0.0014425, 0.0, 1.7500000000000002e-05, 0.0, 3.5000000000000004e-05, 1.7500000000000002e-05, 3e-05, 0.0]], 'PCA': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00036500000000000004, 1e-05, 0.001395, 0.0, 7.9327825e-05, 9.0036e-06, 5.00215e-06, 0.0, 0.0005383847000000001, 2.3093975e-05, 9.811805e-05, 0.0, 0.0024625, 5e-06, 0.0010918450000000001, 2.5185e-06, 0.0016300000000000002, 2.5e-06, 0.0021273922750000003, 2.0055575e-05, 0.0005225000000000001, 2.5e-06, 1.75e-05, 0.0, 0.00141, 0.0, 1.7500000000000002e-05, 0.0, 3.2500000000000004e-05, 1.5e-05, 3e-05, 0.0]], 'ASO': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0030525, 0.00013, 0.005235, 2e-05, 0.000854975825, 0.00021308525, 0.000420181075, 2.501025e-06, 0.003422583, 0.00027712699999999995, 0.0008880942, 1.75717e-05, 0.0079125, 7.5e-05, 0.0047296477500000005, 1.7629575e-05, 0.0061, 3e-05, 0.0070887985, 0.00019052780000000002, 0.0028274999999999997, 4.75e-05, 0.000325, 0.0, 0.0059775, 1.5e-05, 0.00020250000000000002, 2.5e-06, 0.0002475, 8.25e-05, 0.00030250000000000003, 1e-05]], 'APSS': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0030525, 0.00013, 0.005235, 2e-05, 0.000854975825, 0.00021308525, 0.000420181075, 2.501025e-06, 0.003422583, 0.00027712699999999995, 0.0008880942, 1.75717e-05, 0.0079125, 7.5e-05, 0.0047296477500000005, 1.7629575e-05, 0.0061, 3e-05, 0.0070887985, 0.00019052780000000002, 0.0028274999999999997, 4.75e-05, 0.000325, 0.0, 0.0059775, 1.5e-05, 0.00020250000000000002, 2.5e-06, 0.0002475, 8.25e-05, 0.00030250000000000003, 1e-05]], 'Sphere': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0032325, 0.000155, 0.00524, 2e-05, 0.000843223875, 0.000210084, 0.000482708575, 2.501025e-06, 0.00341745925, 0.0002950905, 0.0009057050499999999, 2.0081925e-05, 0.00801, 7.75e-05, 0.004727132750000001, 1.7629575e-05, 0.006095000000000001, 3e-05, 0.007073778499999999, 0.00019052780000000002, 0.0028299999999999996, 4.75e-05, 0.000325, 0.0, 0.0059775, 1.5e-05, 0.00020250000000000002, 2.5e-06, 0.0002425, 7.750000000000001e-05, 0.00030500000000000004, 1e-05]], 'UnorientedSphere': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0030525, 0.00013, 0.005235, 2e-05, 0.0008579158250000001, 0.00021308525, 0.000420181075, 2.501025e-06, 0.003407193, 0.00027712699999999995, 0.0008855792, 1.75717e-05, 0.00791, 7.5e-05, 0.00472463275, 1.7629575e-05, 0.0061, 3e-05, 0.00709380925, 0.00019052780000000002, 0.0028299999999999996, 4.75e-05, 0.000325, 0.0, 0.0059775, 1.5e-05, 0.00020250000000000002, 2.5e-06, 0.0002425, 7.750000000000001e-05, 0.00030250000000000003, 1e-05]], 'Cov2D': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00036500000000000004, 1e-05, 0.001395, 0.0, 7.9327825e-05, 9.0036e-06, 5.00215e-06, 0.0, 0.0005383847000000001, 2.3093975e-05, 9.811805e-05, 0.0, 0.0024625, 5e-06, 0.0010918450000000001, 2.5185e-06, 0.0016300000000000002, 2.5e-06, 0.0021273922750000003, 2.0055575e-05, 0.0005225000000000001, 2.5e-06, 1.75e-05, 0.0, 0.00141, 0.0, 1.7500000000000002e-05, 0.0, 3.2500000000000004e-05, 1.5e-05, 3e-05, 0.0]], 'NormCov2D': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.00036500000000000004, 1e-05, 0.001395, 0.0, 7.9327825e-05, 9.0036e-06, 5.00215e-06, 0.0, 0.0005383847000000001, 2.3093975e-05, 9.811805e-05, 0.0, 0.0024625, 5e-06, 0.0010918450000000001, 2.5185e-06, 0.0016300000000000002, 2.5e-06, 0.0021273922750000003, 2.0055575e-05, 0.0005225000000000001, 2.5e-06, 1.75e-05, 0.0, 0.00141, 0.0, 1.7500000000000002e-05, 0.0, 3.2500000000000004e-05, 1.5e-05, 3e-05, 0.0]], 'Mean': [['Boxy_smooth100k_ddist_minmax', 'Boxy_smooth100k_ddist_minmax_layers', 'Cup34100k_ddist_minmax', 'Cup34100k_ddist_minmax_layers', 'Liberty100k_ddist_minmax', 'Liberty100k_ddist_minmax_layers', 'boxunion2100k_ddist_minmax', 'boxunion2100k_ddist_minmax_layers', 'column100k_ddist_minmax', 'column100k_ddist_minmax_layers', 'column_head100k_ddist_minmax', 'column_head100k_ddist_minmax_layers', 'cylinder100k_ddist_minmax', 'cylinder100k_ddist_minmax_layers', 'galera100k_ddist_minmax', 'galera100k_ddist_minmax_layers', 'icosahedron100k_ddist_minmax', 'icosahedron100k_ddist_minmax_layers', 'netsuke100k_ddist_minmax', 'netsuke100k_ddist_minmax_layers', 'pipe100k_ddist_minmax', 'pipe100k_ddist_minmax_layers', 'pipe_curve100k_ddist_minmax', 'pipe_curve100k_ddist_minmax_layers', 'sphere100k_ddist_minmax', 'sphere100k_ddist_minmax_layers', 'star_halfsmooth100k_ddist_minmax', 'star_halfsmooth100k_ddist_minmax_layers', 'star_sharp100k_ddist_minmax', 'star_sharp100k_ddist_minmax_layers', 'star_smooth100k_ddist_minmax', 'star_smooth100k_ddist_minmax_layers'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}, 'Noise position_kNN_Timings (ms)': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [0.0452434947368421, 0.05299524210526316, 0.055408722807017544, 0.06103429473684211]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [0.03986597894736842, 0.043076552631578946, 0.046917452631578954, 0.04359372807017543]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [0.024583070175438596, 0.025541301754385966, 0.02636158421052632, 0.0237348]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [0.0022798897192982458, 0.002256822631578947, 0.002169894912280702, 0.0018901980350877195]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [0.058236778947368416, 0.10126484385964912, 0.14718870175438598, 0.30914594736842105]], 'AvgHexagram': [[75.0, 150.0, 300.0, 700.0], [0.0073418022631578945, 0.0076934604035087725, 0.008975850614035089, 0.01070246507017544]], 'ShapeOperator': [[75.0, 150.0, 300.0, 700.0], [0.0013775037017543861, 0.001344412596491228, 0.0013031183333333332, 0.0013249677368421052]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [0.0014444983157894736, 0.0013733761403508771, 0.0014345353859649126, 0.001463154192982456]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [0.003160644561403509, 0.0034318282456140352, 0.0034632140350877192, 0.0032226068421052634]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [0.00023303378947368418, 0.0002580229473684211, 0.0002829476140350877, 0.000254833298245614]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [0.010660178245614035, 0.0114521450877193, 0.011214569298245613, 0.011794161228070177]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [0.004356945087719298, 0.0056862326315789465, 0.00582915701754386, 0.005592428421052631]], 'Cov2D': [[75.0, 150.0, 300.0, 700.0], [0.0012150754561403509, 0.0009518918421052632, 0.0010146396666666667, 0.0010182655614035087]], 'NormCov2D': [[75.0, 150.0, 300.0, 700.0], [0.0009800803684210525, 0.000964133754385965, 0.0009346839122807017, 0.0009226071754385965]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [9.700198421052631e-05, 0.00011442182456140351, 0.00011525012982456139, 0.00011048151578947367]]}, 'Noise position_kNN_RMSAE Normal': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [32.16245000000001, 26.990878245614038, 24.336241614035085, 23.407878052631578]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [25.038985964912282, 20.11740635087719, 18.552314298245616, 19.264775368421052]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [25.013994385964914, 20.10930714035088, 18.566350508771926, 19.28460243859649]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [24.349976491228066, 19.86518952631579, 18.469117596491227, 19.315779157894735]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [25.572183333333335, 20.51926878947369, 18.867442122807017, 19.59049538596491]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [25.20575263157895, 20.176215859649123, 18.54608122807018, 19.333447263157893]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [18.65088771929825, 16.539813701754387, 16.416205666666666, 17.691341684210528]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [15.018400039215686, 16.880946732142856, 18.068415736842105, 20.062568982456142]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [34.454324912280704, 29.42905292982456, 24.949585824561403, 22.15466978947368]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [13.87693548076923, 15.250617894736843, 16.201437614035086, 17.910242684210527]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [11.250058090909091, 15.287464829787233, 17.958021607142857, 20.475335428571434]]}, 'Noise position_kNN_Non-stable ratio': {'3DQuadric': [[75.0, 150.0, 300.0, 700.0], [0.001566194556140351, 0.0002484771228070176, 3.296917192982456e-05, 1.6169070175438596e-06]], 'PC-MLS': [[75.0, 150.0, 300.0, 700.0], [0.00021158750175438598, 3.657647192982456e-05, 4.898866666666666e-06, 0.0]], '2-Monge': [[75.0, 150.0, 300.0, 700.0], [0.00021158750175438598, 3.657647192982456e-05, 4.898866666666666e-06, 0.0]], 'Varifolds': [[75.0, 150.0, 300.0, 700.0], [0.00010141369122807018, 1.6716775438596493e-05, 2.3600157894736844e-06, 0.0]], 'WaveJets': [[75.0, 150.0, 300.0, 700.0], [0.00021158750175438598, 3.657647192982456e-05, 4.898866666666666e-06, 0.0]], 'AvgHexagram': [[75.0, 150.0, 300.0, 700.0], [0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [[75.0, 150.0, 300.0, 700.0], [0.0002197828614035088, 3.85097e-05, 5.249743859649123e-06, 0.0]], 'PCA': [[75.0, 150.0, 300.0, 700.0], [0.00021158750175438598, 3.657647192982456e-05, 4.898866666666666e-06, 0.0]], 'ASO': [[75.0, 150.0, 300.0, 700.0], [0.0007752111192982456, 0.00012568370877192981, 1.7022915789473684e-05, 3.888368421052631e-07]], 'APSS': [[75.0, 150.0, 300.0, 700.0], [0.0007752111192982456, 0.00012568370877192981, 1.7022915789473684e-05, 3.888368421052631e-07]], 'Sphere': [[75.0, 150.0, 300.0, 700.0], [0.0007892498666666666, 0.0001297943543859649, 1.9483554385964913e-05, 1.971180701754386e-06]], 'UnorientedSphere': [[75.0, 150.0, 300.0, 700.0], [0.0007751496631578947, 0.00012487944736842106, 1.631777543859649e-05, 3.888368421052631e-07]], 'Cov2D': [[75.0, 150.0, 300.0, 700.0], [0.00021158750175438598, 3.657647192982456e-05, 4.898866666666666e-06, 0.0]], 'NormCov2D': [[75.0, 150.0, 300.0, 700.0], [0.00021158750175438598, 3.657647192982456e-05, 4.898866666666666e-06, 0.0]], 'Mean': [[75.0, 150.0, 300.0, 700.0], [0.0, 0.0, 0.0, 0.0]]}, 'Noise position_noise_type_Timings (ms)': {'3DQuadric': [['high', 'low', 'med'], [0.05178965921052632, 0.05365956842105262, 0.05556208815789472]], 'PC-MLS': [['high', 'low', 'med'], [0.043756268421052624, 0.043059521052631576, 0.043274494736842105]], '2-Monge': [['high', 'low', 'med'], [0.02498736447368421, 0.025115831578947367, 0.02506237105263158]], 'Varifolds': [['high', 'low', 'med'], [0.002128319328947368, 0.0021104808289473687, 0.002208803815789474]], 'WaveJets': [['high', 'low', 'med'], [0.14897326842105263, 0.1565810052631579, 0.1563229302631579]], 'AvgHexagram': [['high', 'low', 'med'], [0.013933662039473682, 0.0023826216842105265, 0.009718900039473684]], 'ShapeOperator': [['high', 'low', 'med'], [0.0014170786315789471, 0.0012324960394736841, 0.0013629271052631579]], 'PCA': [['high', 'low', 'med'], [0.0014303461052631574, 0.0013505333684210525, 0.0015057935526315788]], 'ASO': [['high', 'low', 'med'], [0.0032903043421052634, 0.0032475275000000002, 0.0034208884210526307]], 'APSS': [['high', 'low', 'med'], [0.00026009055263157894, 0.00025463457894736845, 0.0002569031052631579]], 'Sphere': [['high', 'low', 'med'], [0.011331562236842105, 0.010865878157894736, 0.011643350000000002]], 'UnorientedSphere': [['high', 'low', 'med'], [0.005864913552631578, 0.004792266578947369, 0.005441392236842106]], 'Cov2D': [['high', 'low', 'med'], [0.001142967355263158, 0.0010408715263157894, 0.0009660655131578949]], 'NormCov2D': [['high', 'low', 'med'], [0.0009229488815789473, 0.0009406204210526315, 0.0009875596052631578]], 'Mean': [['high', 'low', 'med'], [0.00010641977105263159, 0.00010135532105263158, 0.00012009149868421053]]}, 'Noise position_noise_type_RMSAE Normal': {'3DQuadric': [['high', 'low', 'med'], [37.14074894736842, 17.08374777631579, 25.94858921052632]], 'PC-MLS': [['high', 'low', 'med'], [29.482970526315786, 13.13860530263158, 19.608535657894738]], '2-Monge': [['high', 'low', 'med'], [29.40505223684211, 13.192858486842105, 19.632780131578947]], 'Varifolds': [['high', 'low', 'med'], [29.06179276315789, 13.075317473684212, 19.362936842105263]], 'WaveJets': [['high', 'low', 'med'], [29.815981973684206, 13.611174065789472, 19.984886184210524]], 'PCA': [['high', 'low', 'med'], [29.682171315789475, 13.10058852631579, 19.66336289473684]], 'ASO': [['high', 'low', 'med'], [23.770133157894737, 11.396746315789473, 16.806807105263157]], 'APSS': [['high', 'low', 'med'], [21.563884729729732, 13.781994630136985, 17.33681716216216]], 'Sphere': [['high', 'low', 'med'], [42.69490407894737, 13.730516539473687, 26.815304473684208]], 'UnorientedSphere': [['high', 'low', 'med'], [19.827136266666663, 12.077795162162161, 15.600805135135134]], 'Mean': [['high', 'low', 'med'], [20.603063333333335, 13.981667072463768, 16.880149420289857]]}, 'Noise position_noise_type_Non-stable ratio': {'3DQuadric': [['high', 'low', 'med'], [0.001200715330263158, 1.974655263157895e-06, 0.00018425333289473684]], 'PC-MLS': [['high', 'low', 'med'], [0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05]], '2-Monge': [['high', 'low', 'med'], [0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05]], 'Varifolds': [['high', 'low', 'med'], [8.202512105263158e-05, 2.638052631578948e-07, 8.078935526315791e-06]], 'WaveJets': [['high', 'low', 'med'], [0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05]], 'AvgHexagram': [['high', 'low', 'med'], [0.0, 0.0, 0.0]], 'ShapeOperator': [['high', 'low', 'med'], [0.00017791985263157894, 2.638052631578948e-07, 1.9473071052631577e-05]], 'PCA': [['high', 'low', 'med'], [0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05]], 'ASO': [['high', 'low', 'med'], [0.0006058555460526317, 7.904447368421054e-07, 8.208394473684212e-05]], 'APSS': [['high', 'low', 'med'], [0.0006058555460526317, 7.904447368421054e-07, 8.208394473684212e-05]], 'Sphere': [['high', 'low', 'med'], [0.0006143781434210527, 9.220236842105264e-07, 9.007405000000001e-05]], 'UnorientedSphere': [['high', 'low', 'med'], [0.0006036095000000001, 7.904447368421054e-07, 8.315184736842105e-05]], 'Cov2D': [['high', 'low', 'med'], [0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05]], 'NormCov2D': [['high', 'low', 'med'], [0.0001720368, 2.638052631578948e-07, 1.7496525000000003e-05]], 'Mean': [['high', 'low', 'med'], [0.0, 0.0, 0.0]]}, 'Noise position_Shape_Timings (ms)': {'3DQuadric': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.048871475, 0.055016899999999994, 0.054529725, 0.0528762, 0.054388025, 0.054463225000000004, 0.04503465, 0.050458350000000006, 0.05612252499999999, 0.05603662500000001, 0.05344965, 0.056966375, 0.051821775, 0.052628175, 0.0570181, 0.0548443, 0.055896775, 0.056195300000000004, 0.05114085, 0.053947925, 0.060424025, 0.04956635, 0.054285299999999995, 0.057507325000000005, 0.05509465, 0.051519775000000004, 0.053648325, 0.050898700000000005, 0.0512321, 0.056126625, 0.051460000000000006, 0.050210625, 0.059288099999999996, 0.053148625000000005, 0.059039625, 0.05554705, 0.052210275, 0.049602175, 0.05402342499999999, 0.052685499999999996, 0.053210625, 0.048579575, 0.052714625, 0.056318049999999995, 0.049221274999999995, 0.05431855000000001, 0.052356749999999994, 0.055465225, 0.05270830000000001, 0.057392425, 0.055366124999999995, 0.04806165, 0.05610795, 0.0580181, 0.050510425, 0.0524706, 0.05716925]], 'PC-MLS': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0468159, 0.041247125, 0.041968624999999996, 0.04540795, 0.041581925000000006, 0.044970575, 0.04595197499999999, 0.044116550000000004, 0.039431525, 0.045960225, 0.041846675, 0.041375100000000005, 0.046305575, 0.0418829, 0.04184545, 0.046658624999999995, 0.043801175, 0.045375225000000005, 0.0471349, 0.041298925, 0.048772974999999996, 0.043791025, 0.046491000000000005, 0.041637125000000004, 0.04298745, 0.0419578, 0.04324885, 0.04077795, 0.04620685, 0.04558335, 0.039431324999999996, 0.04133555, 0.043334700000000004, 0.04571067499999999, 0.045959175000000005, 0.045408375, 0.04315864999999999, 0.045319849999999995, 0.04354335, 0.04087875, 0.04299105, 0.041515825000000006, 0.04822654999999999, 0.043927275, 0.046378525, 0.044230425, 0.04371075, 0.042613225, 0.036073299999999996, 0.042153750000000004, 0.043877, 0.04107215, 0.03971005, 0.039655225, 0.0407957, 0.042592525000000006, 0.041680375]], '2-Monge': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.030141025000000002, 0.0253314, 0.0249322, 0.026365674999999998, 0.024132325, 0.0249595, 0.023536425, 0.025269225, 0.0236934, 0.026513575, 0.023063625, 0.0261894, 0.026721150000000003, 0.024257, 0.023150000000000004, 0.027666450000000002, 0.024653775, 0.022997425000000002, 0.0246946, 0.026350725, 0.023480525, 0.025553350000000002, 0.023268350000000004, 0.024595350000000002, 0.023516324999999998, 0.0259861, 0.024134299999999997, 0.020115175, 0.029745999999999998, 0.02919845, 0.024774075, 0.02502745, 0.025312175, 0.022004424999999998, 0.024890875, 0.026917949999999996, 0.023379125, 0.02120855, 0.025740525, 0.023523525, 0.025674625, 0.02549985, 0.02487355, 0.024621124999999997, 0.022990800000000002, 0.024325475, 0.024712025, 0.024888375, 0.025064975, 0.025896225, 0.024714100000000003, 0.024029775, 0.026671125, 0.028071975, 0.02796125, 0.026440275, 0.02471875]], 'Varifolds': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00240049, 0.0019226075000000002, 0.00210459, 0.002232105, 0.0023642575, 0.00219869, 0.0021616875, 0.001762475, 0.0027354475, 0.00157955725, 0.0027874349999999996, 0.00257954, 0.0020633275, 0.0021884925, 0.0019602275, 0.0020590225000000004, 0.00198831, 0.0021792700000000005, 0.0023694299999999996, 0.0020772675, 0.0023535875, 0.0017748975, 0.0020177775, 0.002427405, 0.0022604, 0.002264625, 0.0024483050000000004, 0.0022037525, 0.00204772, 0.00191609, 0.0017797249999999998, 0.0022416, 0.0022604549999999998, 0.00221969, 0.0021473825, 0.00213251, 0.0022566175, 0.00250013475, 0.00199029, 0.0023230075, 0.0020656625, 0.0022073525000000003, 0.00201398, 0.001988825, 0.0018780775, 0.002399925, 0.0021772074999999998, 0.002483575, 0.0017905675, 0.0021506225, 0.001955765, 0.00221572, 0.001958285, 0.0021337624999999997, 0.002334165, 0.0014484485, 0.0020223324999999997]], 'WaveJets': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.15968375, 0.15143602500000003, 0.12965725, 0.12601625, 0.161768725, 0.13464505, 0.13323897499999998, 0.16489025000000002, 0.165562225, 0.13363515, 0.14811697499999998, 0.17022579999999998, 0.15694134999999998, 0.15090967500000002, 0.1685227, 0.134264225, 0.126483275, 0.150603125, 0.1453699, 0.16994745, 0.133477, 0.153298325, 0.15770905000000002, 0.15401330000000002, 0.16134102500000003, 0.159196925, 0.198964775, 0.1415073, 0.1703306, 0.17283732499999999, 0.1542512, 0.157926725, 0.14634039999999998, 0.15029794999999999, 0.18349635, 0.163513925, 0.144533325, 0.13728864999999998, 0.161490525, 0.158646125, 0.154171475, 0.1389101, 0.15974644999999998, 0.1688987, 0.17502362500000002, 0.13178355, 0.1572851, 0.12079242500000001, 0.173858475, 0.150972375, 0.133476625, 0.1638182, 0.136209875, 0.172822725, 0.148260575, 0.1680009, 0.179256775]], 'AvgHexagram': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0007932614999999999, 0.0011592339999999999, 0.0008861317499999999, 0.00100402975, 0.0013055879999999999, 0.0014180669999999999, 0.0009023880000000001, 0.001477247, 0.00103835275, 0.00098916375, 0.0007006605, 0.0009980575, 0.0010356240000000002, 0.00116053575, 0.00116645775, 0.0012491535, 0.0009321617500000001, 0.00110014375, 0.0011051595, 0.0009798740000000002, 0.000960717, 0.00130884975, 0.00117207275, 0.00121067675, 0.00125598625, 0.0012626265000000002, 0.00115109525, 0.00099586975, 0.001110059, 0.0012923592500000002, 0.0013473105, 0.00120758575, 0.0012269825, 0.000947996, 0.00115538675, 0.0010785175, 0.0014668100000000002, 0.00104735225, 0.00108792025, 0.24374625, 0.0247556525, 0.16441, 0.00128540975, 0.0011570682500000001, 0.0008490692499999999, 0.00122968775, 0.00086042975, 0.0009410730000000001, 0.0012882025000000002, 0.0014246985, 0.001257464, 0.0012973775, 0.0013301182500000002, 0.00143401, 0.001491049, 0.0010714607499999998, 0.0011520055]], 'ShapeOperator': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.001336303, 0.00119180675, 0.0009428232499999999, 0.0013948175, 0.00133691775, 0.00099005025, 0.0013480950000000001, 0.0011155524999999999, 0.001728781, 0.0018694200000000001, 0.00117799975, 0.0015688149999999999, 0.001571251, 0.0012754827500000001, 0.001717595, 0.00160875175, 0.0010580272499999999, 0.00147253, 0.0014622175, 0.0011240597500000002, 0.0016598725000000001, 0.0011724399999999999, 0.0014064225, 0.0014927175000000001, 0.0017455699999999999, 0.0010991192499999998, 0.00121592, 0.0015898375, 0.0010537805000000002, 0.0009851615, 0.0016636025, 0.0015585125, 0.0013349672500000001, 0.0011032515000000001, 0.00116708925, 0.0013186200000000002, 0.00117268075, 0.0013925399999999998, 0.001330924, 0.0013878542499999999, 0.0011093115000000001, 0.0015533600000000002, 0.0014873224999999999, 0.0015472325, 0.00120066125, 0.0010762785, 0.0013124920000000002, 0.0016634475000000001, 0.0013477150000000002, 0.0012791265, 0.0011509295, 0.00113514, 0.00099596725, 0.0013539075, 0.00145194575, 0.0012159845, 0.001214532]], 'PCA': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00122344725, 0.0010658047499999999, 0.00112624375, 0.0012898875, 0.0016094975, 0.0013594935000000002, 0.00121799775, 0.00153645125, 0.0014778125000000002, 0.0014599927499999998, 0.0014422725, 0.0010145425, 0.0015163132500000001, 0.00117096525, 0.0019358599999999998, 0.0015741175, 0.0012637224999999998, 0.001447952, 0.0015624649999999999, 0.001445317, 0.0015714927500000001, 0.00137967575, 0.0013760975, 0.0017775725, 0.001245596, 0.001477237, 0.0019326950000000001, 0.0018539, 0.001330795, 0.001437705, 0.0016097799999999999, 0.0013060790000000001, 0.0013286862499999998, 0.0014076825, 0.00180038, 0.0017769074999999998, 0.0013567924999999998, 0.00132793, 0.00156948, 0.001335605, 0.0010630665, 0.0016106725, 0.0015150325, 0.00133793775, 0.001678985, 0.0012645832500000002, 0.00122132, 0.00153587475, 0.00126802, 0.0011701530000000002, 0.00111548025, 0.0013580775, 0.0015031889999999998, 0.00108136175, 0.0017376100000000001, 0.0012119185, 0.00183126]], 'ASO': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.002905925, 0.0038020099999999998, 0.0037117725, 0.0037658875, 0.0032847375, 0.0033996275000000003, 0.0038799875, 0.0026909675, 0.00332309, 0.0030837175000000003, 0.0028407199999999997, 0.0034427525, 0.002501215, 0.0035579125000000005, 0.0031859475000000003, 0.0028351, 0.0036154474999999997, 0.0030102824999999997, 0.0034638950000000003, 0.0028102475, 0.0036802600000000003, 0.0029149224999999996, 0.0036659325, 0.003516025, 0.0040347075, 0.0030092900000000004, 0.0034362625000000004, 0.0039830675, 0.0033497674999999998, 0.0034783799999999997, 0.0030549275, 0.0036336025000000003, 0.0030110725, 0.003079925, 0.0026714449999999997, 0.0039322, 0.0029265425, 0.0038372, 0.002730905, 0.00311509, 0.003526675, 0.0029748199999999995, 0.003708265, 0.0036175550000000006, 0.0032964149999999996, 0.0028593925, 0.0030668725, 0.004612867499999999, 0.0028353174999999997, 0.0031874525, 0.0032108625, 0.0036115925, 0.002520475, 0.003495985, 0.003956305, 0.0030147125000000003, 0.0035473525]], 'APSS': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.000214772, 0.00019446175, 0.000261964, 0.00028463125, 0.0002369645, 0.00033254275, 0.0003050045, 0.000267238, 0.00023728575000000001, 0.00033371275, 0.00018003475000000002, 0.00025155, 0.00018044674999999997, 0.00029627075, 0.00024568175, 0.00022392124999999998, 0.00025411525, 0.00019477725, 0.00023652424999999998, 0.000170792, 0.00022587724999999998, 0.00020251, 0.000245785, 0.00016381799999999998, 0.00028492175000000003, 0.00026959525, 0.00035770974999999993, 0.0001923575, 0.00037499500000000004, 0.00021165074999999998, 0.00024492025, 0.00019957149999999998, 0.00023629374999999998, 0.000253964, 0.00036207075, 0.00029088225, 0.0002964305, 0.00021696025000000001, 0.00023789074999999997, 0.00033729075, 0.00023034, 0.00032304575000000003, 0.00022611299999999998, 0.00018205650000000003, 0.00027698675, 0.00031895074999999996, 0.00031248575, 0.00021576375, 0.00027321875, 0.00032196199999999996, 0.00029776075000000003, 0.00025561350000000003, 0.0002886645, 0.00024441925, 0.000276417, 0.00023369350000000002, 0.00027525875]], 'Sphere': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.01062888, 0.009877114999999999, 0.011856175, 0.0088178275, 0.00915794, 0.011897225, 0.012101822500000001, 0.0116262, 0.013070677499999999, 0.013939975, 0.00921113, 0.012263017500000003, 0.0114977, 0.01291009, 0.0103546575, 0.012980317500000001, 0.0113585275, 0.0099786575, 0.007994897499999999, 0.0118152575, 0.0117975075, 0.011940277499999999, 0.009676460000000001, 0.01050238, 0.010774875, 0.00968335, 0.0141423525, 0.01094144, 0.0088602125, 0.0156999, 0.009703005, 0.0107213175, 0.013406125, 0.01334005, 0.014474182500000002, 0.010180765, 0.0127361975, 0.0132411175, 0.0093035725, 0.01057163, 0.012444679999999998, 0.0106271325, 0.009617135, 0.009102155, 0.0134512, 0.009621709999999999, 0.0095099025, 0.01082457, 0.014201897500000001, 0.012425242500000001, 0.010252567499999999, 0.01327553, 0.010378135, 0.009734000000000001, 0.010614515, 0.00997867, 0.011881167500000001]], 'UnorientedSphere': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00539475, 0.0028410625000000003, 0.004363745, 0.0045617875, 0.003987940000000001, 0.0062423475, 0.007513682499999999, 0.00705264, 0.0074735175000000004, 0.005367162500000001, 0.0039467025000000005, 0.0044643224999999995, 0.0060461225, 0.00563812, 0.006650315, 0.0077585275, 0.004401505, 0.006045795, 0.0042039475, 0.0034233125, 0.0046064825, 0.0057580125000000005, 0.00396747, 0.004151510000000001, 0.006726567500000001, 0.006106965, 0.0056262225, 0.0056676025000000005, 0.004378802499999999, 0.003960544999999999, 0.0059161775, 0.00477002, 0.00677923, 0.0065514675, 0.005043395, 0.0061605175000000005, 0.005772982499999999, 0.0058556325, 0.0048092675000000005, 0.0035373625000000002, 0.0017722125000000002, 0.0020230725, 0.0042930425, 0.0044336825, 0.005524055, 0.0060979599999999995, 0.0037353449999999997, 0.005002629999999999, 0.006645587499999999, 0.0067574625, 0.005699555, 0.006402875, 0.007499862499999999, 0.006765005, 0.00721774, 0.0054409325, 0.0070383175]], 'Cov2D': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00105310975, 0.0010169755, 0.0009995505, 0.0010974185, 0.00099823325, 0.0008654055, 0.0015114142499999999, 0.00117814925, 0.0009099005, 0.00111935575, 0.00106495075, 0.0009214047500000001, 0.00121964525, 0.0009255559999999999, 0.0007618039999999999, 0.0011241089999999999, 0.0010346205, 0.001033692, 0.001056689, 0.001033378, 0.00070586125, 0.0009396004999999999, 0.0009865005000000001, 0.0011752105, 0.0012917175, 0.00089543875, 0.0012071324999999998, 0.0010575405, 0.0007187494999999999, 0.0011173490000000001, 0.0011586572499999999, 0.0011543812500000002, 0.0008156275, 0.00107585075, 0.0011809685, 0.0009164922500000002, 0.0013467475, 0.0012055850000000001, 0.001056981, 0.0008753809999999999, 0.0008184775, 0.00108090825, 0.0011909215, 0.001026224, 0.0009173865, 0.00102041125, 0.001245389, 0.00092927275, 0.00119307825, 0.0010705379999999998, 0.00103635525, 0.0012080917500000002, 0.0010544422500000001, 0.0008844720000000001, 0.0011766405, 0.0011680015, 0.00102043875]], 'NormCov2D': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00088865525, 0.00097889475, 0.0009006455, 0.0008501082499999999, 0.0012453009999999999, 0.0007473065, 0.0008229155, 0.00102969825, 0.000898177, 0.0007028997500000001, 0.000932424, 0.00099451, 0.0007727945, 0.00065759475, 0.000999271, 0.0010475855, 0.0007899362499999998, 0.0013223299999999998, 0.0008470545, 0.00080209125, 0.00106208775, 0.00105725325, 0.001039557, 0.0010325915, 0.00101632475, 0.0007567382499999999, 0.00084149425, 0.0009742525000000001, 0.0009419962500000002, 0.00121289375, 0.0010821197500000001, 0.0008427867499999999, 0.00105143875, 0.0010807672500000001, 0.0011459950000000001, 0.000834424, 0.0009068925, 0.0010382454999999999, 0.0008920285, 0.0009697029999999999, 0.0011575584999999999, 0.000969541, 0.00087445375, 0.0010074955, 0.001243582, 0.0009089195000000001, 0.00094860625, 0.00098295175, 0.0008086430000000001, 0.0008968575, 0.00103765, 0.0009059765, 0.00086095675, 0.000770506, 0.00101870975, 0.0007990545, 0.00097020325]], 'Mean': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.009625e-05, 0.000134621225, 7.31241e-05, 9.036627500000002e-05, 0.0001004288, 0.0001375336, 0.000104671575, 6.626107499999999e-05, 9.2598325e-05, 0.000138758425, 8.40376e-05, 0.00011210035, 9.863385e-05, 8.6389925e-05, 0.00010730040000000001, 0.00010890814999999999, 6.9527225e-05, 0.00011504474999999999, 0.00011711685000000001, 7.4878125e-05, 8.743105e-05, 9.320024999999999e-05, 0.00012935515, 0.00010370522500000002, 0.00010605900000000001, 9.94372e-05, 0.00013444472500000003, 7.578637499999999e-05, 8.511385e-05, 0.00014479455, 7.645814999999999e-05, 8.849945e-05, 0.00015569119999999997, 0.00015686925, 6.812945e-05, 0.000131757525, 0.00012134632499999999, 0.0001151115, 0.000139727425, 0.00012907754999999998, 0.00015706297499999997, 0.0001084079, 0.000103825275, 0.00011201020000000001, 0.00014323917499999998, 8.9688275e-05, 7.4233025e-05, 0.00010841957500000001, 0.0001762909, 0.00013551805, 0.000122785, 8.148655e-05, 0.0001065932, 0.000137023125, 7.3336375e-05, 0.000138543075, 0.00012661047499999998]]}, 'Noise position_Shape_RMSAE Normal': {'3DQuadric': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [37.944725000000005, 17.4544025, 22.586025, 31.106, 11.67214, 18.937350000000002, 53.3344, 33.09525, 44.630675, 38.001925, 21.492775, 27.1071, 56.761700000000005, 37.353325, 50.555475, 45.498275, 34.42715, 38.65004999999999, 24.10445, 9.243765, 15.463700000000001, 27.719995, 2.321306, 14.174622499999998, 40.441950000000006, 22.893250000000002, 28.725050000000003, 22.0003, 11.935469999999999, 12.47222, 38.492125, 22.699375, 28.20835, 43.42825, 14.5145, 27.02235, 40.837375, 11.716639999999998, 26.987875000000003, 55.013125, 20.041765, 45.974975, 18.867585, 1.7417574999999998, 8.7864075, 18.841075, 1.55727175, 8.68967, 37.490500000000004, 16.505925, 23.592549999999996, 46.736225, 24.65735, 34.42505, 29.054250000000003, 9.267790000000002, 16.033699999999996]], 'PC-MLS': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [25.048650000000002, 7.684122500000001, 13.866999999999999, 22.07255, 7.616350000000001, 12.894325, 49.007375, 30.346824999999995, 40.049699999999994, 29.267899999999997, 15.327550000000002, 20.441725, 54.35, 34.43155, 47.19307500000001, 41.054175, 32.9268, 35.867125, 15.293675, 7.4327875, 9.9005775, 17.077005000000003, 1.142791, 7.256819999999999, 33.63895, 18.0803, 23.65265, 15.462275000000002, 6.4381474999999995, 9.030864999999999, 33.51885, 18.80235, 24.224649999999997, 33.77695, 7.3448775, 13.581600000000002, 34.743700000000004, 7.2826200000000005, 17.16145, 36.504825000000004, 15.662025, 28.0642, 11.312025000000002, 1.16739975, 4.4866624999999996, 11.260634999999999, 0.7680450000000001, 4.377602499999999, 31.703950000000003, 11.642310000000002, 18.943025, 42.1412, 19.2534, 29.791850000000004, 22.94175, 6.28325, 11.777275]], '2-Monge': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [24.955650000000002, 7.7613325, 13.895249999999999, 22.046325, 7.7708925, 13.008875, 48.9324, 30.384299999999996, 40.019425, 29.23205, 15.278475, 20.46735, 54.33125, 34.127175, 47.189274999999995, 41.07205, 33.06462499999999, 35.986824999999996, 15.24095, 7.4667025, 9.9404725, 16.8804125, 1.19881775, 7.200307499999999, 33.58215, 18.10185, 23.6942, 15.361225, 6.4371875, 9.043109999999999, 33.44775, 18.85135, 24.26205, 33.71235, 7.37329, 13.587050000000001, 34.707125, 7.288740000000001, 17.210275000000003, 36.32, 15.905425, 27.903899999999997, 11.177719999999999, 1.19578725, 4.496177499999999, 11.13586, 0.8191437500000001, 4.38953, 31.619175000000002, 11.8482125, 19.024224999999998, 42.097125, 19.3333, 29.865875000000003, 22.844425, 6.457705, 11.83865]], 'Varifolds': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [24.5248, 7.6772575000000005, 13.58195, 21.653225, 7.240815, 12.64865, 48.7582, 30.2804, 39.777274999999996, 28.879500000000004, 15.991074999999999, 20.394375, 54.222425, 33.899125, 46.983374999999995, 40.80905, 32.620625000000004, 35.66605, 14.872900000000001, 7.9106925, 9.9745825, 16.39251, 1.138682, 6.8584075, 33.2435, 18.128725, 23.447525000000002, 14.958575, 6.44797, 8.9155525, 33.120725, 18.736525, 24.012225, 33.438575, 7.8464275, 13.252500000000001, 34.43495, 7.547255, 16.737425, 36.065000000000005, 14.90933, 27.53355, 10.7092725, 1.1666765, 4.3379775, 10.675705, 0.766776, 4.2303975000000005, 31.229324999999996, 11.17255, 18.597450000000002, 41.80565000000001, 19.005975, 29.452350000000003, 22.380174999999998, 5.9441500000000005, 11.4941825]], 'WaveJets': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [25.43935, 8.2555025, 14.390275, 22.404124999999997, 7.583119999999999, 12.994824999999999, 49.13195, 30.68085, 40.264525, 29.597424999999998, 16.295125, 20.874825, 54.40152500000001, 33.7363, 47.184799999999996, 41.20175, 33.0604, 35.973575, 15.8049, 8.539525, 10.588515, 17.5063025, 1.30531, 7.7314775, 33.924625, 18.7724, 24.040025, 16.01265, 6.66081, 9.4928675, 33.812599999999996, 19.405525, 24.640175, 34.038574999999994, 8.5474875, 14.016975, 34.968275, 8.33493, 17.3598, 36.650999999999996, 15.39055, 28.3051, 12.006585, 1.28956475, 5.091514999999999, 11.956869999999999, 0.932265, 5.005912499999999, 31.99435, 12.092032500000002, 19.359724999999997, 42.290775, 21.043875, 30.073449999999998, 23.360025, 6.6867350000000005, 12.324475]], 'PCA': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [25.30715, 7.6816825, 13.992049999999999, 22.18895, 7.2692975, 12.731774999999999, 49.114325, 30.318224999999998, 40.16095, 29.419675, 16.003700000000002, 20.549625, 54.40265, 34.0426, 47.247474999999994, 41.101150000000004, 32.621224999999995, 35.699225, 15.502450000000001, 7.918505, 10.0377425, 17.4610625, 1.1392107500000002, 7.475759999999999, 33.800824999999996, 18.140349999999998, 23.69585, 15.758175000000001, 6.44905, 9.09169, 33.70025, 18.7576, 24.289475000000003, 33.908525, 7.852755, 13.584125, 34.866074999999995, 7.5479199999999995, 17.009725, 36.732825000000005, 14.9681875, 28.337600000000002, 11.6503975, 1.1669067499999999, 4.572325, 11.59012, 0.7670045, 4.451415, 31.939625, 11.2339, 19.0275, 42.28845, 19.048099999999998, 29.804825, 23.228575000000003, 5.9849625, 11.8447625]], 'ASO': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [20.13245, 5.182425, 10.991375, 13.3843, 4.98873, 8.008769999999998, 43.892825, 26.4552, 36.191925, 25.679750000000002, 14.268975000000001, 18.534525000000002, 51.148925, 31.610799999999998, 43.7197, 39.0491, 33.434749999999994, 35.45505, 12.494724999999999, 6.909704999999999, 8.757735, 11.3816575, 0.8821559999999998, 4.8258575, 28.7026, 15.550574999999998, 20.747, 11.882275, 5.5727225, 7.639645, 29.028574999999996, 16.061975, 21.47985, 17.420399999999997, 7.1804775, 10.626832499999999, 17.614475000000002, 7.3206050000000005, 10.708475, 32.3836, 5.953665, 20.9268, 7.3109475, 1.0413925, 3.2314225000000003, 7.211275, 0.595964, 3.0965575000000003, 26.6255, 9.774282500000002, 16.559175, 37.884675, 18.752000000000002, 27.965249999999997, 18.404474999999998, 5.00178, 9.863389999999999]], 'APSS': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [17.799950000000003, 7.935242499999999, 11.748715, 13.76125, 9.09623, 10.6905775, 41.804175, 29.916525, 36.241474999999994, 24.778124999999996, 17.0987, 19.900125, 50.680675, 39.19625, 47.557675, 39.67463333333333, 36.99883333333333, 37.86496666666667, 11.383875, 8.2831675, 9.30114, 5.5677075, 0.53689875, 3.1344100000000004, 28.15045, 19.054000000000002, 22.631625, 9.721883333333333, 7.852405, 7.9878133333333325, 27.908425, 19.413425, 22.942074999999996, 13.998000000000001, 8.29874, 10.4596125, 15.023025, 8.7036825, 11.065175, 25.150025, 12.55547, 21.08695, 3.98278, 0.83678925, 2.161735, 3.9045925, 0.2826815, 2.065295, 24.966324999999998, 11.445224999999999, 16.952600000000004, 36.60735, 21.283425, 28.503975, 16.417749999999998, 5.909622499999999, 9.8983725]], 'Sphere': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [41.73685, 7.5663425, 22.733375, 35.4646, 9.452065, 15.830675, 54.942375, 30.312450000000002, 48.361549999999994, 42.634975, 16.392425, 25.697675, 57.70287499999999, 35.38705, 54.051075, 48.327799999999996, 35.2639, 39.143074999999996, 29.216275000000003, 7.922615, 12.354265, 41.3375, 1.1355225, 20.11049, 46.07985, 18.650425000000002, 30.0686, 33.153175, 6.4488025, 13.8250975, 46.509475, 19.07655, 31.156575, 43.813674999999996, 8.095062500000001, 21.386575, 44.20655, 9.11666, 22.34825, 48.577774999999995, 13.781705, 44.895525000000006, 31.3552675, 1.1613845, 10.131594999999999, 31.176685000000003, 0.7564522499999999, 10.1871625, 44.933825, 12.349155000000001, 28.285075000000003, 50.719875, 21.663275000000002, 39.256, 39.31377499999999, 6.3479725, 19.668149999999997]], 'UnorientedSphere': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [17.74395, 7.0472325, 11.0969525, 10.969974999999998, 7.21211, 8.6100675, 40.0161, 28.464999999999996, 34.7338, 25.759349999999998, 14.272224999999999, 18.820449999999997, 44.040725, 31.840899999999998, 39.123575, 36.5878, 33.4544, 34.38473333333334, 11.429, 6.40407, 8.18333, 5.9353, 0.53844825, 3.3051825000000004, 26.613425000000003, 18.007424999999998, 21.357675, 9.51924, 7.007273333333333, 7.810953333333333, 27.139075, 18.86155, 22.3099, 15.115825000000001, 6.67468, 10.30445, 12.7427, 7.194650000000001, 9.387385, 14.41645, 9.3232075, 13.579775, 4.263895000000001, 0.83684075, 2.2425675, 4.1980699999999995, 0.283114, 2.1506100000000004, 24.5319, 11.45664, 16.6765, 33.6451, 19.07105, 25.3784, 16.237875000000003, 5.6038125, 9.70751]], 'Mean': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [17.971733333333333, 8.3269, 11.7900725, 17.0353, 8.611947500000001, 12.402102500000002, 42.5561, 30.1828, 36.114525, 24.712400000000002, 20.9283, 20.200875, 51.48095, 40.82525, 48.49816666666666, 39.73726666666667, 37.124766666666666, 37.96273333333333, 11.2899, 8.685825, 9.509689999999999, 3.8087966666666673, 0.48659450000000004, 1.9132975, 28.7249, 19.51635, 22.751175, 9.43426, 7.961449999999999, 8.509225, 28.22923333333333, 23.401249999999997, 25.05775, 13.991900000000001, 8.63426, 10.370425, 16.699299999999997, 9.021482500000001, 11.025715, 26.6256, 9.83279, 19.9477, 2.35859, 0.85533175, 1.3735700000000002, 2.2104999999999997, 0.29311575, 1.1128575, 25.215366666666664, 12.605807500000001, 17.238225, 37.6006, 22.822049999999997, 28.880450000000003, 16.059275, 6.4941775, 9.909659999999999]]}, 'Noise position_Shape_Non-stable ratio': {'3DQuadric': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00089, 0.0, 2.25e-05, 0.00019, 0.0, 0.0, 0.0030257159249999998, 0.0, 0.0005534460000000001, 0.0005277417, 0.0, 7.50345e-06, 0.00282616975, 0.0, 0.00050967875, 0.0003113485, 0.0, 2.510875e-06, 0.0001475, 0.0, 0.0, 0.0011625, 0.0, 5.75e-05, 0.000697992, 0.0, 1.5118975e-05, 0.0003325, 0.0, 2.5e-06, 0.0008671233999999999, 7.518450000000001e-06, 2.2555275e-05, 0.0005425, 0.0, 1.75e-05, 0.0006275, 0.0, 1.25e-05, 0.0056675, 0.0, 0.0019349999999999999, 0.0003875, 0.0, 5e-06, 0.0003475, 0.0, 5e-06, 0.00123, 0.0, 6e-05, 0.00235, 3e-05, 0.0002625, 0.0006825, 0.0, 1e-05]], 'PC-MLS': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.75e-05, 0.0, 2.5e-06, 1.75e-05, 0.0, 0.0, 0.0004926296750000001, 0.0, 5.1695675e-05, 4.0018399999999996e-05, 0.0, 0.0, 0.00041029017499999995, 0.0, 3.8226e-05, 2.0086974999999998e-05, 0.0, 0.0, 1.75e-05, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 6.2995825e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 9.5e-05, 0.0, 0.0, 7.5e-05, 0.0, 0.0, 0.001115, 0.0, 0.00021, 5.75e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.00015, 0.0, 5e-06, 0.00030250000000000003, 0.0, 1.25e-05, 6e-05, 0.0, 2.5e-06]], '2-Monge': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.75e-05, 0.0, 2.5e-06, 1.75e-05, 0.0, 0.0, 0.0004926296750000001, 0.0, 5.1695675e-05, 4.0018399999999996e-05, 0.0, 0.0, 0.00041029017499999995, 0.0, 3.8226e-05, 2.0086974999999998e-05, 0.0, 0.0, 1.75e-05, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 6.2995825e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 9.5e-05, 0.0, 0.0, 7.5e-05, 0.0, 0.0, 0.001115, 0.0, 0.00021, 5.75e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.00015, 0.0, 5e-06, 0.00030250000000000003, 0.0, 1.25e-05, 6e-05, 0.0, 2.5e-06]], 'Varifolds': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [3e-05, 0.0, 2.5e-06, 1e-05, 0.0, 0.0, 0.00024935532500000004, 0.0, 1.82455e-05, 2.00092e-05, 0.0, 0.0, 0.00019877465, 0.0, 1.2741975e-05, 7.532625e-06, 0.0, 0.0, 5e-06, 0.0, 0.0, 6.25e-05, 0.0, 2.5e-06, 3.0238e-05, 0.0, 0.0, 1.25e-05, 0.0, 0.0, 2.75675e-05, 5.0123e-06, 5.0123e-06, 4.2499999999999996e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.0005449999999999999, 0.0, 0.00010750000000000001, 1.5e-05, 0.0, 0.0, 1.9999999999999998e-05, 0.0, 0.0, 6.75e-05, 0.0, 2.5e-06, 0.0001525, 0.0, 2.5e-06, 3.2500000000000004e-05, 0.0, 0.0]], 'WaveJets': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.75e-05, 0.0, 2.5e-06, 1.75e-05, 0.0, 0.0, 0.0004926296750000001, 0.0, 5.1695675e-05, 4.0018399999999996e-05, 0.0, 0.0, 0.00041029017499999995, 0.0, 3.8226e-05, 2.0086974999999998e-05, 0.0, 0.0, 1.75e-05, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 6.2995825e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 9.5e-05, 0.0, 0.0, 7.5e-05, 0.0, 0.0, 0.001115, 0.0, 0.00021, 5.75e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.00015, 0.0, 5e-06, 0.00030250000000000003, 0.0, 1.25e-05, 6e-05, 0.0, 2.5e-06]], 'AvgHexagram': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]], 'ShapeOperator': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.75e-05, 0.0, 2.5e-06, 1.75e-05, 0.0, 0.0, 0.000501752175, 0.0, 5.1695675e-05, 4.7521899999999996e-05, 0.0, 0.0, 0.000417936175, 0.0, 4.077425e-05, 2.0086974999999998e-05, 0.0, 0.0, 1.75e-05, 0.0, 0.0, 0.00014, 0.0, 5e-06, 6.2995825e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 7.518415e-05, 5.0123e-06, 7.518425000000001e-06, 9.750000000000001e-05, 0.0, 0.0, 7.75e-05, 0.0, 0.0, 0.0011475, 0.0, 0.00023999999999999998, 6e-05, 0.0, 0.0, 3.5e-05, 0.0, 0.0, 0.000155, 0.0, 5e-06, 0.0003275, 0.0, 1.5e-05, 6.25e-05, 0.0, 2.5e-06]], 'PCA': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.75e-05, 0.0, 2.5e-06, 1.75e-05, 0.0, 0.0, 0.0004926296750000001, 0.0, 5.1695675e-05, 4.0018399999999996e-05, 0.0, 0.0, 0.00041029017499999995, 0.0, 3.8226e-05, 2.0086974999999998e-05, 0.0, 0.0, 1.75e-05, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 6.2995825e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 9.5e-05, 0.0, 0.0, 7.5e-05, 0.0, 0.0, 0.001115, 0.0, 0.00021, 5.75e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.00015, 0.0, 5e-06, 0.00030250000000000003, 0.0, 1.25e-05, 6e-05, 0.0, 2.5e-06]], 'ASO': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0004075, 0.0, 7.5e-06, 7.75e-05, 0.0, 0.0, 0.0014687631749999998, 0.0, 0.000252396175, 0.0002125977, 0.0, 5.0023e-06, 0.00149845475, 0.0, 0.000244645925, 0.00013307625000000002, 0.0, 0.0, 8e-05, 0.0, 0.0, 0.0005600000000000001, 0.0, 1.75e-05, 0.00030741915, 0.0, 2.519825e-06, 0.000135, 0.0, 0.0, 0.00038594435, 7.518450000000001e-06, 1.2530725e-05, 0.000235, 0.0, 2.5e-06, 0.0002825, 0.0, 5e-06, 0.0032825, 0.0, 0.0009075, 0.0002075, 0.0, 0.0, 0.00013250000000000002, 0.0, 2.5e-06, 0.0006425000000000001, 0.0, 1.25e-05, 0.0011949999999999999, 7.5e-06, 8.25e-05, 0.0002675, 0.0, 5e-06]], 'APSS': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0004075, 0.0, 7.5e-06, 7.75e-05, 0.0, 0.0, 0.0014687631749999998, 0.0, 0.000252396175, 0.0002125977, 0.0, 5.0023e-06, 0.00149845475, 0.0, 0.000244645925, 0.00013307625000000002, 0.0, 0.0, 8e-05, 0.0, 0.0, 0.0005600000000000001, 0.0, 1.75e-05, 0.00030741915, 0.0, 2.519825e-06, 0.000135, 0.0, 0.0, 0.00038594435, 7.518450000000001e-06, 1.2530725e-05, 0.000235, 0.0, 2.5e-06, 0.0002825, 0.0, 5e-06, 0.0032825, 0.0, 0.0009075, 0.0002075, 0.0, 0.0, 0.00013250000000000002, 0.0, 2.5e-06, 0.0006425000000000001, 0.0, 1.25e-05, 0.0011949999999999999, 7.5e-06, 8.25e-05, 0.0002675, 0.0, 5e-06]], 'Sphere': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.00042, 0.0, 1.25e-05, 8.5e-05, 0.0, 2.5e-06, 0.001493090425, 0.0, 0.000261518925, 0.00022760465, 0.0, 7.50345e-06, 0.0014933599, 0.0, 0.00025229107499999994, 0.000145630625, 0.0, 2.510875e-06, 9e-05, 0.0, 2.5e-06, 0.000575, 0.0, 3.7500000000000003e-05, 0.000317498625, 0.0, 5.03965e-06, 0.000145, 0.0, 7.500000000000001e-06, 0.00040850049999999996, 7.518450000000001e-06, 1.7542975e-05, 0.0002425, 0.0, 7.5e-06, 0.000295, 0.0, 7.5e-06, 0.00321, 2.5e-06, 0.000935, 0.00022250000000000001, 0.0, 2e-05, 0.000145, 0.0, 7.5e-06, 0.0006600000000000001, 0.0, 2.25e-05, 0.0012174999999999998, 7.5e-06, 9.250000000000001e-05, 0.00028, 0.0, 1e-05]], 'UnorientedSphere': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0004075, 0.0, 7.5e-06, 7.75e-05, 0.0, 0.0, 0.001468762925, 0.0, 0.000252396175, 0.0002125977, 0.0, 5.0023e-06, 0.0014882615, 0.0, 0.000259936075, 0.00013307625000000002, 0.0, 0.0, 8e-05, 0.0, 0.0, 0.0005600000000000001, 0.0, 1.75e-05, 0.00030741915, 0.0, 2.519825e-06, 0.0001375, 0.0, 0.0, 0.00039346297500000003, 7.518450000000001e-06, 1.2530725e-05, 0.0002375, 0.0, 2.5e-06, 0.0002825, 0.0, 5e-06, 0.003225, 0.0, 0.0009125, 0.0002075, 0.0, 0.0, 0.00013250000000000002, 0.0, 2.5e-06, 0.00064, 0.0, 1.25e-05, 0.00121, 7.5e-06, 8.25e-05, 0.0002675, 0.0, 5e-06]], 'Cov2D': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.75e-05, 0.0, 2.5e-06, 1.75e-05, 0.0, 0.0, 0.0004926296750000001, 0.0, 5.1695675e-05, 4.0018399999999996e-05, 0.0, 0.0, 0.00041029017499999995, 0.0, 3.8226e-05, 2.0086974999999998e-05, 0.0, 0.0, 1.75e-05, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 6.2995825e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 9.5e-05, 0.0, 0.0, 7.5e-05, 0.0, 0.0, 0.001115, 0.0, 0.00021, 5.75e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.00015, 0.0, 5e-06, 0.00030250000000000003, 0.0, 1.25e-05, 6e-05, 0.0, 2.5e-06]], 'NormCov2D': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [8.75e-05, 0.0, 2.5e-06, 1.75e-05, 0.0, 0.0, 0.0004926296750000001, 0.0, 5.1695675e-05, 4.0018399999999996e-05, 0.0, 0.0, 0.00041029017499999995, 0.0, 3.8226e-05, 2.0086974999999998e-05, 0.0, 0.0, 1.75e-05, 0.0, 0.0, 0.0001325, 0.0, 5e-06, 6.2995825e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 7.267815000000001e-05, 5.0123e-06, 5.0123e-06, 9.5e-05, 0.0, 0.0, 7.5e-05, 0.0, 0.0, 0.001115, 0.0, 0.00021, 5.75e-05, 0.0, 0.0, 3e-05, 0.0, 0.0, 0.00015, 0.0, 5e-06, 0.00030250000000000003, 0.0, 1.25e-05, 6e-05, 0.0, 2.5e-06]], 'Mean': [['Boxy_smooth100k_noise_white_1.00e01', 'Boxy_smooth100k_noise_white_1.00e02', 'Boxy_smooth100k_noise_white_5.00e02', 'Cup34100k_noise_white_1.00e01', 'Cup34100k_noise_white_1.00e02', 'Cup34100k_noise_white_5.00e02', 'Liberty100k_noise_white_1.00e01', 'Liberty100k_noise_white_1.00e02', 'Liberty100k_noise_white_5.00e02', 'boxunion2100k_noise_white_1.00e01', 'boxunion2100k_noise_white_1.00e02', 'boxunion2100k_noise_white_5.00e02', 'column100k_noise_white_1.00e01', 'column100k_noise_white_1.00e02', 'column100k_noise_white_5.00e02', 'column_head100k_noise_white_1.00e01', 'column_head100k_noise_white_1.00e02', 'column_head100k_noise_white_5.00e02', 'cylinder100k_noise_white_1.00e01', 'cylinder100k_noise_white_1.00e02', 'cylinder100k_noise_white_5.00e02', 'cylinder_analytic100k_noise_white_1.00e01', 'cylinder_analytic100k_noise_white_1.00e02', 'cylinder_analytic100k_noise_white_5.00e02', 'galera100k_noise_white_1.00e01', 'galera100k_noise_white_1.00e02', 'galera100k_noise_white_5.00e02', 'icosahedron100k_noise_white_1.00e01', 'icosahedron100k_noise_white_1.00e02', 'icosahedron100k_noise_white_5.00e02', 'netsuke100k_noise_white_1.00e01', 'netsuke100k_noise_white_1.00e02', 'netsuke100k_noise_white_5.00e02', 'pipe100k_noise_white_1.00e01', 'pipe100k_noise_white_1.00e02', 'pipe100k_noise_white_5.00e02', 'pipe_curve100k_noise_white_1.00e01', 'pipe_curve100k_noise_white_1.00e02', 'pipe_curve100k_noise_white_5.00e02', 'sheet_analytic100k_noise_white_1.00e01', 'sheet_analytic100k_noise_white_1.00e02', 'sheet_analytic100k_noise_white_5.00e02', 'sphere100k_noise_white_1.00e01', 'sphere100k_noise_white_1.00e02', 'sphere100k_noise_white_5.00e02', 'sphere_analytic100k_noise_white_1.00e01', 'sphere_analytic100k_noise_white_1.00e02', 'sphere_analytic100k_noise_white_5.00e02', 'star_halfsmooth100k_noise_white_1.00e01', 'star_halfsmooth100k_noise_white_1.00e02', 'star_halfsmooth100k_noise_white_5.00e02', 'star_sharp100k_noise_white_1.00e01', 'star_sharp100k_noise_white_1.00e02', 'star_sharp100k_noise_white_5.00e02', 'star_smooth100k_noise_white_1.00e01', 'star_smooth100k_noise_white_1.00e02', 'star_smooth100k_noise_white_5.00e02'], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}},
-    colorMap: {'PCA': 'rgba(31, 119, 180, 1)', '3DQuadric': 'rgba(174, 199, 232, 1)', 'Mean': 'rgba(255, 127, 14, 1)', 'Cov2D': 'rgba(255, 187, 120, 1)', 'NormCov2D': 'rgba(44, 160, 44, 1)', 'ShapeOperator': 'rgba(152, 223, 138, 1)', '2-Monge': 'rgba(214, 39, 40, 1)', 'PC-MLS': 'rgba(255, 152, 150, 1)', 'JetFitting': 'rgba(148, 103, 189, 1)', 'WaveJets': 'rgba(197, 176, 213, 1)', 'Sphere': 'rgba(140, 86, 75, 1)', 'APSS': 'rgba(196, 156, 148, 1)', 'UnorientedSphere': 'rgba(227, 119, 194, 1)', 'ASO': 'rgba(247, 182, 210, 1)', 'Varifolds': 'rgba(127, 127, 127, 1)', 'VCM': 'rgba(199, 199, 199, 1)', 'AvgHexagram': 'rgba(188, 189, 34, 1)'},
-};
-
-export const getXLabels = (): string[] => PCPNet.xLabels;
-export const getYLabels = (): string[] => PCPNet.yLabels;
-export const getDividers = (): string[] => PCPNet.dividers;
-export const getConstraints = (): string[] => PCPNet.constraints;
-export const getData = (): { [key: string]: PlotDataType } => PCPNet.data;
-export const getDataForKey = (key: string): PlotDataType | undefined => PCPNet.data[key];
-
-export const getSpecificData = (xLabel: string, yLabel: string, divider: string | null, constraint: string | null): PlotDataType | null => {
-    const xIndex = PCPNet.xLabels.indexOf(xLabel);
-    const yIndex = PCPNet.yLabels.indexOf(yLabel);
-    
-    if (xIndex === -1 || yIndex === -1) {
-        console.error('Invalid xLabel or yLabel');
-        return null;
-    }
-
-    let key = `${constraint || 'overall'}_${xLabel}_${yLabel}`;
-    if (divider) {
-        key = `${key}_${divider}`;
-    }
-
-    const dataForKey = PCPNet.data[key];
-    if (!dataForKey) {
-        console.error('No data found for the given parameters');
-        return null;
-    }
-
-    return dataForKey;
-};
-
-export const getColorMap = (): { [method: string]: string } => PCPNet.colorMap;
-
-const PCPNetAccessors: PlotDataAccessors = {
-    getXLabels,
-    getYLabels,
-    getDividers,
-    getConstraints,
-    getData,
-    getDataForKey,
-    getSpecificData,
-    getColorMap,
-};
-
-export default PCPNetAccessors;
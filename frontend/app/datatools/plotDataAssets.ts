@@ -0,0 +1,58 @@
+// Dataframes of the data viewer, written by tools/export_dataframes.py in public/dataframes/<experiment>/:
+// index.json, and the series of each constraint in the file given by index.files, fetched when a plot needs it.
+import { PlotDataType, PlotDataIndex } from './types';
+
+const isProd: boolean = process.env.NODE_ENV === 'production';
+const isStatic: boolean = process.env.STATIC_BUILD === 'true';
+const repoName: string = 'pcloud-differential-estimation-benchmark-website';
+const base: string = isProd && !isStatic ? `/${repoName}` : '';
+
+export type ConstraintData = { [key: string]: PlotDataType };
+
+export const getDataFramePath = (experiment: string, file: string): string => `${base}/dataframes/${experiment}/${file}`;
+
+// Fetched files, shared by the plots asking for the same one (a failed fetch is forgotten, so that it is retried)
+const requests: { [path: string]: Promise<any> } = {};
+
+const fetchJson = (path: string): Promise<any> => {
+  if (!(path in requests)) {
+    requests[path] = fetch(path).then(response => {
+      if (!response.ok) throw new Error(`Failed to fetch ${path}: ${response.status}`);
+      return response.json();
+    }).catch(error => {
+      delete requests[path];
+      throw error;
+    });
+  }
+  return requests[path];
+};
+
+export const loadPlotDataIndex = (experiment: string): Promise<PlotDataIndex> =>
+  fetchJson(getDataFramePath(experiment, 'index.json'));
+
+// Series of a constraint, null for a constraint the experiment does not have
+export const loadConstraintData = async (experiment: string, constraint: string | null): Promise<ConstraintData | null> => {
+  const index: PlotDataIndex = await loadPlotDataIndex(experiment);
+  const file: string | undefined = constraint ? index.files[constraint] : undefined;
+  return file ? fetchJson(getDataFramePath(experiment, file)) : null;
+};
+
+export const getSpecificData = (index: PlotDataIndex, data: ConstraintData | null, xLabel: string, yLabel: string, divider: string | null, constraint: string | null): PlotDataType | null => {
+  if (!index.xLabels.includes(xLabel) || !index.yLabels.includes(yLabel)) {
+    console.error('Invalid xLabel or yLabel');
+    return null;
+  }
+
+  let key = `${constraint || 'overall'}_${xLabel}_${yLabel}`;
+  if (divider) {
+    key = `${key}_${divider}`;
+  }
+
+  const dataForKey = data?.[key];
+  if (!dataForKey) {
+    console.error('No data found for the given parameters');
+    return null;
+  }
+
+  return dataForKey;
+};
@@ -26,3 +26,17 @@ export interface PlotDataAccessors {
   getSpecificData: (xLabel: string, yLabel: string, divider: string | null, constraint: string | null) => PlotDataType | null;
   getColorMap : () => { [method: string]: string };
 }
+
+// index.json of an experiment written by tools/export_dataframes.py, the data of each constraint is in its own file
+export interface PlotDataIndex {
+  xLabels: string[];
+  yLabels: string[];
+  dividers: string[];
+  constraints: string[];
+  files: {
+    [constraint: string]: string;
+  };
+  colorMap: {
+    [method: string]: string;
+  };
+}
@@ -0,0 +1,324 @@
+// Reader for the binary columnar point clouds written by tools/merge_pts.py (--format bin / --publish_format bin shards).
+// Layout: uint32 LE header length, JSON header, then one float32 LE block per column.
+
+export interface BinaryColumnHeader {
+  name: string;
+  components: number;
+  offset: number;
+  length: number;
+  // Compact encoding (merge_pts.py --compact), see tools/web_format.py
+  dtype?: 'float16' | 'uint16';
+  scale?: number;
+  min?: number[];
+  max?: number[];
+  max_error?: number;
+  validity?: number;
+  // Value shown for the missing values (the placeholder of the JSON point clouds), they are decoded as NaN
+  fill?: number;
+}
+
+export interface BinaryPointCloudHeader {
+  version: number;
+  rows: number;
+  dtype: string;
+  columns: BinaryColumnHeader[];
+  [key: string]: unknown;
+}
+
+export interface BinaryPointCloud {
+  header: BinaryPointCloudHeader;
+  columns: { [name: string]: Float32Array };
+}
+
+// Float value of every float16 bit pattern
+let float16Table: Float32Array | null = null;
+
+const getFloat16Table = (): Float32Array => {
+  if (!float16Table) {
+    float16Table = new Float32Array(65536);
+    for (let bits = 0; bits < 65536; bits++) {
+      const sign: number = bits & 0x8000 ? -1 : 1;
+      const exponent: number = (bits >> 10) & 0x1f;
+      const fraction: number = bits & 0x3ff;
+      if (exponent === 0) {
+        float16Table[bits] = sign * fraction * 2 ** -24;
+      } else if (exponent === 31) {
+        float16Table[bits] = fraction ? NaN : sign * Infinity;
+      } else {
+        float16Table[bits] = sign * (1 + fraction / 1024) * 2 ** (exponent - 15);
+      }
+    }
+  }
+  return float16Table;
+};
+
+// Decodes the rows of a column of the compact encoding starting at row start, the missing values are NaN.
+// bits holds the validity bitmap (null without missing values) from its byte of row start (start >> 3).
+const decodeCompactRows = (column: BinaryColumnHeader, encoded: Uint16Array, bits: Uint8Array | null, start: number): Float32Array => {
+  const values = new Float32Array(encoded.length);
+  if (column.dtype === 'float16') {
+    const table: Float32Array = getFloat16Table();
+    const scale: number = column.scale ?? 1;
+    for (let i = 0; i < encoded.length; i++) {
+      values[i] = table[encoded[i]] * scale;
+    }
+  } else {
+    const components: number = column.components;
+    const low: number[] = column.min ?? [];
+    const step: number[] = low.map((value: number, k: number) => ((column.max ?? [])[k] - value) / 65535);
+    for (let i = 0; i < encoded.length; i++) {
+      values[i] = low[i % components] + encoded[i] * step[i % components];
+    }
+  }
+  if (bits) {
+    const rows: number = encoded.length / column.components;
+    const first: number = start & 7;
+    for (let row = 0; row < rows; row++) {
+      const bit: number = first + row;
+      if (!(bits[bit >> 3] & (1 << (bit & 7)))) {
+        values.fill(NaN, row * column.components, (row + 1) * column.components);
+      }
+    }
+  }
+  return values;
+};
+
+// Decodes a whole column of the compact encoding
+const decodeCompactColumn = (buffer: ArrayBuffer, column: BinaryColumnHeader, rows: number): Float32Array =>
+  decodeCompactRows(column, new Uint16Array(buffer, column.offset, column.length),
+    column.validity !== undefined ? new Uint8Array(buffer, column.validity, Math.ceil(rows / 8)) : null, 0);
+
+export const parseBinaryPointCloud = (buffer: ArrayBuffer): BinaryPointCloud => {
+  const headerLength: number = new DataView(buffer).getUint32(0, true);
+  const header: BinaryPointCloudHeader = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)));
+  const columns: { [name: string]: Float32Array } = {};
+  for (const column of header.columns) {
+    if (column.dtype) {
+      columns[column.name] = decodeCompactColumn(buffer, column, header.rows);
+    } else {
+      // The blocks are 4 bytes aligned, so they are wrapped without copy
+      columns[column.name] = new Float32Array(buffer, column.offset, column.length);
+    }
+  }
+  return { header, columns };
+};
+
+export const fetchBinaryPointCloud = async (path: string): Promise<BinaryPointCloud> => {
+  const response = await fetch(path);
+  if (!response.ok) {
+    throw new Error(`HTTP error! status: ${response.status}`);
+  }
+  return parseBinaryPointCloud(await response.arrayBuffer());
+};
+
+// Rows [x, y, z, ...] of a point cloud, as in the JSON point clouds: the value of each column is at its index in columnIndices.
+// The missing values (compact encoding) are the fill value of their column, as in the JSON point clouds (100 for the errors),
+// and the columns the point cloud does not have are 0.
+// The points flagged as hidden by the "visible" column of the value-only point clouds (--split_geometry) are skipped.
+export const pointCloudRows = (cloud: BinaryPointCloud, columnIndices: { [name: string]: number }): number[][] => {
+  const position: Float32Array = cloud.columns.position;
+  const visible: Float32Array | undefined = cloud.columns.visible;
+  const fills: { [name: string]: number } = Object.fromEntries(cloud.header.columns
+    .map((column: BinaryColumnHeader) => [column.name, column.fill ?? 0]));
+  const indices: [Float32Array | undefined, number, number][] = Object.entries(columnIndices)
+    .map(([name, index]: [string, number]) => [cloud.columns[name], index, fills[name] ?? 0] as [Float32Array | undefined, number, number]);
+  const width: number = Math.max(2, ...Object.values(columnIndices)) + 1;
+  const rows: number[][] = [];
+  for (let i = 0; i < cloud.header.rows; i++) {
+    if (visible && !visible[i]) {
+      continue;
+    }
+    const row: number[] = new Array(width).fill(0);
+    row[0] = position[3 * i];
+    row[1] = position[3 * i + 1];
+    row[2] = position[3 * i + 2];
+    for (const [values, index, fill] of indices) {
+      const value: number = values ? values[i] : 0;
+      row[index] = isNaN(value) ? fill : value;
+    }
+    rows.push(row);
+  }
+  return rows;
+};
+
+// Geometry files shared by the value-only point clouds (merge_pts.py --split_geometry), fetched once per shape
+const geometryCache: { [path: string]: Promise<BinaryPointCloud> } = {};
+
+const resolvePath = (base: string, relative: string): string => {
+  const parts = base.split('/').slice(0, -1);
+  for (const part of relative.split('/')) {
+    if (part === '..') {
+      parts.pop();
+    } else if (part !== '.') {
+      parts.push(part);
+    }
+  }
+  return parts.join('/');
+};
+
+const fetchGeometry = (path: string): Promise<BinaryPointCloud> => {
+  if (!(path in geometryCache)) {
+    geometryCache[path] = fetchBinaryPointCloud(path);
+  }
+  return geometryCache[path];
+};
+
+// Fetches a point cloud and, when it only holds values, adds the "position" column of its shared geometry
+export const fetchPointCloudWithGeometry = async (path: string): Promise<BinaryPointCloud> => {
+  const cloud = await fetchBinaryPointCloud(path);
+  const geometryPath = cloud.header.geometry;
+  if (typeof geometryPath !== 'string') {
+    return cloud;
+  }
+  const fullPath = resolvePath(path, geometryPath);
+  const geometry = await fetchGeometry(fullPath);
+  if (geometry.header.geometry_checksum !== cloud.header.geometry_checksum || geometry.header.rows !== cloud.header.rows) {
+    throw new Error(`Geometry ${fullPath} does not match ${path}`);
+  }
+  return { header: cloud.header, columns: { ...cloud.columns, position: geometry.columns.position } };
+};
+
+export interface ShardColumnIndex extends BinaryColumnHeader {
+  file: string;
+}
+
+export interface ShardIndex {
+  version: number;
+  rows: number;
+  dtype: string;
+  columns: ShardColumnIndex[];
+  [key: string]: unknown;
+}
+
+// Bytes [start, end) of a file with a range request (sliced from the whole file if the server ignores the range)
+const fetchRange = async (path: string, start: number, end: number): Promise<ArrayBuffer> => {
+  if (end <= start) {
+    return new ArrayBuffer(0);
+  }
+  const response = await fetch(path, { headers: { Range: `bytes=${start}-${end - 1}` } });
+  if (!response.ok) {
+    throw new Error(`HTTP error! status: ${response.status}`);
+  }
+  const buffer: ArrayBuffer = await response.arrayBuffer();
+  return response.status === 206 ? buffer : buffer.slice(start, end);
+};
+
+// Fetches the rows [start, end) of a column of a binary file with range requests,
+// for the compact encoding its 16 bits values and the bytes of its validity bitmap covering these rows
+const fetchColumnRows = async (path: string, column: BinaryColumnHeader, start: number, end: number): Promise<Float32Array> => {
+  const components: number = column.components;
+  if (!column.dtype) {
+    return new Float32Array(await fetchRange(path, column.offset + 4 * start * components, column.offset + 4 * end * components));
+  }
+  const [encoded, bits] = await Promise.all([
+    fetchRange(path, column.offset + 2 * start * components, column.offset + 2 * end * components),
+    column.validity !== undefined ? fetchRange(path, column.validity + (start >> 3), column.validity + ((end + 7) >> 3)) : Promise.resolve(null),
+  ]);
+  return decodeCompactRows(column, new Uint16Array(encoded), bits ? new Uint8Array(bits) : null, start);
+};
+
+// Rows fetched from the column shards and the geometry files, by path (one column per file): a selection change or a finer tier
+// only fetches the rows not cached yet. The oldest columns are dropped beyond shardCacheColumns.
+const shardCacheColumns: number = 64;
+const shardCache: Map<string, { rows: number; values: Promise<Float32Array> }> = new Map();
+
+const fetchCachedColumnRows = async (path: string, column: BinaryColumnHeader, rows: number): Promise<Float32Array> => {
+  const cached = shardCache.get(path);
+  if (cached && cached.rows >= rows) {
+    return (await cached.values).subarray(0, rows * column.components);
+  }
+  const start: number = cached ? cached.rows : 0;
+  const values: Promise<Float32Array> = Promise.all([
+    cached ? cached.values : Promise.resolve(new Float32Array(0)),
+    fetchColumnRows(path, column, start, rows),
+  ]).then(([head, tail]: [Float32Array, Float32Array]) => {
+    const all = new Float32Array(head.length + tail.length);
+    all.set(head);
+    all.set(tail, head.length);
+    return all;
+  });
+  shardCache.delete(path);
+  shardCache.set(path, { rows, values });
+  if (shardCache.size > shardCacheColumns) {
+    shardCache.delete(shardCache.keys().next().value as string);
+  }
+  // A failed fetch is forgotten, so that it is retried
+  values.catch(() => {
+    if (shardCache.get(path)?.values === values) shardCache.delete(path);
+  });
+  return values;
+};
+
+// Header of a binary file, from a range request of its first bytes (a second one when it is larger than binaryHeaderProbe)
+const binaryHeaderProbe: number = 4096;
+const binaryHeaderCache: { [path: string]: Promise<BinaryPointCloudHeader> } = {};
+
+const fetchBinaryHeader = (path: string): Promise<BinaryPointCloudHeader> => {
+  if (!(path in binaryHeaderCache)) {
+    binaryHeaderCache[path] = (async (): Promise<BinaryPointCloudHeader> => {
+      let buffer: ArrayBuffer = await fetchRange(path, 0, binaryHeaderProbe);
+      const headerLength: number = new DataView(buffer).getUint32(0, true);
+      if (buffer.byteLength < 4 + headerLength) {
+        buffer = await fetchRange(path, 0, 4 + headerLength);
+      }
+      return JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)));
+    })();
+    binaryHeaderCache[path].catch(() => delete binaryHeaderCache[path]);
+  }
+  return binaryHeaderCache[path];
+};
+
+// Positions of the first rows of the shared geometry of a point cloud published as column shards,
+// fetched with range requests like the shards, so that a coarse tier does not wait for the whole geometry
+const fetchGeometryRows = async (path: string, index: ShardIndex, rows: number): Promise<Float32Array> => {
+  const header: BinaryPointCloudHeader = await fetchBinaryHeader(path);
+  const position: BinaryColumnHeader | undefined = header.columns.find((column: BinaryColumnHeader) => column.name === 'position');
+  if (!position || header.geometry_checksum !== index.geometry_checksum || header.rows !== index.rows) {
+    throw new Error(`Geometry ${path} does not match its shards`);
+  }
+  return fetchCachedColumnRows(path, position, rows);
+};
+
+// Shard indexes, fetched once per point cloud
+const shardIndexCache: { [path: string]: Promise<ShardIndex> } = {};
+
+const fetchShardIndex = (path: string): Promise<ShardIndex> => {
+  if (!(path in shardIndexCache)) {
+    shardIndexCache[path] = fetch(path).then((response: Response) => {
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+      }
+      return response.json();
+    });
+    shardIndexCache[path].catch(() => delete shardIndexCache[path]);
+  }
+  return shardIndexCache[path];
+};
+
+// Fetches only the given columns of a point cloud published as column shards (merge_pts.py --publish_format shards),
+// indexPath is the path of its index.json. The positions are always fetched, from the shared geometry if any.
+// The index and the rows of each column are cached, so that fetching another column only fetches that one.
+// tier selects the first rows of a level of detail tier (merge_pts.py --lod), all the rows are fetched otherwise:
+// fetching the next tier after a coarser one only fetches its additional rows.
+// The header gives the tiers of the point cloud, if any, so that a viewer knows whether it got all the rows.
+export const fetchPointCloudColumns = async (indexPath: string, names: string[], tier?: number): Promise<BinaryPointCloud> => {
+  const index: ShardIndex = await fetchShardIndex(indexPath);
+  const tiers = index.tiers as number[] | undefined;
+  const rows: number = tier !== undefined && tiers ? tiers[Math.min(tier, tiers.length - 1)] : index.rows;
+  const wanted: string[] = Array.from(new Set(['position', 'visible', ...names]));
+  const shards = index.columns.filter((column: ShardColumnIndex) => wanted.includes(column.name));
+  const geometryPath = index.geometry;
+  const [values, positions] = await Promise.all([
+    Promise.all(shards.map((column: ShardColumnIndex) => fetchCachedColumnRows(resolvePath(indexPath, column.file), column, rows))),
+    typeof geometryPath === 'string' ? fetchGeometryRows(resolvePath(indexPath, geometryPath), index, rows) : Promise.resolve(null),
+  ]);
+  const columns: { [name: string]: Float32Array } = {};
+  shards.forEach((column: ShardColumnIndex, i: number) => {
+    columns[column.name] = values[i];
+  });
+  if (positions) {
+    // The geometry is shared by every quantity and method of the shape, its rows are cached like the ones of the shards
+    columns.position = positions;
+  }
+  return { header: { version: index.version, rows, dtype: index.dtype, columns: shards, tiers }, columns };
+};
@@ -0,0 +1,57 @@
+// Statistics sidecars (.stats.json) written by tools/merge_pts.py --publish next to each published point cloud.
+
+export interface ColumnStats {
+  // Number of the values of the distribution, the placeholders of the values missing from the estimations are left out of it
+  // (and of the mean, std, percentiles and histogram) and counted in missing
+  count: number;
+  missing?: number;
+  min: number | null;
+  max: number | null;
+  mean: number | null;
+  std: number | null;
+  p1: number | null;
+  p5: number | null;
+  p50: number | null;
+  p95: number | null;
+  p99: number | null;
+  // Counts of the values in `bins` equal bins between min and max
+  histogram: number[] | null;
+}
+
+export interface PointCloudStats {
+  rows: number;
+  bins: number;
+  columns: { [name: string]: ColumnStats };
+}
+
+export const getStatsPath = (path: string): string => path.replace(/\.json$/, '.stats.json');
+
+// Returns null when the sidecar is missing (data published without it), the caller then scans the points
+export const fetchPointCloudStats = async (path: string): Promise<PointCloudStats | null> => {
+  try {
+    const response = await fetch(path);
+    return response.ok ? await response.json() : null;
+  } catch {
+    return null;
+  }
+};
+
+// Min and max of the non-NaN values, without spreading them as arguments (which overflows the stack on large clouds)
+export const valuesRange = (values: number[]): [number, number] | null => {
+  let min: number = Infinity;
+  let max: number = -Infinity;
+  for (let i = 0; i < values.length; i++) {
+    const value: number = values[i];
+    if (typeof value === "number" && !isNaN(value)) {
+      if (value < min) min = value;
+      if (value > max) max = value;
+    }
+  }
+  return min <= max ? [min, max] : null;
+};
+
+export const statsRange = (stats: PointCloudStats | null, column: string): [number, number] | null => {
+  const columnStats: ColumnStats | undefined = stats?.columns[column];
+  if (!columnStats || columnStats.min === null || columnStats.max === null) return null;
+  return [columnStats.min, columnStats.max];
+};
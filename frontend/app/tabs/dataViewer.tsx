@@ -18,16 +18,14 @@ import { Info } from "lucide-react";
 import dynamic from 'next/dynamic';
 const Plot = dynamic(() => import('react-plotly.js'), { ssr: false });
 
-import expe_DGtal from '../datatools/dataframes/DGTal';
-import expe_PCPNet from '../datatools/dataframes/PCPNet';
-import expe_CAD from '../datatools/dataframes/CAD';
-
-import { PlotDataType, PlotDataAccessors } from '../datatools/types';
-
-const allDataAccessors: { [key: string]: PlotDataAccessors } = {
-    DGtal: expe_DGtal,
-    PCPNet: expe_PCPNet,
-    ABC: expe_CAD,
+import { PlotDataType, PlotDataIndex } from '../datatools/types';
+import { ConstraintData, loadPlotDataIndex, loadConstraintData, getSpecificData } from '../datatools/plotDataAssets';
+
+// Experiment of each data file, whose dataframes are fetched from public/dataframes when they are plotted
+const allDataExperiments: { [key: string]: string } = {
+    DGtal: 'DGTal',
+    PCPNet: 'PCPNet',
+    ABC: 'CAD',
   };
 
 interface AxisData {
@@ -329,8 +327,9 @@ export function DataViewer({
     const [possibleSpliters, setPossibleDividers] = useState<string[]>([]);
     const [possibleConstraints, setPossibleConstraints] = useState<string[]>([]);
     const [plotData, setPlotData] = useState<any>(null);
+    const [plotIndex, setPlotIndex] = useState<PlotDataIndex | null>(null);
   
-    const currentAccessor = useMemo(() => allDataAccessors[selectedDataAccessor], [selectedDataAccessor]);
+    const currentExperiment = useMemo(() => allDataExperiments[selectedDataAccessor], [selectedDataAccessor]);
   
     useEffect(() => {
       const checkIsMobile = () => setIsMobile(window.innerWidth < 768);
@@ -340,13 +339,16 @@ export function DataViewer({
     }, []);
   
     useEffect(() => {
-        const dividers = currentAccessor.getDividers();
-        const constraints = currentAccessor.getConstraints();
-        
-        setPossibleDividers(dividers);
-        setPossibleConstraints(constraints);
-
-      }, [currentAccessor]);
+        let cancelled = false;
+        setPlotIndex(null);
+        loadPlotDataIndex(currentExperiment).then((index: PlotDataIndex) => {
+          if (cancelled) return;
+          setPlotIndex(index);
+          setPossibleDividers(index.dividers);
+          setPossibleConstraints(index.constraints);
+        }).catch((error) => console.error(error));
+        return () => { cancelled = true; };
+      }, [currentExperiment]);
   
       const generateImprovedAxisLayout = useMemo(() => (rows: number, cols: number) => {
         const layout: any = {};
@@ -377,7 +379,7 @@ export function DataViewer({
         };
       }, [xAxes, yAxes]);
 
-      const updatePlotData = useCallback(() => {
+      const updatePlotData = useCallback((index: PlotDataIndex, constraintData: { [constraint: string]: ConstraintData | null }) => {
         const allPlots = {
           data: [] as any[],
           layout: {
@@ -386,12 +388,12 @@ export function DataViewer({
         };
 
         let methodList: string[] = [];
-        const colorMap = currentAccessor.getColorMap();
+        const colorMap = index.colorMap;
 
         for (let i = 0; i < xAxes.length; i++) {
           for (let j = 0; j < yAxes.length; j++) {
             if (xAxes[i].label && yAxes[j].label) {
-              const data = currentAccessor.getSpecificData(xAxes[i].label, yAxes[j].label, splitBy, xAxes[i].constraint);
+              const data = getSpecificData(index, constraintData[xAxes[i].constraint || ''], xAxes[i].label, yAxes[j].label, splitBy, xAxes[i].constraint);
               if (data) {
                 let localY: number[] = [];
                 const newPlotData = Object.entries(data).map(([method, values]) => {
@@ -444,11 +446,22 @@ export function DataViewer({
         legend: { orientation: 'h', y: -0.2 },
       };
       setPlotData(allPlots);
-    }, [currentAccessor, xAxes, yAxes, splitBy]);
+    }, [xAxes, yAxes, splitBy]);
 
+    // Fetches the data of the constraints of the rows (once per constraint, see plotDataAssets) before plotting them
     useEffect(() => {
-      updatePlotData();
-    }, [updatePlotData]);
+      if (!plotIndex) return;
+      let cancelled = false;
+      const constraints: string[] = Array.from(new Set(xAxes.map(axis => axis.constraint || '')));
+      Promise.all(constraints.map(constraint => loadConstraintData(currentExperiment, constraint || null)))
+        .then((loaded: (ConstraintData | null)[]) => {
+          if (cancelled) return;
+          const constraintData: { [constraint: string]: ConstraintData | null } = {};
+          constraints.forEach((constraint, i) => { constraintData[constraint] = loaded[i]; });
+          updatePlotData(plotIndex, constraintData);
+        }).catch((error) => console.error(error));
+      return () => { cancelled = true; };
+    }, [plotIndex, currentExperiment, xAxes, updatePlotData]);
   
     const renderPlot = useMemo(() => {
         if (!plotData) {
@@ -473,13 +486,13 @@ export function DataViewer({
   
       const configPanel = useMemo(() => (
         <ConfigPanel 
-          dataFiles={Object.keys(allDataAccessors)}
+          dataFiles={Object.keys(allDataExperiments)}
           selectedDataFile={selectedDataAccessor}
           setSelectedDataFile={setSelectedDataAccessor}
           possibleSpliters={possibleSpliters}
           possibleConstraints={possibleConstraints}
-          xLabels={currentAccessor.getXLabels()}
-          yLabels={currentAccessor.getYLabels()}
+          xLabels={plotIndex ? plotIndex.xLabels : []}
+          yLabels={plotIndex ? plotIndex.yLabels : []}
           xAxes={xAxes}
           yAxes={yAxes}
           updateAxis={updateAxis}
@@ -489,7 +502,7 @@ export function DataViewer({
           splitBy={splitBy}
           setSplitBy={setSplitBy}
         />
-    ), [selectedDataAccessor, currentAccessor, xAxes, yAxes, updateAxis, updateConstraint, addAxis, removeAxis, splitBy, possibleSpliters, possibleConstraints, setSelectedDataAccessor, setSplitBy]);
+    ), [selectedDataAccessor, plotIndex, xAxes, yAxes, updateAxis, updateConstraint, addAxis, removeAxis, splitBy, possibleSpliters, possibleConstraints, setSelectedDataAccessor, setSplitBy]);
   
     if (isMobile) {
       return (
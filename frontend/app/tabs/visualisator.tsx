@@ -15,6 +15,8 @@ import { Button } from "../components/ui/button";
 import { Menu, Loader2, Info, ArrowRight, ArrowLeft, ArrowUp, ArrowDown } from "lucide-react";
 import { Separator } from "../components/ui/separator";
 import { Tooltip, TooltipContent, TooltipProvider, TooltipTrigger } from "../components/ui/tooltip";
+import { PointCloudStats, fetchPointCloudStats, getStatsPath, statsRange, valuesRange } from "../lib/pointCloudStats";
+import { BinaryPointCloud, fetchPointCloudColumns, fetchPointCloudWithGeometry, pointCloudRows } from "../lib/pointCloudBinary";
 
 const isProd: boolean = process.env.NODE_ENV === 'production';
 const isStatic: boolean = process.env.STATIC_BUILD === 'true';
@@ -79,6 +81,65 @@ const getPath = (dataset: string, error: boolean, quantity: string, radius: stri
 
 const getIndexMethod = (method: string): number => methods_indices[method] || 3;
 
+const getBinaryPath = (path: string): string => path.replace(/\.json$/, '.bin');
+
+const getShardIndexPath = (path: string): string => path.replace(/\.json$/, '/index.json');
+
+// Rows of the point clouds published whole, kept for the last few paths so that selecting another method does not fetch them again
+const tableCacheSize: number = 4;
+const tableCache: Map<string, Promise<number[][]>> = new Map();
+
+// Rows of a point cloud published whole, with every method column: its binary file (merge_pts.py --publish_format bin,
+// with the positions of the shared geometry of the shape for --split_geometry) when it was published, its JSON file otherwise.
+// The binary file is fetched whole, so its level of detail tiers (--lod) are not used: only the column shards load progressively.
+const fetchPointCloudTable = (path: string): Promise<number[][]> => {
+  let rows: Promise<number[][]> | undefined = tableCache.get(path);
+  if (!rows) {
+    rows = fetchPointCloudWithGeometry(getBinaryPath(path))
+      .then((cloud: BinaryPointCloud) => pointCloudRows(cloud, methods_indices))
+      .catch(async () => {
+        const response = await fetch(path);
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        return response.json();
+      });
+    tableCache.set(path, rows);
+    if (tableCache.size > tableCacheSize) {
+      tableCache.delete(tableCache.keys().next().value as string);
+    }
+    rows.catch(() => tableCache.delete(path));
+  }
+  return rows;
+};
+
+// Rows of a published point cloud with the columns of the given methods: only these columns from its column shards
+// (merge_pts.py --publish_format shards) when they were published, the whole point cloud otherwise (fetchPointCloudTable).
+// When the shards have level of detail tiers (merge_pts.py --lod), they are fetched one after the other (each one only
+// fetching its additional rows), and onCoarse receives the rows of every tier before the last one.
+const loadPointCloud = async (path: string, methods: string[], onCoarse: (data: number[][]) => void): Promise<number[][]> => {
+  const columnIndices: { [name: string]: number } = Object.fromEntries(methods.map((method: string) => [method, getIndexMethod(method)]));
+  const indexPath: string = getShardIndexPath(path);
+  let cloud: BinaryPointCloud;
+  try {
+    cloud = await fetchPointCloudColumns(indexPath, methods, 0);
+  } catch {
+    return fetchPointCloudTable(path);
+  }
+  const tiers = cloud.header.tiers as number[] | undefined;
+  for (let tier = 1; tiers && tier < tiers.length; tier++) {
+    onCoarse(pointCloudRows(cloud, columnIndices));
+    cloud = await fetchPointCloudColumns(indexPath, methods, tier);
+  }
+  return pointCloudRows(cloud, columnIndices);
+};
+
+// Range of a method column, from the statistics sidecar when it was published, from the points otherwise
+const getDataRange = (data: number[][], stats: PointCloudStats | null, method: string): [number, number] | null => {
+  const index: number = getIndexMethod(method);
+  return statsRange(stats, method) ?? valuesRange(data.map((point: number[]) => point[index]));
+};
+
 interface CameraState {
   position: Vector3;
   target: Vector3;
@@ -649,6 +710,8 @@ const VisualisatorContent: React.FC<VisualisatorProps> = ({ className, ...props
   const [pointSize, setPointSize] = useState<number>(0.01);
   const [pointCloudDataLeft, setPointCloudDataLeft] = useState<number[][]>([]);
   const [pointCloudDataRight, setPointCloudDataRight] = useState<number[][]>([]);
+  const [pointCloudStatsLeft, setPointCloudStatsLeft] = useState<PointCloudStats | null>(null);
+  const [pointCloudStatsRight, setPointCloudStatsRight] = useState<PointCloudStats | null>(null);
   const [isMobile, setIsMobile] = useState<boolean>(false);
   const [isLoading, setIsLoading] = useState<boolean>(false);
   const [minMaxLeft, setMinMaxLeft] = useState<[number, number]>([0, 10]);
@@ -662,28 +725,22 @@ const VisualisatorContent: React.FC<VisualisatorProps> = ({ className, ...props
   const leftControlsRef = useRef<OrbitControls | null>(null);
   const rightControlsRef = useRef<OrbitControls | null>(null);
   const isUpdatingRef = useRef<boolean>(false);
+  // Number of the last load of the point clouds, the results of the previous ones (still streaming their tiers) are dropped
+  const loadIdRef = useRef<number>(0);
 
   const globalMin: number = Math.min(minMaxLeft[0], minMaxRight[0]);
   const globalMax: number = Math.max(minMaxLeft[1], minMaxRight[1]);
 
-  const getMinMaxValues = useCallback((data: number[][], index: number): [number, number] => {
+  const getMinMaxValues = useCallback((data: number[][], stats: PointCloudStats | null, method: string): [number, number] => {
     if (data.length === 0) return [0, 0];
-    
-    const values: number[] = data
-      .map((point: number[]) => point[index])
-      .filter((value: number) => typeof value === "number" && !isNaN(value));
-
-    if (values.length === 0) return [0, 0];
-    
-    const limitedValues: number[] = values.slice(0, 100000);
-    return [Math.min(...limitedValues), Math.max(...limitedValues)];
+    return getDataRange(data, stats, method) ?? [0, 0];
   }, []);
 
   const updateMinMaxValues = useCallback((): void => {
       if (pointCloudDataLeft.length === 0 || pointCloudDataRight.length === 0) return;
 
-      const [minLeftData, maxLeftData] = getMinMaxValues(pointCloudDataLeft, getIndexMethod(selectedLeft));
-      const [minRightData, maxRightData] = getMinMaxValues(pointCloudDataRight, getIndexMethod(selectedRight));
+      const [minLeftData, maxLeftData] = getMinMaxValues(pointCloudDataLeft, pointCloudStatsLeft, selectedLeft);
+      const [minRightData, maxRightData] = getMinMaxValues(pointCloudDataRight, pointCloudStatsRight, selectedRight);
 
       const { minClamped: minLeft, maxClamped: maxLeft, wasClamped: clampedLeft } =
         clampMinMaxPositive(minLeftData, maxLeftData, 100000000);
@@ -736,53 +793,60 @@ const VisualisatorContent: React.FC<VisualisatorProps> = ({ className, ...props
           right: [minRightData, maxRightData],
         });
       }
-    }, [pointCloudDataLeft, pointCloudDataRight, selectedLeft, selectedRight, getMinMaxValues]);
+    }, [pointCloudDataLeft, pointCloudDataRight, pointCloudStatsLeft, pointCloudStatsRight, selectedLeft, selectedRight, getMinMaxValues]);
 
   useEffect(() => {
     updateMinMaxValues();
-  }, [pointCloudDataLeft, pointCloudDataRight, selectedLeft, selectedRight]);
+  }, [pointCloudDataLeft, pointCloudDataRight, pointCloudStatsLeft, pointCloudStatsRight, selectedLeft, selectedRight]);
 
   const squeezeColorRange = useCallback((isLeft: boolean) => {
     if (isLeft && pointCloudDataLeft.length > 0) {
-      const index = getIndexMethod(selectedLeft);
-      const values = pointCloudDataLeft.map(p => p[index]).filter(v => !isNaN(v));
-      if (values.length > 0) {
-        var min_value = Math.min(...values);
-        var max_value = Math.max(...values);
-        min_value = Math.max(min_value, globalMin);
-        max_value = Math.min(max_value, 100000000);
+      const range = getDataRange(pointCloudDataLeft, pointCloudStatsLeft, selectedLeft);
+      if (range) {
+        var min_value = Math.max(range[0], globalMin);
+        var max_value = Math.min(range[1], 100000000);
         setColorRangeLeft([min_value, max_value]);
       }
     } else if (!isLeft && pointCloudDataRight.length > 0) {
-      const index = getIndexMethod(selectedRight);
-      const values = pointCloudDataRight.map(p => p[index]).filter(v => !isNaN(v));
-      if (values.length > 0) {
-        var min_value = Math.min(...values);
-        var max_value = Math.max(...values);
-        min_value = Math.max(min_value, globalMin);
-        max_value = Math.min(max_value, 100000000);
+      const range = getDataRange(pointCloudDataRight, pointCloudStatsRight, selectedRight);
+      if (range) {
+        var min_value = Math.max(range[0], globalMin);
+        var max_value = Math.min(range[1], 100000000);
         setColorRangeRight([min_value, max_value]);
       }
     }
-  }, [pointCloudDataLeft, pointCloudDataRight, selectedLeft, selectedRight]);
+  }, [pointCloudDataLeft, pointCloudDataRight, pointCloudStatsLeft, pointCloudStatsRight, selectedLeft, selectedRight]);
 
   const loadPointCloudData = useCallback(async (): Promise<void> => {
+    const loadId: number = ++loadIdRef.current;
+    const isCurrent = (): boolean => loadIdRef.current === loadId;
     setIsLoading(true);
     try {
       const leftPath: string = getPath(selectedDataset, displayLeftError, selectedQuantity, leftRadius, selectedShape);
       const rightPath: string = getPath(selectedDataset, displayRightError, selectedQuantity, rightRadius, selectedShape);
 
-      const [leftResponse, rightResponse] = await Promise.all([fetch(leftPath), fetch(rightPath)]);
-
-      if (!leftResponse.ok || !rightResponse.ok) {
-        throw new Error(`HTTP error! status: ${leftResponse.status} or ${rightResponse.status}`);
-      }
+      // The coarse level of detail tiers are shown, once both sides have one, while the rest of the points is fetched
+      const coarseSides: Set<string> = new Set();
+      const showCoarse = (side: string, setData: (data: number[][]) => void) => (data: number[][]): void => {
+        if (!isCurrent()) return;
+        setData(data);
+        coarseSides.add(side);
+        if (coarseSides.size === 2) setIsLoading(false);
+      };
 
-      const leftData: number[][] = await leftResponse.json();
-      const rightData: number[][] = await rightResponse.json();
+      // Only the column of the selected method of each side is fetched from the column shards (the others stay cached)
+      const [leftData, rightData, leftStats, rightStats] = await Promise.all([
+        loadPointCloud(leftPath, [selectedLeft], showCoarse("left", setPointCloudDataLeft)),
+        loadPointCloud(rightPath, [selectedRight], showCoarse("right", setPointCloudDataRight)),
+        fetchPointCloudStats(getStatsPath(leftPath)),
+        fetchPointCloudStats(getStatsPath(rightPath)),
+      ]);
+      if (!isCurrent()) return;
 
       setPointCloudDataLeft(leftData);
       setPointCloudDataRight(rightData);
+      setPointCloudStatsLeft(leftStats);
+      setPointCloudStatsRight(rightStats);
 
       if (cameraStateRef.current) {
         [leftControlsRef, rightControlsRef].forEach((ref: React.MutableRefObject<OrbitControls | null>) => {
@@ -795,13 +859,16 @@ const VisualisatorContent: React.FC<VisualisatorProps> = ({ className, ...props
         });
       }
     } catch (error) {
+      if (!isCurrent()) return;
       console.error("Error loading point cloud data:", error);
       setPointCloudDataLeft([]);
       setPointCloudDataRight([]);
+      setPointCloudStatsLeft(null);
+      setPointCloudStatsRight(null);
     } finally {
-      setIsLoading(false);
+      if (isCurrent()) setIsLoading(false);
     }
-  }, [selectedDataset, selectedShape, selectedQuantity, displayLeftError, displayRightError, leftRadius, rightRadius]);
+  }, [selectedDataset, selectedShape, selectedQuantity, selectedLeft, selectedRight, displayLeftError, displayRightError, leftRadius, rightRadius]);
 
   useEffect(() => {
     const checkIsMobile = (): void => setIsMobile(window.innerWidth < 768);
@@ -816,7 +883,7 @@ const VisualisatorContent: React.FC<VisualisatorProps> = ({ className, ...props
 
   useEffect(() => {
     loadPointCloudData();
-  }, [selectedShape, selectedQuantity, displayLeftError, displayRightError, leftRadius, rightRadius, loadPointCloudData]);
+  }, [selectedShape, selectedQuantity, selectedLeft, selectedRight, displayLeftError, displayRightError, leftRadius, rightRadius, loadPointCloudData]);
 
   useEffect(() => {
     if (selectedDataset === "CAD" || selectedDataset === "CAD_helios") {
@@ -1,3 +1,4 @@
+// Conversion historique : tools/merge_pts.py --publish applique désormais ces mêmes règles et écrit directement public/data.
 import fs from 'fs';
 import path from 'path';
 import { fileURLToPath } from 'url';
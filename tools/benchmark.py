@@ -0,0 +1,350 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+import traceback
+
+import numpy as np
+
+import merge_pts as mp
+
+# Benchmark of the Python tools on synthetic data:
+#   python benchmark.py run --sizes 10k 100k --output bench.json
+#   python benchmark.py compare old.json new.json
+#   python benchmark.py check
+# The data of each size is generated once in <work_dir>/<size> and reused by the next runs:
+#   - a ground truth and estimation / error .pts tree laid out like the results (see merge_pts.estimation_paths),
+#     one shape of <size> points and one file per method, with the columns of merge_pts.quantities_n_idx and directions_n_idx,
+#   - .dat statistics files of two datasets read by toolbox.open_data_all, with dat_rows_per_point rows per point
+#     (a row of statistics sums up many points).
+# Each case runs in its own process, so that its peak memory is its own, and the best time of the repeats is kept.
+
+benchmark_version = 1
+
+size_presets = ["10k", "100k", "1M", "5M"]
+default_sizes = ["10k", "100k"]
+
+# Number of columns of the generated .pts files, as in the estimation files (up to the dMax direction)
+pts_columns = 16
+dat_rows_per_point = 0.01
+dat_datasets = ["Implicit", "CAD"]
+dat_shapes = ["torus", "goursat-hole", "selle", "sphere9"]
+generated_marker = ".generated.json"
+
+# Cases timed (see run_case)
+cases = ["merge_files", "merge_files_error", "open_data_all", "open_data_all_compact", "clean_data", "aggregate_cube", "create_subplots"]
+
+# A relative slowdown (or memory increase) above the threshold is flagged by compare
+default_threshold = 0.10
+
+# Parses a number of points such as 100k or 5M
+def parse_count(text):
+    units = {"K": 1000, "M": 1000 ** 2, "G": 1000 ** 3}
+    text = text.strip().upper()
+    if text[-1:] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+# Writes a .pts file: the positions (already rounded, so their tokens match across files) then the values
+def write_pts(path, positions, values):
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    np.savetxt(path, np.column_stack([positions, values]), fmt="%.6f")
+
+# Generates the .pts trees of merge_pts: <data_dir>/gt/dataset_implicit/<shape>.pts and, for the estimations and the errors,
+# <data_dir>/<kind>/DGtal/r0.1/<method>/allErrorStats-<shape>_<method>_0.1_<kind>.pts.
+# The estimation files list the points in another order and miss some of them, as the real ones.
+def generate_pts(data_dir, points, seed=0):
+    rng = np.random.default_rng(seed)
+    shape = "torus"
+    angles = rng.uniform(0, 2 * np.pi, (points, 2))
+    positions = np.column_stack([(1 + 0.4 * np.cos(angles[:, 1])) * np.cos(angles[:, 0]),
+                                 (1 + 0.4 * np.cos(angles[:, 1])) * np.sin(angles[:, 0]),
+                                 0.4 * np.sin(angles[:, 1])]).round(6)
+    groundtruth = rng.normal(size=(points, pts_columns - 3))
+    write_pts(os.path.join(data_dir, "gt", "dataset_implicit", shape + ".pts"), positions, groundtruth)
+    for kind in ["estim", "error"]:
+        for method, _ in mp.methods:
+            kept = rng.permutation(points)[:points - points // 100]
+            values = groundtruth[kept] + rng.normal(scale=0.01, size=(len(kept), pts_columns - 3))
+            if kind == "error":
+                values = np.abs(values - groundtruth[kept])
+            write_pts(os.path.join(data_dir, kind, "DGtal", "r0.1", method, f"allErrorStats-{shape}_{method}_0.1_{kind}.pts"),
+                      positions[kept], values)
+
+# Generates the .dat statistics files of toolbox: <data_dir>/dat/<dataset>/allErrorStats-<shape>.dat with the columns of toolbox.headers
+def generate_dat(data_dir, rows, seed=0):
+    import methods as m
+    rng = np.random.default_rng(seed)
+    columns = 39
+    per_file = max(1, rows // (len(dat_datasets) * len(dat_shapes)))
+    for dataset in dat_datasets:
+        output_dir = os.path.join(data_dir, "dat", dataset)
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        for shape in dat_shapes:
+            values = rng.uniform(0, 1, (per_file, columns))
+            values[:, 0] = rng.choice([5000, 10000, 25000, 50000], per_file)
+            values[:, 1] = rng.choice([0.01, 0.02, 0.05, 0.1], per_file)
+            values[:, 2] = rng.choice([0.0, 0.1, 0.2], per_file)
+            method = rng.choice(m.all_methods, per_file)
+            with open(os.path.join(output_dir, f"allErrorStats-{shape}.dat"), 'w') as f:
+                f.write("\n".join(" ".join(f"{value:.6g}" for value in row) + " " + name for row, name in zip(values.tolist(), method)) + "\n")
+
+# Generates the data of a size in <work_dir>/<size> unless it is already there
+def generate(work_dir, size, seed=0):
+    data_dir = os.path.join(work_dir, size)
+    marker = os.path.join(data_dir, generated_marker)
+    points = parse_count(size)
+    description = {"version": benchmark_version, "points": points, "seed": seed, "pts_columns": pts_columns, "dat_rows_per_point": dat_rows_per_point}
+    if os.path.exists(marker):
+        with open(marker, 'r') as f:
+            if json.load(f) == description:
+                return data_dir
+    print(f"[BENCHMARK] Generating {size} points in {data_dir}")
+    generate_pts(data_dir, points, seed)
+    generate_dat(data_dir, max(1, int(points * dat_rows_per_point)), seed)
+    with open(marker, 'w') as f:
+        json.dump(description, f)
+    return data_dir
+
+def files_rows_bytes(paths):
+    rows = 0
+    size = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            rows += sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b""))
+        size += os.path.getsize(path)
+    return rows, size
+
+def pts_inputs(data_dir, kind):
+    estimations = mp.estimation_paths(os.path.join(data_dir, kind, "DGtal"))
+    groundtruths = mp.groundtruth_paths(estimations, os.path.join(data_dir, "gt", "dataset_implicit"))
+    paths = list(groundtruths.values()) + [path for files in estimations.values() for path in files.values()]
+    return groundtruths, estimations, paths
+
+def dat_frame(data_dir, compact=False):
+    import toolbox
+    import pandas as pd
+    frames = [toolbox.open_data_all(os.path.join(data_dir, "dat", dataset), added_param=[("dataset", dataset)], compact=compact) for dataset in dat_datasets]
+    return toolbox.concat_data(frames) if compact else pd.concat(frames)
+
+def dat_paths(data_dir):
+    return [os.path.join(data_dir, "dat", dataset, f"allErrorStats-{shape}.dat") for dataset in dat_datasets for shape in dat_shapes]
+
+# Runs a case in this process, returns its result with the time of the timed part only
+def run_case(case, data_dir, output_dir):
+    rows, size = None, None
+    if case == "merge_files":
+        groundtruths, estimations, paths = pts_inputs(data_dir, "estim")
+        rows, size = files_rows_bytes(paths)
+        timed = lambda: mp.merge_files(groundtruths, estimations, 4, output_dir)
+    elif case == "merge_files_error":
+        groundtruths, errors, paths = pts_inputs(data_dir, "error")
+        rows, size = files_rows_bytes(paths)
+        timed = lambda: mp.merge_files_error(groundtruths, errors, 5, 4, output_dir)
+    elif case == "open_data_all":
+        import toolbox
+        rows, size = files_rows_bytes(dat_paths(data_dir))
+        timed = lambda: dat_frame(data_dir)
+    elif case == "open_data_all_compact":
+        import toolbox
+        rows, size = files_rows_bytes(dat_paths(data_dir))
+        timed = lambda: dat_frame(data_dir, compact=True)
+    elif case == "clean_data":
+        import toolbox
+        frame = dat_frame(data_dir)
+        rows = len(frame)
+        timed = lambda: toolbox.clean_data(frame)
+    elif case == "aggregate_cube":
+        import toolbox
+        frame = toolbox.clean_data(dat_frame(data_dir))
+        rows = len(frame)
+        timed = lambda: toolbox.aggregate_cube(frame)
+    elif case == "create_subplots":
+        import toolbox
+        import visualization_tools as vt
+        import methods as m
+        frame = toolbox.clean_data(dat_frame(data_dir))
+        rows = len(frame)
+        colors = {method: vt.random_color[i % len(vt.random_color)] for i, method in enumerate(m.all_methods)}
+        subplot_rows = [("Noise position", [0.0, 0.1], "Radius", "Radius")]
+        subplot_cols = [("N", [5000, 10000, 25000, 50000], "Mean curvature (mean)", "Mean curvature"),
+                        ("N", [5000, 10000, 25000, 50000], "normal mean", "Normal")]
+        timed = lambda: vt.create_subplots(frame, subplot_rows, subplot_cols, "Method", colors, split_by="dataset")
+    else:
+        raise ValueError("Unknown case " + case)
+    baseline = mp.peak_rss()
+    start = time.perf_counter()
+    timed()
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "bytes": size, "seconds": seconds, "baseline_rss": baseline, "peak_rss": mp.peak_rss()}
+
+# Runs a case in a new process, its logs are dropped. Returns its result, with a status "ok", "skipped"
+# (a dependency of the case is missing) or "failed".
+def spawn_case(case, data_dir, output_dir):
+    process = subprocess.run([sys.executable, os.path.abspath(__file__), "case", case, data_dir, output_dir],
+                             capture_output=True, text=True)
+    lines = process.stdout.strip().splitlines()
+    if process.returncode != 0 or len(lines) == 0:
+        error = (process.stderr.strip().splitlines() or ["exit code " + str(process.returncode)])[-1]
+        return {"status": "failed", "error": error}
+    return json.loads(lines[-1])
+
+# Runs every case on every size, repeat times each, and returns the results
+def run_benchmark(sizes, work_dir, selected_cases=None, repeat=1, seed=0):
+    results = []
+    for size in sizes:
+        data_dir = generate(work_dir, size, seed)
+        output_dir = os.path.join(data_dir, "output")
+        for case in selected_cases or cases:
+            runs = [spawn_case(case, data_dir, output_dir) for _ in range(repeat)]
+            ok = [run for run in runs if run["status"] == "ok"]
+            result = {"case": case, "size": size, "points": parse_count(size), "status": runs[0]["status"] if len(ok) == 0 else "ok"}
+            if len(ok) == 0:
+                result["error"] = runs[0].get("error")
+            else:
+                best = min(ok, key=lambda run: run["seconds"])
+                result.update({key: best[key] for key in ["rows", "bytes", "seconds", "baseline_rss"]})
+                result["peak_rss"] = max(run["peak_rss"] for run in ok) if all(run["peak_rss"] is not None for run in ok) else None
+                result["rows_per_s"] = best["rows"] / best["seconds"] if best["seconds"] > 0 else None
+                result["mb_per_s"] = best["bytes"] / (1 << 20) / best["seconds"] if best["bytes"] is not None and best["seconds"] > 0 else None
+            print_result(result)
+            results.append(result)
+    return results
+
+def print_result(result):
+    if result["status"] != "ok":
+        print(f"{result['case']:<21} {result['size']:>6}  {result['status']}: {result.get('error')}")
+        return
+    throughput = f"{result['rows_per_s']:12.0f} rows/s" if result["rows_per_s"] is not None else " " * 19
+    bandwidth = f"{result['mb_per_s']:8.1f} MB/s" if result["mb_per_s"] is not None else " " * 13
+    memory = f"{result['peak_rss'] / (1 << 20):8.0f} MB peak" if result["peak_rss"] is not None else ""
+    print(f"{result['case']:<21} {result['size']:>6} {result['seconds']:9.3f} s {throughput} {bandwidth} {memory}")
+
+def write_results(path, results):
+    try:
+        import pandas as pd
+        pandas_version = pd.__version__
+    except ImportError:
+        pandas_version = None
+    report = {
+        "version": benchmark_version,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pandas_version,
+        "results": results,
+    }
+    if os.path.dirname(path) != "" and not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=1)
+
+# Compares the results of two runs, case by case and size by size.
+# Returns the list of (case, size, what, old, new) whose time or peak memory grew by more than the thresholds.
+def compare_results(old, new, threshold=default_threshold, memory_threshold=default_threshold):
+    old_results = {(result["case"], result["size"]): result for result in old["results"] if result["status"] == "ok"}
+    regressions = []
+    print(f"{'case':<21} {'size':>6} {'old s':>9} {'new s':>9} {'ratio':>7} {'old MB':>8} {'new MB':>8}")
+    for result in new["results"]:
+        key = (result["case"], result["size"])
+        if result["status"] != "ok" or key not in old_results:
+            print(f"{key[0]:<21} {key[1]:>6}  not compared ({result['status']}{', no previous result' if key not in old_results else ''})")
+            continue
+        before = old_results[key]
+        ratio = result["seconds"] / before["seconds"] if before["seconds"] > 0 else float("inf")
+        flags = []
+        if ratio > 1 + threshold:
+            flags.append("SLOWER")
+            regressions.append((key[0], key[1], "seconds", before["seconds"], result["seconds"]))
+        megabytes = lambda rss: f"{rss / (1 << 20):8.0f}" if rss is not None else f"{'-':>8}"
+        if before.get("peak_rss") and result.get("peak_rss") and result["peak_rss"] > before["peak_rss"] * (1 + memory_threshold):
+            flags.append("MORE MEMORY")
+            regressions.append((key[0], key[1], "peak_rss", before["peak_rss"], result["peak_rss"]))
+        print(f"{key[0]:<21} {key[1]:>6} {before['seconds']:9.3f} {result['seconds']:9.3f} {ratio:7.2f} "
+              f"{megabytes(before.get('peak_rss'))} {megabytes(result.get('peak_rss'))}  {' '.join(flags)}")
+    return regressions
+
+def load_results(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Checks the errors computed by merge_pts (--compute_errors --angular_errors) on the generated data of a size: with the
+# ground truth given as the estimation of every method (a perfect estimator), every error must be 0.
+# Returns the list of (error_mode, quantity, largest error) of the quantities with a non-zero error.
+def check_errors(work_dir, size, seed=0):
+    data_dir = generate(work_dir, size, seed)
+    groundtruths, _, _ = pts_inputs(data_dir, "estim")
+    estimations = {shape: {method: path for method, _ in mp.methods} for shape, path in groundtruths.items()}
+    failures = []
+    for error_mode in ["abs", "relative"]:
+        output_dir = os.path.join(data_dir, "check", error_mode)
+        for shape, groundtruth in groundtruths.items():
+            merges = mp.shape_merges(shape, estimations, None, os.path.join(output_dir, "estims"), os.path.join(output_dir, "errors"),
+                                     compute_errors=True, angular_errors=True)
+            mp.merge_shape(shape, groundtruth, merges, error_mode=error_mode)
+            for quantity in [name for name, _ in mp.quantities_n_idx] + [name for name, _ in mp.directions_n_idx]:
+                errors = np.loadtxt(os.path.join(output_dir, "errors", quantity, shape + ".pts"), ndmin=2)[:, 4:]
+                largest = np.nanmax(errors) if errors.size > 0 else 0.0
+                print(f"{error_mode:<8} {quantity:<7} {shape:<12} largest error {largest:.3g}")
+                if not largest == 0:
+                    failures.append((error_mode, quantity, largest))
+    return failures
+
+
+if __name__ == '__main__' :
+    parser = argparse.ArgumentParser(description='Benchmark the Python tools on synthetic data.')
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help='Run the benchmark and write its results.')
+    run_parser.add_argument('--sizes', type=str, nargs='+', default=default_sizes, help='Numbers of points of the generated shapes (presets: ' + " ".join(size_presets) + ').')
+    run_parser.add_argument('--cases', type=str, nargs='+', default=cases, choices=cases, help='Cases to run.')
+    run_parser.add_argument('--work_dir', type=str, default="benchmark_data", help='Directory of the generated data, reused by the next runs.')
+    run_parser.add_argument('--output', type=str, default="benchmark.json", help='Results file.')
+    run_parser.add_argument('--repeat', type=int, default=1, help='Runs of each case, the best time is kept.')
+    run_parser.add_argument('--seed', type=int, default=0, help='Seed of the generated data.')
+    compare_parser = subparsers.add_parser("compare", help='Compare the results of two runs and flag the regressions.')
+    compare_parser.add_argument('old', type=str, help='Results of the reference run.')
+    compare_parser.add_argument('new', type=str, help='Results of the new run.')
+    compare_parser.add_argument('--threshold', type=float, default=default_threshold, help='Relative slowdown flagged as a regression.')
+    compare_parser.add_argument('--memory_threshold', type=float, default=default_threshold, help='Relative peak memory increase flagged as a regression.')
+    check_parser = subparsers.add_parser("check", help='Check that a perfect estimator (the ground truth itself) gets zero computed errors.')
+    check_parser.add_argument('--size', type=str, default=default_sizes[0], help='Number of points of the generated shape.')
+    check_parser.add_argument('--work_dir', type=str, default="benchmark_data", help='Directory of the generated data, reused by the next runs.')
+    check_parser.add_argument('--seed', type=int, default=0, help='Seed of the generated data.')
+    # Runs a single case in this process and prints its result as the last line (used by run)
+    case_parser = subparsers.add_parser("case")
+    case_parser.add_argument('case', type=str, choices=cases)
+    case_parser.add_argument('data_dir', type=str)
+    case_parser.add_argument('output_dir', type=str)
+    args = parser.parse_args()
+
+    if args.command == "case" :
+        try:
+            result = run_case(args.case, args.data_dir, args.output_dir)
+            result["status"] = "ok"
+        except ImportError as error:
+            result = {"status": "skipped", "error": str(error)}
+        except Exception:
+            result = {"status": "failed", "error": traceback.format_exc().strip().splitlines()[-1]}
+        print(json.dumps(result))
+    elif args.command == "run" :
+        results = run_benchmark(args.sizes, args.work_dir, args.cases, args.repeat, args.seed)
+        write_results(args.output, results)
+        print(f"Results written to {args.output}")
+    elif args.command == "check" :
+        failures = check_errors(args.work_dir, args.size, args.seed)
+        if len(failures) > 0 :
+            print(f"\n{len(failures)} non-zero error(s) for a perfect estimator")
+            sys.exit(1)
+        print("\nPerfect estimator: every error is 0")
+    else :
+        regressions = compare_results(load_results(args.old), load_results(args.new), args.threshold, args.memory_threshold)
+        if len(regressions) > 0 :
+            print(f"\n{len(regressions)} regression(s)")
+            sys.exit(1)
+        print("\nNo regression")
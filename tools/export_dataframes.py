@@ -0,0 +1,314 @@
+import os
+import re
+import ast
+import json
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import toolbox as tb
+
+# Dataframes of the data viewer of the website (frontend/app/tabs/dataViewer.tsx), the port of the former
+# createLightDataframes.ipynb notebook, which this script replaces.
+# Each experiment is written as JSON assets loaded on demand by frontend/app/datatools/plotDataAssets.ts:
+#   - <output>/<experiment>/index.json: the xLabels, yLabels, dividers, constraints and colorMap of the experiment,
+#     and in "files" the name of the data file of each constraint,
+#   - <output>/<experiment>/<constraint file>: the series of the constraint, keyed as in the former dataframes/*.tsx
+#     modules ("<constraint>_<x label>_<y label>[_<divider>]"), each series being {method: [x values, y means]}.
+# The viewer only fetches the index and the constraints it plots, instead of bundling every series.
+
+experiments = ["CAD", "DGTal", "DGTal_Numerical", "PCPNet"]
+
+# Names of the y labels in the viewer (DGTal_Numerical keeps the names of the columns)
+y_label_names = {
+    "Nb neighbors (mean)": "Neighbors count",
+    "Mean curvature (mean)": "RMSE Mean curvature",
+    "Gaussian curvature (mean)": "RMSE Gaussian curvature",
+    "K1 mean": "RMSE Min curvature",
+    "K2 mean": "RMSE Max curvature",
+    "D1 mean": "RMSAE Min direction",
+    "D2 mean": "RMSAE Max direction",
+    "pos mean": "RMSE Position",
+    "iShape mean": "RMSE Shape Index",
+    "normal mean": "RMSAE Normal",
+    "Timings (mean)": "Timings (ms)",
+    "non_stable_ratio": "Non-stable ratio",
+}
+
+# matplotlib tab20 colormap, the color of a method is the one at its index in the methods kept by tb.methods
+# (the last one past the 20 colors, as matplotlib does)
+tab20 = [(31, 119, 180), (174, 199, 232), (255, 127, 14), (255, 187, 120), (44, 160, 44), (152, 223, 138), (214, 39, 40),
+         (255, 152, 150), (148, 103, 189), (197, 176, 213), (140, 86, 75), (196, 156, 148), (227, 119, 194), (247, 182, 210),
+         (127, 127, 127), (199, 199, 199), (188, 189, 34), (219, 219, 141), (23, 190, 207), (158, 218, 229)]
+
+def color_map(methods):
+    return {method: "rgba({}, {}, {}, 1)".format(*tab20[min(i, len(tab20) - 1)]) for i, method in enumerate(methods)}
+
+# Statistics of the experiments, in the directories of stats_dir (stats_implicit, stats_CAD and stats_PCPNet of the former notebook,
+# whose flip/ and outlier/ directories hold the "outlier" and "flip" datasets)
+implicit_dirs = [
+    ("double/implicit", [["expe", "DGTal"], ["type", "double"], ["dataset", "implicit"]]),
+    ("double/flip", [["expe", "DGTal"], ["type", "double"], ["dataset", "outlier"]]),
+    ("double/outlier", [["expe", "DGTal"], ["type", "double"], ["dataset", "flip"]]),
+    ("double/implicit_helios", [["expe", "DGTal"], ["type", "double"], ["dataset", "helios"]]),
+    ("float/implicit", [["expe", "DGTal"], ["type", "float"], ["dataset", "implicit"]]),
+]
+CAD_dirs = [
+    ("double/CAD", [["expe", "CAD"], ["type", "double"], ["dataset", "CAD"], ["struct", "kD-Tree"]]),
+    ("double/CAD_helios", [["expe", "CAD"], ["type", "double"], ["dataset", "helios"], ["struct", "kD-Tree"]]),
+    ("double/CAD_kNNgraph", [["expe", "CAD"], ["type", "double"], ["dataset", "CAD"], ["struct", "kNN-graph"]]),
+    ("double/CAD_helios_kNNgraph", [["expe", "CAD"], ["type", "double"], ["dataset", "helios"], ["struct", "kNN-graph"]]),
+]
+PCPNet_dirs = [
+    ("double/PCPNet/testset_no_noise", [["expe", "PCPNet"], ["type", "double"], ["noise_type", "no"]]),
+    ("double/PCPNet/testset_low_noise", [["expe", "PCPNet"], ["type", "double"], ["noise_type", "low"]]),
+    ("double/PCPNet/testset_med_noise", [["expe", "PCPNet"], ["type", "double"], ["noise_type", "med"]]),
+    ("double/PCPNet/testset_high_noise", [["expe", "PCPNet"], ["type", "double"], ["noise_type", "high"]]),
+    ("double/PCPNet/testset_vardensity_gradient", [["expe", "PCPNet"], ["type", "double"], ["noise_type", "gradient"]]),
+    ("double/PCPNet/testset_vardensity_striped", [["expe", "PCPNet"], ["type", "double"], ["noise_type", "striped"]]),
+]
+# Position noise level of the PCPNet test sets (-1 for the variable density ones)
+PCPNet_noise_position = {"no": 0, "low": 1, "med": 2, "high": 3}
+
+stats_dirs = {"CAD": CAD_dirs, "DGTal": implicit_dirs, "DGTal_Numerical": implicit_dirs, "PCPNet": PCPNet_dirs}
+
+def open_stats(stats_dir, dirs, cache_dir=None, workers=None):
+    data_list = []
+    for directory, added_param in dirs:
+        data_list.append(tb.open_data_all(os.path.join(stats_dir, directory), added_param=added_param, recursive=False,
+                                          workers=workers, cache_dir=cache_dir))
+    return pd.concat(data_list).reset_index(drop=True)
+
+# Noise classes, timings in milliseconds and methods kept by tb.methods, as prepared by the former notebook for every experiment
+def prepare_stats(data):
+    if "noise_type" in data.columns:
+        data["Noise position"] = data["noise_type"].astype("object").map(PCPNet_noise_position).astype("float64").fillna(-1)
+        data = data.rename(columns={"Radius": "kNN"})
+
+    # Class of a noise: its index in the order of appearance of the noises, NaN for the rows without noise value
+    position_class = pd.factorize(data["Noise position"])[0]
+    normal_class = pd.factorize(data["Noise normal"])[0]
+    data["Noise position class"] = np.where(position_class >= 0, position_class, np.nan)
+    data["Noise normal class"] = np.where(normal_class >= 0, normal_class, np.nan)
+    data["Noise class"] = np.where((position_class == normal_class) & (position_class >= 0), position_class, -1).astype("float64")
+
+    # Timings (mean) from nanosecond to millisecond
+    data["Timings (mean)"] = data["Timings (mean)"] / 1e6
+
+    all_methods = tb.methods(data, True)[0]
+    return data[data["Method"].isin(all_methods)], color_map(all_methods)
+
+# Experiments of the viewer: the rows of the experiment, with its constraint columns added, its labels and its constraints
+# (column, values, description), as in createCAD_tsx, createImplicit_tsx, createNumerical_tsx and createPCPNet_tsx
+def CAD_dataframes(data):
+    data = data[data["expe"] == "CAD"].copy()
+    for dataset, name in [("helios", "Helios"), ("CAD", "CAD")]:
+        for struct in ["kD-Tree", "kNN-graph"]:
+            rows = (data["dataset"] == dataset) & (data["struct"] == struct)
+            data.loc[rows & (data["Noise normal"] == 0), "noise"] = f"{name} no noise {struct}"
+            data.loc[rows & (data["Noise normal"] != 0), "noise"] = f"{name} noise {struct}"
+
+    constraints = [
+        ("noise", data["noise"].unique(), "all"),
+        ("noise", ["CAD no noise kD-Tree"], "No noise kD-Tree"),
+        ("noise", ["Helios no noise kD-Tree"], "Helios kD-Tree"),
+        ("noise", ["CAD noise kD-Tree"], "Noise normal kD-Tree"),
+        ("noise", ["Helios noise kD-Tree"], "Helios + noise normal kD-Tree"),
+        ("noise", ["CAD no noise kNN-graph"], "No noise kNN-graph"),
+        ("noise", ["Helios no noise kNN-graph"], "Helios kNN-graph"),
+        ("noise", ["CAD noise kNN-graph"], "Noise normal kNN-graph"),
+        ("noise", ["Helios noise kNN-graph"], "Helios + noise normal kNN-graph"),
+    ]
+    x_labels = ["Radius", "Noise normal", "Shape", "struct"]
+    y_labels = ["N", "Nb neighbors (mean)", "normal mean", "Timings (mean)", "non_stable_ratio"]
+    return data, x_labels, y_labels, [], constraints, y_label_names
+
+def DGTal_dataframes(data):
+    data = data[(data["expe"] == "DGTal") & (data["type"] == "double")].copy()
+    implicit = data["dataset"] == "implicit"
+    helios = data["dataset"] == "helios"
+    data.loc[data["dataset"] == "flip", "noise"] = "flip"
+    data.loc[data["dataset"] == "outlier", "noise"] = "outlier"
+    data.loc[implicit & (data["Noise class"] == 0), "noise"] = "no noise"
+    data.loc[implicit & (data["Noise class"] != 0), "noise"] = "noise"
+    data.loc[implicit & (data["Noise normal"] == 0), "noise precision"] = "noise position"
+    data.loc[implicit & (data["Noise position"] == 0), "noise precision"] = "noise normal"
+    data.loc[helios & (data["Noise class"] == 0), "noise"] = "Helios no noise"
+    data.loc[helios & (data["Noise class"] != 0), "noise"] = "Helios noise"
+
+    constraints = [
+        ("noise", data["noise"].unique(), "all"),
+        ("noise", ["no noise"], "No noise"),
+        ("noise", ["noise"], "Noise"),
+        ("noise precision", ["noise position"], "Noise position"),
+        ("noise precision", ["noise normal"], "Noise normal"),
+        ("noise", ["Helios no noise"], "Helios no noise"),
+        ("noise", ["Helios noise"], "Helios normal noise"),
+        ("dataset", ["flip"], "Flip"),
+        ("dataset", ["outlier"], "Outlier"),
+    ]
+    x_labels = ["Radius", "Noise position", "Noise class", "Noise normal", "flip-normal", "Shape"]
+    y_labels = ["N", "Nb neighbors (mean)", "Mean curvature (mean)", "Gaussian curvature (mean)", "K1 mean", "K2 mean", "D1 mean",
+                "D2 mean", "pos mean", "iShape mean", "normal mean", "Timings (mean)", "non_stable_ratio"]
+    return data, x_labels, y_labels, [], constraints, y_label_names
+
+def DGTal_Numerical_dataframes(data):
+    data = data[data["expe"] == "DGTal"].copy()
+    for precision in ["double", "float"]:
+        implicit = (data["type"] == precision) & (data["dataset"] == "implicit")
+        data.loc[implicit & (data["Noise class"] == 0), f"{precision} noise"] = f"no noise {precision}"
+        data.loc[implicit & (data["Noise class"] != 0), f"{precision} noise"] = f"noise {precision}"
+        data.loc[implicit & (data["Noise normal"] == 0), f"{precision} noise precision"] = f"noise position {precision}"
+        data.loc[implicit & (data["Noise position"] == 0), f"{precision} noise precision"] = f"noise normal {precision}"
+
+    constraints = [("double noise", data["double noise"].unique(), "all double"), ("float noise", data["float noise"].unique(), "all float")]
+    for precision in ["double", "float"]:
+        constraints += [
+            (f"{precision} noise", [f"no noise {precision}"], f"No noise {precision}"),
+            (f"{precision} noise", [f"noise {precision}"], f"Noise {precision}"),
+            (f"{precision} noise precision", [f"noise position {precision}"], f"Noise position {precision}"),
+            (f"{precision} noise precision", [f"noise normal {precision}"], f"Noise normal {precision}"),
+        ]
+    x_labels = ["Radius", "Noise position", "Noise class", "Noise normal", "Shape", "type"]
+    y_labels = ["N", "Nb neighbors (mean)", "Mean curvature (mean)", "Gaussian curvature (mean)", "K1 mean", "K2 mean", "D1 mean",
+                "D2 mean", "pos mean", "iShape mean", "normal mean", "Timings (mean)", "non_stable_ratio"]
+    return data, x_labels, y_labels, [], constraints, {}
+
+def PCPNet_dataframes(data):
+    data = data[(data["expe"] == "PCPNet") & (data["kNN"] >= 0)].copy()
+    constraints = [
+        ("kNN", data["kNN"].unique(), "all"),
+        ("noise_type", ["no"], "No noise"),
+        ("noise_type", ["gradient", "striped"], "Density"),
+        ("noise_type", ["low", "med", "high"], "Noise position"),
+    ]
+    x_labels = ["kNN", "noise_type", "Shape"]
+    y_labels = ["Timings (mean)", "normal mean", "non_stable_ratio"]
+    return data, x_labels, y_labels, [], constraints, y_label_names
+
+experiment_dataframes = {"CAD": CAD_dataframes, "DGTal": DGTal_dataframes, "DGTal_Numerical": DGTal_Numerical_dataframes, "PCPNet": PCPNet_dataframes}
+
+# x values of a series as the former notebook gave them: floats for the numbers, the others as they are
+def series_values(values):
+    return [float(value) if isinstance(value, (int, float, np.number)) else value for value in values]
+
+# Every series of an experiment, keyed as the keys of dataframe_to_tsx_data ("<constraint>_<x label>_<y label>[_<divider>]").
+# The rows are aggregated once in a cube by method, constraint columns, x labels and dividers (see tb.aggregate_cube),
+# then each (constraint, x label, divider) is a single query of the cube giving the series of all the y labels:
+# for each method (in the order of its first row), the mean of each y label at each sorted x value (-1 when it has none).
+# With a divider, a series per method and divider value ("<method>_<divider value>"), without the x values lacking a mean.
+def experiment_series(data, x_labels, y_labels, dividers, constraints, y_names={}, for_what="Method"):
+    constraint_columns = list(dict.fromkeys(column for column, _, _ in constraints))
+    cube = tb.aggregate_cube(data, keys=[for_what] + constraint_columns + x_labels + dividers, columns=y_labels)
+
+    series = {}
+    for column, values, description in constraints:
+        for x_label in x_labels:
+            for divider in dividers + [None]:
+                by = [for_what] + ([divider] if divider is not None else []) + [x_label]
+                result = tb.query_cube(cube, {column: list(values)}, by, y_labels)
+                methods = result.index.get_level_values(for_what)
+                x_values = result.index.get_level_values(x_label)
+                dividers_values = result.index.get_level_values(divider) if divider is not None else None
+                for y_label in y_labels:
+                    means = result[(y_label, "mean")].to_numpy()
+                    key = f"{description}_{x_label}_{y_names.get(y_label, y_label)}" + (f"_{divider}" if divider is not None else "")
+                    key_series = {}
+                    for method in tb.query_cube_order(result, level=for_what):
+                        rows = methods == method
+                        if divider is None:
+                            key_series[method] = [series_values(x_values[rows]), [-1 if np.isnan(mean) else float(mean) for mean in means[rows]]]
+                            continue
+                        for value in tb.query_cube_order(result[rows], level=divider):
+                            kept = rows & (dividers_values == value) & ~np.isnan(means)
+                            if kept.any():
+                                key_series[f"{method}_{value}"] = [series_values(x_values[kept]), means[kept].tolist()]
+                    series[key] = key_series
+    return series
+
+# Name of the data file of a constraint: its description in lower case, with the other characters than letters and digits
+# replaced by "-" (and an index when two descriptions give the same name)
+def constraint_file_name(description, taken):
+    name = re.sub(r"[^a-z0-9]+", "-", description.lower()).strip("-") or "constraint"
+    file_name, i = name + ".json", 1
+    while file_name in taken:
+        i += 1
+        file_name = f"{name}-{i}.json"
+    return file_name
+
+# Writes the assets of an experiment (see the top of this file) and returns the size of each file in bytes
+def write_assets(output_dir, experiment, x_labels, y_labels, dividers, constraints, data, colors):
+    experiment_dir = os.path.join(output_dir, experiment)
+    os.makedirs(experiment_dir, exist_ok=True)
+
+    files, sizes, written = {}, {}, set()
+    for constraint in constraints:
+        file_name = constraint_file_name(constraint, files.values())
+        files[constraint] = file_name
+        constraint_data = {}
+        for x_label in x_labels:
+            for y_label in y_labels:
+                for divider in dividers + [None]:
+                    key = f"{constraint}_{x_label}_{y_label}" + (f"_{divider}" if divider is not None else "")
+                    if key in data:
+                        constraint_data[key] = data[key]
+        written.update(constraint_data.keys())
+        sizes[file_name] = write_json(os.path.join(experiment_dir, file_name), constraint_data)
+
+    missing = [key for key in data if key not in written]
+    if len(missing) > 0:
+        print(f"{experiment}: {len(missing)} series not matching any constraint and labels were not written (e.g. {missing[0]})")
+    index = {"xLabels": x_labels, "yLabels": y_labels, "dividers": dividers, "constraints": constraints, "files": files, "colorMap": colors}
+    sizes["index.json"] = write_json(os.path.join(experiment_dir, "index.json"), index)
+    return sizes
+
+def write_json(path, content):
+    with open(path, "w") as file:
+        json.dump(content, file, separators=(",", ":"), allow_nan=False)
+    return os.path.getsize(path)
+
+# Dataset of a former dataframes/<experiment>.tsx module, whose PlotDataSet literal was written by the former notebook with the
+# Python repr of its lists and dicts
+def read_tsx(path):
+    with open(path) as file:
+        content = file.read()
+    literal = re.search(r"const \w+: PlotDataSet = (\{.*?\n\});", content, re.DOTALL)
+    if literal is None:
+        raise ValueError(f"No PlotDataSet found in {path}")
+    return ast.literal_eval(re.sub(r"^(\s+)(\w+):", r"\1'\2':", literal.group(1), flags=re.MULTILINE))
+
+def export_experiment(experiment, args, stats):
+    if args.from_tsx:
+        dataset = read_tsx(os.path.join(args.from_tsx, experiment + ".tsx"))
+        return write_assets(args.output, experiment, dataset["xLabels"], dataset["yLabels"], dataset["dividers"],
+                            dataset["constraints"], dataset["data"], dataset["colorMap"])
+
+    dirs = stats_dirs[experiment]
+    if id(dirs) not in stats:
+        stats[id(dirs)] = prepare_stats(open_stats(args.stats_dir, dirs, args.cache_dir, args.workers))
+    data, colors = stats[id(dirs)]
+    data, x_labels, y_labels, dividers, constraints, y_names = experiment_dataframes[experiment](data)
+    dividers = [divider for divider in dividers if divider in data.columns]
+
+    series = experiment_series(data, x_labels, y_labels, dividers, constraints, y_names)
+    return write_assets(args.output, experiment, x_labels, [y_names.get(y_label, y_label) for y_label in y_labels], dividers,
+                        [description for _, _, description in constraints], series, colors)
+
+if __name__ == '__main__' :
+    parser = argparse.ArgumentParser(description='Export the dataframes of the data viewer of the website as JSON assets loaded per constraint.')
+    parser.add_argument('--stats_dir', type=str, default=".", help='Directory of the statistics of the experiments (containing double/ and float/).')
+    parser.add_argument('--output', type=str, default="../frontend/public/dataframes", help='Output directory, with a subdirectory per experiment.')
+    parser.add_argument('--experiments', type=str, nargs='+', default=experiments, choices=experiments, help='Exported experiments.')
+    parser.add_argument('--from_tsx', type=str, default="", help='Convert the former dataframes/<experiment>.tsx modules of this directory instead of reading the statistics.')
+    parser.add_argument('--cache_dir', type=str, default=None, help='Cache of the statistics read (see toolbox.open_data_all), BENCHMARK_DATA_CACHE by default, "" to disable it.')
+    parser.add_argument('--workers', type=int, default=None, help='Number of statistics files read concurrently.')
+    args = parser.parse_args()
+
+    # Statistics read once for the experiments sharing them (DGTal and DGTal_Numerical)
+    stats = {}
+    for experiment in args.experiments:
+        start = time.perf_counter()
+        sizes = export_experiment(experiment, args, stats)
+        print(f"{experiment}: {len(sizes)} files, {sum(sizes.values()) / 1e6:.2f} MB in {time.perf_counter() - start:.2f}s")
@@ -1,17 +1,40 @@
 import os 
+import io
 import sys
+import re
+import csv
+import time
 import argparse
-import glob
+import json
+import hashlib
+import traceback
+import contextlib
+import itertools
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import web_format as wf
 
 # (groundtruth, corresponding) 
 dataset_gt_e = [
-    # ("dataset_CAD", "CAD"),
-    # ("dataset_helios","CAD_helios"),
+    ("dataset_CAD", "CAD"),
+    ("dataset_helios","CAD_helios"),
     ("dataset_implicit","DGtal"),
-    # ("dataset_implicit_helios","DGtal_helios"),
-    # ("PCPNet_rescaled","PCPNet"),
+    ("dataset_implicit_helios","DGtal_helios"),
+    ("PCPNet_rescaled","PCPNet"),
 ]
 
+# datasets merged when --datasets is not given
+default_datasets = ["DGtal"]
+
 quantities_n_idx = [
     ('kMean', 4), 
     ('kGauss', 3),
@@ -26,6 +49,14 @@ quantities_n_idx_err = [
     ('kMax', 7),
 ]
 
+# Unit vectors of the estimation and ground truth files, whose computed errors are angles (see --angular_errors):
+# the normal (indices 5 to 7), and the principal directions (indices 10 to 12 and 13 to 15) of the curvatures kMin and kMax
+directions_n_idx = [
+    ('normal', [5, 6, 7]),
+    ('dMin', [10, 11, 12]),
+    ('dMax', [13, 14, 15]),
+]
+
 methods = [
     ('Mean', 4),
     ('Cov2D', 5),
@@ -46,52 +77,249 @@ methods = [
     ('AvgHexagram', 20),
 ]
 
+method_indices = dict(methods)
+
 # filename will be in the format allErrorStats-<shape>_<method>_<radius>_estim.pts
+# (the shape may contain '-' and '_', the method and the radius may not)
+estimation_name_pattern = re.compile(r"^[^-]*-(?P<shape>.+)_(?P<method>[^_]+)_(?P<radius>[^_]+)_[^_]+\.pts$")
+
+# Methods whose name appears in text, without the ones only found inside a longer match
+# (Cov2D in NormCov2D, Sphere in UnorientedSphere)
+def method_matches(text):
+    found = [method for method, _ in methods if method in text]
+    return [method for method in found if not any(method != other and method in other for other in found)]
+
+# Parses the name of an estimation file into (shape, method, radius, issue).
+# The method part of the name is a method name, or contains exactly one. Otherwise the method is None
+# and issue tells why (as when the name is not in the expected format, where everything is None).
+def parse_estimation_name(filename):
+    match = estimation_name_pattern.match(filename)
+    if match is None:
+        return None, None, None, "name not in the <prefix>-<shape>_<method>_<radius>_<kind>.pts format"
+    token = match.group("method")
+    candidates = [token] if token in method_indices else method_matches(token)
+    if len(candidates) == 1:
+        return match.group("shape"), candidates[0], match.group("radius"), None
+    if len(candidates) == 0:
+        return match.group("shape"), None, match.group("radius"), "unknown method " + token
+    return match.group("shape"), None, match.group("radius"), "ambiguous method " + token + " (" + ", ".join(candidates) + ")"
+
 def grab_method(filename): 
-    for method, idx in methods:
-        if method in filename:
-            if method == "Cov2D" and "NormCov2D" in filename:
-                return "NormCov2D"
-            if method == "Sphere" and "UnorientedSphere" in filename:
-                return "UnorientedSphere"
-            return method
-    return None
+    return parse_estimation_name(filename)[1]
 
 def grab_shape(filename):
-    first_part = filename.split("-")[0]
-    second_part = filename.split("-")[1:]
-    second_part = "-".join(second_part)
-    second_part = second_part.split("_")[:-3]
-    shape = ""
-    for part in second_part:
-        shape += part + "_"
-    shape = shape[:-1]
-    return shape
+    shape = parse_estimation_name(filename)[0]
+    return shape if shape is not None else ""
 
 # idx 0, 1 and 2 are reserved for the 3D positions, idx 3 if for the ground truth value, and the rest for the estimated values
 def grab_index(filename):
-    for method, idx in methods :
-        if method in filename:
-            return idx
-    return -1
+    return method_indices.get(grab_method(filename), -1)
+
+# Stage profile of --profile: seconds, calls and bytes per (dataset, shape, quantity, method, stage), None when not profiling.
+# The seconds of a stage exclude the ones of the stages profiled inside it, so the stages of a unit add up to its time
+# (the parsing of the method files read concurrently counts the time of each read).
+profile_keys = ["dataset", "shape", "quantity", "method", "stage"]
+profile_stage_names = ["discovery", "parsing", "alignment", "errors", "formatting", "writing"]
+profile_stages = None
+profile_unit = ("", "")
+profile_lock = threading.Lock()
+profile_scope = threading.local()
+
+# Starts profiling the stages of a dataset and shape
+def start_profile(dataset="", shape=""):
+    global profile_stages, profile_unit
+    profile_stages = {}
+    profile_unit = (dataset, shape)
+
+# Stops profiling and returns the rows of the report
+def stop_profile():
+    global profile_stages
+    if profile_stages is None:
+        return []
+    rows = [dict(zip(profile_keys, key), **record) for key, record in profile_stages.items()]
+    profile_stages = None
+    return rows
+
+# Peak resident memory in bytes of this process (or of its terminated children), None where it is not available
+def peak_rss(children=False):
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+# Size of the files, or of the files of the directories (column shards), missing ones count for 0
+def files_size(paths):
+    size = 0
+    for path in paths:
+        if os.path.isdir(path):
+            size += sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+        elif os.path.exists(path):
+            size += os.path.getsize(path)
+    return size
+
+# Sets the quantity of the stages profiled by this thread
+@contextlib.contextmanager
+def profile_quantity(quantity):
+    profile_scope.quantity = quantity
+    try:
+        yield
+    finally:
+        profile_scope.quantity = ""
+
+# Profiles a stage: read and written are the files it reads and writes, whose sizes are added to bytes_read and bytes_written
+@contextlib.contextmanager
+def profiled(stage, method="", read=(), written=(), bytes_read=0, bytes_written=0):
+    if profile_stages is None:
+        yield
+        return
+    if not hasattr(profile_scope, "nested"):
+        profile_scope.nested = []
+    profile_scope.nested.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        nested = profile_scope.nested.pop()
+        if len(profile_scope.nested) > 0:
+            profile_scope.nested[-1] += seconds
+        key = profile_unit + (getattr(profile_scope, "quantity", ""), method, stage)
+        bytes_read += files_size(read)
+        bytes_written += files_size(written)
+        with profile_lock:
+            record = profile_stages.setdefault(key, {"seconds": 0.0, "calls": 0, "bytes_read": 0, "bytes_written": 0})
+            record["seconds"] += seconds - nested
+            record["calls"] += 1
+            record["bytes_read"] += bytes_read
+            record["bytes_written"] += bytes_written
+
+# Writes the report of --profile, as CSV when the path ends with .csv and as JSON otherwise
+def write_profile(path, rows):
+    if os.path.dirname(path) != "" and not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    fields = profile_keys + ["seconds", "calls", "bytes_read", "bytes_written", "peak_rss"]
+    with open(path, 'w', newline='') as f:
+        if path.endswith(".csv"):
+            writer = csv.DictWriter(f, fieldnames=fields, restval="")
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump({"fields": fields, "rows": rows}, f, indent=1)
+
+# Prints the time and bytes of each stage, and the datasets and methods taking the most time
+def print_profile_summary(rows):
+    megabytes = lambda size: f"{size / (1 << 20):10.1f}"
+    print("\n[PROFILE] stage           seconds  read MB  written MB")
+    for stage in profile_stage_names:
+        stage_rows = [row for row in rows if row["stage"] == stage]
+        if len(stage_rows) > 0:
+            print(f"          {stage:<12} {sum(row['seconds'] for row in stage_rows):10.2f} "
+                  f"{megabytes(sum(row['bytes_read'] for row in stage_rows))} {megabytes(sum(row['bytes_written'] for row in stage_rows))}")
+    for key in ["dataset", "method"]:
+        seconds = {}
+        for row in rows:
+            if row["stage"] in profile_stage_names and row[key] != "":
+                seconds[row[key]] = seconds.get(row[key], 0.0) + row["seconds"]
+        slowest = sorted(seconds.items(), key=lambda item: -item[1])[:5]
+        if len(slowest) > 0:
+            print(f"          slowest {key}s: " + ", ".join(f"{name} {value:.2f}s" for name, value in slowest))
+    for row in rows:
+        if row["stage"] == "run":
+            peak = f", peak RSS {row['peak_rss'] / (1 << 20):.0f} MB" if row.get("peak_rss") is not None else ""
+            print(f"          run: {row['seconds']:.2f}s{peak}")
+
+# Reads a whole .pts file at once and returns the requested columns as a 2D array of the original text tokens,
+# or parsed straight to dtype (np.float64 for the columns only used as numbers, see parse_pts).
+# Lines containing a '#' are skipped, CRLF line endings are handled by the text mode newline translation.
+# columns is the list of column indices to keep (all the columns by default).
+def read_pts(filename, columns=None, dtype=str) :
+    return parse_pts(pts_content(filename), columns, dtype)
+
+# Content of a .pts file without its comment lines, to be parsed by parse_pts (once per dtype needed)
+def pts_content(filename) :
+    with open(filename, 'r') as f:
+        content = f.read()
+    if "#" in content:
+        content = "\n".join(line for line in content.splitlines() if "#" not in line)
+    return content
+
+# Columns of the content of a .pts file as text tokens (dtype str), kept byte for byte for the values written back,
+# or as typed values, parsed without going through the tokens
+def parse_pts(content, columns=None, dtype=str) :
+    if content.strip() == "":
+        return np.empty((0, len(columns) if columns is not None else 0), dtype=dtype)
+    return np.loadtxt(io.StringIO(content), dtype=dtype, usecols=columns, ndmin=2, comments=None)
+
+# Lines read at once by read_pts_chunks
+read_chunk_rows = 1 << 16
+
+# Same as read_pts, one table of at most chunk_rows lines at a time, for the files that do not fit in memory
+def read_pts_chunks(filename, columns=None, chunk_rows=None, dtype=str) :
+    for content in pts_chunks(filename, chunk_rows):
+        yield parse_pts(content, columns, dtype)
+
+# Same as pts_content, for at most chunk_rows lines at a time (the chunks without any point are skipped)
+def pts_chunks(filename, chunk_rows=None) :
+    if chunk_rows is None:
+        chunk_rows = read_chunk_rows
+    with open(filename, 'r') as f:
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            if len(lines) == 0:
+                return
+            content = "".join(line for line in lines if "#" not in line)
+            if content.strip() != "":
+                yield content
+
+# Positions with a coordinate close to zero are snapped to 0.0 so that they match across files
+def clamp_positions(positions) :
+    positions = positions.astype(np.float64)
+    positions[np.abs(positions) <= 2e-5] = 0.0
+    return positions
 
 # By default, the quantity kMean value is at index 4
+# Returns the clamped positions as floats and the values as the original text tokens
 def grab_values(filename, quantity_idx = 4) :
-    positions = []
-    values = []
-    print (filename + " " + str(quantity_idx))
-    with open(filename, 'r') as f:
-        for line in f:
-            if "#" in line:
-                continue
-            line = line.split("\n")[0]
-            line = line.split("\r")[0]
-            line = line.split(" ")
-            pos = [float(line[0]), float(line[1]), float(line[2])]
-            pos = [0.0 if abs(p) <= 2e-5 else p for p in pos]
-            positions.append(pos)
-            values.append(line[quantity_idx])
-    return positions, values
+    positions, values, _ = grab_values_quantities(filename, [quantity_idx])
+    return positions, values[:, 0]
+
+# Same as grab_values for several quantities at once, values has one column per quantity index.
+# The positions, and the columns of float_indices (only used as numbers, as by the computed errors), are parsed straight
+# to float64 and returned as a third array, the tokens are only kept for the quantity indices written back as they are.
+def grab_values_quantities(filename, quantity_indices, float_indices=()) :
+    print (filename + " " + " ".join(str(idx) for idx in list(quantity_indices) + list(float_indices)))
+    content = pts_content(filename)
+    table = parse_pts(content, [0, 1, 2] + list(float_indices), np.float64)
+    positions = clamp_positions(table[:, :3])
+    if len(quantity_indices) > 0:
+        values = parse_pts(content, list(quantity_indices))
+    else:
+        values = np.empty((len(table), 0), dtype=str)
+    return positions, values, table[:, 3:]
+
+# Reads the method files of method_files (see grab_values_quantities) with at most read_threads files read at once,
+# and yields (method, positions, values, float values) as soon as each file is parsed, in whatever order they finish in.
+# Waiting on the storage dominates on networked file systems, so the reads overlap even within one process.
+def grab_methods_values(method_files, quantity_indices, read_threads=1, float_indices=()) :
+    def grab(method):
+        with profiled("parsing", method, read=[method_files[method]]):
+            return grab_values_quantities(method_files[method], quantity_indices, float_indices)
+
+    pending = [method for method, _ in methods if method in method_files]
+    if read_threads <= 1:
+        for method in pending:
+            yield (method,) + grab(method)
+        return
+    with ThreadPoolExecutor(max_workers=read_threads) as executor:
+        running = {}
+        while len(pending) > 0 or len(running) > 0:
+            # No more files are in flight than threads, so the parsed files waiting for the aligner stay bounded
+            while len(pending) > 0 and len(running) < read_threads:
+                method = pending.pop(0)
+                running[executor.submit(grab, method)] = method
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield (running.pop(future),) + future.result()
 
 # quantities_n_idx = [
 #     ('kMean', 4), 
@@ -99,39 +327,165 @@ def grab_values(filename, quantity_idx = 4) :
 #     ('kMin', 8),
 #     ('kMax', 9),
 # ]
+# Returns the positions as the original text tokens and the ground truth values as floats
 def grab_ground_truth(filename, quantity_idx = 4) :
-    positions = []
-    values = []
+    positions, _, values = grab_ground_truth_quantities(filename, [quantity_idx])
+    return positions, values[0]
+
+# Same as grab_ground_truth for several quantities at once, values has one array per quantity index.
+# Also returns the positions as floats, parsed with the ground truth values straight to float64.
+def grab_ground_truth_quantities(filename, quantity_indices) :
+    content = pts_content(filename)
+    positions = parse_pts(content, [0, 1, 2])
+    table = parse_pts(content, [0, 1, 2] + ground_truth_columns(), np.float64)
+    return positions, table[:, :3], ground_truth_values(table[:, 3:], quantity_indices)
+
+# Columns of the ground truth files needed by ground_truth_values: kGauss, kMin and kMax
+def ground_truth_columns() :
     kMin_idx = quantities_n_idx[2][1]
     kMax_idx = quantities_n_idx[3][1]
+    return [3, kMin_idx, kMax_idx]
 
-    with open(filename, 'r') as f:
-        for line in f:
-            if "#" in line:
-                continue
-            line = line.split("\n")[0]
-            line = line.split("\r")[0]
-            line = line.split(" ")
-            pos = [float(line[0]), float(line[1]), float(line[2])]
-            pos = [0.0 if abs(p) <= 2e-5 else p for p in pos]
-            positions.append([line[0], line[1], line[2]])
-            # take the absolute value of the ground truth value
-            kmin = abs(float(line[kMin_idx]))
-            kmax = abs(float(line[kMax_idx]))
-            if quantity_idx == 4:
-                values.append((kmin + kmax) / 2.0)
-            elif quantity_idx == 8 or quantity_idx == 9:
-                if kmin > kmax:
-                    kmin, kmax = kmax, kmin
-                if quantity_idx == 8:
-                    values.append(kmin)
-                else:
-                    values.append(kmax)                    
-            elif quantity_idx == 3:
-                values.append(abs(float(line[quantity_idx])))
-            # values.append(line[quantity_idx])
-
-    return positions, values
+# Ground truth values of each quantity index, from a float table of the ground_truth_columns
+def ground_truth_values(table, quantity_indices) :
+    # take the absolute value of the ground truth value
+    kgauss = np.abs(table[:, 0])
+    kmin = np.abs(table[:, 1])
+    kmax = np.abs(table[:, 2])
+
+    values = []
+    for quantity_idx in quantity_indices:
+        if quantity_idx == 4:
+            values.append((kmin + kmax) / 2.0)
+        elif quantity_idx == 8:
+            values.append(np.minimum(kmin, kmax))
+        elif quantity_idx == 9:
+            values.append(np.maximum(kmin, kmax))
+        elif quantity_idx == 3:
+            values.append(kgauss)
+        else:
+            raise ValueError("No ground truth rule for quantity index " + str(quantity_idx))
+
+    return values
+
+# Columns of the estimation files needed to compute the errors of a quantity (a quantity index or a direction name)
+def compared_columns(quantity):
+    if quantity == 3:
+        return [3]
+    if quantity == 4:
+        return [4, 8, 9]
+    if quantity in (8, 9):
+        return [8, 9]
+    if quantity == "normal":
+        return dict(directions_n_idx)["normal"]
+    return [8, 9] + dict(directions_n_idx)["dMin"] + dict(directions_n_idx)["dMax"]
+
+# Quantity compared by the computed errors, column gives the float values of a column of the file.
+# The same rules as ground_truth_values apply: absolute values, the mean curvature as the mean of the absolute principal
+# curvatures, and kMin / kMax sorted by absolute value (the principal directions are swapped along with their curvatures).
+# Where the principal curvatures are not given (NaN, as for the methods estimating only the mean curvature),
+# the absolute value of the mean curvature column is compared instead.
+def compared_quantity(column, quantity):
+    if quantity == 3:
+        return np.abs(column(3))
+    kmin = np.abs(column(8))
+    kmax = np.abs(column(9))
+    if quantity == 4:
+        mean = (kmin + kmax) / 2.0
+        return np.where(np.isnan(mean), np.abs(column(4)), mean)
+    if quantity == 8:
+        return np.minimum(kmin, kmax)
+    if quantity == 9:
+        return np.maximum(kmin, kmax)
+    if quantity == "normal":
+        return np.column_stack([column(idx) for idx in dict(directions_n_idx)["normal"]])
+    dmin = np.column_stack([column(idx) for idx in dict(directions_n_idx)["dMin"]])
+    dmax = np.column_stack([column(idx) for idx in dict(directions_n_idx)["dMax"]])
+    swap = (kmin > kmax)[:, None]
+    return np.where(swap, dmax, dmin) if quantity == "dMin" else np.where(swap, dmin, dmax)
+
+# Ground truth directions (see directions_n_idx), in the order of grab_ground_truth_quantities
+def grab_ground_truth_directions(filename, names) :
+    indices = []
+    for name in names:
+        indices += [idx for idx in compared_columns(name) if idx not in indices]
+    table = read_pts(filename, indices, np.float64)
+    column = lambda idx: table[:, indices.index(idx)]
+    return [compared_quantity(column, name) for name in names]
+
+# Relative errors are divided by the absolute ground truth value, or by this floor where it is smaller (null curvatures)
+relative_error_floor = 1e-6
+
+# Per point errors of an estimated quantity against the ground truth: the absolute (or relative) difference of the values,
+# or the angle in degrees between the directions, regardless of their orientation (NaN for a null direction).
+# The angle is taken from both its sine and cosine, so that identical directions give exactly 0 (arccos is off by about 1e-6 degrees there).
+def quantity_errors(estimated, groundtruth, error_mode="abs"):
+    if estimated.ndim == 2:
+        sine = np.linalg.norm(np.cross(estimated, groundtruth), axis=1)
+        cosine = np.abs(np.sum(estimated * groundtruth, axis=1))
+        null = np.linalg.norm(estimated, axis=1) * np.linalg.norm(groundtruth, axis=1) == 0
+        return np.where(null, np.nan, np.degrees(np.arctan2(sine, cosine)))
+    errors = np.abs(estimated - groundtruth)
+    if error_mode == "relative":
+        errors /= np.maximum(np.abs(groundtruth), relative_error_floor)
+    return errors
+
+# Errors of every method for a quantity, from their aligned values (float columns of float_indices).
+# The points missing from a method get "0" and the missing methods "100", as in the merged error files.
+def computed_errors(aligned_floats, float_indices, found, present, quantity, groundtruth, error_mode="abs"):
+    method_values = []
+    for j, (method, _) in enumerate(methods):
+        if method not in present:
+            method_values.append(np.full(len(groundtruth), 100.0))
+            continue
+        column = lambda idx: aligned_floats[method][:, float_indices.index(idx)]
+        errors = quantity_errors(compared_quantity(column, quantity), groundtruth, error_mode)
+        method_values.append(np.where(found[:, j], errors, 0.0))
+    return method_values
+
+# Turns float positions into exact integer keys: the bit pattern of each coordinate, with -0.0 folded onto 0.0
+def position_keys(positions) :
+    positions = np.ascontiguousarray(positions, dtype=np.float64) + 0.0
+    return positions.view(np.int64)
+
+# Returns, for each ground truth position, the row of the estimation holding the same position (-1 if missing).
+# When several estimation rows share a position, the last one wins.
+# With a tolerance, the ground truth positions left without an exact match are matched to their nearest estimated
+# position within that distance, for clouds whose coordinates were written with a different precision.
+def align_positions(gt_positions, est_positions, tolerance=None) :
+    if len(est_positions) == 0 or len(gt_positions) == 0:
+        return np.full(len(gt_positions), -1, dtype=np.int64)
+
+    # sort-merge join: sort all the keys together, then give every run of equal keys a group id
+    keys = position_keys(np.concatenate([est_positions, gt_positions]))
+    order = np.lexsort((keys[:, 2], keys[:, 1], keys[:, 0]))
+    sorted_keys = keys[order]
+    new_group = np.empty(len(order), dtype=bool)
+    new_group[0] = True
+    np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1, out=new_group[1:])
+    group = np.empty(len(order), dtype=np.int64)
+    group[order] = np.cumsum(new_group) - 1
+
+    n_est = len(est_positions)
+    last_row = np.full(group.max() + 1, -1, dtype=np.int64)
+    np.maximum.at(last_row, group[:n_est], np.arange(n_est))
+    index = last_row[group[n_est:]]
+
+    if tolerance is not None:
+        missing = np.flatnonzero(index < 0)
+        if len(missing) > 0:
+            from scipy.spatial import cKDTree
+            _, nearest = cKDTree(est_positions).query(gt_positions[missing], distance_upper_bound=tolerance)
+            nearest[nearest == len(est_positions)] = -1
+            index[missing] = nearest
+    return index
+
+# Picks the values (one row per estimated point) of the aligned rows, missing rows get the missing value
+def gather_values(values, index, missing="0") :
+    if len(values) == 0:
+        return np.full((len(index),) + values.shape[1:], missing)
+    found = (index >= 0).reshape((-1,) + (1,) * (values.ndim - 1))
+    return np.where(found, values[index], missing)
 
 def shape_names (dir_gt) :
     shapes = []
@@ -140,32 +494,102 @@ def shape_names (dir_gt) :
             shapes.append(file.split(".")[0])
     return shapes
 
-def estimation_paths (dir_est) :
+# Catalog of the estimation files of the dataset directories, kept on disk next to the manifest so that later runs
+# only list the directories that changed.
+# The method files are <dataset>/<radius>/<method>/<file> (or <dataset>/<radius>/<file>): between catalog_depths below the dataset.
+catalog_name = ".estimation_catalog.json"
+catalog_version = 1
+catalog_depths = (2, 3)
+catalog_fields = ["name", "shape", "method", "radius", "issue", "size", "mtime"]
+
+def load_catalog(path):
+    catalog = load_manifest(path)
+    return catalog if catalog.get("version") == catalog_version else {"version": catalog_version, "datasets": {}}
+
+def save_catalog(path, catalog):
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path + ".tmp", 'w') as f:
+        f.write(json.dumps(catalog, separators=(",", ":")))
+    os.replace(path + ".tmp", path)
+
+# Lists a directory, or reuses its cached listing when the directory was not modified since (adding, removing or
+# renaming an entry changes its modification time). A listing is {"mtime", "dirs", "files"} where files holds the columns
+# of the .pts files (see catalog_fields and parse_estimation_name), which keeps the catalog fast to load.
+# Hidden entries are skipped, like glob does.
+def list_directory(path, cached=None):
+    mtime = os.stat(path).st_mtime_ns
+    if cached is not None and cached["mtime"] == mtime:
+        return cached
+    dirs = []
+    files = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                dirs.append(entry.name)
+            elif entry.name.endswith(".pts") and entry.is_file():
+                stat = entry.stat()
+                shape, method, radius, issue = parse_estimation_name(entry.name)
+                files.append((entry.name, shape, method, radius, issue, stat.st_size, stat.st_mtime_ns))
+    files.sort()
+    columns = zip(*files) if len(files) > 0 else [[]] * len(catalog_fields)
+    return {"mtime": mtime, "dirs": sorted(dirs), "files": {field: list(column) for field, column in zip(catalog_fields, columns)}}
+
+# Walks a dataset directory once and returns its entries (dataset, shape, method, radius, path, size, mtime, issue),
+# the size and modification time being the ones of the last listing of their directory (a file rewritten in place
+# does not modify its directory, so they can be stale: stat the file when they matter).
+# listings are the cached listings of its directories, by path relative to dir_est, and are updated in place.
+def catalog_entries(dir_est, listings):
+    dataset = os.path.basename(dir_est)
+    entries = []
+    seen = {}
+    pending = [("", 0)]
+    while len(pending) > 0:
+        relative, depth = pending.pop()
+        directory = os.path.join(dir_est, relative, "")
+        listing = list_directory(directory, listings.get(relative))
+        seen[relative] = listing
+        if depth >= catalog_depths[0]:
+            for name, shape, method, radius, issue, size, mtime in zip(*(listing["files"][field] for field in catalog_fields)):
+                entries.append((dataset, shape, method, radius, directory + name, size, mtime, issue))
+        if depth < catalog_depths[-1]:
+            pending.extend((os.path.join(relative, name), depth + 1) for name in listing["dirs"])
+    listings.clear()
+    listings.update(seen)
+    return entries
+
+# Returns the estimation files of a dataset directory as {shape: {method: path}}.
+# catalog is the catalog loaded by load_catalog, updated in place (None to list every directory).
+# The files which do not give a method, and the ones giving the same shape and method as another file
+# (the newest one is used, by its current modification time rather than the cached one), are reported instead of being
+# silently dropped.
+def estimation_paths (dir_est, catalog=None) :
     shapes = {}
+    if not os.path.isdir(dir_est):
+        return shapes
 
     append_mode = "_25000" if dir_est.endswith("implicit") else ""
 
-    for file in glob.glob(dir_est + "*/*/*"):
-        if append_mode == "_25000" and "implicit_helios" in file:
-            continue
-        basename = os.path.basename(file)
-        if basename.endswith(".pts"):
-            shape = grab_shape(basename) + append_mode
-            method = grab_method(basename)
-            if shape not in shapes:
-                shapes[shape] = {}
-            shapes[shape][method] = file
-    
-    for file in glob.glob(dir_est + "/*/*/*"):
-        if append_mode == "_25000" and "implicit_helios" in file:
+    listings = {}
+    if catalog is not None:
+        listings = catalog["datasets"].setdefault(os.path.abspath(dir_est), {})
+    files = {}
+    for dataset, shape, method, radius, path, size, mtime, issue in catalog_entries(dir_est, listings):
+        if method is None:
+            print ("[CATALOG] Skipping " + path + ": " + issue)
             continue
-        basename = os.path.basename(file)
-        if basename.endswith(".pts"):
-            shape = grab_shape(basename) + append_mode
-            method = grab_method(basename)
-            if shape not in shapes:
-                shapes[shape] = {}
-            shapes[shape][method] = file
+        files.setdefault((shape + append_mode, method), []).append((mtime, path))
+
+    for (shape, method), candidates in files.items():
+        if len(candidates) > 1:
+            candidates = sorted((os.stat(path).st_mtime_ns, path) for _, path in candidates)
+            print ("[CATALOG] " + str(len(candidates)) + " files for " + shape + " / " + method + ", using the newest " + candidates[-1][1]
+                   + " (ignored: " + ", ".join(path for _, path in candidates[:-1]) + ")")
+        if shape not in shapes:
+            shapes[shape] = {}
+        shapes[shape][method] = candidates[-1][1]
     return shapes
 
 def groundtruth_paths (shapes_dict, dir_gt) :
@@ -178,76 +602,594 @@ def groundtruth_paths (shapes_dict, dir_gt) :
                 shapes[shape] = os.path.join(dir_gt, file)
     return shapes
 
-def merge_files(groundtruths, estimations, quantity_idx=4, output_dir=""):
-    for shape in groundtruths:
-        print("\n[ESTIMATION] Merging shape " + shape  + " with quantity " + str(quantity_idx))
-        gt_positions, gt_values = grab_ground_truth(groundtruths[shape], quantity_idx)
+# Merges one shape: the ground truth file and each method file are read once, aligned once,
+# and every requested quantity is written from that single pass.
+# merges is a list of (kind, method_files, outputs) where kind is "estims" or "errors", method_files maps a method to its file,
+# and outputs is a list of (quantity_idx_in_method_files, quantity_idx_in_ground_truth, output_dir, publish_dir).
+# formats lists the files written for each output: "pts" for the merged text file, "bin" for the binary web format.
+# When publish_dir is not None, the web assets of the output are also written there in publish_formats
+# ("json", "bin" and/or "shards", see publish_output).
+# geometry is None or a dictionary {"output": ..., "publish": ...} giving the path (without extension) of the shared
+# geometry file of the shape for the merged files and for the web assets, the files of the outputs then only hold the values.
+# When lod is True, the web assets are written in progressive order with their level of detail tiers (see web_format.progressive_order).
+# When compact is True, the binary web assets use the compact encoding of web_format, where the missing values are flagged.
+# A merge of kind "computed" computes the errors of its method files (estimations) against the ground truth instead of reading them,
+# its outputs are (quantity, quantity, output_dir, publish_dir) with a quantity index of quantities_n_idx or a name of
+# directions_n_idx, and error_mode chooses between "abs" and "relative" errors (see quantity_errors).
+# Consecutive merges of the same method files (the estimations and the errors computed from them) read and align them once.
+# With a memory_limit (in bytes), shapes too large for it are merged out of core (see merge_shape_out_of_core),
+# which only writes the merged .pts files of estimations and errors.
+# read_threads is the number of method files read concurrently (see grab_methods_values).
+def merge_shape(shape, groundtruth, merges, tolerance=None, formats=("pts",), publish_formats=("json",), geometry=None, lod=False,
+                compact=False, error_mode="abs", memory_limit=None, read_threads=1):
+    if memory_limit is not None:
+        buckets = bucket_count(groundtruth, merges, memory_limit)
+        if buckets > 1:
+            print(f"Merging shape {shape} out of core in {buckets} buckets")
+            return merge_shape_out_of_core(shape, groundtruth, merges, buckets)
+    gt_indices = []
+    gt_directions = []
+    for _, _, outputs in merges:
+        for _, gt_idx, _, _ in outputs:
+            if isinstance(gt_idx, str):
+                if gt_idx not in gt_directions:
+                    gt_directions.append(gt_idx)
+            elif gt_idx not in gt_indices:
+                gt_indices.append(gt_idx)
+    with profiled("parsing", "groundtruth", read=[groundtruth]):
+        gt_positions, gt_float_positions, gt_quantities = grab_ground_truth_quantities(groundtruth, gt_indices)
+        gt_values = dict(zip(gt_indices, gt_quantities))
+        if len(gt_directions) > 0:
+            gt_values.update(zip(gt_directions, grab_ground_truth_directions(groundtruth, gt_directions)))
+
+    if geometry is None:
+        geometry = {}
+    with profile_quantity("geometry"), profiled("formatting"):
+        order = wf.progressive_order(gt_float_positions) if lod else None
+        checksums = write_geometry(gt_positions, geometry, formats, publish_formats, order, compact)
+
+    for method_files, group in itertools.groupby(merges, key=lambda merge: merge[1]):
+        group = list(group)
+        # The values written back are kept as text tokens, the ones compared by the computed errors are parsed as floats
+        value_indices = []
+        float_indices = []
+        for kind, _, outputs in group:
+            for value_idx, _, _, _ in outputs:
+                if kind == "computed":
+                    float_indices += [column for column in compared_columns(value_idx) if column not in float_indices]
+                elif value_idx not in value_indices:
+                    value_indices.append(value_idx)
         aligned_values = {}
+        aligned_floats = {}
+        found = np.zeros((len(gt_positions), len(methods)), dtype=bool)
         for method, _ in methods:
-            if method in estimations[shape]:
-                est_positions, est_values = grab_values(estimations[shape][method], quantity_idx)
-                est_pos_set = set(tuple(float(p) for p in pos) for pos in est_positions)
-                bool_list = [tuple(float(p) for p in pos) in est_pos_set for pos in gt_positions]
-                pos_to_value = {tuple(float(p) for p in pos): val for pos, val in zip(est_positions, est_values)}
-                
-                aligned = []
-                for pos, exists in zip(gt_positions, bool_list):
-                    key = tuple(float(p) for p in pos)
-                    if exists:
-                        aligned.append(pos_to_value.get(key, "0"))
+            if method not in method_files:
+                print(f"Method {method} not found for shape {shape}")
+                aligned_values[method] = np.full((len(gt_positions), len(value_indices)), "100")
+        columns = {method: j for j, (method, _) in enumerate(methods)}
+        for method, est_positions, est_values, est_floats in grab_methods_values(method_files, value_indices, read_threads, float_indices):
+            with profiled("alignment", method):
+                index = align_positions(gt_float_positions, est_positions, tolerance)
+                aligned_values[method] = gather_values(est_values, index)
+                aligned_floats[method] = gather_values(est_floats, index, np.nan)
+                found[:, columns[method]] = index >= 0
+
+        for kind, _, outputs in group:
+            for value_idx, gt_idx, output_dir, publish_dir in outputs:
+                # The outputs of a quantity are in a directory named after it (see shape_merges)
+                with profile_quantity(kind + "/" + os.path.basename(output_dir)), profiled("formatting"):
+                    if kind == "computed":
+                        with profiled("errors"):
+                            method_values = computed_errors(aligned_floats, float_indices, found, method_files, value_idx, gt_values[gt_idx], error_mode)
+                        # The ground truth column keeps the curvature values, as in the merged error files, and is 0 for the directions
+                        gt_output = gt_values[gt_idx] if gt_values[gt_idx].ndim == 1 else np.zeros(len(gt_positions))
                     else:
-                        aligned.append("0")
-                aligned_values[method] = aligned
+                        method_values = [aligned_values[method][:, value_indices.index(value_idx)] for method, _ in methods]
+                        gt_output = gt_values[gt_idx]
+                    write_output(os.path.join(output_dir, shape), gt_positions, gt_output, method_values, formats,
+                                 geometry.get("output"), checksums["output"])
+                    if publish_dir is not None:
+                        table = merged_table(gt_float_positions, gt_output, method_values)
+                        publish_output(os.path.join(publish_dir, published_name(shape)), table, kind == "errors", publish_formats,
+                                       geometry.get("publish"), checksums["publish"], order, found, compact,
+                                       0.0 if kind == "estims" else 100.0)
+
+# Writes the shared geometry files of a shape and returns their checksums {"output": ..., "publish": ...} (None without shared geometry).
+# order is the optional progressive order of the web assets, which use the compact encoding when compact is True.
+def write_geometry(gt_positions, geometry, formats, publish_formats, order=None, compact=False):
+    checksums = {"output": None, "publish": None}
+    if geometry.get("output") is None and geometry.get("publish") is None:
+        return checksums
+    float_positions = gt_positions.astype(np.float32)
+    checksum = wf.geometry_checksum(float_positions)
+    if geometry.get("output") is not None:
+        checksums["output"] = checksum
+        if "pts" in formats:
+            write_merged(geometry["output"] + ".pts", gt_positions, None, [], header=f"# geometry sha1:{checksum} rows:{len(gt_positions)}")
+        if "bin" in formats:
+            with profiled("writing", written=[geometry["output"] + ".bin"]):
+                wf.write_binary(geometry["output"] + ".bin", [("position", float_positions)], {"geometry_checksum": checksum})
+    if geometry.get("publish") is not None and ("bin" in publish_formats or "shards" in publish_formats):
+        extra = {}
+        if order is not None:
+            float_positions = float_positions[order]
+            checksum = wf.geometry_checksum(float_positions)
+            extra["tiers"] = wf.tier_rows(len(order))
+        extra["geometry_checksum"] = checksum
+        with profiled("writing", written=[geometry["publish"] + ".bin"]):
+            wf.write_binary(geometry["publish"] + ".bin", [("position", float_positions)], extra, compact)
+        checksums["publish"] = checksum
+    return checksums
+
+# Header referencing the shared geometry from a value-only file, by a path relative to that file
+def geometry_reference(output_file, geometry_file, checksum):
+    return {"geometry": os.path.relpath(geometry_file, os.path.dirname(output_file)), "geometry_checksum": checksum}
+
+# Writes the merged files of one output, output is the path without extension
+def write_output(output, gt_positions, gt_values, method_values, formats, geometry=None, checksum=None):
+    if "pts" in formats:
+        if geometry is None:
+            write_merged(output + ".pts", gt_positions, gt_values, method_values)
+        else:
+            reference = geometry_reference(output, geometry + ".pts", checksum)
+            header = f"# geometry {reference['geometry']} sha1:{checksum} rows:{len(gt_positions)}"
+            write_merged(output + ".pts", None, gt_values, method_values, header=header)
+    if "bin" in formats:
+        if geometry is None:
+            columns = binary_columns(gt_positions, gt_values, method_values)
+            reference = None
+        else:
+            columns = binary_columns(None, gt_values, method_values)
+            reference = geometry_reference(output, geometry + ".bin", checksum)
+        with profiled("writing", written=[output + ".bin"]):
+            wf.write_binary(output + ".bin", columns, reference)
+
+# Writes the web assets of one output, output is the path without extension, and their statistics sidecar (.stats.json)
+# computed on the points shown by the viewer. The JSON keeps the full rows of the points left by publish_table for the current viewer.
+# The binary file and the column shards (in the directory output/) keep every point when they reference a shared geometry,
+# the dropped ones are flagged by a "visible" column.
+# order is the optional progressive order of the points, the binary files and the shards then give their tiers.
+# found is None, or the mask (one column per method) of the values found in the estimations: the other values ("0" or "100")
+# are left out of the distributions of the statistics, and are missing instead in the binary files and the shards
+# when compact is True (compact encoding). Their headers then give the value the viewer shows for them (see publish_fills),
+# fill being the one of the points missing from a method.
+def publish_output(output, table, is_errors, publish_formats, geometry=None, checksum=None, order=None, found=None, compact=False,
+                   fill=0.0):
+    table, visible = publish_table(table, is_errors)
+    if order is not None:
+        table, visible = table[order], visible[order]
+        found = found[order] if found is not None else None
+    if "json" in publish_formats:
+        with profiled("writing", written=[output + ".json"]):
+            wf.write_json(output + ".json", table[visible])
+    visible_table = table[visible]
+    names = ["Ground Truth"] + [method for method, _ in methods]
+    with profiled("writing", written=[output + ".stats.json"]):
+        wf.write_stats(output + ".stats.json", [(name, visible_table[:, 3 + j]) for j, name in enumerate(names)],
+                       binary_validity(found[visible]) if found is not None else None)
+    extra = {}
+    compact = compact and found is not None
+    if geometry is None:
+        if order is not None:
+            extra["tiers"] = wf.tier_rows(len(table), visible)
+        columns = binary_columns(visible_table[:, :3], visible_table[:, 3], visible_table[:, 4:].T)
+        validity = binary_validity(found[visible]) if compact else None
+        fills = publish_fills(found, fill) if compact else None
+        if "bin" in publish_formats:
+            with profiled("writing", written=[output + ".bin"]):
+                wf.write_binary(output + ".bin", columns, extra, compact, validity, fills)
+        if "shards" in publish_formats:
+            with profiled("writing", written=[output]):
+                wf.write_shards(output, columns, extra, compact, validity, fills)
+    else:
+        if order is not None:
+            extra["tiers"] = wf.tier_rows(len(table))
+        columns = binary_columns(None, table[:, 3], table[:, 4:].T) + [("visible", visible.astype(np.float32))]
+        validity = binary_validity(found) if compact else None
+        fills = publish_fills(found, fill) if compact else None
+        if "bin" in publish_formats:
+            with profiled("writing", written=[output + ".bin"]):
+                wf.write_binary(output + ".bin", columns, dict(extra, **geometry_reference(output, geometry + ".bin", checksum)),
+                                compact, validity, fills)
+        if "shards" in publish_formats:
+            reference = geometry_reference(os.path.join(output, wf.shard_index_name), geometry + ".bin", checksum)
+            with profiled("writing", written=[output]):
+                wf.write_shards(output, columns, dict(extra, **reference), compact, validity, fills)
+
+# Merged values as a float table: positions, ground truth, then one column per method
+def merged_table(gt_positions, gt_values, method_values):
+    return np.column_stack([gt_positions.astype(np.float64), gt_values] + [values.astype(np.float64) for values in method_values])
+
+# Column of the JetFitting errors in the merged files, they are published as their square root
+jetfitting_column = dict(methods)["JetFitting"]
+
+# Publishing rules of the web assets (formerly applied by frontend/scripts/convertPtsToJson.js):
+# the JetFitting errors are published as their square root,
+# and the points where every method column is 0 are not shown.
+# Returns the table and the mask of the points to show.
+def publish_table(table, is_errors):
+    if is_errors:
+        with np.errstate(invalid='ignore'):
+            table[:, jetfitting_column] = np.sqrt(table[:, jetfitting_column])
+    visible = np.any(table[:, 4:] != 0, axis=1)
+    return table, visible
+
+# The shape "selle" is published as "saddle"
+def published_name(shape):
+    return shape.replace("selle", "saddle")
+
+# Columns of the binary web format: the positions (unless None), the ground truth, then one column per method
+def binary_columns(gt_positions, gt_values, method_values):
+    columns = [("position", gt_positions.astype(np.float32))] if gt_positions is not None else []
+    columns += [("Ground Truth", gt_values.astype(np.float32))]
+    columns += [(method, values.astype(np.float32)) for (method, _), values in zip(methods, method_values)]
+    return columns
+
+# Masks of the valid values of the method columns of the binary web format, from the mask of the values found in the estimations
+def binary_validity(found):
+    return {method: found[:, j] for j, (method, _) in enumerate(methods)}
+
+# Values shown for the missing values of the method columns of the compact web format: "100" for a method missing from the shape,
+# as in the merged files, and fill for the points missing from a method (0 for the estimations, but 100 for the errors,
+# where 0 would show them as perfect)
+def publish_fills(found, fill):
+    return {method: fill if np.any(found[:, j]) else 100.0 for j, (method, _) in enumerate(methods)}
+
+# Number of points formatted and flushed at once by write_merged, it bounds the memory used by the output
+write_chunk_size = 65536
+
+# Writes a merged file: the ground truth positions and value, then one column per method.
+# The method values are text tokens written as is, or floats (computed errors) written like the ground truth values.
+# gt_positions or gt_values can be None to write the values or the positions only, header is an optional comment line.
+# The rows are formatted and written chunk by chunk so the whole file is never held in memory.
+def write_merged(output_file, gt_positions, gt_values, method_values, chunk_size=None, header=None):
+    if chunk_size is None:
+        chunk_size = write_chunk_size
+    rows = len(gt_positions) if gt_positions is not None else len(gt_values)
+    output_dir = os.path.dirname(output_file)
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_file, 'w') as f:
+        if header is not None:
+            f.write(header + "\n")
+        for start in range(0, rows, chunk_size):
+            end = start + chunk_size
+            with profiled("formatting"):
+                lines = merged_rows(gt_positions[start:end] if gt_positions is not None else None,
+                                    gt_values[start:end] if gt_values is not None else None,
+                                    [values[start:end] for values in method_values])
+            with profiled("writing", bytes_written=len(lines)):
+                f.write(lines)
+
+# Lines of a merged file for a chunk of points (see write_merged)
+def merged_rows(gt_positions, gt_values, method_values):
+    columns = []
+    if gt_positions is not None:
+        columns += [gt_positions[:, 0].tolist(), gt_positions[:, 1].tolist(), gt_positions[:, 2].tolist()]
+    if gt_values is not None:
+        columns += [[str(value) for value in gt_values.tolist()]]
+    columns += [values.tolist() if values.dtype.kind != 'f' else [str(value) for value in values.tolist()] for values in method_values]
+    return "\n".join(" ".join(row) for row in zip(*columns)) + "\n"
+
+
+# Out-of-core merge (--memory_limit): the points of the ground truth and of each method file are streamed and partitioned
+# by a hash of their position into bucket files, each bucket is aligned on its own (the same position always lands in the
+# same bucket), and the aligned values are scattered into memory-mapped columns in the order of the ground truth.
+# The merged files are then written by streaming the ground truth again, so the memory used is about the size of a bucket.
+
+# Bytes of memory used by the in-memory merge per byte of input file (text tokens and float arrays), used to pick the bucket count
+merge_memory_factor = 8
+
+# Parses a size such as 512M or 4G (bytes without unit)
+def parse_size(text):
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    text = text.strip().upper().rstrip("B")
+    if text[-1:] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+# Number of buckets so that the ground truth and the largest method file of a bucket fit in memory_limit bytes
+def bucket_count(groundtruth, merges, memory_limit):
+    largest = max([os.path.getsize(path) for _, method_files, _ in merges for path in method_files.values()], default=0)
+    needed = (os.path.getsize(groundtruth) + largest) * merge_memory_factor
+    return max(1, -(-needed // memory_limit))
+
+# Bucket of each position, from the exact keys used by align_positions
+def position_buckets(positions, buckets):
+    keys = position_keys(positions).view(np.uint64)
+    hashes = keys[:, 0] * np.uint64(0x9E3779B97F4A7C15) ^ keys[:, 1] * np.uint64(0xC2B2AE3D27D4EB4F) ^ keys[:, 2] * np.uint64(0x165667B19E3779F9)
+    return ((hashes ^ (hashes >> np.uint64(29))) % np.uint64(buckets)).astype(np.int64)
+
+# Appends the positions and payload (row numbers or values) of a chunk to the file of their bucket, in the order of the chunk
+def save_buckets(files, buckets, positions, payload):
+    order = np.argsort(buckets, kind="stable")
+    bounds = np.searchsorted(buckets[order], np.arange(len(files) + 1))
+    for bucket, f in enumerate(files):
+        rows = order[bounds[bucket]:bounds[bucket + 1]]
+        if len(rows) > 0:
+            np.save(f, positions[rows])
+            np.save(f, payload[rows])
+
+# Positions and payload of a bucket file, in the order they were saved
+def load_bucket(path):
+    positions = []
+    payload = []
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        while f.tell() < size:
+            positions.append(np.load(f))
+            payload.append(np.load(f))
+    if len(positions) == 0:
+        return np.empty((0, 3)), None
+    return np.concatenate(positions), np.concatenate(payload)
+
+# Partitions the rows of a .pts file into bucket files: the positions (clamped for the estimations) and the payload
+# of each row, its row number for the ground truth or its value tokens. Returns the number of rows and the token width.
+def partition_pts(filename, columns, paths, is_groundtruth):
+    files = [open(path, 'wb') for path in paths]
+    rows = 0
+    width = 1
+    try:
+        for content in pts_chunks(filename):
+            positions = parse_pts(content, [0, 1, 2], np.float64)
+            if is_groundtruth:
+                payload = np.arange(rows, rows + len(positions))
             else:
-                print(f"Method {method} not found for shape {shape}")
-                aligned_values[method] = ["100"] * len(gt_positions)
-        merged_file_content = ""
-        for i in range(len(gt_positions)):
-            pos = gt_positions[i]
-            line = f"{pos[0]} {pos[1]} {pos[2]} {gt_values[i]}"
+                positions = clamp_positions(positions)
+                payload = parse_pts(content, columns).astype(np.bytes_)
+                width = max(width, payload.dtype.itemsize)
+            save_buckets(files, position_buckets(positions, len(paths)), positions, payload)
+            rows += len(positions)
+    finally:
+        for f in files:
+            f.close()
+    return rows, width
+
+# Same as merge_shape (merged .pts files only) with the points partitioned in the given number of buckets
+def merge_shape_out_of_core(shape, groundtruth, merges, buckets):
+    with tempfile.TemporaryDirectory(prefix="merge_pts_") as tmp:
+        gt_paths = [os.path.join(tmp, f"gt_{bucket}.npy") for bucket in range(buckets)]
+        with profiled("parsing", "groundtruth", read=[groundtruth]):
+            rows, _ = partition_pts(groundtruth, [], gt_paths, True)
+
+        aligned = []
+        for m, (kind, method_files, outputs) in enumerate(merges):
+            value_indices = [value_idx for value_idx, _, _, _ in outputs]
+            aligned_values = {}
             for method, _ in methods:
-                line += " " + aligned_values[method][i]
-            merged_file_content += line + "\n"
-        output_file = os.path.join(output_dir, shape + ".pts")
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        with open(output_file, 'w') as f:
-            f.write(merged_file_content)
+                if method not in method_files:
+                    print(f"Method {method} not found for shape {shape}")
+                    aligned_values[method] = None
+                    continue
+                print (method_files[method] + " " + " ".join(str(idx) for idx in value_indices))
+                paths = [os.path.join(tmp, f"{m}_{method}_{bucket}.npy") for bucket in range(buckets)]
+                with profiled("parsing", method, read=[method_files[method]]):
+                    _, width = partition_pts(method_files[method], value_indices, paths, False)
+                with profiled("alignment", method):
+                    values = np.lib.format.open_memmap(os.path.join(tmp, f"{m}_{method}.npy"), mode="w+", dtype=f"S{width}", shape=(rows, len(value_indices)))
+                    values[:] = b"0"
+                    for bucket in range(buckets):
+                        gt_positions, gt_rows = load_bucket(gt_paths[bucket])
+                        est_positions, est_values = load_bucket(paths[bucket])
+                        if gt_rows is not None and est_values is not None:
+                            index = align_positions(gt_positions, est_positions)
+                            found = index >= 0
+                            values[gt_rows[found]] = est_values[index[found]]
+                        os.remove(paths[bucket])
+                aligned_values[method] = values
+            aligned.append(aligned_values)
+
+        # Every output is written in the same pass over the ground truth
+        outputs = []
+        gt_indices = []
+        for (kind, method_files, merge_outputs), aligned_values in zip(merges, aligned):
+            for i, (_, gt_idx, output_dir, _) in enumerate(merge_outputs):
+                if not os.path.exists(output_dir):
+                    os.makedirs(output_dir, exist_ok=True)
+                outputs.append((open(os.path.join(output_dir, shape + ".pts"), 'w'), i, gt_idx, aligned_values))
+                if gt_idx not in gt_indices:
+                    gt_indices.append(gt_idx)
+        with profiled("writing", read=[groundtruth], written=[f.name for f, _, _, _ in outputs]):
+            try:
+                start = 0
+                for content in pts_chunks(groundtruth):
+                    positions = parse_pts(content, [0, 1, 2])
+                    end = start + len(positions)
+                    gt_values = dict(zip(gt_indices, ground_truth_values(parse_pts(content, ground_truth_columns(), np.float64), gt_indices)))
+                    for f, i, gt_idx, aligned_values in outputs:
+                        method_values = [aligned_values[method][start:end, i].astype(str) if aligned_values[method] is not None else np.full(len(positions), "100")
+                                         for method, _ in methods]
+                        f.write(merged_rows(positions, gt_values[gt_idx], method_values))
+                    start = end
+            finally:
+                for f, _, _, _ in outputs:
+                    f.close()
+        del aligned
+
+
+def merge_files(groundtruths, estimations, quantity_idx=4, output_dir="", tolerance=None, read_threads=1):
+    for shape in groundtruths:
+        print("\n[ESTIMATION] Merging shape " + shape  + " with quantity " + str(quantity_idx))
+        merge_shape(shape, groundtruths[shape], [("estims", estimations[shape], [(quantity_idx, quantity_idx, output_dir, None)])], tolerance,
+                    read_threads=read_threads)
 
 
-def merge_files_error(groundtruths, errors, quantity_idx_err, quantity_idx, output_dir):
+def merge_files_error(groundtruths, errors, quantity_idx_err, quantity_idx, output_dir, tolerance=None, read_threads=1):
     for shape in groundtruths:
         print("\n[ERROR] Merging shape " + shape + " with quantity " + str(quantity_idx_err) + " and " + str(quantity_idx))
-        gt_positions, gt_values = grab_ground_truth(groundtruths[shape], quantity_idx)
-        err_maps = {}
-        for method in errors[shape]:
-            est_positions, est_values = grab_values(errors[shape][method], quantity_idx_err)
-            pos_to_err = {tuple(float(p) for p in pos): val for pos, val in zip(est_positions, est_values)}
-            err_maps[method] = pos_to_err
-        aligned_errors = {}
-        for method, _ in methods:
-            if method in err_maps:
-                method_map = err_maps[method]
-                aligned = []
-                for pos in gt_positions:
-                    key = tuple(float(p) for p in pos)
-                    aligned.append(method_map.get(key, "0"))
-                aligned_errors[method] = aligned
-            else:
-                print("Method " + method + " not found for shape " + shape)
-                aligned_errors[method] = ["100"] * len(gt_positions)
-        merged_file_content = ""
-        for i in range(len(gt_values)):
-            pos = gt_positions[i]
-            line = f"{pos[0]} {pos[1]} {pos[2]} {gt_values[i]}"
-            for method, _ in methods:
-                line += " " + aligned_errors[method][i]
-            merged_file_content += line + "\n"
-        output_file = os.path.join(output_dir, shape + ".pts")
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        with open(output_file, 'w') as f:
-            f.write(merged_file_content)
+        merge_shape(shape, groundtruths[shape], [("errors", errors[shape], [(quantity_idx_err, quantity_idx, output_dir, None)])], tolerance,
+                    read_threads=read_threads)
+
+
+# Builds the merges of merge_shape for every quantity of quantities_n_idx (and quantities_n_idx_err for the errors).
+# estimations and errors are the dictionaries given by estimation_paths (or None),
+# their outputs go to <output_dir>/<quantity_name>/<shape>.pts, and their web assets to <publish_dir>/<quantity_name>/ if given.
+# With compute_errors, the errors are computed from the estimations instead of read from errors (with the angular errors
+# of directions_n_idx too when angular_errors is True).
+def shape_merges(shape, estimations, errors, estimations_output_dir="", errors_output_dir="", estimations_publish_dir=None, errors_publish_dir=None,
+                 compute_errors=False, angular_errors=False):
+    def publish_dir(root, quantity_name):
+        return os.path.join(root, quantity_name) if root is not None else None
+
+    merges = []
+    if estimations is not None and shape in estimations:
+        merges.append(("estims", estimations[shape],
+                       [(quantity_idx, quantity_idx, os.path.join(estimations_output_dir, quantity_name), publish_dir(estimations_publish_dir, quantity_name))
+                        for quantity_name, quantity_idx in quantities_n_idx]))
+    if compute_errors and estimations is not None and shape in estimations:
+        quantities = [(quantity_name, quantity_idx) for quantity_name, quantity_idx in quantities_n_idx]
+        if angular_errors:
+            quantities += [(name, name) for name, _ in directions_n_idx]
+        merges.append(("computed", estimations[shape],
+                       [(quantity, quantity, os.path.join(errors_output_dir, quantity_name), publish_dir(errors_publish_dir, quantity_name))
+                        for quantity_name, quantity in quantities]))
+    elif errors is not None and shape in errors:
+        merges.append(("errors", errors[shape],
+                       [(quantity_idx_err, quantity_idx, os.path.join(errors_output_dir, quantity_name_err), publish_dir(errors_publish_dir, quantity_name_err))
+                        for (quantity_name_err, quantity_idx_err), (_, quantity_idx) in zip(quantities_n_idx_err, quantities_n_idx)]))
+    return merges
+
+# Merges every quantity in a single pass per shape
+def merge_files_all_quantities(groundtruths, estimations, errors, estimations_output_dir="", errors_output_dir="", tolerance=None, read_threads=1):
+    for shape in groundtruths:
+        print("\n[MERGE] Merging shape " + shape + " with quantities " + ", ".join(name for name, _ in quantities_n_idx))
+        merges = shape_merges(shape, estimations, errors, estimations_output_dir, errors_output_dir)
+        merge_shape(shape, groundtruths[shape], merges, tolerance, read_threads=read_threads)
+
+# A work unit is (dataset, shape, groundtruth, merges, geometry) and only holds file paths, so it is cheap to send to a worker.
+# Runs one unit and returns its log, the error traceback (None on success) instead of raising, and its profile rows
+# (see profiled) when profile is True, with a "total" row giving its time and the peak memory of its process so far.
+# options are the keyword arguments given to merge_shape.
+def merge_unit(unit, options=None, profile=False):
+    dataset, shape, groundtruth, merges, geometry = unit
+    if options is None:
+        options = {}
+    log = io.StringIO()
+    error = None
+    if profile:
+        start_profile(dataset, shape)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        print("\n[MERGE] Merging shape " + shape + " of " + dataset + " with quantities " + ", ".join(name for name, _ in quantities_n_idx))
+        try:
+            merge_shape(shape, groundtruth, merges, geometry=geometry, **options)
+        except Exception:
+            error = traceback.format_exc()
+    rows = stop_profile()
+    if profile:
+        rows.append({"dataset": dataset, "shape": shape, "quantity": "", "method": "", "stage": "total",
+                     "seconds": time.perf_counter() - start, "peak_rss": peak_rss()})
+    return log.getvalue(), error, rows
+
+# Prints the log of a unit, skipping the lines it already printed
+def print_unit_log(log):
+    seen = set()
+    for line in log.splitlines():
+        if line.strip() != "" and line in seen:
+            continue
+        seen.add(line)
+        print(line)
+
+# Runs the units on jobs processes. Logs are printed in the order of the units, whatever the order they finish in.
+# Returns the list of (dataset, shape, traceback) of the units that failed.
+# When profile is a list, the profile rows of the units are appended to it.
+def run_units(units, jobs=1, options=None, profile=None):
+    failures = []
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        if executor is not None:
+            results = [executor.submit(merge_unit, unit, options, profile is not None) for unit in units]
+        for i, unit in enumerate(units):
+            log, error, rows = results[i].result() if executor is not None else merge_unit(unit, options, profile is not None)
+            if profile is not None:
+                profile += rows
+            print_unit_log(log)
+            if error is not None:
+                print(error)
+                failures.append((unit[0], unit[1], error))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return failures
+
+
+# Name of the manifest holding the fingerprints of the inputs of every merged shape, stored in the output directory
+manifest_name = ".merge_manifest.json"
+
+# Size and modification time of a file. With with_hash, the content hash replaces the modification time,
+# so a file touched but not modified is not seen as changed.
+def file_fingerprint(path, with_hash=False):
+    stat = os.stat(path)
+    if not with_hash:
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return {"size": stat.st_size, "sha1": sha.hexdigest()}
+
+# Fingerprint of everything a unit depends on: its ground truth, its method files and the merge parameters.
+# It goes through json so that it compares equal to the one loaded from the manifest.
+def unit_fingerprint(unit, params, with_hash=False):
+    _, _, groundtruth, merges, geometry = unit
+    fingerprint = {
+        "groundtruth": [groundtruth, file_fingerprint(groundtruth, with_hash)],
+        "merges": [[kind, [[method, method_files[method], file_fingerprint(method_files[method], with_hash)] for method, _ in methods if method in method_files], outputs]
+                   for kind, method_files, outputs in merges],
+        "geometry": geometry,
+        "methods": methods,
+        "params": params,
+    }
+    return json.loads(json.dumps(fingerprint))
+
+def unit_key(unit):
+    return unit[0] + "/" + unit[1]
+
+def unit_outputs(unit, formats=("pts",), publish_formats=("json",)):
+    _, shape, _, merges, geometry = unit
+    files = []
+    for _, _, outputs in merges:
+        for _, _, output_dir, publish_dir in outputs:
+            files += [os.path.join(output_dir, shape + "." + extension) for extension in formats]
+            if publish_dir is not None:
+                published = os.path.join(publish_dir, published_name(shape))
+                files += [published + "." + extension for extension in publish_formats if extension != "shards"]
+                files += [published + ".stats.json"]
+                if "shards" in publish_formats:
+                    files += [os.path.join(published, wf.shard_index_name)]
+    if geometry is not None and geometry.get("output") is not None:
+        files += [geometry["output"] + "." + extension for extension in formats]
+    if geometry is not None and geometry.get("publish") is not None and ("bin" in publish_formats or "shards" in publish_formats):
+        files += [geometry["publish"] + ".bin"]
+    return files
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_manifest(path, manifest):
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path + ".tmp", 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(path + ".tmp", path)
+
+# Splits the units between the ones to merge and the ones whose inputs, parameters and outputs did not change since
+# the manifest was written. params are the merge_shape options. Returns (units to merge, their fingerprints).
+def outdated_units(units, manifest, params, with_hash=False, force=False):
+    outdated = []
+    fingerprints = []
+    for unit in units:
+        fingerprint = unit_fingerprint(unit, params, with_hash)
+        up_to_date = manifest.get(unit_key(unit)) == fingerprint and all(os.path.exists(output) for output in unit_outputs(unit, params.get("formats", ("pts",)), params.get("publish_formats", ("json",))))
+        if up_to_date and not force:
+            print ("[SKIP] " + unit_key(unit) + " is up to date")
+            continue
+        outdated.append(unit)
+        fingerprints.append(fingerprint)
+    return outdated, fingerprints
 
 
 if __name__ == '__main__' :
@@ -255,10 +1197,36 @@ if __name__ == '__main__' :
     parser.add_argument('--groundtruths', type=str, help='Input dataset groundtruths.', required=True)
     parser.add_argument('--estimations', type=str, help='Input estimations.', default="")
     parser.add_argument('--errors', type=str, help='Input errors.', default="")
-    parser.add_argument('--output', type=str, help='Output directory.', required=True)
+    parser.add_argument('--output', type=str, help='Output directory. When both estimations and errors are given, they go to its estims/ and errors/ subdirectories.', required=True)
     parser.add_argument('--quantity_idx', type=int, default=4, help='Index of the quantity to merge.')
+    parser.add_argument('--tolerance', type=float, default=None, help='Match positions to their nearest neighbour within this distance instead of exactly.')
+    parser.add_argument('--datasets', type=str, nargs='+', default=default_datasets, choices=[name for _, name in dataset_gt_e], help='Datasets to merge.')
+    parser.add_argument('--jobs', type=int, default=1, help='Number of shapes merged in parallel.')
+    parser.add_argument('--read_threads', type=int, default=1, help='Number of method files of a shape read concurrently (helps on networked storage).')
+    parser.add_argument('--force', action='store_true', help='Merge every shape, even the ones whose inputs did not change since the last run.')
+    parser.add_argument('--publish', type=str, default="", help='Also write the web assets to this directory, laid out like the output directory.')
+    parser.add_argument('--format', type=str, nargs='+', default=["pts"], choices=["pts", "bin"], help='Written files: merged text .pts and/or binary columnar .bin for the viewer.')
+    parser.add_argument('--publish_format', type=str, nargs='+', default=["json"], choices=["json", "bin", "shards"], help='Published web assets: JSON rows, binary columnar .bin and/or one .bin per column with an index.json.')
+    parser.add_argument('--split_geometry', action='store_true', help='Write the positions once per shape in a geometry file, the other files only hold the values.')
+    parser.add_argument('--geometry_dir', type=str, default="", help='Directory of the geometry files of the merged files (default: <output>/geometry).')
+    parser.add_argument('--publish_geometry_dir', type=str, default="", help='Directory of the geometry files of the web assets (default: <publish>/geometry).')
+    parser.add_argument('--lod', action='store_true', help='Publish the points in progressive order with level of detail tiers (about 10k, 100k and all the points).')
+    parser.add_argument('--compact', action='store_true', help='Publish the binary web assets with the compact encoding (16 bits values, missing values in a validity bitmap).')
+    parser.add_argument('--compute_errors', action='store_true', help='Compute the errors tree from the estimations and the ground truth, in the same pass, instead of reading --errors.')
+    parser.add_argument('--error_mode', type=str, default="abs", choices=["abs", "relative"], help='Computed errors: absolute or relative to the ground truth.')
+    parser.add_argument('--angular_errors', action='store_true', help='Also compute the angular errors of the normals and principal directions (see directions_n_idx).')
+    parser.add_argument('--memory_limit', '--memory-limit', type=str, default=None, help='Memory available per shape (e.g. 4G): larger shapes are merged out of core, in buckets on disk.')
+    parser.add_argument('--hash', action='store_true', help='Also compare the content hash of the inputs to detect changes, not only their size and modification time.')
+    parser.add_argument('--catalog', type=str, default="", help='Catalog of the estimation files, reused to only list the changed directories (default: <output>/' + catalog_name + ').')
+    parser.add_argument('--rescan', action='store_true', help='List every directory of the estimations again instead of reusing the catalog.')
+    parser.add_argument('--profile', type=str, nargs='?', const="", default=None, help='Write the time, bytes read and written, and peak memory of every stage, shape and method to this report (.json, or .csv; default: <output>/merge_profile.json) and print a summary.')
     args = parser.parse_args()
 
+    if args.compute_errors and (args.estimations == "" or args.errors != ""):
+        parser.error("--compute_errors needs --estimations and replaces --errors")
+    if args.memory_limit is not None and (args.tolerance is not None or args.publish != "" or args.format != ["pts"] or args.split_geometry or args.compute_errors):
+        parser.error("--memory_limit only writes the merged .pts files, without --tolerance, --publish, --format bin, --split_geometry and --compute_errors")
+
     if args.groundtruths.endswith("/") :
         args.groundtruths = args.groundtruths[:-1]
     
@@ -268,26 +1236,102 @@ if __name__ == '__main__' :
     if args.output.endswith("/") :
         args.output = args.output[:-1]
 
-    if args.estimations != "" :
-        for groundtruth_name, estimation_name in dataset_gt_e :
-            for quantity_name, quantity_idx in quantities_n_idx :
-                groundtruth_path = os.path.join(args.groundtruths, groundtruth_name)
-                estimation_path = os.path.join(args.estimations, estimation_name) 
-                output_dir = os.path.join(args.output, estimation_name, quantity_name)
-                print (f'gt {groundtruth_path}, estim {estimation_path}, out: {output_dir}')
-                estimations = estimation_paths(estimation_path)
-                groundtruths = groundtruth_paths(estimations, groundtruth_path)
-                merge_files(groundtruths, estimations, quantity_idx, output_dir)
-
-    if args.errors != "" :
-        for groundtruth_name, estimation_name in dataset_gt_e :
-            for (quantity_name_err, quantity_idx_err), (quantity_name, quantity_idx) in zip(quantities_n_idx_err, quantities_n_idx) :
-                print (f"\n{quantity_name_err} , {quantity_idx_err}")
-                print (f"{quantity_name} , {quantity_idx}")
-                groundtruth_path = os.path.join(args.groundtruths, groundtruth_name)
-                error_path = os.path.join(args.errors, estimation_name) 
-                output_dir = os.path.join(args.output, estimation_name, quantity_name_err)
-                print (f'gt {groundtruth_path}, estim {error_path}, out: {output_dir}')
-                errors = estimation_paths(error_path)
-                groundtruths = groundtruth_paths(errors, groundtruth_path)
-                merge_files_error(groundtruths, errors, quantity_idx_err, quantity_idx, output_dir)
\ No newline at end of file
+    if args.publish.endswith("/") :
+        args.publish = args.publish[:-1]
+
+    if args.profile == "" :
+        args.profile = os.path.join(args.output, "merge_profile.json")
+    profile = [] if args.profile is not None else None
+    run_start = time.perf_counter()
+
+    estimations_output = args.output
+    errors_output = args.output
+    estimations_publish = args.publish
+    errors_publish = args.publish
+    if args.estimations != "" and (args.errors != "" or args.compute_errors) :
+        estimations_output = os.path.join(args.output, "estims")
+        errors_output = os.path.join(args.output, "errors")
+        estimations_publish = os.path.join(args.publish, "estims")
+        errors_publish = os.path.join(args.publish, "errors")
+
+    catalog_path = args.catalog or os.path.join(args.output, catalog_name)
+    catalog = load_catalog(catalog_path)
+    if args.rescan :
+        catalog["datasets"] = {}
+
+    units = []
+    for groundtruth_name, estimation_name in dataset_gt_e :
+        if estimation_name not in args.datasets :
+            continue
+        groundtruth_path = os.path.join(args.groundtruths, groundtruth_name)
+        estimations = None
+        errors = None
+        shapes = {}
+        if profile is not None :
+            start_profile(estimation_name)
+        if args.estimations != "" :
+            estimation_path = os.path.join(args.estimations, estimation_name)
+            print (f'gt {groundtruth_path}, estim {estimation_path}, out: {os.path.join(estimations_output, estimation_name)}')
+            with profiled("discovery") :
+                estimations = estimation_paths(estimation_path, catalog)
+            shapes.update(estimations)
+        if args.errors != "" :
+            error_path = os.path.join(args.errors, estimation_name)
+            print (f'gt {groundtruth_path}, errors {error_path}, out: {os.path.join(errors_output, estimation_name)}')
+            with profiled("discovery") :
+                errors = estimation_paths(error_path, catalog)
+            shapes.update(errors)
+        with profiled("discovery") :
+            groundtruths = groundtruth_paths(shapes, groundtruth_path)
+        if profile is not None :
+            profile += stop_profile()
+        for shape in groundtruths:
+            merges = shape_merges(shape, estimations, errors,
+                                  os.path.join(estimations_output, estimation_name), os.path.join(errors_output, estimation_name),
+                                  os.path.join(estimations_publish, estimation_name) if args.publish != "" else None,
+                                  os.path.join(errors_publish, estimation_name) if args.publish != "" else None,
+                                  args.compute_errors, args.angular_errors)
+            geometry = None
+            if args.split_geometry :
+                geometry = {
+                    "output": os.path.join(args.geometry_dir or os.path.join(args.output, "geometry"), estimation_name, shape),
+                    "publish": os.path.join(args.publish_geometry_dir or os.path.join(args.publish, "geometry"), estimation_name, published_name(shape)) if args.publish != "" else None,
+                }
+            units.append((estimation_name, shape, groundtruths[shape], merges, geometry))
+
+    save_catalog(catalog_path, catalog)
+
+    manifest_path = os.path.join(args.output, manifest_name)
+    manifest = load_manifest(manifest_path)
+    options = {"tolerance": args.tolerance, "formats": args.format, "publish_formats": args.publish_format, "lod": args.lod, "compact": args.compact, "error_mode": args.error_mode}
+    total = len(units)
+    units, fingerprints = outdated_units(units, manifest, options, args.hash, args.force)
+    # The memory limit and the read threads change how the shapes are merged, not their outputs, so they are not part of the fingerprints
+    if args.memory_limit is not None :
+        options["memory_limit"] = parse_size(args.memory_limit)
+    if args.read_threads > 1 :
+        options["read_threads"] = args.read_threads
+
+    failures = run_units(units, args.jobs, options, profile)
+    failed = set(dataset + "/" + shape for dataset, shape, _ in failures)
+    for unit, fingerprint in zip(units, fingerprints) :
+        if unit_key(unit) in failed :
+            manifest.pop(unit_key(unit), None)
+        else :
+            manifest[unit_key(unit)] = fingerprint
+    save_manifest(manifest_path, manifest)
+
+    if profile is not None :
+        peaks = [peak for peak in (peak_rss(), peak_rss(children=True)) if peak is not None]
+        profile.append({"dataset": "", "shape": "", "quantity": "", "method": "", "stage": "run",
+                        "seconds": time.perf_counter() - run_start, "peak_rss": max(peaks) if len(peaks) > 0 else None})
+        write_profile(args.profile, profile)
+        print_profile_summary(profile)
+        print (f"Profile written to {args.profile}")
+
+    print (f"\nMerged {len(units) - len(failures)}/{len(units)} shapes, {total - len(units)} up to date")
+    if len(failures) > 0 :
+        print (f"{len(failures)} shape(s) failed:")
+        for dataset, shape, error in failures :
+            print (f"  {dataset}/{shape}: {error.strip().splitlines()[-1]}")
+        sys.exit(1)
@@ -1,7 +1,18 @@
+import numpy as np
 import pandas as pd
 import seaborn as sns
 import sys
 import os
+import re
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+try:
+    import pyarrow
+    import pyarrow.feather
+except ImportError:
+    pyarrow = None
 
 
 import methods as m
@@ -37,18 +48,36 @@ dataset_properties = {
 def clean_data(dataframe):
     # for each row, if the column dataset is provided, check if columns containing diff_properties are in the dataset_properties. 
     # If not, put the value at the column to Nan.
-
-    for index, row in dataframe.iterrows():
-
-        if "dataset" in dataframe.columns:
-            current_dataset = row["dataset"]
-            for column in dataframe.columns:
-                for prop in diff_properties:
-                    if prop in column:
-                        if prop not in dataset_properties[current_dataset]:
-                            dataframe.at[index, column] = None
-        else :
-            continue
+    # The (dataset x column) validity is decided once per distinct dataset, and the columns invalid for the same datasets
+    # are cleared together, with a single assignment on the rows of these datasets.
+
+    if "dataset" not in dataframe.columns:
+        return dataframe
+
+    column_properties = [(column, [prop for prop in diff_properties if prop in column]) for column in dataframe.columns]
+    column_properties = [(column, props) for column, props in column_properties if len(props) > 0]
+    if len(column_properties) == 0:
+        return dataframe
+
+    datasets = dataframe["dataset"].unique()
+    for current_dataset in datasets:
+        if current_dataset not in dataset_properties:
+            raise KeyError(current_dataset)
+
+    invalid_columns = {}
+    for column, props in column_properties:
+        invalid_datasets = tuple(current_dataset for current_dataset in datasets
+                                 if any(prop not in dataset_properties[current_dataset] for prop in props))
+        if len(invalid_datasets) > 0:
+            invalid_columns.setdefault(invalid_datasets, []).append(column)
+
+    for invalid_datasets, columns in invalid_columns.items():
+        rows = dataframe["dataset"].isin(invalid_datasets).to_numpy()
+        # The cells used to be cleared by index label, which also clears the rows sharing a label with an invalid row
+        # (the dataframes concatenated by open_data_all repeat their labels)
+        if not dataframe.index.is_unique:
+            rows = dataframe.index.isin(dataframe.index[rows])
+        dataframe.loc[rows, columns] = None
 
     return dataframe
 
@@ -71,6 +100,12 @@ def methods (dataframe, orientation=True):
     else:
         return all_met, unoriented
 
+# Name of a .dat file up to its first ".dat"
+dat_stem_pattern = re.compile(r"^(.*?)(?:\.dat|$)")
+# Parameter name before a "=" of a file name (after its last ".", "_" or "-"), and parameter value after it (up to the next "_" or "-")
+header_name_pattern = re.compile(r"([^._-]*)$")
+header_value_pattern = re.compile(r"^([^_-]*)")
+
 def find_shape(file_path):
     """
     Find the shape name in a file path.
@@ -79,11 +114,9 @@ def find_shape(file_path):
     # Grab the name of the file only
     filename = os.path.basename(file_path)
     # The name should be allErrorStats-shape.dat, but shape can have multiple words separated by "-", "_" or "."
-    # We split the name of the file by "-" "_" and "."
-    grab_name = filename.split(".dat")[0].split("-")[1:]
-    shape_name = ""
-    for i in range(0, len(grab_name)):
-        shape_name += grab_name[i]
+    # The shape is everything after the first "-", without the "-"
+    stem = dat_stem_pattern.match(filename).group(1)
+    shape_name = stem.partition("-")[2].replace("-", "")
 
     # print (f'The name of the shape is : {shape_name}') 
 
@@ -97,75 +130,267 @@ def find_shape(file_path):
     #         return shape
     # return None
 
-def add_header_from_filename(df, file_path):
+def headers_from_filename(file_path):
     """
-    Add headers to a dataframe from its filename.
+    Headers given by a filename, as a list of (name, value).
     """
 
-    # Grab the name of the file
-    filename = os.path.basename(file_path)
     # Split the name of the file
-    filename = filename.split(".dat")[0].split("=")
-    # If there is only one element, it means that there is no header
-    if len(filename) == 1:
-        return df
-    
-    # print (filename)
+    filename = dat_stem_pattern.match(os.path.basename(file_path)).group(1).split("=")
 
     # one "=" is equal to new header, and it is possible to have multiple "="
-    for i in range(0, len(filename)-1):
-        header_name = filename[i].split(".")[-1].split("_")[-1].split("-")[-1]
-        header_value = filename[i+1].split("_")[0].split("-")[0]
+    return [(header_name_pattern.search(filename[i]).group(1), header_value_pattern.match(filename[i+1]).group(1))
+            for i in range(0, len(filename)-1)]
+
+def add_header_from_filename(df, file_path):
+    """
+    Add headers to a dataframe from its filename.
+    """
+
+    # If there is no "=" in the name, there is no header
+    for header_name, header_value in headers_from_filename(file_path):
         df[header_name] = header_value
-        # print (header_name, header_value)
 
     return df
 
-def open_data_file(file_path, header=headers, added_param=[]):
+# Compact schema of the dataframes (compact=True): the statistics are float32, the columns of repeated strings
+# (Method, Shape, added_param and the headers of the filename) categorical and the counts integers.
+# The parameters of the experiments keep their float64 values, the plots select them by equality.
+compact_parameter_columns = ["Radius", "Noise position", "Noise normal", "flip-normal"]
+# Converted to the smallest integer type when all their values are integers (else kept as float64, as the parameters)
+compact_integer_columns = ['N', 'Nb neighbors (mean)', 'Nb neighbors max']
+compact_categorical_columns = ["Method"]
+
+def compact_dtypes(header):
+    """
+    dtypes given to read_csv for the columns of header in the compact schema.
+    """
+    dtypes = {}
+    for column in header:
+        if column in compact_categorical_columns:
+            dtypes[column] = "category"
+        elif column in compact_parameter_columns or column in compact_integer_columns:
+            dtypes[column] = "float64"
+        else:
+            dtypes[column] = "float32"
+    return dtypes
+
+def compact_data(df, header=headers):
+    """
+    Convert a dataframe read with compact_dtypes to the compact schema: the integer counts, and the columns
+    added after the reading (which are not in header) categorical.
+    """
+    for column in compact_integer_columns:
+        if column in df.columns:
+            values = df[column]
+            if values.notna().all() and (values % 1 == 0).all():
+                df[column] = pd.to_numeric(values, downcast="integer")
+    for column in df.columns:
+        if column not in header and not pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = df[column].astype("category")
+    return df
+
+def concat_data(data):
+    """
+    Concatenate dataframes keeping their categorical columns categorical
+    (pd.concat turns them to object columns when their categories differ).
+    """
+    columns = []
+    categorical = []
+    for data_current in data:
+        for column, dtype in data_current.dtypes.items():
+            if column not in columns:
+                columns.append(column)
+            if isinstance(dtype, pd.CategoricalDtype) and column not in categorical:
+                categorical.append(column)
+    # The categorical columns found in every dataframe are concatenated on their own, with the union of their categories
+    shared = [column for column in categorical if all(column in data_current.columns for data_current in data)]
+    df = pd.concat([data_current.drop(columns=shared) for data_current in data])
+    for column in shared:
+        df[column] = pd.api.types.union_categoricals([data_current[column] for data_current in data])
+    df = df[columns]
+    # The other ones miss from some of the dataframes, which gives back object columns (the missing values are NaN)
+    for column in categorical:
+        if column not in shared:
+            df[column] = df[column].astype("category")
+    return df
+
+def open_data_file(file_path, header=headers, added_param=[], compact=False, usecols=None):
+    """
+    Open a dat file, None if it has no shape.
+    compact loads it with the compact schema (see compact_dtypes), usecols only loads these columns of header.
+    """
     shape = find_shape(file_path)
     if shape is None:
         return None
-    df = pd.read_csv(file_path, names=header, delim_whitespace=True,header=None)
+    # The columns are separated by runs of whitespaces, which the C parser handles natively with this separator
+    dtype = None
+    if compact:
+        dtype = compact_dtypes(header if usecols is None else [column for column in header if column in usecols])
+    df = pd.read_csv(file_path, names=header, sep=r"\s+", header=None, engine="c", usecols=usecols, dtype=dtype)
     df["Shape"] = shape
     if added_param != []:
         for param in added_param:
             df[param[0]] = param[1]
     return df
 
-def open_data_dir(dir_path, added_param=[],header=headers, recursive=False):
-    
-    data = []
+def open_data_file_with_headers(file_path, header=headers, added_param=[], compact=False, usecols=None):
+    """
+    Open a dat file with the headers of its filename, None if it has no shape.
+    """
+    data_current = open_data_file(file_path, header, added_param, compact, usecols)
+    if data_current is None:
+        return None
+    data_current = add_header_from_filename(data_current, file_path)
+    if compact:
+        data_current = compact_data(data_current, header)
+    return data_current
 
-    for file in os.listdir(dir_path):
-            file_path = os.path.join(dir_path, file)
-            
-            if file.endswith(".dat"):
-                
-                data_current = open_data_file(file_path, header, added_param)
-                
-                if data_current is None:
-                    continue
+def find_data_files(dir_path, recursive=False):
+    """
+    List the dat files of a directory (and of its subdirectories when recursive), in a single scan
+    and in the order of the directory entries, the files of a subdirectory coming at its place.
+    """
+    files = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".dat") and entry.is_file():
+                files.append(entry.path)
+            if recursive and entry.is_dir():
+                files += find_data_files(entry.path, recursive)
+    return files
+
+def open_data_dir(dir_path, added_param=[],header=headers, recursive=False, workers=None, processes=False, compact=False, usecols=None):
+    """
+    Open the dat files of a directory and return the list of their dataframes.
+    The files are parsed concurrently by workers threads (or processes when processes is True,
+    for the large corpora where the parsing itself is the bottleneck), None lets the pool choose.
+    compact and usecols set the columns loaded and their types (see open_data_file).
+    """
 
-                data.append(add_header_from_filename(data_current, file_path))
+    return open_data_files(find_data_files(dir_path, recursive), added_param, header, workers, processes, compact, usecols)
 
-            if os.path.isdir(file_path) and recursive:
-                data += open_data_dir(file_path, added_param, recursive)
+def open_data_files(files, added_param=[], header=headers, workers=None, processes=False, compact=False, usecols=None):
+    """
+    Open the given dat files and return the list of their dataframes (see open_data_dir).
+    """
 
-    return data
+    if len(files) <= 1:
+        data = [open_data_file_with_headers(file_path, header, added_param, compact, usecols) for file_path in files]
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers) if processes else ThreadPoolExecutor(max_workers=workers)
+        with executor:
+            data = list(executor.map(open_data_file_with_headers, files, [header] * len(files), [added_param] * len(files),
+                                     [compact] * len(files), [usecols] * len(files)))
+
+    return [data_current for data_current in data if data_current is not None]
+
+# Cache of the dataframes of open_data_all (see data_cache_key), disabled when None or empty.
+# It can be set here or with the BENCHMARK_DATA_CACHE environment variable.
+data_cache_dir = os.environ.get("BENCHMARK_DATA_CACHE")
+# Once the cache is larger than this (in bytes), the least recently used dataframes are removed
+data_cache_size_limit = 2 << 30
+# Feather files memory-mapped back with pyarrow, pickles without it
+data_cache_extension = ".feather" if pyarrow is not None else ".pkl"
+
+def data_cache_key(dir_path, files, added_param, header, recursive, compact=False, usecols=None):
+    """
+    Keys of the cached dataframe of a directory: (source, content).
+    The source identifies the directory and the parameters of the call, the content the dat files (with their size and
+    modification time), so that any change of a file gives another cached dataframe.
+    """
+    source = [os.path.abspath(dir_path), recursive, list(header), [list(param) for param in added_param]]
+    # The default loading keeps the keys it had before the compact schema
+    if compact or usecols is not None:
+        source += [compact, None if usecols is None else list(usecols)]
+    source = json.dumps(source, default=str)
+    content = []
+    for file_path in files:
+        stat = os.stat(file_path)
+        content.append((os.path.relpath(file_path, dir_path), stat.st_size, stat.st_mtime_ns))
+    source_key = hashlib.sha1(source.encode()).hexdigest()[:16]
+    return source_key, hashlib.sha1(json.dumps([source, content]).encode()).hexdigest()[:16]
+
+def read_data_cache(path):
+    """
+    Read a cached dataframe, None if it is missing or unreadable.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        if path.endswith(".feather"):
+            df = pyarrow.feather.read_table(path, memory_map=True).to_pandas()
+        else:
+            df = pd.read_pickle(path)
+    except Exception:
+        return None
+    # The access time is kept in the modification time, for the eviction
+    os.utime(path)
+    return df
 
-def open_data_all(dir_path, added_param=[],header=headers, recursive=False):
+def write_data_cache(cache_dir, source_key, content_key, df, size_limit=None):
+    """
+    Cache a dataframe, replacing the ones of the same source (their dat files changed since),
+    then remove the least recently used dataframes until the cache fits in size_limit.
+    """
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, source_key + "-" + content_key + data_cache_extension)
+    if data_cache_extension == ".feather":
+        pyarrow.feather.write_feather(df, path + ".tmp", compression="uncompressed")
+    else:
+        df.to_pickle(path + ".tmp", protocol=5)
+    os.replace(path + ".tmp", path)
+
+    cached = []
+    for entry in os.scandir(cache_dir):
+        if entry.path == path or not entry.name.endswith((".feather", ".pkl")):
+            continue
+        if entry.name.startswith(source_key + "-"):
+            os.remove(entry.path)
+        else:
+            cached.append((entry.stat().st_mtime, entry.stat().st_size, entry.path))
+    size = os.path.getsize(path) + sum(file_size for _, file_size, _ in cached)
+    size_limit = data_cache_size_limit if size_limit is None else size_limit
+    for _, file_size, file_path in sorted(cached):
+        if size <= size_limit:
+            break
+        os.remove(file_path)
+        size -= file_size
+    return path
+
+def open_data_all(dir_path, added_param=[],header=headers, recursive=False, workers=None, processes=False, cache_dir=None, compact=False, usecols=None):
     """
     Open a dat file and return a dataframe.
     added_param is a list of tuple (name, value) to add to the dataframe.
     recursive is a boolean to open all the files in the directory and subdirectories.
+    workers and processes set the pool parsing the files (see open_data_dir).
+    cache_dir is the directory of the dataframes cache: None uses data_cache_dir (the BENCHMARK_DATA_CACHE environment
+    variable), and an empty value ("" or False) disables the cache even when data_cache_dir is set.
+    The dataframe is read back from the cache as long as the dat files do not change.
+    compact loads the dataframe with the compact schema (see compact_dtypes), several times smaller in memory,
+    and usecols only loads these columns of header (Shape and the added headers are always there).
     
     [TODO] Modify this function to be generic with shapes.
     """
 
-    data = open_data_dir(dir_path, added_param,header, recursive)
+    if cache_dir is None:
+        cache_dir = data_cache_dir
+    cache_dir = cache_dir or None
+    files = find_data_files(dir_path, recursive)
+    if cache_dir is not None and len(files) > 0:
+        source_key, content_key = data_cache_key(dir_path, files, added_param, header, recursive, compact, usecols)
+        df = read_data_cache(os.path.join(cache_dir, source_key + "-" + content_key + data_cache_extension))
+        if df is not None:
+            return df
+
+    data = open_data_files(files, added_param, header, workers, processes, compact, usecols)
 
     if len(data) != 0:
-        return pd.concat(data)
+        df = concat_data(data) if compact else pd.concat(data)
+        if cache_dir is not None:
+            write_data_cache(cache_dir, source_key, content_key, df)
+        return df
     
     return None
 
@@ -175,4 +400,127 @@ def add_header(df, added_param=[]):
     """
     for param in added_param:
         df[param[0]] = param[1]
-    return df
\ No newline at end of file
+    return df
+
+
+# Keys of the aggregate cubes (the ones missing from the dataframe are left out): the datasets sit side by side in a cube,
+# the first level of its index
+cube_keys = ["dataset", "N", "Radius", "Noise position", "Noise normal", "Shape", "Method"]
+# Statistics of each column of the dataframe in a cube
+cube_stats = ["mean", "std", "count", "min", "max"]
+# Position of the first row of each group in the dataframe, to list the groups in the order of the rows (as unique does)
+cube_order = ("order", "min")
+
+def aggregate_cube(dataframe, keys=cube_keys, columns=None):
+    """
+    Aggregate cube of a dataframe: the statistics (cube_stats) of its numeric columns (or of columns) for each
+    combination of the keys, computed by a single groupby and indexed by a sorted MultiIndex with a level per key.
+    The counts are float64 as the other statistics, so that the cube is a single array.
+    The plots of visualization_tools query it (see query_cube) instead of filtering the rows of the dataframe.
+    """
+    present_keys = [key for key in dict.fromkeys(keys) if key in dataframe.columns]
+    if len(present_keys) == 0:
+        raise ValueError("The dataframe has none of the keys " + str(keys))
+    keys = present_keys
+    if columns is None:
+        columns = [column for column in dataframe.columns if column not in keys and pd.api.types.is_numeric_dtype(dataframe[column])]
+
+    # float64 statistics whatever the schema of the dataframe (see compact_dtypes), the merged groups add them up
+    data = dataframe[keys].reset_index(drop=True)
+    data[columns] = dataframe[columns].astype("float64").to_numpy()
+    data[cube_order[0]] = np.arange(len(data))
+    grouped = data.groupby(keys, sort=True, observed=True, dropna=False)
+
+    cube = grouped[columns].agg(cube_stats)
+    cube[cube_order] = grouped[cube_order[0]].min()
+    return cube.astype("float64")
+
+def is_cube(data):
+    """
+    True for an aggregate cube (see aggregate_cube), False for a dataframe of rows.
+    """
+    return isinstance(data.columns, pd.MultiIndex) and cube_order in data.columns
+
+def query_cube(cube, selection={}, by=[], columns=None):
+    """
+    Statistics of the rows matching selection (a dict of key: value or list of values), grouped by the keys of by
+    and sorted as a groupby (without the groups of NaN keys), as if they were computed on these rows of the dataframe of the cube.
+    Without by, a Series of the statistics of all the matching rows.
+    """
+    mask = np.ones(len(cube), dtype=bool)
+    for key, value in selection.items():
+        values = value if isinstance(value, (list, tuple, set, np.ndarray, pd.Index)) else [value]
+        mask &= cube.index.get_level_values(key).isin(values)
+    if columns is None:
+        columns = [column for column in cube.columns.get_level_values(0).unique() if column != cube_order[0]]
+    result_columns = pd.MultiIndex.from_tuples([(column, stat) for column in columns for stat in cube_stats] + [cube_order])
+
+    # The cube is a single float64 block (see aggregate_cube), the groups are merged on its array
+    index = cube.index[mask]
+    values = cube.to_numpy()[mask]
+    if len(by) > 0:
+        levels = [index.get_level_values(key) for key in by]
+        keep = np.logical_and.reduce([level.notna() for level in levels])
+        values, levels = values[keep], [level[keep] for level in levels]
+        keys = levels[0] if len(by) == 1 else pd.MultiIndex.from_arrays(levels, names=by)
+        codes, groups = pd.factorize(keys, sort=True)
+    else:
+        codes, groups = np.zeros(len(values), dtype=np.int64), None
+    if len(values) == 0:
+        if groups is not None:
+            return pd.DataFrame(columns=result_columns, index=pd.MultiIndex.from_arrays([[]] * len(by), names=by) if len(by) > 1 else pd.Index([], name=by[0]), dtype="float64")
+        empty = pd.Series(np.nan, index=result_columns)
+        empty[[(column, "count") for column in columns]] = 0
+        return empty
+
+    rows = np.argsort(codes, kind="stable")
+    starts = np.flatnonzero(np.r_[True, np.diff(codes[rows]) != 0])
+    values = values[rows]
+    positions = {key: position for position, key in enumerate(cube.columns)}
+    stat = lambda name: values[:, [positions[(column, name)] for column in columns]]
+    counts, means, stds = stat("count"), np.nan_to_num(stat("mean")), np.nan_to_num(stat("std"))
+
+    # Means weighted by their counts, and variances merged with the sums of the squared deviations to the merged mean
+    total_counts = np.add.reduceat(counts, starts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        merged_means = np.add.reduceat(counts * means, starts) / total_counts
+        row_means = np.repeat(merged_means, np.diff(np.r_[starts, len(values)]), axis=0)
+        squares = np.add.reduceat(np.maximum(counts - 1, 0) * stds ** 2 + counts * (means - np.nan_to_num(row_means)) ** 2, starts)
+        merged_stds = np.where(total_counts > 1, np.sqrt(squares / (total_counts - 1)), np.nan)
+    merged = np.stack([merged_means, merged_stds, total_counts,
+                       np.fmin.reduceat(stat("min"), starts), np.fmax.reduceat(stat("max"), starts)], axis=2).reshape(len(starts), -1)
+    orders = np.minimum.reduceat(values[:, positions[cube_order]], starts)
+    result = pd.DataFrame(np.column_stack([merged, orders]), columns=result_columns)
+
+    if groups is None:
+        return result.iloc[0]
+    result.index = groups
+    result.index.names = by
+    return result
+
+def query_cube_order(result, level=None):
+    """
+    Groups of a query_cube result (or the values of one of its keys) in the order of the rows of the dataframe,
+    as unique gives them.
+    """
+    orders = result[cube_order] if level is None else result[cube_order].groupby(level=level, observed=True).min()
+    return orders.sort_values(kind="stable").index.tolist()
+
+def save_cube(cube, path):
+    """
+    Save a cube in a feather file when path ends with .feather (pyarrow is needed, load_cube memory-maps it back),
+    else in a pickle. data_cache_extension is the extension of the format available.
+    """
+    if path.endswith(".feather"):
+        pyarrow.feather.write_feather(cube, path, compression="uncompressed")
+    else:
+        cube.to_pickle(path, protocol=5)
+    return path
+
+def load_cube(path):
+    """
+    Load a cube saved by save_cube.
+    """
+    if path.endswith(".feather"):
+        return pyarrow.feather.read_table(path, memory_map=True).to_pandas()
+    return pd.read_pickle(path)
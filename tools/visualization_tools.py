@@ -11,6 +11,7 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 
 import methods as m
+import toolbox as tb
 import sys
 import os
 
@@ -32,6 +33,31 @@ properties = {
     "non_stable_ratio" : m.all_methods,
 }
 
+# The diagrams computing means and standard deviations take the dataframe or its aggregate cube (see toolbox.aggregate_cube),
+# built with the keys they select or group by, and query the cube instead of filtering the rows.
+# The cube of a dataframe only holds the columns the diagram shows.
+def as_cube(data, keys=tb.cube_keys, columns=None):
+    if tb.is_cube(data):
+        missing = [key for key in keys if key not in data.index.names and key not in tb.cube_keys]
+        if len(missing) > 0:
+            raise ValueError(f"The cube has no {missing} keys, build it with toolbox.aggregate_cube(data, keys)")
+        return data
+    return tb.aggregate_cube(data, keys, None if columns is None else list(dict.fromkeys(columns)))
+
+# Levels of a cube, sorted as the unique values of the column
+def cube_levels(cube, key):
+    return sorted(cube.index.get_level_values(key).unique())
+
+# Values of the categories for a label of a query_cube result, NaN when there are no rows with this label
+def cube_values(stats, label, categories, stat='mean'):
+    if label not in stats.index:
+        return [np.nan for _ in categories]
+    return [stats.loc[label, (category, stat)] for category in categories]
+
+# Selection of the rows of N points and shape ('all' for every shape)
+def cube_selection(N, shape='all'):
+    return {'N': N} if shape == 'all' else {'N': N, 'Shape': shape}
+
 def generate_random_color(alpha='1'):
     '''Generate a random color in RGBA format.'''
     r, g, b = random.sample(range(0, 256), 3)
@@ -164,14 +190,14 @@ def radar_shapes_comparison(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS
 def radar_methods_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_PONCA','PLANE_PONCA'] , filename='radar_test.html', 
                                       N=10000, shape='torus', categories=['K1 mean', 'K2 mean', 'D1 mean', 'D2 mean', 'Timings (mean)']):
 
-    # Filter data to keep only lines with N points and shape
-    filtered_data = data[(data['N'] == N) & (data['Shape'] == shape)] if shape != 'all' else data[data['N'] == N]
+    # Statistics of the lines with N points and shape
+    stats = tb.query_cube(as_cube(data, columns=categories), cube_selection(N, shape), ['Method'], list(dict.fromkeys(categories)))
 
     colors = {method: random_color[i] for i, method in enumerate(methods)}
 
     data_methods = []
     for method in methods:
-        method_data = filtered_data[filtered_data['Method'] == method][categories].mean().tolist()
+        method_data = cube_values(stats, method, categories)
         # method_data = [np.log(x+1) for x in method_data]  # Add 1 before taking log
         method_data = [x for x in method_data]  # Add 1 before taking log
         method_data.append(method_data[0])  # To make it cyclic
@@ -201,8 +227,8 @@ def radar_methods_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_PONC
 def radar_methods_comp_standard_dev(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_PONCA','PLANE_PONCA'], filename='radar_test.html', 
                                       N=10000, shape='torus', categories=['K1 mean', 'K2 mean', 'D1 mean', 'D2 mean', 'Timings (mean)']):
     
-    # Filter data to keep only lines with N points and shape
-    filtered_data = data[(data['N'] == N) & (data['Shape'] == shape)] if shape != 'all' else data[data['N'] == N]
+    # Statistics of the lines with N points and shape
+    stats = tb.query_cube(as_cube(data, columns=categories), cube_selection(N, shape), ['Method'], list(dict.fromkeys(categories)))
 
     data_methods = []
     data_methods_std = []
@@ -211,8 +237,8 @@ def radar_methods_comp_standard_dev(data, methods=['ASO','JetFitting','ASO_PONCA
     colors = {method: random_color[i] for i, method in enumerate(methods)}
     
     for method in methods:
-        method_data = filtered_data[filtered_data['Method'] == method][categories].mean().tolist()
-        method_data_std = filtered_data[filtered_data['Method'] == method][categories].std().tolist()
+        method_data = cube_values(stats, method, categories)
+        method_data_std = cube_values(stats, method, categories, 'std')
         
         # method_data = [np.log(x+1) for x in method_data]  # Add 1 before taking log
         # method_data_std = [np.log(x+1) for x in method_data_std]  # Add 1 before taking log
@@ -268,11 +294,9 @@ def radar_methods_comp_standard_dev_slider(data,
                                            with_neighbors=False):
 
     # Get all unique radii from data
-    radii = []
-    if with_neighbors:
-        radii = sorted(data['Nb neighbors (mean)'].unique())
-    else :
-        radii = sorted(data['Radius'].unique())
+    radius_key = 'Nb neighbors (mean)' if with_neighbors else 'Radius'
+    cube = as_cube(data, tb.cube_keys + [radius_key], categories)
+    radii = cube_levels(cube, radius_key)
 
     fig = go.Figure()
 
@@ -281,19 +305,15 @@ def radar_methods_comp_standard_dev_slider(data,
     colors = {method: random_color[i] for i, method in enumerate(methods)}
 
     for r, radius in enumerate(radii):
-        # Filter data to keep only lines with the radius and shape and with N points 
-        filtered_data = []
-        if with_neighbors:
-            filtered_data = data[(data['N'] == N) & (data['Nb neighbors (mean)'] == radius) & (data['Shape'] == shape)] if shape != 'all' else data[(data['Nb neighbors (mean)'] == radius) & (data['N'] == N)]
-        else:
-            filtered_data = data[(data['N'] == N) & (data['Radius'] == radius) & (data['Shape'] == shape)] if shape != 'all' else data[(data['Radius'] == radius) & (data['N'] == N)]
+        # Statistics of the lines with the radius and shape and with N points 
+        stats = tb.query_cube(cube, {**cube_selection(N, shape), radius_key: radius}, ['Method'], list(dict.fromkeys(categories)))
 
         data_methods = []
         data_methods_std = []
 
         for method in methods:
-            method_data = filtered_data[filtered_data['Method'] == method][categories].mean().tolist()
-            method_data_std = filtered_data[filtered_data['Method'] == method][categories].std().tolist()
+            method_data = cube_values(stats, method, categories)
+            method_data_std = cube_values(stats, method, categories, 'std')
 
             # method_data = [np.log(x + 1) for x in method_data]  # Add 1 before taking log
             # method_data_std = [np.log(x + 1) for x in method_data_std]  # Add 1 before taking log
@@ -370,24 +390,23 @@ def radar_methods_comp_standard_dev_slider(data,
 def radar_shapes_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_PONCA','PLANE_PONCA'], filename='radar_shape.html',
                        N=10000, categorie='Mean curvature (mean)'):
     
-    data_diag = data[data['N'] == N]
+    stats = tb.query_cube(as_cube(data, columns=[categorie]), {'N': N}, ['Shape', 'Method'], [categorie])
 
     # Data preparation for each method
     data_methods = []
-    shapes = data_diag['Shape'].unique()
+    shapes = tb.query_cube_order(stats, 'Shape')
 
     colors = {method: random_color[i] for i, method in enumerate(methods)}
 
     for method in methods:
-        method_data = data_diag[data_diag['Method'] == method].groupby('Shape')[categorie].mean()
-        method_data = method_data.reindex(shapes)
+        method_data = [cube_values(stats, (shape, method), [categorie])[0] for shape in shapes]
         # method_data = [np.log(x + 1) for x in method_data]  # Add 1 before taking log
         method_data = [x for x in method_data]
         method_data.append(method_data[0])  # To make it cyclic
         data_methods.append(method_data)
 
     # Catégories
-    categories = shapes.tolist()
+    categories = list(shapes)
     categories.append(categories[0])  # Categories must also be cyclical
 
     # Creating the radar diagram
@@ -412,11 +431,9 @@ def radar_shapes_comp_standard_dev_slider(data, methods=['ASO','JetFitting','ASO
                              filename='radar_shape.html', N=10000, categorie='Mean curvature (mean)', with_neighbors=False):
 
     # Get all unique radii from data
-    radii = []
-    if with_neighbors:
-        radii = sorted(data['Nb neighbors (mean)'].unique())
-    else:
-        radii = sorted(data['Radius'].unique())
+    radius_key = 'Nb neighbors (mean)' if with_neighbors else 'Radius'
+    cube = as_cube(data, tb.cube_keys + [radius_key], [categorie])
+    radii = cube_levels(cube, radius_key)
     
     fig = go.Figure()
 
@@ -426,19 +443,16 @@ def radar_shapes_comp_standard_dev_slider(data, methods=['ASO','JetFitting','ASO
 
     
     for r, radius in enumerate(radii):
-        if with_neighbors:
-            data_diag = data[ (data['Nb neighbors (mean)'] == radius) & (data['N'] == N)]
-        else:
-            data_diag = data[(data['N'] == N) & (data['Radius'] == radius)]
+        stats = tb.query_cube(cube, {'N': N, radius_key: radius}, ['Shape', 'Method'], [categorie])
 
         # Data preparation for each method
         data_methods = []
         data_methods_std = []
-        shapes = data_diag['Shape'].unique()
+        shapes = tb.query_cube_order(stats, 'Shape')
 
         for method in methods:
-            method_data = data_diag[data_diag['Method'] == method].groupby('Shape')[categorie].mean()
-            method_data_std = data_diag[data_diag['Method'] == method].groupby('Shape')[categorie].std()
+            method_data = [cube_values(stats, (shape, method), [categorie])[0] for shape in shapes]
+            method_data_std = [cube_values(stats, (shape, method), [categorie], 'std')[0] for shape in shapes]
 
             # method_data = [np.log(x + 1) for x in method_data]  # Add 1 before taking log
             # method_data_std = [np.log(x + 1) for x in method_data_std]  # Add 1 before taking log
@@ -451,7 +465,7 @@ def radar_shapes_comp_standard_dev_slider(data, methods=['ASO','JetFitting','ASO
             data_methods_std.append(method_data_std)
 
         # Categories
-        categories = shapes.tolist()
+        categories = list(shapes)
         categories.append(categories[0])  # Categories must also be cyclical
 
         # Adding scatterpolar traces for each method
@@ -513,16 +527,14 @@ def radar_shapes_comp_standard_dev_slider(data, methods=['ASO','JetFitting','ASO
 def bar_shapes_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_PONCA','PLANE_PONCA'], filename='bar_shape.html',
                        N=10000, categorie='Mean curvature (mean)'):
     
-    data_diag = data[data['N'] == N]    # Data preparation for each method
+    stats = tb.query_cube(as_cube(data, columns=[categorie]), {'N': N}, ['Shape', 'Method'], [categorie])    # Data preparation for each method
     data_means = []
     data_errors = []  # New list to store standard deviation data
-    shapes = data_diag['Shape'].unique()    
+    shapes = tb.query_cube_order(stats, 'Shape')    
 
     for method in methods:
-        method_mean = data_diag[data_diag['Method'] == method].groupby('Shape')[categorie].mean()
-        method_std = data_diag[data_diag['Method'] == method].groupby('Shape')[categorie].std()  # Calculating standard deviation        
-        method_mean = method_mean.reindex(shapes)
-        method_std = method_std.reindex(shapes)  # Ensuring standard deviation data is in the same order        
+        method_mean = [cube_values(stats, (shape, method), [categorie])[0] for shape in shapes]
+        method_std = [cube_values(stats, (shape, method), [categorie], 'std')[0] for shape in shapes]  # Standard deviation, in the same order        
         method_mean = np.log(method_mean).tolist()
         method_std = np.log(method_std).tolist()  # Apply log to standard deviation as well        
         data_means.append(method_mean)
@@ -599,13 +611,13 @@ def box_plot_methods_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_P
 def bar_chart_methods_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_PONCA','PLANE_PONCA'], 
                            N=10000, shape='torus', category='K1 mean', filename='bar_chart_test.html'):
 
-    # Filter data to keep only lines with N points and shape
-    filtered_data = data[(data['N'] == N) & (data['Shape'] == shape)] if shape != 'all' else data[data['N'] == N]
+    # Statistics of the lines with N points and shape
+    stats = tb.query_cube(as_cube(data, columns=[category]), cube_selection(N, shape), ['Method'], [category])
 
     fig = go.Figure()
 
     for method in methods:
-        method_data = filtered_data[filtered_data['Method'] == method][category].mean()
+        method_data = cube_values(stats, method, [category])[0]
         method_data=np.log(method_data)
         fig.add_trace(go.Bar(x=[method], y=[method_data], name=method))
 
@@ -637,8 +649,8 @@ def heatmap_methods_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_PO
                          N=10000, shapes=['torus', 'goursat', 'leopold'], category='K1 mean', 
                          filename='heatmap_test.html'):
 
-    # Filter data to keep only lines with N points
-    filtered_data = data[data['N'] == N]
+    # Statistics of the lines with N points
+    stats = tb.query_cube(as_cube(data, columns=[category]), {'N': N}, ['Method', 'Shape'], [category])
 
     # Create an empty DataFrame for the heatmap
     heatmap_data = pd.DataFrame(index=methods, columns=shapes)
@@ -646,7 +658,7 @@ def heatmap_methods_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS_PO
     # Calculate mean error for each method and shape
     for method in methods:
         for shape in shapes:
-            mean_error = filtered_data[(filtered_data['Method'] == method) & (filtered_data['Shape'] == shape)][category].mean()
+            mean_error = cube_values(stats, (method, shape), [category])[0]
             heatmap_data.loc[method, shape] = mean_error
 
     # Create the heatmap
@@ -687,23 +699,22 @@ def scatter_3d_methods_comp(data, methods=['ASO','JetFitting','ASO_PONCA', 'APSS
 
 def radar_shape_image(data, output_name, categorie, color_map):
     
-    data_diag = data
-    methods = data_diag['Method'].unique()
+    stats = tb.query_cube(as_cube(data, columns=[categorie]), {}, ['Shape', 'Method'], [categorie])
+    methods = tb.query_cube_order(stats, 'Method')
 
     # Data preparation for each method
     data_methods = []
-    shapes = data_diag['Shape'].unique()
+    shapes = tb.query_cube_order(stats, 'Shape')
 
     for method in methods:
-        method_data = data_diag[data_diag['Method'] == method].groupby('Shape')[categorie].mean()
-        method_data = method_data.reindex(shapes)
+        method_data = [cube_values(stats, (shape, method), [categorie])[0] for shape in shapes]
         # method_data = [np.log(x + 1) for x in method_data]  # Add 1 before taking log
         method_data = [x for x in method_data]
         method_data.append(method_data[0])  # To make it cyclic
         data_methods.append(method_data)
 
     # Catégories
-    categories = shapes.tolist()
+    categories = list(shapes)
     categories.append(categories[0])  # Categories must also be cyclical
 
     # Creating the radar diagram
@@ -722,15 +733,14 @@ def radar_shape_image(data, output_name, categorie, color_map):
 
 def radar_estim_image(data, output_name, categories, color_map, range_max=1.0):
     
-    data_diag = data
-    methods = data_diag['Method'].unique()
+    stats = tb.query_cube(as_cube(data, columns=categories), {}, ['Method'], list(dict.fromkeys(categories)))
+    methods = tb.query_cube_order(stats)
 
     # Data preparation for each method
     data_methods = []
-    shapes = data_diag['Shape'].unique()
 
     for method in methods:
-        method_data = data_diag[data_diag['Method'] == method][categories].mean().tolist()
+        method_data = cube_values(stats, method, categories)
         # method_data = [np.log(x + 1) for x in method_data]  # Add 1 before taking log
         method_data = [x for x in method_data]
         method_data.append(method_data[0])  # To make it cyclic
@@ -787,16 +797,22 @@ def create_subplots(dataset, rows, cols, to_legend, colors, line_width=1.5, spli
 
     displayed_legend = set()
 
+    # The cube holds the constraints, the legends, the splits and the x of the subplots
+    keys = [row[0] for row in rows] + [row[2] for row in rows] + [col[0] for col in cols] + [to_legend]
+    cube = as_cube(dataset, tb.cube_keys + [key for key in keys + [split_by] if key is not None and key not in tb.cube_keys], [col[2] for col in cols])
+
     for i, row in enumerate(rows) :
-        data_row = dataset[dataset[row[0]].isin(row[1])]
         # if data_row contains the dataset column, then check 
         for j, col in enumerate(cols) :
-            data_col = data_row[data_row[col[0]].isin(col[1])]
+            selection = {row[0]: list(row[1])}
+            selection[col[0]] = [value for value in selection.get(col[0], col[1]) if value in col[1]]
             if to_legend == "Method" :
-                data_col = data_col[data_col["Method"].isin(properties[col[2]])]
+                selection["Method"] = [method for method in selection.get("Method", properties[col[2]]) if method in properties[col[2]]]
+            by = [to_legend] + ([split_by] if split_by is not None else []) + [row[2]]
+            data_col = tb.query_cube(cube, selection, by, [col[2]])
             traces = []
-            for legend in data_col[to_legend].unique() :
-                data_legend = data_col[data_col[to_legend] == legend]
+            for legend in tb.query_cube_order(data_col, to_legend) :
+                data_legend = data_col.xs(legend, level=to_legend, drop_level=False)
                 
                 showlegend = legend not in displayed_legend
                 if showlegend :
@@ -808,17 +824,17 @@ def create_subplots(dataset, rows, cols, to_legend, colors, line_width=1.5, spli
                 line_names = []
                 
                 if split_by is not None :
-                    for s_idx, split in enumerate( data_legend[split_by].unique() ) :
-                        data_split = data_legend[data_legend[split_by] == split]
-                        x_data = sorted(data_split[row[2]].unique())
-                        y_data = data_split[col[2]].groupby(data_split[row[2]]).mean()
+                    for s_idx, split in enumerate( tb.query_cube_order(data_legend, split_by) ) :
+                        data_split = data_legend.xs(split, level=split_by, drop_level=False)[(col[2], "mean")]
+                        x_data = data_split.index.get_level_values(row[2]).tolist()
+                        y_data = pd.Series(data_split.to_numpy(), index=pd.Index(x_data, name=row[2]), name=col[2])
                         x_datas.append(x_data)
                         y_datas.append(y_data)
                         lines.append(dict(color=colors[legend], dash=dash_patterns[s_idx % len(dash_patterns)]) if (s_idx > 0) else dict(color=colors[legend]))
                         line_names.append(f"{legend}_{split}")
                 else :
-                    x_datas = [sorted(data_legend[row[2]].unique())]
-                    y_datas = [data_legend[col[2]].groupby(data_legend[row[2]]).mean()]
+                    x_datas = [data_legend.index.get_level_values(row[2]).tolist()]
+                    y_datas = [pd.Series(data_legend[(col[2], "mean")].to_numpy(), index=pd.Index(x_datas[0], name=row[2]), name=col[2])]
                     lines = [dict(color=colors[legend], width=line_width)]
                     line_names = [legend]
 
@@ -0,0 +1,306 @@
+import os
+import json
+import struct
+import hashlib
+
+import numpy as np
+
+# Binary columnar point cloud format loaded by the viewer:
+#   - a little-endian uint32 giving the byte length of the JSON header,
+#   - the UTF-8 JSON header, padded with spaces so that the columns start on a 4 bytes boundary,
+#   - one block of little-endian float32 per column, in the order of the header.
+# The header gives the number of rows and, for each column, its name, its number of components (3 for the positions),
+# the byte offset of its block from the start of the file and its length in floats,
+# so that each block can be wrapped in a Float32Array without any copy.
+#
+# With the compact encoding (header "encoding": "compact"), each column gives the "dtype" of its block, padded to 4 bytes:
+#   - "uint16" (the positions): the values quantized in [min, max] (per component), value = min + q * (max - min) / 65535,
+#     the error is at most half a step, (max - min) / 131070, plus the rounding of the decoded value to float32
+#     (2^-24 relative),
+#   - "float16" (the values): value = half * scale, where scale is a power of 2 fitting the column in the float16 range,
+#     the relative error is at most 2^-11 (and the absolute error 2^-25 * scale for the values below 2^-14 * scale),
+#     the decoded values are exact in float32.
+# The missing values (points or methods missing from the estimations, and non-finite values) are given by a validity
+# bitmap (one bit per row, least significant bit first, 1 for a valid value) at the byte offset "validity",
+# when the column has any, and are stored as 0. Such a column also gives "fill", the value shown by the viewer for its missing
+# values (the placeholder of the JSON files, 100 for the errors, see merge_pts.publish_fills), the readers of this module
+# decode them as NaN. Each column also gives "max_error", the largest absolute error measured
+# on its valid values when it was written, between the input values and the float32 values decoded by the readers.
+binary_format_version = 1
+
+# Largest finite float16
+float16_max = 65504.0
+
+# Little-endian numpy types of the blocks of the compact columns
+compact_dtypes = {"float16": "<f2", "uint16": "<u2"}
+
+def encode_column(values, valid=None, fill=0.0):
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values) if values.ndim == 1 else np.all(np.isfinite(values), axis=1)
+    valid = finite if valid is None else finite & valid
+    kept = values[valid]
+    column = {}
+    if values.ndim == 1:
+        largest = np.abs(kept).max() if len(kept) > 0 else 0
+        scale = 2.0 ** int(np.ceil(np.log2(largest / float16_max))) if largest > float16_max else 1.0
+        data = (np.where(valid, values, 0) / scale).astype("<f2")
+        column.update({"dtype": "float16", "scale": scale})
+    else:
+        low = kept.min(axis=0) if len(kept) > 0 else np.zeros(values.shape[1])
+        high = kept.max(axis=0) if len(kept) > 0 else np.zeros(values.shape[1])
+        step = (high - low) / 65535
+        quantized = np.where(step > 0, (np.where(valid[:, None], values, low) - low) / np.where(step > 0, step, 1), 0)
+        data = np.clip(np.rint(quantized), 0, 65535).astype("<u2")
+        column.update({"dtype": "uint16", "min": low.tolist(), "max": high.tolist()})
+    decoded = decode_column(column, data)
+    column["max_error"] = float(np.abs(decoded[valid].astype(np.float64) - kept).max()) if len(kept) > 0 else 0.0
+    blocks = [("offset", data.tobytes())]
+    if not np.all(valid):
+        blocks.append(("validity", np.packbits(valid, bitorder="little").tobytes()))
+        column["fill"] = fill
+    return column, blocks
+
+# Float32 values of a compact column, decoded as the readers do (from its header entry and its encoded data)
+def decode_column(column, data):
+    if column["dtype"] == "float16":
+        return data.astype(np.float32) * np.float32(column["scale"])
+    low = np.asarray(column["min"])
+    step = (np.asarray(column["max"]) - low) / 65535
+    return (low + data.reshape(-1, len(low)) * step).astype(np.float32)
+
+# Header entry (without the offsets) and data blocks of each column, the validity masks and fill values are only used when compact
+def binary_blocks(columns, compact=False, validity=None, fills=None):
+    entries = []
+    for name, values in columns:
+        components = 1 if values.ndim == 1 else values.shape[1]
+        entry = {"name": name, "components": components, "offset": 0, "length": values.size}
+        if compact:
+            column, blocks = encode_column(values, None if validity is None else validity.get(name),
+                                           0.0 if fills is None else fills.get(name, 0.0))
+            entry.update(column)
+        else:
+            blocks = [("offset", np.ascontiguousarray(values, dtype="<f4").tobytes())]
+        entries.append((entry, blocks))
+    return entries
+
+def binary_header(rows, entries, extra=None):
+    header = {"version": binary_format_version, "rows": rows, "dtype": "float32", "columns": []}
+    if extra is not None:
+        header.update(extra)
+    if any("dtype" in entry for entry, _ in entries):
+        header["encoding"] = "compact"
+    # The offsets depend on the size of the header, which depends on the offsets: iterate until it is stable
+    header_size = 0
+    while True:
+        offset = 4 + header_size
+        header["columns"] = []
+        for entry, blocks in entries:
+            entry = dict(entry)
+            for key, data in blocks:
+                entry[key] = offset
+                offset += len(data) + (-len(data) % 4)
+            header["columns"].append(entry)
+        encoded = json.dumps(header).encode("utf-8")
+        padded_size = len(encoded) + (-(4 + len(encoded)) % 4)
+        if padded_size == header_size:
+            return encoded.ljust(header_size, b" ")
+        header_size = padded_size
+
+# columns is a list of (name, values) with values of shape (rows,) or (rows, components).
+# When compact is True, the columns use the compact encoding, validity is an optional dictionary of the masks
+# of the valid rows of the columns, and fills an optional dictionary of the values shown for their missing values (0 by default).
+def write_binary(output_file, columns, extra=None, compact=False, validity=None, fills=None):
+    rows = len(columns[0][1]) if len(columns) > 0 else 0
+    entries = binary_blocks(columns, compact, validity, fills)
+    header = binary_header(rows, entries, extra)
+    output_dir = os.path.dirname(output_file)
+    if output_dir != "" and not os.path.exists(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_file, 'wb') as f:
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for _, blocks in entries:
+            for _, data in blocks:
+                f.write(data + b"\0" * (-len(data) % 4))
+    return json.loads(header.decode("utf-8"))
+
+# Returns the header and a dictionary of the columns (as views on the file content, or decoded float32 arrays
+# with NaN for the missing values for the compact encoding)
+def read_binary(filename):
+    with open(filename, 'rb') as f:
+        content = f.read()
+    header_size = struct.unpack("<I", content[:4])[0]
+    header = json.loads(content[4:4 + header_size].decode("utf-8"))
+    columns = {}
+    for column in header["columns"]:
+        if column.get("dtype") in compact_dtypes:
+            data = np.frombuffer(content, dtype=compact_dtypes[column["dtype"]], count=column["length"], offset=column["offset"])
+            values = decode_column(column, data)
+        else:
+            values = np.frombuffer(content, dtype="<f4", count=column["length"], offset=column["offset"])
+        if column["components"] > 1:
+            values = values.reshape(-1, column["components"])
+        if "validity" in column:
+            bits = np.frombuffer(content, dtype=np.uint8, count=(header["rows"] + 7) // 8, offset=column["validity"])
+            valid = np.unpackbits(bits, bitorder="little")[:header["rows"]].astype(bool)
+            values[~valid] = np.nan
+        columns[column["name"]] = values
+    return header, columns
+
+# Formats a float the way JavaScript's JSON.stringify does, from the shortest repr digits (the same in both languages)
+def js_number(value):
+    text = repr(value)
+    if text in ("nan", "inf", "-inf"):
+        return "null"
+    if "e" not in text:
+        if text.endswith(".0"):
+            text = text[:-2]
+        return "0" if text == "-0" else text
+    sign = ""
+    if text.startswith("-"):
+        sign = "-"
+        text = text[1:]
+    mantissa, exponent = text.split("e")
+    digits = mantissa.replace(".", "")
+    k = len(digits)
+    n = int(exponent) + 1
+    if k <= n <= 21:
+        return sign + digits + "0" * (n - k)
+    if 0 < n <= 21:
+        return sign + digits[:n] + "." + digits[n:]
+    if -6 < n <= 0:
+        return sign + "0." + "0" * (-n) + digits
+    e = n - 1
+    exponent = ("e+" if e >= 0 else "e-") + str(abs(e))
+    if k == 1:
+        return sign + digits + exponent
+    return sign + digits[0] + "." + digits[1:] + exponent
+
+# Writes a 2D float array as a JSON array of rows, as JSON.stringify would, chunk by chunk
+def write_json(output_file, table, chunk_size=65536):
+    output_dir = os.path.dirname(output_file)
+    if output_dir != "" and not os.path.exists(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_file, 'w') as f:
+        f.write("[")
+        for start in range(0, len(table), chunk_size):
+            if start > 0:
+                f.write(",")
+            rows = table[start:start + chunk_size].tolist()
+            f.write(",".join("[" + ",".join(map(js_number, row)) + "]" for row in rows))
+        f.write("]")
+
+# Checksum of a geometry (float32 positions), stored in the value-only files to check they match the geometry file
+def geometry_checksum(positions):
+    return hashlib.sha1(np.ascontiguousarray(positions, dtype="<f4").tobytes()).hexdigest()
+
+# Column shards: one single-column binary file per column in output_dir, listed by an index.json manifest
+# giving the number of rows and, for each column, its file and its header entry (number of components, byte offset of its values
+# in the file and compact encoding), so that a viewer only fetches the columns it shows (and, with tiers, only the rows of a tier).
+shard_index_name = "index.json"
+
+def shard_name(name):
+    return name.replace(" ", "_") + ".bin"
+
+def write_shards(output_dir, columns, extra=None, compact=False, validity=None, fills=None):
+    rows = len(columns[0][1]) if len(columns) > 0 else 0
+    index = {"version": binary_format_version, "rows": rows, "dtype": "float32", "columns": []}
+    if extra is not None:
+        index.update(extra)
+    if compact:
+        index["encoding"] = "compact"
+    for name, values in columns:
+        header = write_binary(os.path.join(output_dir, shard_name(name)), [(name, values)], None, compact, validity, fills)
+        index["columns"].append(dict(header["columns"][0], file=shard_name(name)))
+    with open(os.path.join(output_dir, shard_index_name), 'w') as f:
+        json.dump(index, f)
+
+# Level of detail: the points are published in a progressive order where every prefix covers the whole shape,
+# and the headers give the number of rows of each tier, so that a viewer can draw the first tier and stream the next ones.
+lod_tiers = [10000, 100000]
+
+# Progressive order of the points: the bounding box is split in a grid of 2^level cells per axis for increasing levels,
+# and at each level one point (picked at random, with a fixed seed) of each cell not yet represented comes next.
+# The points are sorted once along a Morton curve, where the cells of every level are contiguous runs.
+def progressive_order(positions, seed=0, bits=20):
+    n = len(positions)
+    if n == 0:
+        return np.arange(0)
+    rank = np.random.default_rng(seed).permutation(n)
+    by_rank = np.empty(n, dtype=np.int64)
+    by_rank[rank] = np.arange(n)
+
+    low = positions.min(axis=0)
+    extent = (positions.max(axis=0) - low).max()
+    scale = (2 ** bits - 1) / extent if extent > 0 else 0
+    grid = ((positions - low) * scale).astype(np.int64)
+    code = np.zeros(n, dtype=np.int64)
+    for bit in range(bits):
+        for axis in range(3):
+            code |= ((grid[:, axis] >> bit) & 1) << (3 * bit + 2 - axis)
+    curve = np.argsort(code, kind="stable")
+    code = code[curve]
+    curve_rank = rank[curve]
+
+    level = np.full(n, bits + 1, dtype=np.int64)
+    new_cell = np.empty(n, dtype=bool)
+    new_cell[0] = True
+    for l in range(bits + 1):
+        prefix = code >> (3 * (bits - l))
+        np.not_equal(prefix[1:], prefix[:-1], out=new_cell[1:])
+        starts = np.flatnonzero(new_cell)
+        # The point picked for a cell has the lowest rank in it, so it is also picked for its finer cells
+        first_rank = np.minimum.reduceat(curve_rank, starts)
+        chosen = by_rank[first_rank]
+        level[chosen] = np.minimum(level[chosen], l)
+        if len(starts) == n:
+            break
+    return np.lexsort((rank, level))
+
+# Number of rows of each tier of n points in progressive order, visible is an optional mask (in that order)
+# of the points kept in the file
+def tier_rows(n, visible=None):
+    tiers = [tier for tier in lod_tiers if tier < n] + [n]
+    if visible is None:
+        return tiers
+    kept = np.concatenate([[0], np.cumsum(visible)])
+    return [int(kept[tier]) for tier in tiers]
+
+# Statistics sidecar of a published file: for each column, the number of finite values, their min, max, mean, std,
+# percentiles and a histogram of stats_bins bins between min and max, so that a viewer gets the color ranges
+# and the distributions without going through the points. The statistics of a column without finite values are null.
+# With a validity mask, the placeholders of the missing values ("0" or "100" in the merged files) are left out of the count,
+# mean, std, percentiles and histogram, and counted in "missing". The min and max still cover them, so that the color
+# ranges match a scan of the points of the published file.
+stats_percentiles = [1, 5, 50, 95, 99]
+stats_bins = 64
+
+def column_stats(values, valid=None):
+    finite = np.isfinite(values)
+    kept = values[finite if valid is None else finite & valid]
+    stats = {"count": len(kept), "missing": 0 if valid is None else int(np.count_nonzero(finite & ~valid))}
+    values = values[finite]
+    if len(values) == 0:
+        stats.update({key: None for key in ["min", "max"]})
+    else:
+        stats.update({"min": float(values.min()), "max": float(values.max())})
+    if len(kept) == 0:
+        stats.update({key: None for key in ["mean", "std"] + [f"p{p}" for p in stats_percentiles] + ["histogram"]})
+        return stats
+    low, high = stats["min"], stats["max"]
+    stats.update({"mean": float(kept.mean()), "std": float(kept.std())})
+    stats.update({f"p{p}": float(value) for p, value in zip(stats_percentiles, np.percentile(kept, stats_percentiles))})
+    counts, _ = np.histogram(kept, bins=stats_bins, range=(low, high) if high > low else (low - 0.5, low + 0.5))
+    stats["histogram"] = counts.tolist()
+    return stats
+
+# columns is a list of (name, values), validity an optional dictionary of the masks of the valid values of some columns
+def write_stats(output_file, columns, validity=None):
+    if validity is None:
+        validity = {}
+    rows = len(columns[0][1]) if len(columns) > 0 else 0
+    output_dir = os.path.dirname(output_file)
+    if output_dir != "" and not os.path.exists(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_file, 'w') as f:
+        json.dump({"rows": rows, "bins": stats_bins, "columns": {name: column_stats(values, validity.get(name)) for name, values in columns}}, f)